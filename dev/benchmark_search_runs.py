@@ -0,0 +1,342 @@
+"""
+Benchmark the latency of common run search queries against a SQL tracking database.
+
+The benchmark seeds a database with synthetic experiments and runs (each with metrics, params
+and tags), then times ``SqlAlchemyStore.search_runs`` for a set of typical search shapes and
+optionally prints the query plan of every generated statement. It is meant to evaluate schema
+and query changes, e.g. new indexes, by comparing its results before and after the change:
+
+    python dev/benchmark_search_runs.py --num-runs 100000 --output before.json
+    python dev/benchmark_search_runs.py --db-uri postgresql://user:pw@localhost/mlflow_bench
+
+An existing database, e.g. a copy of a production tracking database, can be benchmarked without
+adding synthetic data with ``--no-seed --experiment-ids <ids>``.
+"""
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+
+import click
+import sqlalchemy
+
+from mlflow.entities import LifecycleStage, RunStatus, SourceType, ViewType
+from mlflow.store.tracking.dbmodels.models import (
+    SqlLatestMetric,
+    SqlMetric,
+    SqlParam,
+    SqlRun,
+    SqlTag,
+)
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+
+_INSERT_BATCH_SIZE = 5000
+
+# Name, filter string, order_by and number of pages of every benchmarked search. Metric and
+# param names match the data generated by ``seed_database``.
+SEARCH_SHAPES = [
+    ("list", None, None, 1),
+    ("list_3_pages", None, None, 3),
+    ("order_by_metric", None, ["metrics.m0 DESC"], 1),
+    ("order_by_metric_3_pages", None, ["metrics.m0 DESC"], 3),
+    ("order_by_param", None, ["params.p0 ASC"], 1),
+    ("order_by_start_time", None, ["attributes.start_time ASC"], 1),
+    ("filter_metric", "metrics.m0 > 0.9", None, 1),
+    ("filter_param", "params.p1 = 'value-3'", None, 1),
+    ("filter_tag", "tags.t0 = 'value-7'", None, 1),
+    ("filter_metric_and_param", "metrics.m1 < 0.5 and params.p0 = 'value-1'", None, 1),
+    ("filter_or", "params.p0 = 'value-1' or params.p0 = 'value-2'", None, 1),
+    ("filter_in", "params.p2 in ('value-1', 'value-2', 'value-3')", None, 1),
+    ("filter_like", "tags.mlflow.runName like 'run-1%'", None, 1),
+    ("filter_status", "attributes.status = 'FINISHED'", ["metrics.m0 ASC"], 1),
+]
+
+
+def _insert(connection, table, rows):
+    for start in range(0, len(rows), _INSERT_BATCH_SIZE):
+        connection.execute(table.insert(), rows[start : start + _INSERT_BATCH_SIZE])
+
+
+def seed_database(
+    store, num_experiments, num_runs, num_metrics, num_params, num_tags, num_steps, seed=0
+):
+    """
+    Create ``num_experiments`` experiments and spread ``num_runs`` runs across them. Every run
+    has ``num_metrics`` metrics logged at ``num_steps`` steps, ``num_params`` params and
+    ``num_tags`` tags (plus a run name tag) whose values are drawn from a small set, so that
+    filters have realistic selectivities. About 10% of the runs are deleted.
+
+    :return: List of the IDs of the created experiments.
+    """
+    rng = random.Random(seed)
+    experiment_ids = [
+        store.create_experiment("benchmark-{}-{}".format(i, uuid.uuid4().hex))
+        for i in range(num_experiments)
+    ]
+    start_time = int(time.time() * 1000) - num_runs * 1000
+    with store.engine.begin() as connection:
+        for run_offset in range(0, num_runs, _INSERT_BATCH_SIZE):
+            runs, metrics, latest_metrics, params, tags = [], [], [], [], []
+            for i in range(run_offset, min(run_offset + _INSERT_BATCH_SIZE, num_runs)):
+                run_uuid = uuid.uuid4().hex
+                experiment_id = int(experiment_ids[i % num_experiments])
+                lifecycle_stage = (
+                    LifecycleStage.DELETED if rng.random() < 0.1 else LifecycleStage.ACTIVE
+                )
+                run_start_time = start_time + i * 1000
+                runs.append(
+                    {
+                        "run_uuid": run_uuid,
+                        "name": "",
+                        "source_type": SourceType.to_string(SourceType.LOCAL),
+                        "source_name": "",
+                        "entry_point_name": "",
+                        "user_id": "benchmark",
+                        "status": RunStatus.to_string(
+                            rng.choice([RunStatus.FINISHED, RunStatus.FAILED])
+                        ),
+                        "start_time": run_start_time,
+                        "end_time": run_start_time + 500,
+                        "source_version": "",
+                        "lifecycle_stage": lifecycle_stage,
+                        "artifact_uri": "",
+                        "experiment_id": experiment_id,
+                    }
+                )
+                for m in range(num_metrics):
+                    key = "m{}".format(m)
+                    for step in range(num_steps):
+                        value = rng.random()
+                        metrics.append(
+                            {
+                                "key": key,
+                                "value": value,
+                                "timestamp": run_start_time + step,
+                                "step": step,
+                                "is_nan": False,
+                                "run_uuid": run_uuid,
+                            }
+                        )
+                    latest_metrics.append(
+                        {
+                            "key": key,
+                            "value": value,
+                            "timestamp": run_start_time + num_steps - 1,
+                            "step": num_steps - 1,
+                            "is_nan": False,
+                            "run_uuid": run_uuid,
+                            "experiment_id": experiment_id,
+                            "lifecycle_stage": lifecycle_stage,
+                            "start_time": run_start_time,
+                        }
+                    )
+                for p in range(num_params):
+                    params.append(
+                        {
+                            "key": "p{}".format(p),
+                            "value": "value-{}".format(rng.randrange(10)),
+                            "run_uuid": run_uuid,
+                        }
+                    )
+                for t in range(num_tags):
+                    tags.append(
+                        {
+                            "key": "t{}".format(t),
+                            "value": "value-{}".format(rng.randrange(10)),
+                            "run_uuid": run_uuid,
+                        }
+                    )
+                tags.append({"key": "mlflow.runName", "value": "run-%d" % i, "run_uuid": run_uuid})
+            _insert(connection, SqlRun.__table__, runs)
+            _insert(connection, SqlMetric.__table__, metrics)
+            _insert(connection, SqlLatestMetric.__table__, latest_metrics)
+            _insert(connection, SqlParam.__table__, params)
+            _insert(connection, SqlTag.__table__, tags)
+    return experiment_ids
+
+
+class _StatementRecorder(object):
+    """
+    Records the SELECT statements executed by an engine while enabled.
+    """
+
+    def __init__(self, engine):
+        self.statements = []
+        self.enabled = False
+        sqlalchemy.event.listen(engine, "before_cursor_execute", self._record)
+
+    def _record(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):  # pylint: disable=unused-argument
+        if self.enabled and statement.lstrip().upper().startswith("SELECT"):
+            self.statements.append((statement, parameters))
+
+
+def _explain(engine, statement, parameters):
+    dialect_name = engine.dialect.name
+    if dialect_name == "sqlite":
+        prefix = "EXPLAIN QUERY PLAN "
+    elif dialect_name in ["postgresql", "mysql"]:
+        prefix = "EXPLAIN "
+    else:
+        return ["(query plans are not supported for dialect '{}')".format(dialect_name)]
+    with engine.connect() as connection:
+        rows = connection.execute(prefix + statement, parameters).fetchall()
+    return [" | ".join(str(column) for column in row) for row in rows]
+
+
+def run_search_benchmark(store, experiment_ids, max_results, repeats, explain=False):
+    """
+    Time every search shape of ``SEARCH_SHAPES`` ``repeats`` times, after one warm-up search.
+
+    :return: List of dictionaries with the name of each search shape, its number of results and
+             its minimum, median, 95th percentile and maximum latency in milliseconds, as well
+             as the query plans of its statements if ``explain`` is ``True``.
+    """
+    recorder = _StatementRecorder(store.engine)
+    results = []
+    for name, filter_string, order_by, num_pages in SEARCH_SHAPES:
+
+        def search():
+            num_results = 0
+            page_token = None
+            for _ in range(num_pages):
+                runs = store.search_runs(
+                    experiment_ids,
+                    filter_string,
+                    ViewType.ACTIVE_ONLY,
+                    max_results=max_results,
+                    order_by=order_by,
+                    page_token=page_token,
+                )
+                num_results += len(runs)
+                page_token = runs.token
+                if not page_token:
+                    break
+            return num_results
+
+        recorder.statements = []
+        recorder.enabled = True
+        num_results = search()
+        recorder.enabled = False
+        latencies = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            search()
+            latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+        result = {
+            "name": name,
+            "filter": filter_string,
+            "order_by": order_by,
+            "pages": num_pages,
+            "results": num_results,
+            "min_ms": latencies[0],
+            "median_ms": statistics.median(latencies),
+            "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+            "max_ms": latencies[-1],
+        }
+        if explain:
+            result["plans"] = [
+                {"statement": statement, "plan": _explain(store.engine, statement, parameters)}
+                for statement, parameters in recorder.statements
+            ]
+        results.append(result)
+    return results
+
+
+def _print_results(results):
+    click.echo(
+        "{:<26} {:>8} {:>10} {:>10} {:>10} {:>10}".format(
+            "search", "results", "min ms", "median ms", "p95 ms", "max ms"
+        )
+    )
+    for result in results:
+        click.echo(
+            "{name:<26} {results:>8} {min_ms:>10.2f} {median_ms:>10.2f} {p95_ms:>10.2f}"
+            " {max_ms:>10.2f}".format(**result)
+        )
+        for plan in result.get("plans", []):
+            click.echo("    " + " ".join(plan["statement"].split()))
+            for line in plan["plan"]:
+                click.echo("        " + line)
+
+
+@click.command()
+@click.option(
+    "--db-uri",
+    default=None,
+    help="SQLAlchemy URI of the tracking database to benchmark. Defaults to a new SQLite "
+    "database in a temporary directory.",
+)
+@click.option("--num-experiments", default=10, show_default=True)
+@click.option("--num-runs", default=10000, show_default=True)
+@click.option("--num-metrics", default=10, show_default=True, help="Metrics per run.")
+@click.option("--num-params", default=10, show_default=True, help="Params per run.")
+@click.option("--num-tags", default=5, show_default=True, help="Tags per run.")
+@click.option("--num-steps", default=5, show_default=True, help="Logged steps per metric.")
+@click.option("--no-seed", is_flag=True, help="Benchmark the existing data only.")
+@click.option(
+    "--experiment-ids",
+    default=None,
+    help="Comma-separated IDs of the experiments to search. Defaults to the seeded experiments.",
+)
+@click.option("--max-results", default=100, show_default=True, help="Page size of searches.")
+@click.option("--repeats", default=20, show_default=True, help="Timed repetitions per search.")
+@click.option("--explain", is_flag=True, help="Print the query plan of every statement.")
+@click.option("--output", default=None, help="Path of a JSON file to write the results to.")
+def main(
+    db_uri,
+    num_experiments,
+    num_runs,
+    num_metrics,
+    num_params,
+    num_tags,
+    num_steps,
+    no_seed,
+    experiment_ids,
+    max_results,
+    repeats,
+    explain,
+    output,
+):
+    tmp_dir = tempfile.mkdtemp()
+    if db_uri is None:
+        db_uri = "sqlite:///" + os.path.join(tmp_dir, "benchmark.db")
+    store = SqlAlchemyStore(db_uri, os.path.join(tmp_dir, "artifacts"))
+
+    if experiment_ids is not None:
+        experiment_ids = experiment_ids.split(",")
+    if not no_seed:
+        click.echo("Seeding {} runs into {}...".format(num_runs, db_uri))
+        start = time.perf_counter()
+        seeded_experiment_ids = seed_database(
+            store, num_experiments, num_runs, num_metrics, num_params, num_tags, num_steps
+        )
+        click.echo("Seeded database in {:.1f}s".format(time.perf_counter() - start))
+        experiment_ids = experiment_ids or seeded_experiment_ids
+    if not experiment_ids:
+        raise click.UsageError("--experiment-ids is required with --no-seed")
+
+    results = run_search_benchmark(store, experiment_ids, max_results, repeats, explain)
+    _print_results(results)
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(
+                {
+                    "dialect": store.engine.dialect.name,
+                    "num_runs": num_runs if not no_seed else None,
+                    "max_results": max_results,
+                    "repeats": repeats,
+                    "searches": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
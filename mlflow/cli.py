@@ -2,6 +2,7 @@ import json
 import os
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import click
 from click import UsageError
@@ -423,8 +424,14 @@ def server(
     " are not specified, data is removed for all runs in the `deleted`"
     " lifecycle stage.",
 )
+@click.option(
+    "--max-workers",
+    default=8,
+    type=click.IntRange(min=1),
+    help="Maximum number of runs whose artifacts are deleted concurrently.",
+)
 @experimental
-def gc(backend_store_uri, run_ids):
+def gc(backend_store_uri, run_ids, max_workers):
     """
     Permanently delete runs in the `deleted` lifecycle stage from the specified backend store.
     This command deletes all artifacts and metadata associated with the specified runs.
@@ -439,6 +446,7 @@ def gc(backend_store_uri, run_ids):
     else:
         run_ids = run_ids.split(",")
 
+    artifact_uris = {}
     for run_id in run_ids:
         run = backend_store.get_run(run_id)
         if run.info.lifecycle_stage != LifecycleStage.DELETED:
@@ -446,10 +454,35 @@ def gc(backend_store_uri, run_ids):
                 "Run {} is not in `deleted` lifecycle stage. Only runs in "
                 "`deleted` lifecycle stage can be deleted.".format(run_id)
             )
-        artifact_repo = get_artifact_repository(run.info.artifact_uri)
-        artifact_repo.delete_artifacts()
-        backend_store._hard_delete_run(run_id)
-        print("Run with ID %s has been permanently deleted." % str(run_id))
+        artifact_uris[run_id] = run.info.artifact_uri
+
+    def delete_run_artifacts(run_id):
+        get_artifact_repository(artifact_uris[run_id]).delete_artifacts()
+        return run_id
+
+    # Artifact deletion is I/O bound and dominates the cost of purging a run, so it is spread
+    # across a thread pool. Runs are hard-deleted from the backend store on this thread as soon
+    # as their artifacts are gone.
+    failed_run_ids = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(delete_run_artifacts, run_id): run_id for run_id in run_ids}
+        for num_done, future in enumerate(as_completed(futures), start=1):
+            run_id = futures[future]
+            try:
+                future.result()
+            except Exception as e:  # pylint: disable=broad-except
+                eprint("Failed to delete artifacts of run with ID %s: %s" % (run_id, e))
+                failed_run_ids.append(run_id)
+                continue
+            backend_store._hard_delete_run(run_id)
+            print(
+                "Run with ID %s has been permanently deleted (%d/%d)."
+                % (str(run_id), num_done, len(run_ids))
+            )
+    if failed_run_ids:
+        raise MlflowException(
+            "Failed to permanently delete runs with IDs: %s" % ", ".join(failed_run_ids)
+        )
 
 
 cli.add_command(mlflow.models.cli.commands)
@@ -3,6 +3,10 @@ import pprint
 
 
 class _MLflowObject(object):
+    # Subclasses that are created in large numbers, e.g. for every run of a search, declare
+    # ``__slots__`` to avoid the memory overhead of a per-instance ``__dict__``
+    __slots__ = ()
+
     def __iter__(self):
         # Iterate through list of properties and yield as key -> value
         for prop in self._properties():
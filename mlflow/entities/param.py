@@ -9,6 +9,8 @@ class Param(_MLflowObject):
     Parameter object.
     """
 
+    __slots__ = ("_key", "_value")
+
     def __init__(self, key, value):
         if "pyspark.ml" in sys.modules:
             import pyspark.ml.param
@@ -14,6 +14,19 @@ class RunData(_MLflowObject):
     Run data (metrics and parameters).
     """
 
+    # Run data converted from protobuf keeps the protobuf message, and the metrics, params and
+    # tags dictionaries are built on first access, so that run data which is only passed through
+    # (e.g. from a store to a REST response) is never expanded into entities
+    __slots__ = (
+        "_metric_list",
+        "_param_list",
+        "_tag_list",
+        "_metrics",
+        "_params",
+        "_tags",
+        "_proto",
+    )
+
     def __init__(self, metrics=None, params=None, tags=None):
         """
         Construct a new :py:class:`mlflow.entities.RunData` instance.
@@ -23,10 +36,30 @@ class RunData(_MLflowObject):
         """
         # Maintain the original list of metrics so that we can easily convert it back to
         # protobuf
-        self._metric_objs = metrics or []
-        self._metrics = {metric.key: metric.value for metric in self._metric_objs}
-        self._params = {param.key: param.value for param in (params or [])}
-        self._tags = {tag.key: tag.value for tag in (tags or [])}
+        self._metric_list = metrics or []
+        self._param_list = params or []
+        self._tag_list = tags or []
+        self._metrics = None
+        self._params = None
+        self._tags = None
+        self._proto = None
+
+    @classmethod
+    def _properties(cls):
+        return [p for p in cls._get_properties_helper() if not p.startswith("_")]
+
+    def _materialize(self):
+        if self._proto is not None:
+            proto = self._proto
+            self._proto = None
+            self._metric_list = [Metric.from_proto(metric) for metric in proto.metrics]
+            self._param_list = [Param.from_proto(param) for param in proto.params]
+            self._tag_list = [RunTag.from_proto(tag) for tag in proto.tags]
+
+    @property
+    def _metric_objs(self):
+        self._materialize()
+        return self._metric_list
 
     @property
     def metrics(self):
@@ -35,31 +68,45 @@ class RunData(_MLflowObject):
         For each metric key, the metric value with the latest timestamp is returned. In case there
         are multiple values with the same latest timestamp, the maximum of these values is returned.
         """
+        if self._metrics is None:
+            self._materialize()
+            self._metrics = {metric.key: metric.value for metric in self._metric_list}
         return self._metrics
 
     @property
     def params(self):
         """Dictionary of param key (string) -> param value for the current run."""
+        if self._params is None:
+            self._materialize()
+            self._params = {param.key: param.value for param in self._param_list}
+            self._param_list = None
         return self._params
 
     @property
     def tags(self):
         """Dictionary of tag key (string) -> tag value for the current run."""
+        if self._tags is None:
+            self._materialize()
+            self._tags = {tag.key: tag.value for tag in self._tag_list}
+            self._tag_list = None
         return self._tags
 
     def _add_metric(self, metric):
-        self._metrics[metric.key] = metric.value
-        self._metric_objs.append(metric)
+        self.metrics[metric.key] = metric.value
+        self._metric_list.append(metric)
 
     def _add_param(self, param):
-        self._params[param.key] = param.value
+        self.params[param.key] = param.value
 
     def _add_tag(self, tag):
-        self._tags[tag.key] = tag.value
+        self.tags[tag.key] = tag.value
 
     def to_proto(self):
         run_data = ProtoRunData()
-        run_data.metrics.extend([m.to_proto() for m in self._metric_objs])
+        if self._proto is not None:
+            run_data.CopyFrom(self._proto)
+            return run_data
+        run_data.metrics.extend([m.to_proto() for m in self._metric_list])
         run_data.params.extend([ProtoParam(key=key, value=val) for key, val in self.params.items()])
         run_data.tags.extend([ProtoRunTag(key=key, value=val) for key, val in self.tags.items()])
         return run_data
@@ -74,11 +121,6 @@ class RunData(_MLflowObject):
     @classmethod
     def from_proto(cls, proto):
         run_data = cls()
-        # iterate proto and add metrics, params, and tags
-        for proto_metric in proto.metrics:
-            run_data._add_metric(Metric.from_proto(proto_metric))
-        for proto_param in proto.params:
-            run_data._add_param(Param.from_proto(proto_param))
-        for proto_tag in proto.tags:
-            run_data._add_tag(RunTag.from_proto(proto_tag))
+        run_data._proto = ProtoRunData()
+        run_data._proto.CopyFrom(proto)
         return run_data
@@ -5,14 +5,15 @@ from mlflow.protos.service_pb2 import RunTag as ProtoRunTag
 class RunTag(_MLflowObject):
     """Tag object associated with a run."""
 
+    __slots__ = ("_key", "_value")
+
     def __init__(self, key, value):
         self._key = key
         self._value = value
 
     def __eq__(self, other):
         if type(other) is type(self):
-            # TODO deep equality here?
-            return self.__dict__ == other.__dict__
+            return self._key == other._key and self._value == other._value
         return False
 
     @property
@@ -5,6 +5,7 @@ from tabulate import tabulate
 
 from mlflow.data import is_uri
 from mlflow.entities import ViewType
+from mlflow.store.tracking import archive
 from mlflow.tracking import _get_store, fluent
 
 EXPERIMENT_ID = click.option("--experiment-id", "-x", type=click.STRING, required=True)
@@ -140,3 +141,53 @@ def generate_csv_with_runs(experiment_id, filename):
         )
     else:
         print(runs.to_csv(index=False))
+
+
+@commands.command("export")
+@click.option(
+    "--path",
+    "-o",
+    type=click.Path(file_okay=False),
+    required=True,
+    help="Path of the archive directory, created if it does not exist.",
+)
+@click.option(
+    "--experiment-id",
+    "-x",
+    "experiment_ids",
+    type=click.STRING,
+    multiple=True,
+    help="ID of an experiment to export. Can be repeated. All experiments are exported by "
+    "default.",
+)
+@click.option(
+    "--include-artifacts", is_flag=True, help="Also export the artifacts of the runs.",
+)
+def export_experiments(path, experiment_ids, include_artifacts):
+    """
+    Export experiments with all their runs, params, tags and metric histories to an archive
+    directory, which can be imported into another tracking server or backend store with the
+    ``import`` command.
+    """
+    store = _get_store()
+    archive.export_experiments(store, path, list(experiment_ids) or None, include_artifacts)
+    print("Experiments have been exported to %s." % path)
+
+
+@commands.command("import")
+@click.option(
+    "--path",
+    "-i",
+    type=click.Path(exists=True, file_okay=False),
+    required=True,
+    help="Path of an archive directory created by the ``export`` command.",
+)
+def import_experiments(path):
+    """
+    Import the experiments and runs of an archive directory created by the ``export`` command.
+    Runs are imported with new IDs into the existing active experiment with the same name if there
+    is one, and into a new experiment otherwise.
+    """
+    store = _get_store()
+    run_ids = archive.import_experiments(store, path)
+    print("Imported %d runs from %s." % (len(run_ids), path))
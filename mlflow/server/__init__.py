@@ -6,6 +6,7 @@ import textwrap
 from flask import Flask, send_from_directory, Response
 
 from mlflow.server import handlers
+from mlflow.server.compression import activate_compression
 from mlflow.server.handlers import (
     get_artifact_handler,
     STATIC_PREFIX_ENV_VAR,
@@ -19,6 +20,9 @@ from mlflow.utils.process import exec_cmd
 BACKEND_STORE_URI_ENV_VAR = "_MLFLOW_SERVER_FILE_STORE"
 ARTIFACT_ROOT_ENV_VAR = "_MLFLOW_SERVER_ARTIFACT_ROOT"
 PROMETHEUS_EXPORTER_ENV_VAR = "prometheus_multiproc_dir"
+# Opt-in tracing and profiling, see ``mlflow.server.tracing``
+TRACING_ENV_VAR = "MLFLOW_SERVER_TRACING"
+SLOW_REQUEST_THRESHOLD_ENV_VAR = "MLFLOW_SERVER_SLOW_REQUEST_THRESHOLD_MS"
 
 REL_STATIC_DIR = "js/build"
 
@@ -29,13 +33,7 @@ STATIC_DIR = os.path.join(app.root_path, REL_STATIC_DIR)
 for http_path, handler, methods in handlers.get_endpoints():
     app.add_url_rule(http_path, handler.__name__, handler, methods=methods)
 
-if os.getenv(PROMETHEUS_EXPORTER_ENV_VAR):
-    from mlflow.server.prometheus_exporter import activate_prometheus_exporter
-
-    prometheus_metrics_path = os.getenv(PROMETHEUS_EXPORTER_ENV_VAR)
-    if not os.path.exists(prometheus_metrics_path):
-        os.makedirs(prometheus_metrics_path)
-    activate_prometheus_exporter(app)
+activate_compression(app)
 
 
 # Provide a health check endpoint to ensure the application is responsive
@@ -87,6 +85,22 @@ def serve():
     return Response(text, mimetype="text/plain")
 
 
+# Activated after all the routes are registered, so that all of them are instrumented. Tracing
+# is imported only if enabled, so that it costs nothing otherwise
+if os.getenv(PROMETHEUS_EXPORTER_ENV_VAR):
+    from mlflow.server.prometheus_exporter import activate_prometheus_exporter
+
+    prometheus_metrics_path = os.getenv(PROMETHEUS_EXPORTER_ENV_VAR)
+    if not os.path.exists(prometheus_metrics_path):
+        os.makedirs(prometheus_metrics_path)
+    activate_prometheus_exporter(app)
+
+if os.getenv(TRACING_ENV_VAR) or os.getenv(SLOW_REQUEST_THRESHOLD_ENV_VAR):
+    from mlflow.server.tracing import activate_tracing
+
+    activate_tracing(app)
+
+
 def _build_waitress_command(waitress_opts, host, port):
     opts = shlex.split(waitress_opts) if waitress_opts else []
     return (
@@ -0,0 +1,92 @@
+"""
+Gzip compression of the bodies of tracking server requests and responses, negotiated with HTTP
+headers:
+
+- JSON and protobuf responses of at least ``MIN_COMPRESSED_SIZE`` bytes are gzip-compressed for
+  clients that send an ``Accept-Encoding: gzip`` request header, as the Python client does.
+- Requests with a ``Content-Encoding: gzip`` header are decompressed before they reach the
+  handlers. Every response advertises this with an ``Accept-Encoding: gzip`` response header
+  (RFC 7694), which the Python client uses to decide whether to compress large request bodies.
+"""
+import gzip
+import io
+import zlib
+
+from flask import request
+
+# Smaller bodies do not shrink enough to be worth the compression time
+MIN_COMPRESSED_SIZE = 1024
+# Upper bound of the size of decompressed request bodies, so that small compressed requests
+# cannot exhaust the memory of the server
+MAX_DECOMPRESSED_REQUEST_SIZE = 512 * 1024 * 1024
+_COMPRESSED_MIMETYPES = ["application/json", "application/x-protobuf"]
+# Fast compression: most of the size reduction of JSON comes from the lowest levels
+_COMPRESS_LEVEL = 1
+
+
+def _accepts_gzip(accept_encoding):
+    codings = [coding.split(";")[0].strip().lower() for coding in accept_encoding.split(",")]
+    return "gzip" in codings
+
+
+class GzipRequestMiddleware(object):
+    """
+    WSGI middleware that decompresses request bodies sent with ``Content-Encoding: gzip``.
+    Requests whose body is not valid gzip data, or decompresses to more than
+    ``MAX_DECOMPRESSED_REQUEST_SIZE`` bytes, are rejected with status code 400 or 413.
+    """
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        if environ.get("HTTP_CONTENT_ENCODING", "").strip().lower() != "gzip":
+            return self.wsgi_app(environ, start_response)
+        content_length = int(environ.get("CONTENT_LENGTH") or 0)
+        compressed = environ["wsgi.input"].read(content_length)
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            body = decompressor.decompress(compressed, MAX_DECOMPRESSED_REQUEST_SIZE)
+        except zlib.error:
+            return self._error(start_response, "400 Bad Request", "Invalid gzip request body")
+        if decompressor.unconsumed_tail:
+            return self._error(
+                start_response, "413 Request Entity Too Large", "Request body too large"
+            )
+        environ["wsgi.input"] = io.BytesIO(body)
+        environ["CONTENT_LENGTH"] = str(len(body))
+        del environ["HTTP_CONTENT_ENCODING"]
+        return self.wsgi_app(environ, start_response)
+
+    @staticmethod
+    def _error(start_response, status, message):
+        body = message.encode("utf-8")
+        start_response(status, [("Content-Type", "text/plain"), ("Content-Length", str(len(body)))])
+        return [body]
+
+
+def compress_response(response):
+    """
+    Flask ``after_request`` function that gzip-compresses large API responses for clients that
+    accept it, and advertises that gzip-compressed requests are accepted.
+    """
+    response.headers["Accept-Encoding"] = "gzip"
+    if (
+        response.mimetype in _COMPRESSED_MIMETYPES
+        and not response.direct_passthrough
+        and response.status_code < 300
+        and "Content-Encoding" not in response.headers
+        and _accepts_gzip(request.headers.get("Accept-Encoding", ""))
+    ):
+        data = response.get_data()
+        if len(data) >= MIN_COMPRESSED_SIZE:
+            response.set_data(gzip.compress(data, compresslevel=_COMPRESS_LEVEL))
+            response.headers["Content-Encoding"] = "gzip"
+            response.vary.add("Accept-Encoding")
+    return response
+
+
+def activate_compression(app):
+    app.wsgi_app = GzipRequestMiddleware(app.wsgi_app)
+    app.after_request(compress_response)
+    return app
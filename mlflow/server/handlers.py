@@ -6,11 +6,11 @@ import re
 import logging
 from functools import wraps
 
-from flask import Response, request, send_file
+from flask import Response, has_request_context, request, send_file
 from google.protobuf import descriptor
 from querystring_parser import parser
 
-from mlflow.entities import Metric, Param, RunTag, ViewType, ExperimentTag
+from mlflow.entities import Metric, Param, RunStatus, RunTag, ViewType, ExperimentTag
 from mlflow.entities.model_registry import RegisteredModelTag, ModelVersionTag
 from mlflow.exceptions import MlflowException
 from mlflow.models import Model
@@ -65,12 +65,14 @@ from mlflow.protos.model_registry_pb2 import (
     DeleteModelVersionTag,
 )
 from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST, INVALID_PARAMETER_VALUE
+from mlflow.server.response_cache import SEARCH_SCOPE, ResponseCache, compute_etag
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.db.db_types import DATABASE_ENGINES
+from mlflow.store.model_registry import REGISTRY_CHANGES_PATH
 from mlflow.tracking._model_registry.registry import ModelRegistryStoreRegistry
 from mlflow.tracking._tracking_service.registry import TrackingStoreRegistry
-from mlflow.utils.proto_json_utils import message_to_json, parse_dict
-from mlflow.utils.validation import _validate_batch_log_api_req
+from mlflow.utils.proto_json_utils import message_to_compact_json, parse_dict
+from mlflow.utils.validation import _validate_batch_log_api_req, _validate_batch_log_limits
 from mlflow.utils.string_utils import is_string_type
 from mlflow.tracking.registry import UnsupportedModelRegistryStoreURIException
 
@@ -78,6 +80,23 @@ _logger = logging.getLogger(__name__)
 _tracking_store = None
 _model_registry_store = None
 STATIC_PREFIX_ENV_VAR = "_MLFLOW_STATIC_PREFIX"
+JSON_CONTENT_TYPE = "application/json"
+PROTOBUF_CONTENT_TYPE = "application/x-protobuf"
+# Maximum number of responses of read-only tracking endpoints cached by each server process. The
+# response cache is disabled by default
+RESPONSE_CACHE_SIZE_ENV_VAR = "MLFLOW_SERVER_RESPONSE_CACHE_SIZE"
+# Time to live in seconds of cached responses, which bounds how long writes handled by other
+# server processes or made directly to the backend store can go unnoticed
+RESPONSE_CACHE_TTL_ENV_VAR = "MLFLOW_SERVER_RESPONSE_CACHE_TTL"
+# Time to live in seconds of the cached responses of terminated runs, which default to the time to
+# live of other responses. Terminated runs can still be updated, e.g. by tagging or deleting them,
+# and the updates handled by other server processes are only noticed once the cached responses of
+# the run expire, so only set a longer time to live if such stale responses are acceptable
+TERMINATED_RUN_CACHE_TTL_ENV_VAR = "MLFLOW_SERVER_TERMINATED_RUN_CACHE_TTL"
+_DEFAULT_RESPONSE_CACHE_TTL = 10
+_EXPERIMENTS_SCOPE = "experiments"
+_response_cache = None
+_metric_write_buffer = None
 
 
 class TrackingStoreRegistryWrapper(TrackingStoreRegistry):
@@ -179,6 +198,10 @@ def _get_request_message(request_message, flask_request=request):
         parse_dict(request_dict, request_message)
         return request_message
 
+    if flask_request.mimetype == PROTOBUF_CONTENT_TYPE:
+        request_message.ParseFromString(flask_request.get_data())
+        return request_message
+
     request_json = _get_request_json(flask_request)
 
     # Older clients may post their JSON double-encoded as strings, so the get_json
@@ -195,6 +218,133 @@ def _get_request_message(request_message, flask_request=request):
     return request_message
 
 
+def _accepts_protobuf(flask_request=request):
+    """
+    Whether the client prefers binary protobuf responses, as requested with an ``Accept`` header
+    such as ``application/x-protobuf, application/json;q=0.9``. Clients that accept any content
+    type, like browsers and older MLflow clients, get JSON.
+    """
+    if not has_request_context():
+        return False
+    best_match = flask_request.accept_mimetypes.best_match(
+        [JSON_CONTENT_TYPE, PROTOBUF_CONTENT_TYPE], default=JSON_CONTENT_TYPE
+    )
+    return best_match == PROTOBUF_CONTENT_TYPE
+
+
+def _wrap_response(response_message):
+    if _accepts_protobuf():
+        response = Response(mimetype=PROTOBUF_CONTENT_TYPE)
+        response.set_data(response_message.SerializeToString())
+    else:
+        response = Response(mimetype=JSON_CONTENT_TYPE)
+        response.set_data(message_to_compact_json(response_message))
+    response.vary.add("Accept")
+    return response
+
+
+def _get_response_cache():
+    global _response_cache
+    if _response_cache is None:
+        max_entries = int(os.environ.get(RESPONSE_CACHE_SIZE_ENV_VAR, 0))
+        if max_entries > 0:
+            ttl = float(os.environ.get(RESPONSE_CACHE_TTL_ENV_VAR, _DEFAULT_RESPONSE_CACHE_TTL))
+            _response_cache = ResponseCache(max_entries, ttl)
+    return _response_cache
+
+
+def _invalidate_cached_responses(run_id=None):
+    """
+    Invalidate the cached responses affected by a write to the run ``run_id``, or all cached
+    responses if ``run_id`` is None.
+    """
+    response_cache = _get_response_cache()
+    if response_cache is None:
+        return
+    if run_id is None:
+        response_cache.clear()
+    else:
+        response_cache.invalidate(run_id)
+
+
+def _get_metric_write_buffer():
+    global _metric_write_buffer
+    if _metric_write_buffer is None:
+        from mlflow.server import metric_buffer
+
+        acknowledge = os.environ.get(metric_buffer.METRIC_BUFFER_ENV_VAR)
+        if acknowledge:
+            flush_interval = os.environ.get(
+                metric_buffer.METRIC_FLUSH_INTERVAL_ENV_VAR,
+                metric_buffer._DEFAULT_FLUSH_INTERVAL_MS,
+            )
+            max_size = os.environ.get(
+                metric_buffer.METRIC_BUFFER_MAX_SIZE_ENV_VAR, metric_buffer._DEFAULT_MAX_SIZE
+            )
+            write_timeout = os.environ.get(
+                metric_buffer.METRIC_BUFFER_WRITE_TIMEOUT_ENV_VAR,
+                metric_buffer._DEFAULT_WRITE_TIMEOUT,
+            )
+            _metric_write_buffer = metric_buffer.MetricWriteBuffer(
+                # Looked up on each flush, so that the store can be wrapped after the buffer is
+                # created, e.g. by tracing
+                get_store=lambda: _get_tracking_store(),  # pylint: disable=unnecessary-lambda
+                acknowledge=acknowledge,
+                flush_interval=float(flush_interval) / 1000,
+                max_size=int(max_size),
+                on_flush=_invalidate_cached_responses,
+                write_timeout=float(write_timeout),
+            )
+    return _metric_write_buffer
+
+
+def _cached_response(scope, get_response_message, get_ttl=None):
+    """
+    Build the response of a read-only handler, using the response cache if it is enabled.
+    Responses carry a weak ETag, and GET requests whose ``If-None-Match`` header matches it get
+    an empty 304 response.
+
+    :param scope: Scope of the response in the cache, e.g. the ID of the run it describes.
+    :param get_response_message: Function computing the response protobuf message.
+    :param get_ttl: Optional function returning the time to live in the cache of a response
+                    message, or None for the default time to live.
+    """
+    if not has_request_context():
+        return _wrap_response(get_response_message())
+    response_cache = _get_response_cache()
+    if response_cache is None:
+        response = _wrap_response(get_response_message())
+        etag = compute_etag(response.get_data())
+    else:
+        key = (
+            request.path,
+            request.method,
+            request.query_string,
+            request.get_data(),
+            _accepts_protobuf(),
+        )
+        entry = response_cache.get(key)
+        if entry is None:
+            generation = response_cache.generation()
+            response_message = get_response_message()
+            response = _wrap_response(response_message)
+            ttl = get_ttl(response_message) if get_ttl is not None else None
+            entry = response_cache.put(
+                key, scope, generation, response.get_data(), response.mimetype, ttl
+            )
+        else:
+            response = Response(entry.data, mimetype=entry.mimetype)
+            response.vary.add("Accept")
+        etag = entry.etag
+    response.set_etag(etag, weak=True)
+    # Clients must revalidate the response before reusing it
+    response.headers["Cache-Control"] = "no-cache"
+    if request.method in ("GET", "HEAD") and request.if_none_match.contains_weak(etag):
+        response.set_data(b"")
+        response.status_code = 304
+    return response
+
+
 def _send_artifact(artifact_repository, path):
     filename = os.path.abspath(artifact_repository.download_artifacts(path))
     extension = os.path.splitext(filename)[-1].replace(".", "")
@@ -258,11 +408,10 @@ def _create_experiment():
     experiment_id = _get_tracking_store().create_experiment(
         request_message.name, request_message.artifact_location
     )
+    _invalidate_cached_responses()
     response_message = CreateExperiment.Response()
     response_message.experiment_id = experiment_id
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -271,9 +420,7 @@ def _get_experiment():
     response_message = GetExperiment.Response()
     experiment = _get_tracking_store().get_experiment(request_message.experiment_id).to_proto()
     response_message.experiment.MergeFrom(experiment)
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -288,29 +435,25 @@ def _get_experiment_by_name():
         )
     experiment = store_exp.to_proto()
     response_message.experiment.MergeFrom(experiment)
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
 def _delete_experiment():
     request_message = _get_request_message(DeleteExperiment())
     _get_tracking_store().delete_experiment(request_message.experiment_id)
+    _invalidate_cached_responses()
     response_message = DeleteExperiment.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
 def _restore_experiment():
     request_message = _get_request_message(RestoreExperiment())
     _get_tracking_store().restore_experiment(request_message.experiment_id)
+    _invalidate_cached_responses()
     response_message = RestoreExperiment.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -320,10 +463,9 @@ def _update_experiment():
         _get_tracking_store().rename_experiment(
             request_message.experiment_id, request_message.new_name
         )
+        _invalidate_cached_responses()
     response_message = UpdateExperiment.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -337,12 +479,11 @@ def _create_run():
         start_time=request_message.start_time,
         tags=tags,
     )
+    _invalidate_cached_responses(run.info.run_id)
 
     response_message = CreateRun.Response()
     response_message.run.MergeFrom(run.to_proto())
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -352,30 +493,27 @@ def _update_run():
     updated_info = _get_tracking_store().update_run_info(
         run_id, request_message.status, request_message.end_time
     )
+    _invalidate_cached_responses(run_id)
     response_message = UpdateRun.Response(run_info=updated_info.to_proto())
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
 def _delete_run():
     request_message = _get_request_message(DeleteRun())
     _get_tracking_store().delete_run(request_message.run_id)
+    _invalidate_cached_responses(request_message.run_id)
     response_message = DeleteRun.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
 def _restore_run():
     request_message = _get_request_message(RestoreRun())
     _get_tracking_store().restore_run(request_message.run_id)
+    _invalidate_cached_responses(request_message.run_id)
     response_message = RestoreRun.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -385,11 +523,14 @@ def _log_metric():
         request_message.key, request_message.value, request_message.timestamp, request_message.step
     )
     run_id = request_message.run_id or request_message.run_uuid
-    _get_tracking_store().log_metric(run_id, metric)
+    metric_write_buffer = _get_metric_write_buffer()
+    if metric_write_buffer is not None:
+        metric_write_buffer.log_metric(run_id, metric)
+    else:
+        _get_tracking_store().log_metric(run_id, metric)
+        _invalidate_cached_responses(run_id)
     response_message = LogMetric.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -398,10 +539,9 @@ def _log_param():
     param = Param(request_message.key, request_message.value)
     run_id = request_message.run_id or request_message.run_uuid
     _get_tracking_store().log_param(run_id, param)
+    _invalidate_cached_responses(run_id)
     response_message = LogParam.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -409,10 +549,9 @@ def _set_experiment_tag():
     request_message = _get_request_message(SetExperimentTag())
     tag = ExperimentTag(request_message.key, request_message.value)
     _get_tracking_store().set_experiment_tag(request_message.experiment_id, tag)
+    _invalidate_cached_responses()
     response_message = SetExperimentTag.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -421,37 +560,43 @@ def _set_tag():
     tag = RunTag(request_message.key, request_message.value)
     run_id = request_message.run_id or request_message.run_uuid
     _get_tracking_store().set_tag(run_id, tag)
+    _invalidate_cached_responses(run_id)
     response_message = SetTag.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
 def _delete_tag():
     request_message = _get_request_message(DeleteTag())
     _get_tracking_store().delete_tag(request_message.run_id, request_message.key)
+    _invalidate_cached_responses(request_message.run_id)
     response_message = DeleteTag.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
 def _get_run():
     request_message = _get_request_message(GetRun())
-    response_message = GetRun.Response()
     run_id = request_message.run_id or request_message.run_uuid
-    response_message.run.MergeFrom(_get_tracking_store().get_run(run_id).to_proto())
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+
+    def get_response_message():
+        response_message = GetRun.Response()
+        response_message.run.MergeFrom(_get_tracking_store().get_run(run_id).to_proto())
+        return response_message
+
+    return _cached_response(run_id, get_response_message, _get_run_response_ttl)
+
+
+def _get_run_response_ttl(response_message):
+    terminated_run_ttl = os.environ.get(TERMINATED_RUN_CACHE_TTL_ENV_VAR)
+    if terminated_run_ttl and RunStatus.is_terminated(response_message.run.info.status):
+        return float(terminated_run_ttl)
+    return None
 
 
 @catch_mlflow_exception
 def _search_runs():
     request_message = _get_request_message(SearchRuns())
-    response_message = SearchRuns.Response()
     run_view_type = ViewType.ACTIVE_ONLY
     if request_message.HasField("run_view_type"):
         run_view_type = ViewType.from_proto(request_message.run_view_type)
@@ -460,15 +605,18 @@ def _search_runs():
     experiment_ids = request_message.experiment_ids
     order_by = request_message.order_by
     page_token = request_message.page_token
-    run_entities = _get_tracking_store().search_runs(
-        experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
-    )
-    response_message.runs.extend([r.to_proto() for r in run_entities])
-    if run_entities.token:
-        response_message.next_page_token = run_entities.token
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+
+    def get_response_message():
+        response_message = SearchRuns.Response()
+        run_entities = _get_tracking_store().search_runs(
+            experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+        )
+        response_message.runs.extend([r.to_proto() for r in run_entities])
+        if run_entities.token:
+            response_message.next_page_token = run_entities.token
+        return response_message
+
+    return _cached_response(SEARCH_SCOPE, get_response_message)
 
 
 @catch_mlflow_exception
@@ -484,32 +632,36 @@ def _list_artifacts():
     artifact_entities = _get_artifact_repo(run).list_artifacts(path)
     response_message.files.extend([a.to_proto() for a in artifact_entities])
     response_message.root_uri = _get_artifact_repo(run).artifact_uri
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
 def _get_metric_history():
     request_message = _get_request_message(GetMetricHistory())
-    response_message = GetMetricHistory.Response()
     run_id = request_message.run_id or request_message.run_uuid
-    metric_entites = _get_tracking_store().get_metric_history(run_id, request_message.metric_key)
-    response_message.metrics.extend([m.to_proto() for m in metric_entites])
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+
+    def get_response_message():
+        response_message = GetMetricHistory.Response()
+        metric_entites = _get_tracking_store().get_metric_history(
+            run_id, request_message.metric_key
+        )
+        response_message.metrics.extend([m.to_proto() for m in metric_entites])
+        return response_message
+
+    return _cached_response(run_id, get_response_message)
 
 
 @catch_mlflow_exception
 def _list_experiments():
     request_message = _get_request_message(ListExperiments())
-    experiment_entities = _get_tracking_store().list_experiments(request_message.view_type)
-    response_message = ListExperiments.Response()
-    response_message.experiments.extend([e.to_proto() for e in experiment_entities])
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+
+    def get_response_message():
+        experiment_entities = _get_tracking_store().list_experiments(request_message.view_type)
+        response_message = ListExperiments.Response()
+        response_message.experiments.extend([e.to_proto() for e in experiment_entities])
+        return response_message
+
+    return _cached_response(_EXPERIMENTS_SCOPE, get_response_message)
 
 
 @catch_mlflow_exception
@@ -519,18 +671,24 @@ def _get_artifact_repo(run):
 
 @catch_mlflow_exception
 def _log_batch():
-    _validate_batch_log_api_req(_get_request_json())
+    if has_request_context() and request.mimetype == PROTOBUF_CONTENT_TYPE:
+        # Binary protobuf requests are not JSON, the size of their body is validated instead
+        _validate_batch_log_api_req(request.get_data())
+    else:
+        request_json = _get_request_json()
+        if request_json is not None:
+            _validate_batch_log_api_req(request_json)
     request_message = _get_request_message(LogBatch())
     metrics = [Metric.from_proto(proto_metric) for proto_metric in request_message.metrics]
     params = [Param.from_proto(proto_param) for proto_param in request_message.params]
     tags = [RunTag.from_proto(proto_tag) for proto_tag in request_message.tags]
+    _validate_batch_log_limits(metrics, params, tags)
     _get_tracking_store().log_batch(
         run_id=request_message.run_id, metrics=metrics, params=params, tags=tags
     )
+    _invalidate_cached_responses(request_message.run_id)
     response_message = LogBatch.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -557,16 +715,9 @@ def _log_model():
     _get_tracking_store().record_logged_model(
         run_id=request_message.run_id, mlflow_model=Model.from_dict(model)
     )
+    _invalidate_cached_responses(request_message.run_id)
     response_message = LogModel.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
-
-
-def _wrap_response(response_message):
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -762,9 +913,16 @@ def _get_model_version_download_uri():
 @catch_mlflow_exception
 def _search_model_versions():
     request_message = _get_request_message(SearchModelVersions())
-    model_versions = _get_model_registry_store().search_model_versions(request_message.filter)
+    model_versions = _get_model_registry_store().search_model_versions(
+        filter_string=request_message.filter,
+        max_results=request_message.max_results,
+        order_by=request_message.order_by,
+        page_token=request_message.page_token,
+    )
     response_message = SearchModelVersions.Response()
     response_message.model_versions.extend([e.to_proto() for e in model_versions])
+    if model_versions.token:
+        response_message.next_page_token = model_versions.token
     return _wrap_response(response_message)
 
 
@@ -787,6 +945,27 @@ def _delete_model_version_tag():
     return _wrap_response(DeleteModelVersionTag.Response())
 
 
+@catch_mlflow_exception
+def _get_registry_changes():
+    args = {}
+    for arg in ["since_revision", "timeout"]:
+        try:
+            args[arg] = int(request.args[arg]) if arg in request.args else None
+        except ValueError:
+            raise MlflowException(
+                "Invalid value for request parameter {}: '{}'. It must be an integer.".format(
+                    arg, request.args[arg]
+                ),
+                INVALID_PARAMETER_VALUE,
+            )
+    revision, names = _get_model_registry_store().get_registry_changes(
+        since_revision=args["since_revision"], timeout=args["timeout"] or 0
+    )
+    response = Response(mimetype="application/json")
+    response.set_data(json.dumps({"revision": revision, "registered_model_names": names}))
+    return response
+
+
 def _add_static_prefix(route):
     prefix = os.environ.get(STATIC_PREFIX_ENV_VAR)
     if prefix:
@@ -826,7 +1005,15 @@ def get_endpoints():
                     ret.append((http_path, handler, [endpoint.method]))
         return ret
 
-    return get_service_endpoints(MlflowService) + get_service_endpoints(ModelRegistryService)
+    registry_changes_endpoints = [
+        (http_path, _get_registry_changes, ["GET"])
+        for http_path in _get_paths(REGISTRY_CHANGES_PATH)
+    ]
+    return (
+        get_service_endpoints(MlflowService)
+        + get_service_endpoints(ModelRegistryService)
+        + registry_changes_endpoints
+    )
 
 
 HANDLERS = {
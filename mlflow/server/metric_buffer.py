@@ -0,0 +1,258 @@
+"""
+Write coalescing of the metrics logged with the ``LogMetric`` API of the tracking server.
+
+Setting the ``MLFLOW_SERVER_METRIC_BUFFER`` environment variable makes the ``LogMetric``
+handler add metrics to an in-process buffer instead of writing each of them to the tracking store
+in its own transaction. A background thread flushes the buffer every
+``MLFLOW_SERVER_METRIC_FLUSH_INTERVAL_MS`` milliseconds (100 by default), with one ``log_batch``
+call per run. The value of ``MLFLOW_SERVER_METRIC_BUFFER`` sets the durability of the writes:
+
+- ``flush``: requests are answered once their metric is written to the store, and get the error
+  of the store if the write fails.
+- ``enqueue``: requests are answered as soon as their metric is buffered. Metrics may not be
+  readable immediately, and errors of the store, e.g. for runs that do not exist, are logged
+  instead of being returned. Buffered metrics are lost if the server process is killed.
+
+At most ``MLFLOW_SERVER_METRIC_BUFFER_MAX_SIZE`` metrics (10000 by default) are buffered: further
+requests wait for the next flush, which starts immediately. In ``flush`` mode, requests fail with
+a ``TEMPORARILY_UNAVAILABLE`` error if their metric is not written within
+``MLFLOW_SERVER_METRIC_BUFFER_WRITE_TIMEOUT`` seconds (60 by default).
+
+Buffers are per server process, so only the requests handled concurrently by the threads of a
+process are coalesced. In ``flush`` mode, the server must run threaded workers, e.g. with
+``mlflow server --gunicorn-opts "--threads 8"``: a synchronous gunicorn worker handles one request
+at a time, so each request would wait for the flush interval without being merged with others.
+``enqueue`` mode coalesces the metrics of consecutive requests with any kind of worker.
+"""
+import atexit
+import collections
+import logging
+import threading
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, TEMPORARILY_UNAVAILABLE
+from mlflow.utils.validation import MAX_METRICS_PER_BATCH, _validate_metric
+
+METRIC_BUFFER_ENV_VAR = "MLFLOW_SERVER_METRIC_BUFFER"
+METRIC_FLUSH_INTERVAL_ENV_VAR = "MLFLOW_SERVER_METRIC_FLUSH_INTERVAL_MS"
+METRIC_BUFFER_MAX_SIZE_ENV_VAR = "MLFLOW_SERVER_METRIC_BUFFER_MAX_SIZE"
+METRIC_BUFFER_WRITE_TIMEOUT_ENV_VAR = "MLFLOW_SERVER_METRIC_BUFFER_WRITE_TIMEOUT"
+ACKNOWLEDGE_AFTER_FLUSH = "flush"
+ACKNOWLEDGE_AFTER_ENQUEUE = "enqueue"
+_DEFAULT_FLUSH_INTERVAL_MS = 100
+_DEFAULT_MAX_SIZE = 10000
+_DEFAULT_WRITE_TIMEOUT = 60
+
+_logger = logging.getLogger(__name__)
+
+# Exposed by the Prometheus exporter of the server if it is enabled
+QUEUE_DEPTH = Gauge(
+    "mlflow_metric_buffer_queue_depth",
+    "Number of metrics waiting in the buffer to be written to the tracking store",
+    multiprocess_mode="livesum",
+    registry=None,
+)
+FLUSH_DURATION = Histogram(
+    "mlflow_metric_buffer_flush_duration_seconds",
+    "Duration of the flushes of the metric buffer to the tracking store",
+    registry=None,
+)
+FLUSHED_METRICS = Counter(
+    "mlflow_metric_buffer_flushed_metrics_total",
+    "Number of metrics flushed from the buffer, by result",
+    ["result"],
+    registry=None,
+)
+
+
+class _PendingWrite(object):
+    """
+    Result of the write of a buffered metric, awaited by requests that are acknowledged after the
+    flush.
+    """
+
+    __slots__ = ("_done", "exception")
+
+    def __init__(self):
+        self._done = threading.Event()
+        self.exception = None
+
+    def done(self):
+        return self._done.is_set()
+
+    def set_result(self, exception=None):
+        self.exception = exception
+        self._done.set()
+
+    def wait(self, timeout):
+        if not self._done.wait(timeout):
+            raise MlflowException(
+                "The metric was not written to the tracking store within %s seconds" % timeout,
+                error_code=TEMPORARILY_UNAVAILABLE,
+            )
+        if self.exception is not None:
+            raise self.exception
+
+
+class MetricWriteBuffer(object):
+    """
+    Buffer of metrics, flushed to a tracking store in batches per run by a daemon thread.
+
+    :param get_store: Function returning the tracking store.
+    :param acknowledge: ``ACKNOWLEDGE_AFTER_FLUSH`` to make :py:meth:`log_metric` wait for the
+                        write of the metric, or ``ACKNOWLEDGE_AFTER_ENQUEUE``.
+    :param flush_interval: Interval between flushes, in seconds.
+    :param max_size: Maximum number of buffered metrics.
+    :param on_flush: Optional function called with the ID of each run whose metrics are flushed.
+    :param write_timeout: Maximum time in seconds that :py:meth:`log_metric` waits for the write
+                          of the metric when acknowledging writes after the flush.
+    """
+
+    def __init__(
+        self,
+        get_store,
+        acknowledge=ACKNOWLEDGE_AFTER_FLUSH,
+        flush_interval=_DEFAULT_FLUSH_INTERVAL_MS / 1000,
+        max_size=_DEFAULT_MAX_SIZE,
+        on_flush=None,
+        write_timeout=_DEFAULT_WRITE_TIMEOUT,
+    ):
+        if acknowledge not in (ACKNOWLEDGE_AFTER_FLUSH, ACKNOWLEDGE_AFTER_ENQUEUE):
+            raise MlflowException(
+                "Invalid metric buffer acknowledgement mode '%s'. Supported modes: '%s', '%s'"
+                % (acknowledge, ACKNOWLEDGE_AFTER_FLUSH, ACKNOWLEDGE_AFTER_ENQUEUE),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        self.get_store = get_store
+        self.acknowledge = acknowledge
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+        self.on_flush = on_flush
+        self.write_timeout = write_timeout
+        # Run ID -> list of (metric, pending write or None), in order of arrival
+        self._pending = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._flush_requested = threading.Condition(self._lock)
+        # Flushes are serialized, so that the metrics of a run are written in order of arrival
+        self._flush_lock = threading.Lock()
+        self._flusher = None
+
+    def __len__(self):
+        return self._size
+
+    def _ensure_flusher_started(self):
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._run_flusher, name="mlflow-metric-flush")
+            self._flusher.daemon = True
+            self._flusher.start()
+            atexit.register(self.flush)
+
+    def _run_flusher(self):
+        while True:
+            with self._lock:
+                if self._size < self.max_size:
+                    self._flush_requested.wait(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except
+                _logger.exception("Failed to flush the metric buffer")
+
+    def log_metric(self, run_id, metric):
+        """
+        Buffer a metric of a run. Returns once the metric is written if the buffer acknowledges
+        writes after the flush, and raises the exception of the store if the write fails.
+        """
+        # Invalid metrics are rejected immediately, so that they are never acknowledged
+        _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
+        pending_write = _PendingWrite() if self.acknowledge == ACKNOWLEDGE_AFTER_FLUSH else None
+        with self._lock:
+            self._ensure_flusher_started()
+            while self._size >= self.max_size:
+                self._flush_requested.notify()
+                self._not_full.wait()
+            self._pending.setdefault(run_id, []).append((metric, pending_write))
+            self._size += 1
+            QUEUE_DEPTH.inc()
+            if self._size >= self.max_size:
+                self._flush_requested.notify()
+        if pending_write is not None:
+            pending_write.wait(self.write_timeout)
+
+    def flush(self):
+        """
+        Write all buffered metrics to the store, with one ``log_batch`` call per run and per
+        ``MAX_METRICS_PER_BATCH`` metrics.
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, collections.OrderedDict()
+                size, self._size = self._size, 0
+                self._not_full.notify_all()
+            if not pending:
+                return
+            QUEUE_DEPTH.dec(size)
+            start_time = time.time()
+            error = None
+            try:
+                store = self.get_store()
+                for run_id, writes in pending.items():
+                    for start in range(0, len(writes), MAX_METRICS_PER_BATCH):
+                        self._write_batch(
+                            store, run_id, writes[start : start + MAX_METRICS_PER_BATCH]
+                        )
+                    if self.on_flush is not None:
+                        self.on_flush(run_id)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                FLUSH_DURATION.observe(time.time() - start_time)
+                # Requests waiting for metrics that were not written must not wait forever
+                self._fail_pending_writes(pending, error)
+
+    @staticmethod
+    def _fail_pending_writes(pending, error):
+        for writes in pending.values():
+            for metric, pending_write in writes:
+                if pending_write is not None and not pending_write.done():
+                    pending_write.set_result(
+                        error
+                        or MlflowException(
+                            "Failed to flush metric '%s' to the tracking store" % metric.key
+                        )
+                    )
+
+    def _write_batch(self, store, run_id, writes):
+        try:
+            store.log_batch(run_id, metrics=[metric for metric, _ in writes], params=[], tags=[])
+        except Exception:  # pylint: disable=broad-except
+            # Write the metrics one by one, so that only the requests of the metrics that cannot
+            # be written get an error
+            for metric, pending_write in writes:
+                try:
+                    store.log_metric(run_id, metric)
+                except Exception as e:  # pylint: disable=broad-except
+                    FLUSHED_METRICS.labels(result="error").inc()
+                    if pending_write is not None:
+                        pending_write.set_result(e)
+                    else:
+                        _logger.error(
+                            "Failed to write buffered metric '%s' of run '%s': %s",
+                            metric.key,
+                            run_id,
+                            e,
+                        )
+                else:
+                    FLUSHED_METRICS.labels(result="success").inc()
+                    if pending_write is not None:
+                        pending_write.set_result()
+            return
+        FLUSHED_METRICS.labels(result="success").inc(len(writes))
+        for _, pending_write in writes:
+            if pending_write is not None:
+                pending_write.set_result()
@@ -1,32 +1,161 @@
-from prometheus_flask_exporter.multiprocess import GunicornInternalPrometheusMetrics
-from flask import request
-
-
-def activate_prometheus_exporter(app):
-    metrics = GunicornInternalPrometheusMetrics(app, export_defaults=False)
-
-    endpoint = app.view_functions
-    histogram = metrics.histogram(
-        "mlflow_requests_by_status_and_path",
-        "Request latencies and count by status and path",
-        labels={
-            "status": lambda r: r.status_code,
-            "path": lambda: change_path_for_metric(request.path),
-        },
-    )
-    for func_name, func in endpoint.items():
-        if func_name in ["_search_runs", "_log_metric", "_log_param", "_set_tag", "_create_run"]:
-            app.view_functions[func_name] = histogram(func)
-
-    return app
-
-
-def change_path_for_metric(path):
-    """
-    Replace the '/' in the metric path by '_' so grafana can correctly use it.
-    :param path: path of the metric (example: runs/search)
-    :return: path with '_' instead of '/'
-    """
-    if "mlflow/" in path:
-        path = path.split("mlflow/")[-1]
-    return path.replace("/", "_")
+import time
+
+from prometheus_client import Counter, Histogram
+from prometheus_flask_exporter.multiprocess import GunicornInternalPrometheusMetrics
+from flask import request
+
+from mlflow.server.handlers import HANDLERS, _get_registry_changes
+
+# Views serving artifact files, registered in ``mlflow.server``
+_ARTIFACT_VIEW_FUNCTIONS = ["serve_artifacts", "serve_model_version_artifact"]
+
+_INSTRUMENTED_VIEW_FUNCTIONS = set(
+    [handler.__name__ for handler in HANDLERS.values()]
+    + [_get_registry_changes.__name__]
+    + _ARTIFACT_VIEW_FUNCTIONS
+)
+
+# Buckets of the payload size histograms, in bytes, from 100 bytes to 1 GB
+_SIZE_BUCKETS = (1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8, 1e9, float("inf"))
+
+# The metrics below are not registered with the default registry: in multiprocess mode, their
+# values are collected from the files of all server processes by the registry of the exporter
+REQUEST_SIZE = Histogram(
+    "mlflow_request_size_bytes",
+    "Size of request bodies by method and path",
+    ["method", "path"],
+    buckets=_SIZE_BUCKETS,
+    registry=None,
+)
+RESPONSE_SIZE = Histogram(
+    "mlflow_response_size_bytes",
+    "Size of response bodies, including served artifact files, by method, status and path",
+    ["method", "status", "path"],
+    buckets=_SIZE_BUCKETS,
+    registry=None,
+)
+SQL_QUERY_DURATION = Histogram(
+    "mlflow_sqlalchemy_query_duration_seconds",
+    "Duration of SQL statements executed by SQLAlchemy stores, by statement type",
+    ["statement"],
+    registry=None,
+)
+SQL_SESSIONS = Counter(
+    "mlflow_sqlalchemy_sessions_total",
+    "Number of SQLAlchemy store sessions that started a database transaction",
+    registry=None,
+)
+SQL_ROWS_LOADED = Counter(
+    "mlflow_sqlalchemy_rows_loaded_total",
+    "Number of rows loaded as objects by SQLAlchemy store queries, by table",
+    ["table"],
+    registry=None,
+)
+
+
+def activate_prometheus_exporter(app):
+    """
+    Expose Prometheus metrics of the tracking server on the ``/metrics`` endpoint of ``app``:
+
+    - the latency of the requests to every REST API handler and artifact download endpoint, by
+      status and path;
+    - the size of request and response bodies, by method, status and path;
+    - the duration of the SQL statements of SQLAlchemy stores, the number of their sessions and
+      of the rows their queries load.
+
+    Must be called after all the routes of ``app`` are registered.
+    """
+    metrics = GunicornInternalPrometheusMetrics(app, export_defaults=False)
+
+    endpoint = app.view_functions
+    histogram = metrics.histogram(
+        "mlflow_requests_by_status_and_path",
+        "Request latencies and count by status and path",
+        labels={
+            "status": lambda r: r.status_code,
+            "path": lambda: change_path_for_metric(request.path),
+        },
+    )
+    for func_name, func in endpoint.items():
+        if func_name in _INSTRUMENTED_VIEW_FUNCTIONS:
+            app.view_functions[func_name] = histogram(func)
+
+    app.after_request(_observe_payload_sizes)
+    _instrument_sqlalchemy()
+    return app
+
+
+def _observe_payload_sizes(response):
+    if request.endpoint not in _INSTRUMENTED_VIEW_FUNCTIONS:
+        return response
+    path = change_path_for_metric(request.path)
+    REQUEST_SIZE.labels(method=request.method, path=path).observe(request.content_length or 0)
+    # Artifact files are streamed, and their size is only known from the Content-Length header
+    response_size = response.content_length
+    if response_size is None and not response.direct_passthrough:
+        response_size = len(response.get_data())
+    if response_size is not None:
+        RESPONSE_SIZE.labels(method=request.method, status=response.status_code, path=path).observe(
+            response_size
+        )
+    return response
+
+
+def _get_statement_type(statement):
+    words = statement.split(None, 1)
+    keyword = words[0].upper() if words else ""
+    return keyword if keyword in ("SELECT", "INSERT", "UPDATE", "DELETE") else "OTHER"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("mlflow_query_start_time", []).append(time.time())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_time = conn.info["mlflow_query_start_time"].pop()
+    SQL_QUERY_DURATION.labels(statement=_get_statement_type(statement)).observe(
+        time.time() - start_time
+    )
+
+
+def _handle_error(exception_context):
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("mlflow_query_start_time"):
+        connection.info["mlflow_query_start_time"].pop()
+
+
+def _after_begin(session, transaction, connection):
+    SQL_SESSIONS.inc()
+
+
+def _loaded_as_persistent(session, instance):
+    SQL_ROWS_LOADED.labels(table=getattr(instance, "__tablename__", "unknown")).inc()
+
+
+def _instrument_sqlalchemy():
+    """
+    Listen to the events of all SQLAlchemy engines and sessions, including those of stores
+    created later.
+    """
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.orm import Session
+
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    event.listen(Session, "after_begin", _after_begin)
+    event.listen(Session, "loaded_as_persistent", _loaded_as_persistent)
+
+
+def change_path_for_metric(path):
+    """
+    Replace the '/' in the metric path by '_' so grafana can correctly use it.
+    :param path: path of the metric (example: runs/search)
+    :return: path with '_' instead of '/'
+    """
+    if "mlflow/" in path:
+        path = path.split("mlflow/")[-1]
+    return path.replace("/", "_")
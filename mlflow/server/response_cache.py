@@ -0,0 +1,124 @@
+"""
+In-process cache of the responses of read-only tracking server endpoints.
+
+Cached responses belong to a scope, e.g. the ID of the run they describe or ``SEARCH_SCOPE`` for
+search results spanning several runs. Handlers that modify a run invalidate the scope of the run
+and ``SEARCH_SCOPE``, and handlers that modify experiments invalidate the whole cache.
+
+The cache of a server process is not invalidated by writes handled by other processes, such as
+the other workers of ``mlflow server`` or clients that write to the backend store directly, so
+entries also expire after a time to live. Entries of terminated runs, which rarely change, can be
+given a longer time to live.
+"""
+import collections
+import hashlib
+import threading
+import time
+
+# Scope of the responses that depend on any run, e.g. run search results
+SEARCH_SCOPE = "search"
+
+CacheEntry = collections.namedtuple("CacheEntry", ["etag", "data", "mimetype", "expires_at"])
+
+
+def compute_etag(data):
+    """
+    :return: Entity tag of a response body, to be used as a weak validator since the body may be
+             sent with different content encodings.
+    """
+    return hashlib.sha1(data).hexdigest()
+
+
+class ResponseCache(object):
+    """
+    Thread-safe LRU cache of response bodies.
+
+    :param max_entries: Maximum number of cached responses.
+    :param ttl: Default time to live of cached responses, in seconds.
+    """
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._scope_keys = collections.defaultdict(set)
+        # Incremented by every invalidation, so that responses computed concurrently with a write
+        # are not cached
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def generation(self):
+        """
+        :return: Opaque value to pass to :py:meth:`put`, taken before computing a response.
+        """
+        return self._generation
+
+    def get(self, key):
+        """
+        :return: The :py:class:`CacheEntry` cached for ``key``, or None if there is none or it has
+                 expired.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                return None
+            entry, _ = value
+            if entry.expires_at <= time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, scope, generation, data, mimetype, ttl=None):
+        """
+        Cache a response body, unless the cache was invalidated since ``generation`` was taken.
+
+        :param key: Hashable key of the request.
+        :param scope: Scope of the response, e.g. the ID of a run or ``SEARCH_SCOPE``.
+        :param generation: Value returned by :py:meth:`generation` before computing the response.
+        :param data: Response body.
+        :param mimetype: Response content type.
+        :param ttl: Time to live of the entry in seconds, defaults to the ``ttl`` of the cache.
+        :return: The new :py:class:`CacheEntry`.
+        """
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        entry = CacheEntry(compute_etag(data), data, mimetype, expires_at)
+        with self._lock:
+            if generation != self._generation:
+                return entry
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (entry, scope)
+            self._scope_keys[scope].add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+        return entry
+
+    def invalidate(self, scope):
+        """
+        Remove the responses of ``scope``, and of ``SEARCH_SCOPE`` which may contain them.
+        """
+        with self._lock:
+            self._generation += 1
+            for invalidated_scope in {scope, SEARCH_SCOPE}:
+                for key in list(self._scope_keys.get(invalidated_scope, ())):
+                    self._remove(key)
+
+    def clear(self):
+        """
+        Remove all cached responses.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._scope_keys.clear()
+
+    def _remove(self, key):
+        _, scope = self._entries.pop(key)
+        keys = self._scope_keys[scope]
+        keys.discard(key)
+        if not keys:
+            del self._scope_keys[scope]
@@ -0,0 +1,401 @@
+"""
+Opt-in tracing and profiling of tracking server requests.
+
+Tracing is enabled by setting the ``MLFLOW_SERVER_TRACING`` environment variable to the name of
+a span exporter:
+
+- ``log``: log every span as a JSON object with the field names of the OpenTelemetry (OTLP)
+  JSON encoding, with the ``mlflow.server.tracing`` logger.
+- ``opentelemetry``: send the spans to the tracer provider of the ``opentelemetry-api``
+  package, configured e.g. with ``opentelemetry-instrument``.
+
+Each request to a REST API handler is traced with a root span, with child spans for parsing
+the request message, for each call to the tracking or model registry store, and for encoding the
+response. The time of the root span not covered by its children is mostly spent converting
+entities to protobuf messages.
+
+Setting ``MLFLOW_SERVER_SLOW_REQUEST_THRESHOLD_MS`` enables a sampling profiler: the stacks of
+requests running for longer than the threshold are sampled every
+``MLFLOW_SERVER_PROFILER_INTERVAL_MS`` milliseconds (10 by default), and logged when the request
+ends, in the collapsed format of flame graph tools.
+
+Nothing is wrapped when neither is enabled, so that the server does not pay for either.
+"""
+import collections
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import traceback
+from functools import wraps
+
+from flask import request
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.server import TRACING_ENV_VAR, SLOW_REQUEST_THRESHOLD_ENV_VAR, handlers
+
+PROFILER_INTERVAL_ENV_VAR = "MLFLOW_SERVER_PROFILER_INTERVAL_MS"
+_DEFAULT_PROFILER_INTERVAL_MS = 10
+
+_logger = logging.getLogger(__name__)
+
+
+def _time_ns():
+    return int(time.time() * 1e9)
+
+
+class Span(object):
+    """
+    Timed operation of a request. Times are in nanoseconds since the epoch.
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "start_time",
+        "end_time",
+        "attributes",
+    )
+
+    def __init__(self, name, trace_id, parent_span_id=None, attributes=None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = "%016x" % random.getrandbits(64)
+        self.parent_span_id = parent_span_id
+        self.start_time = _time_ns()
+        self.end_time = None
+        self.attributes = attributes or {}
+
+    def to_dict(self):
+        """
+        :return: Dictionary with the field names of the OTLP JSON encoding of spans.
+        """
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id or "",
+            "name": self.name,
+            "startTimeUnixNano": str(self.start_time),
+            "endTimeUnixNano": str(self.end_time),
+            "attributes": [
+                {"key": key, "value": {"stringValue": str(value)}}
+                for key, value in self.attributes.items()
+            ],
+        }
+
+
+class LogSpanExporter(object):
+    """
+    Span exporter logging each span as an OTLP JSON object.
+    """
+
+    def export(self, spans):
+        for span in spans:
+            _logger.info(json.dumps(span.to_dict(), separators=(",", ":")))
+
+
+class OpenTelemetrySpanExporter(object):
+    """
+    Span exporter sending spans to the global tracer provider of OpenTelemetry. Requires the
+    ``opentelemetry-api`` package.
+    """
+
+    def __init__(self):
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = trace.get_tracer(__name__)
+
+    def export(self, spans):
+        # Spans are exported by request, parents before their children
+        otel_spans = {}
+        for span in spans:
+            parent = otel_spans.get(span.parent_span_id)
+            context = self._trace.set_span_in_context(parent) if parent is not None else None
+            otel_span = self._tracer.start_span(
+                span.name, context=context, start_time=span.start_time, attributes=span.attributes
+            )
+            otel_span.end(end_time=span.end_time)
+            otel_spans[span.span_id] = otel_span
+
+
+_SPAN_EXPORTERS = {
+    "log": LogSpanExporter,
+    "opentelemetry": OpenTelemetrySpanExporter,
+}
+
+
+class Tracer(object):
+    """
+    Records the spans of the requests of each thread, and exports them when requests end.
+
+    :param exporter: Object with an ``export(spans)`` method, called with the list of spans of
+                     each request, in order of their start time.
+    """
+
+    def __init__(self, exporter):
+        self.exporter = exporter
+        self._local = threading.local()
+
+    def _get_stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+            self._local.spans = []
+        return stack
+
+    def start_span(self, name, attributes=None):
+        stack = self._get_stack()
+        if stack:
+            parent = stack[-1]
+            span = Span(name, parent.trace_id, parent.span_id, attributes)
+        else:
+            span = Span(name, "%032x" % random.getrandbits(128), attributes=attributes)
+            self._local.spans = []
+        stack.append(span)
+        self._local.spans.append(span)
+        return span
+
+    def end_span(self, span):
+        span.end_time = _time_ns()
+        stack = self._get_stack()
+        stack.remove(span)
+        if not stack:
+            spans = self._local.spans
+            self._local.spans = []
+            try:
+                self.exporter.export(spans)
+            except Exception:  # pylint: disable=broad-except
+                _logger.exception("Failed to export the spans of a request")
+
+    def wrap(self, name, func, get_attributes=None):
+        """
+        :return: ``func`` recording a span named ``name`` around each of its calls.
+        :param get_attributes: Optional function returning the attributes of the span, called
+                               with the arguments of ``func``.
+        """
+
+        @wraps(func)
+        def traced(*args, **kwargs):
+            attributes = get_attributes(*args, **kwargs) if get_attributes is not None else None
+            span = self.start_span(name, attributes)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                span.attributes["error"] = type(e).__name__
+                raise
+            finally:
+                self.end_span(span)
+
+        return traced
+
+
+class _TracedStore(object):
+    """
+    Proxy of a tracking or model registry store, recording a span around each method call.
+    """
+
+    def __init__(self, store, tracer):
+        self._store = store
+        self._tracer = tracer
+
+    def __getattr__(self, name):
+        attribute = getattr(self._store, name)
+        if not callable(attribute) or name.startswith("_"):
+            return attribute
+        return self._tracer.wrap("store." + name, attribute)
+
+
+class SlowRequestProfiler(object):
+    """
+    Sampling profiler of slow requests. A daemon thread samples the stacks of the threads whose
+    request has been running for longer than ``threshold`` seconds, every ``interval`` seconds.
+    When such a request ends, the number of samples of each stack is logged. The sampler thread
+    sleeps while no request is in progress, and exits when :py:meth:`stop` is called.
+    """
+
+    def __init__(self, threshold, interval):
+        self.threshold = threshold
+        self.interval = interval
+        # Thread ID -> [start time, Counter of collapsed stacks] of the requests in progress
+        self._requests = {}
+        self._lock = threading.Lock()
+        # Set while requests are in progress
+        self._requests_in_progress = threading.Event()
+        self._stopped = threading.Event()
+        self._sampler = None
+        self._sampler_pid = None
+
+    def _ensure_sampler_started(self):
+        # Server worker processes are forked after the profiler is created, and need their own
+        # sampler thread
+        pid = os.getpid()
+        if self._sampler_pid == pid:
+            return
+        with self._lock:
+            if self._sampler_pid != pid and not self._stopped.is_set():
+                self._sampler_pid = pid
+                self._sampler = threading.Thread(target=self._run_sampler, name="mlflow-profiler")
+                self._sampler.daemon = True
+                self._sampler.start()
+
+    def _run_sampler(self):
+        while not self._stopped.is_set():
+            self._requests_in_progress.wait()
+            if self._stopped.wait(self.interval):
+                return
+            self.sample()
+
+    def stop(self):
+        """
+        Stop the sampler thread, and wait for it to exit.
+        """
+        self._stopped.set()
+        # Wakes up the sampler if it waits for requests
+        self._requests_in_progress.set()
+        sampler = self._sampler
+        if sampler is not None and sampler.is_alive() and self._sampler_pid == os.getpid():
+            sampler.join()
+
+    def sample(self):
+        """
+        Record the current stack of each slow request.
+        """
+        now = time.time()
+        with self._lock:
+            slow_requests = [
+                (thread_id, samples)
+                for thread_id, (start_time, samples) in self._requests.items()
+                if now - start_time >= self.threshold
+            ]
+        if not slow_requests:
+            return
+        frames = sys._current_frames()  # pylint: disable=protected-access
+        for thread_id, samples in slow_requests:
+            frame = frames.get(thread_id)
+            if frame is not None:
+                samples[_collapse_stack(frame)] += 1
+
+    def start_request(self):
+        self._ensure_sampler_started()
+        with self._lock:
+            self._requests[threading.get_ident()] = [time.time(), collections.Counter()]
+            self._requests_in_progress.set()
+
+    def end_request(self, description):
+        with self._lock:
+            start_time, samples = self._requests.pop(threading.get_ident())
+            if not self._requests and not self._stopped.is_set():
+                self._requests_in_progress.clear()
+        if samples:
+            _logger.warning(
+                "Slow request %s took %.0f ms. Stack samples:\n%s",
+                description,
+                (time.time() - start_time) * 1000,
+                "\n".join("%s %d" % (stack, count) for stack, count in samples.most_common()),
+            )
+
+    def wrap(self, func):
+        @wraps(func)
+        def profiled(*args, **kwargs):
+            self.start_request()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.end_request("%s %s" % (request.method, request.path))
+
+        return profiled
+
+
+def _collapse_stack(frame):
+    """
+    :return: The stack of ``frame``, outermost frame first, as semicolon-separated frames.
+    """
+    return ";".join(
+        "%s (%s:%d)" % (name, os.path.basename(filename), line_number)
+        for filename, line_number, name, _ in traceback.extract_stack(frame)
+    )
+
+
+def _get_span_exporter(name):
+    if name not in _SPAN_EXPORTERS:
+        raise MlflowException(
+            "Invalid value '%s' of %s. Supported span exporters: %s"
+            % (name, TRACING_ENV_VAR, sorted(_SPAN_EXPORTERS)),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    return _SPAN_EXPORTERS[name]()
+
+
+def activate_tracing(app, exporter=None, profiler=None):
+    """
+    Trace the REST API handlers of ``app``, and profile its slow requests, as configured by the
+    environment variables documented in :py:mod:`mlflow.server.tracing`. Must be called after
+    all the routes of ``app`` are registered.
+
+    :param exporter: Optional span exporter overriding ``MLFLOW_SERVER_TRACING``.
+    :param profiler: Optional :py:class:`SlowRequestProfiler` overriding
+                     ``MLFLOW_SERVER_SLOW_REQUEST_THRESHOLD_MS``.
+    :return: The :py:class:`Tracer`, or None if tracing is disabled.
+    """
+    if exporter is None and os.environ.get(TRACING_ENV_VAR):
+        exporter = _get_span_exporter(os.environ[TRACING_ENV_VAR])
+    if profiler is None and os.environ.get(SLOW_REQUEST_THRESHOLD_ENV_VAR):
+        interval = os.environ.get(PROFILER_INTERVAL_ENV_VAR, _DEFAULT_PROFILER_INTERVAL_MS)
+        profiler = SlowRequestProfiler(
+            threshold=float(os.environ[SLOW_REQUEST_THRESHOLD_ENV_VAR]) / 1000,
+            interval=float(interval) / 1000,
+        )
+
+    handler_names = set(handler.__name__ for handler in handlers.HANDLERS.values())
+    tracer = Tracer(exporter) if exporter is not None else None
+    if tracer is not None:
+        _trace_handler_phases(tracer)
+    for func_name, func in list(app.view_functions.items()):
+        if func_name not in handler_names:
+            continue
+        if tracer is not None:
+            func = tracer.wrap(
+                func_name,
+                func,
+                get_attributes=lambda *args, **kwargs: {
+                    "http.method": request.method,
+                    "http.target": request.path,
+                },
+            )
+        if profiler is not None:
+            func = profiler.wrap(func)
+        app.view_functions[func_name] = func
+    return tracer
+
+
+def _trace_handler_phases(tracer):
+    """
+    Record spans around the request parsing, store calls and response encoding of the handlers.
+    """
+    handlers._get_request_message = tracer.wrap("parse_request", handlers._get_request_message)
+    handlers._wrap_response = tracer.wrap("encode_response", handlers._wrap_response)
+    for getter_name in ["_get_tracking_store", "_get_model_registry_store"]:
+        getter = getattr(handlers, getter_name)
+        setattr(handlers, getter_name, _traced_store_getter(getter, tracer))
+
+
+def _traced_store_getter(get_store, tracer):
+    # The proxy of the last store returned by ``get_store``, which returns the same store object
+    # for the lifetime of the server
+    traced_stores = [_TracedStore(None, tracer)]
+
+    @wraps(get_store)
+    def get_traced_store(*args, **kwargs):
+        store = get_store(*args, **kwargs)
+        if traced_stores[0]._store is not store:
+            traced_stores[0] = _TracedStore(store, tracer)
+        return traced_stores[0]
+
+    return get_traced_store
@@ -0,0 +1,244 @@
+"""
+A machine-wide on-disk cache for downloaded artifacts that are known to be immutable, such as the
+artifacts of a terminated run or of a specific model version. The cache is shared by all
+processes that point ``MLFLOW_ARTIFACT_CACHE_DIR`` to the same directory.
+
+Entries are keyed by the fully resolved artifact location and laid out as::
+
+    <cache_dir>/entries/<key>/meta.json   # location, relative artifact path and size
+    <cache_dir>/entries/<key>/data/...    # the downloaded artifacts, read-only
+    <cache_dir>/locks/<key>.lock          # held while the entry is being downloaded
+    <cache_dir>/locks/<key>.lease.lock    # shared by the readers of the entry, see ``lease``
+    <cache_dir>/tmp/                      # in-progress downloads
+
+Downloads go to a private staging directory that is atomically renamed into ``entries`` once
+complete, so readers never observe partial entries. Concurrent downloads of the same key are
+serialized with a file lock, so only one process fetches it. The least recently used entries are
+evicted once the total size exceeds ``MLFLOW_ARTIFACT_CACHE_MAX_SIZE`` bytes, except for the
+entries that are leased by readers, e.g. while they are copied out of the cache.
+"""
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+import stat
+import tempfile
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # File locking is unavailable on Windows; atomic renames still guarantee consistent entries,
+    # but concurrent processes may download the same artifacts more than once.
+    fcntl = None
+
+ARTIFACT_CACHE_DIR_ENV_VAR = "MLFLOW_ARTIFACT_CACHE_DIR"
+ARTIFACT_CACHE_MAX_SIZE_ENV_VAR = "MLFLOW_ARTIFACT_CACHE_MAX_SIZE"
+_DEFAULT_ARTIFACT_CACHE_MAX_SIZE = 10 * 1024 ** 3
+_EVICTION_LOCK_NAME = "_eviction"
+_META_FILE_NAME = "meta.json"
+_DATA_DIR_NAME = "data"
+
+_logger = logging.getLogger(__name__)
+
+
+def get_artifact_cache():
+    """
+    :return: The :py:class:`ArtifactCache` configured by the ``MLFLOW_ARTIFACT_CACHE_DIR``
+             environment variable, or ``None`` if artifact caching is disabled.
+    """
+    cache_dir = os.environ.get(ARTIFACT_CACHE_DIR_ENV_VAR)
+    if not cache_dir:
+        return None
+    max_size = int(
+        os.environ.get(ARTIFACT_CACHE_MAX_SIZE_ENV_VAR, _DEFAULT_ARTIFACT_CACHE_MAX_SIZE)
+    )
+    return ArtifactCache(cache_dir, max_size)
+
+
+def _get_dir_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def _make_read_only(path):
+    remove_write = ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+    paths = [path] if os.path.isfile(path) else []
+    for root, _, names in os.walk(path):
+        paths.extend(os.path.join(root, name) for name in names)
+    for file_path in paths:
+        os.chmod(file_path, os.stat(file_path).st_mode & remove_write)
+
+
+def _rmtree(path):
+    def _make_writable_and_retry(func, failed_path, _):
+        os.chmod(failed_path, stat.S_IWUSR | stat.S_IRUSR)
+        func(failed_path)
+
+    shutil.rmtree(path, onerror=_make_writable_and_retry)
+
+
+class ArtifactCache(object):
+    """
+    On-disk LRU cache of downloaded artifacts, keyed by immutable artifact locations.
+    """
+
+    def __init__(self, root_dir, max_size):
+        self.root_dir = os.path.abspath(root_dir)
+        self.max_size = max_size
+        self._entries_dir = os.path.join(self.root_dir, "entries")
+        self._locks_dir = os.path.join(self.root_dir, "locks")
+        self._tmp_dir = os.path.join(self.root_dir, "tmp")
+        for path in [self._entries_dir, self._locks_dir, self._tmp_dir]:
+            os.makedirs(path, exist_ok=True)
+
+    @staticmethod
+    def _get_key(location):
+        return hashlib.sha256(location.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _get_lease_lock_name(key):
+        return key + ".lease"
+
+    @contextlib.contextmanager
+    def _lock(self, name, shared=False, blocking=True):
+        """
+        Hold a file lock for the duration of the context, which yields whether the lock was
+        acquired. Non-blocking locks are not acquired if they are held by another reader or
+        writer, including in the same process.
+        """
+        with open(os.path.join(self._locks_dir, name + ".lock"), "a") as lock_file:
+            acquired = True
+            if fcntl is not None:
+                operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+                try:
+                    fcntl.flock(lock_file.fileno(), operation | (0 if blocking else fcntl.LOCK_NB))
+                except (IOError, OSError):
+                    if blocking:
+                        raise
+                    acquired = False
+            try:
+                yield acquired
+            finally:
+                if fcntl is not None and acquired:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _read_entry(self, key):
+        entry_dir = os.path.join(self._entries_dir, key)
+        try:
+            with open(os.path.join(entry_dir, _META_FILE_NAME), "r") as f:
+                meta = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        # Record the access for LRU eviction
+        os.utime(entry_dir, None)
+        return os.path.join(entry_dir, _DATA_DIR_NAME, meta["path"])
+
+    def get(self, location):
+        """
+        :return: Local path of the cached artifacts downloaded from ``location``, or ``None`` if
+                 they are not cached.
+        """
+        return self._read_entry(self._get_key(location))
+
+    def get_or_download(self, location, download_fn):
+        """
+        Return the local path of the artifacts at ``location``, downloading them into the cache
+        first if necessary. The returned files are read-only and must not be modified or deleted
+        by the caller.
+
+        :param location: The immutable, fully resolved location of the artifacts.
+        :param download_fn: Function that accepts an existing local directory, downloads the
+                            artifacts into it and returns the local path of the artifacts.
+        """
+        key = self._get_key(location)
+        cached_path = self._read_entry(key)
+        if cached_path is not None:
+            return cached_path
+
+        with self._lock(key):
+            # Another process may have completed the download while we were waiting on the lock
+            cached_path = self._read_entry(key)
+            if cached_path is not None:
+                return cached_path
+
+            staging_dir = tempfile.mkdtemp(dir=self._tmp_dir)
+            try:
+                data_dir = os.path.join(staging_dir, _DATA_DIR_NAME)
+                os.mkdir(data_dir)
+                local_path = download_fn(data_dir)
+                _make_read_only(data_dir)
+                meta = {
+                    "location": location,
+                    "path": os.path.relpath(local_path, data_dir),
+                    "size": _get_dir_size(data_dir),
+                    "created": time.time(),
+                }
+                with open(os.path.join(staging_dir, _META_FILE_NAME), "w") as f:
+                    json.dump(meta, f)
+                entry_dir = os.path.join(self._entries_dir, key)
+                if os.path.exists(entry_dir):
+                    # Remove an incomplete entry left behind by an interrupted process
+                    _rmtree(entry_dir)
+                os.rename(staging_dir, entry_dir)
+            except Exception:
+                _rmtree(staging_dir)
+                raise
+
+        self.evict(keep_key=key)
+        return self._read_entry(key)
+
+    @contextlib.contextmanager
+    def lease(self, location, download_fn):
+        """
+        Like :py:meth:`get_or_download`, but the entry is not evicted until the context exits, so
+        that the returned path can be read, e.g. to copy the artifacts out of the cache, while
+        other processes add entries to the cache.
+        """
+        with self._lock(self._get_lease_lock_name(self._get_key(location)), shared=True):
+            yield self.get_or_download(location, download_fn)
+
+    def evict(self, keep_key=None):
+        """
+        Remove the least recently used entries until the cache fits within ``max_size`` bytes.
+        The entry identified by ``keep_key`` and the leased entries are never evicted.
+        """
+        with self._lock(_EVICTION_LOCK_NAME):
+            entries = []
+            for key in os.listdir(self._entries_dir):
+                entry_dir = os.path.join(self._entries_dir, key)
+                try:
+                    with open(os.path.join(entry_dir, _META_FILE_NAME), "r") as f:
+                        size = json.load(f)["size"]
+                    entries.append((os.stat(entry_dir).st_mtime, key, size))
+                except (IOError, OSError, ValueError, KeyError):
+                    continue
+            total_size = sum(size for _, _, size in entries)
+            for _, key, size in sorted(entries):
+                if total_size <= self.max_size:
+                    break
+                if key == keep_key:
+                    continue
+                with self._lock(self._get_lease_lock_name(key), blocking=False) as acquired:
+                    if not acquired:
+                        _logger.debug("Not evicting cached artifacts %s, which are in use", key)
+                        continue
+                    _logger.debug("Evicting cached artifacts %s (%s bytes)", key, size)
+                    evicted_dir = tempfile.mkdtemp(dir=self._tmp_dir)
+                    try:
+                        # Rename first so that readers never observe a partially deleted entry
+                        os.rename(
+                            os.path.join(self._entries_dir, key), os.path.join(evicted_dir, key)
+                        )
+                    except OSError:
+                        continue
+                    finally:
+                        _rmtree(evicted_dir)
+                total_size -= size
@@ -1,3 +1,4 @@
+import json
 import os
 import posixpath
 import tempfile
@@ -5,10 +6,16 @@ from abc import abstractmethod, ABCMeta
 
 from mlflow.utils.validation import path_not_unique, bad_path_message
 from mlflow.utils.annotations import experimental
+from mlflow.utils.file_utils import TempDir, compute_file_md5, relative_path_to_artifact_path
 
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
 
+# Name of the manifest file written next to artifacts logged via ``sync_upload_artifacts``. It
+# records the size and MD5 digest of every synced file, relative to the directory containing it.
+_MANIFEST_FILE_NAME = ".mlflow-manifest.json"
+_MANIFEST_VERSION = 1
+
 
 class ArtifactRepository:
     """
@@ -157,9 +164,168 @@ class ArtifactRepository:
         """
         pass
 
+    def _list_files_recursively(self, artifact_path):
+        """
+        :return: Dictionary mapping the posix path of every file under ``artifact_path``
+                 (relative to ``artifact_path``) to its :py:class:`mlflow.entities.FileInfo`.
+        """
+        files = {}
+
+        def _list_dir(dir_path):
+            for file_info in self.list_artifacts(dir_path):
+                # prevent infinite loop, sometimes the dir is recursively included
+                if file_info.path in (".", dir_path):
+                    continue
+                if file_info.is_dir:
+                    _list_dir(file_info.path)
+                else:
+                    rel_path = (
+                        posixpath.relpath(file_info.path, artifact_path)
+                        if artifact_path
+                        else file_info.path
+                    )
+                    files[rel_path] = file_info
+
+        _list_dir(artifact_path)
+        return files
+
+    def _read_manifest(self, artifact_path, remote_files):
+        """
+        Download and parse the sync manifest stored under ``artifact_path``, if there is one.
+
+        :return: Dictionary mapping relative file paths to ``{"size": ..., "md5": ...}`` entries.
+        """
+        if _MANIFEST_FILE_NAME not in remote_files:
+            return {}
+        with TempDir() as tmp:
+            local_path = tmp.path(_MANIFEST_FILE_NAME)
+            self._download_file(
+                remote_file_path=remote_files[_MANIFEST_FILE_NAME].path, local_path=local_path
+            )
+            with open(local_path, "r") as f:
+                manifest = json.load(f)
+        if manifest.get("version") != _MANIFEST_VERSION:
+            return {}
+        return manifest.get("files", {})
+
+    def _write_manifest(self, artifact_path, manifest):
+        with TempDir() as tmp:
+            local_path = tmp.path(_MANIFEST_FILE_NAME)
+            with open(local_path, "w") as f:
+                json.dump({"version": _MANIFEST_VERSION, "files": manifest}, f, sort_keys=True)
+            self.log_artifact(local_path, artifact_path)
+
+    @experimental
+    def sync_upload_artifacts(self, local_dir, artifact_path=None):
+        """
+        Incrementally log the files in the specified local directory as artifacts. Only files
+        whose size or MD5 digest differ from the copy already stored under ``artifact_path`` are
+        uploaded. A manifest recording the size and digest of every synced file is written next
+        to the artifacts so that subsequent syncs (in either direction) can skip unchanged files.
+        Remote files that do not exist locally are left untouched.
+
+        :param local_dir: Directory of local artifacts to log
+        :param artifact_path: Directory within the run's artifact directory in which to log the
+                              artifacts
+        :return: Sorted list of posix paths, relative to ``local_dir``, of the uploaded files.
+        """
+        verify_artifact_path(artifact_path)
+        remote_files = self._list_files_recursively(artifact_path)
+        manifest = self._read_manifest(artifact_path, remote_files)
+        local_manifest = {}
+        for root, _, filenames in os.walk(local_dir):
+            for filename in filenames:
+                local_path = os.path.join(root, filename)
+                rel_path = relative_path_to_artifact_path(os.path.relpath(local_path, local_dir))
+                if rel_path == _MANIFEST_FILE_NAME:
+                    continue
+                local_manifest[rel_path] = {
+                    "size": os.path.getsize(local_path),
+                    "md5": compute_file_md5(local_path),
+                }
+
+        uploaded = []
+        for rel_path, entry in sorted(local_manifest.items()):
+            if _is_synced(entry, manifest.get(rel_path), remote_files.get(rel_path)):
+                continue
+            rel_dir = posixpath.dirname(rel_path)
+            dst_dir = posixpath.join(artifact_path or "", rel_dir) if rel_dir else artifact_path
+            self.log_artifact(os.path.join(local_dir, *rel_path.split("/")), dst_dir)
+            uploaded.append(rel_path)
+
+        updated_manifest = dict(manifest, **local_manifest)
+        if uploaded or updated_manifest != manifest:
+            self._write_manifest(artifact_path, updated_manifest)
+        return uploaded
+
+    @experimental
+    def sync_download_artifacts(self, artifact_path, dst_path):
+        """
+        Incrementally download an artifact directory into a local directory. Local files whose
+        size and MD5 digest match the manifest written by ``sync_upload_artifacts`` are kept as
+        is; every other file is downloaded. Artifacts without a manifest are always downloaded.
+
+        :param artifact_path: Relative source path to the desired artifact directory.
+        :param dst_path: Absolute path of the local filesystem destination directory. The
+                         artifacts are placed under ``dst_path`` exactly as they would be by
+                         ``download_artifacts``, so repeated syncs to the same ``dst_path``
+                         only transfer changed files.
+        :return: Absolute path of the local filesystem location containing the desired artifacts.
+        """
+        if not os.path.isdir(dst_path):
+            raise MlflowException(
+                message=(
+                    "The destination path for downloaded artifacts must be an existing directory!"
+                    " Destination path: {dst_path}".format(dst_path=dst_path)
+                ),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        if not self._is_directory(artifact_path):
+            return self.download_artifacts(artifact_path, dst_path)
+
+        dst_path = os.path.abspath(dst_path)
+        local_dir = os.path.join(dst_path, artifact_path) if artifact_path else dst_path
+        remote_files = self._list_files_recursively(artifact_path)
+        manifest = self._read_manifest(artifact_path, remote_files)
+        for rel_path, file_info in sorted(remote_files.items()):
+            if rel_path == _MANIFEST_FILE_NAME:
+                continue
+            local_path = os.path.join(local_dir, *rel_path.split("/"))
+            manifest_entry = manifest.get(rel_path)
+            if (
+                manifest_entry is not None
+                and os.path.isfile(local_path)
+                and os.path.getsize(local_path) == manifest_entry["size"]
+            ):
+                local_entry = {
+                    "size": manifest_entry["size"],
+                    "md5": compute_file_md5(local_path),
+                }
+                if _is_synced(local_entry, manifest_entry, file_info):
+                    continue
+            local_file_dir = os.path.dirname(local_path)
+            if not os.path.exists(local_file_dir):
+                os.makedirs(local_file_dir)
+            self._download_file(remote_file_path=file_info.path, local_path=local_path)
+        return local_dir
+
 
 def verify_artifact_path(artifact_path):
     if artifact_path and path_not_unique(artifact_path):
         raise MlflowException(
             "Invalid artifact path: '%s'. %s" % (artifact_path, bad_path_message(artifact_path))
         )
+
+
+def _is_synced(local_entry, manifest_entry, remote_file_info):
+    """
+    Return True if a file described by ``local_entry`` does not need to be transferred, i.e. its
+    remote copy exists, still matches the manifest and has the same size and MD5 digest.
+    """
+    if manifest_entry is None or remote_file_info is None:
+        return False
+    remote_size = remote_file_info.file_size
+    if remote_size is not None and remote_size != manifest_entry.get("size"):
+        # The remote file was modified without updating the manifest
+        return False
+    return all(local_entry[key] == manifest_entry.get(key) for key in ("size", "md5"))
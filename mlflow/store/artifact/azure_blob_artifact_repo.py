@@ -6,6 +6,10 @@ import urllib.parse
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.utils import _chunk_list
+
+# Maximum number of sub-requests accepted by a single Azure Blob Storage batch request
+_MAX_BLOBS_PER_DELETE_REQUEST = 256
 
 
 class AzureBlobArtifactRepository(ArtifactRepository):
@@ -136,4 +140,15 @@ class AzureBlobArtifactRepository(ArtifactRepository):
             container_client.download_blob(remote_full_path).readinto(file)
 
     def delete_artifacts(self, artifact_path=None):
-        raise MlflowException("Not implemented yet")
+        (container, _, dest_path) = self.parse_wasbs_uri(self.artifact_uri)
+        container_client = self.client.get_container_client(container)
+        if artifact_path:
+            dest_path = posixpath.join(dest_path, artifact_path)
+        prefix = dest_path + "/" if dest_path else ""
+        blob_names = [
+            blob.name
+            for blob in container_client.list_blobs(name_starts_with=dest_path)
+            if blob.name == dest_path or blob.name.startswith(prefix)
+        ]
+        for batch in _chunk_list(blob_names, _MAX_BLOBS_PER_DELETE_REQUEST):
+            container_client.delete_blobs(*batch)
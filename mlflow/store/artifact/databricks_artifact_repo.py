@@ -2,7 +2,6 @@ import base64
 import logging
 import os
 import posixpath
-import requests
 import uuid
 
 from azure.core.exceptions import ClientAuthenticationError
@@ -21,11 +20,13 @@ from mlflow.protos.databricks_artifacts_pb2 import (
 from mlflow.protos.service_pb2 import MlflowService, GetRun, ListArtifacts
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
 from mlflow.utils.databricks_utils import get_databricks_host_creds
+from mlflow.utils.download_utils import download_url_in_parallel
 from mlflow.utils.file_utils import relative_path_to_artifact_path, yield_file_in_chunks
 from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.rest_utils import (
     call_endpoint,
     extract_api_info_for_service,
+    get_request_session,
     _REST_API_PATH_PREFIX,
 )
 from mlflow.utils.uri import (
@@ -38,7 +39,6 @@ from mlflow.utils.uri import (
 
 _logger = logging.getLogger(__name__)
 _AZURE_MAX_BLOCK_CHUNK_SIZE = 100000000  # Max. size of each block allowed is 100 MB in stage_block
-_DOWNLOAD_CHUNK_SIZE = 100000000
 _SERVICE_AND_METHOD_TO_INFO = {
     service: extract_api_info_for_service(service, _REST_API_PATH_PREFIX)
     for service in [MlflowService, DatabricksMlflowArtifactsService]
@@ -192,11 +192,12 @@ class DatabricksArtifactRepository(ArtifactRepository):
             headers = self._extract_headers_from_credentials(credentials.headers)
             signed_write_uri = credentials.signed_uri
             # Putting an empty file in a request by reading file bytes gives 501 error.
+            session = get_request_session(signed_write_uri)
             if os.stat(local_file).st_size == 0:
-                put_request = requests.put(signed_write_uri, "", headers=headers)
+                put_request = session.put(signed_write_uri, "", headers=headers)
             else:
                 with open(local_file, "rb") as file:
-                    put_request = requests.put(signed_write_uri, file, headers=headers)
+                    put_request = session.put(signed_write_uri, file, headers=headers)
             put_request.raise_for_status()
         except Exception as err:
             raise MlflowException(err)
@@ -218,11 +219,11 @@ class DatabricksArtifactRepository(ArtifactRepository):
         Since the download mechanism for both cloud services, i.e., Azure and AWS is the same,
         a single download method is sufficient.
 
-        The default working of `requests.get` is to download the entire response body immediately.
-        However, this could be inefficient for large files. Hence the parameter `stream` is set to
-        true. This only downloads the response headers at first and keeps the connection open,
-        allowing content retrieval to be made via `iter_content`.
-        In addition, since the connection is kept open, refreshing credentials is not required.
+        Both signed URI types honor HTTP range requests, so large files are fetched over several
+        concurrent connections, each downloading a chunk of the file into its own offset of the
+        local file (see :py:func:`mlflow.utils.download_utils.download_url_in_parallel`). The
+        chunk size and parallelism are controlled by the ``MLFLOW_PARALLEL_DOWNLOAD_CHUNK_SIZE``
+        and ``MLFLOW_PARALLEL_DOWNLOAD_MAX_WORKERS`` environment variables.
         """
         if cloud_credential.type not in [
             ArtifactCredentialType.AZURE_SAS_URI,
@@ -232,14 +233,7 @@ class DatabricksArtifactRepository(ArtifactRepository):
                 message="Cloud provider not supported.", error_code=INTERNAL_ERROR
             )
         try:
-            signed_read_uri = cloud_credential.signed_uri
-            with requests.get(signed_read_uri, stream=True) as response:
-                response.raise_for_status()
-                with open(local_file_path, "wb") as output_file:
-                    for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
-                        if not chunk:
-                            break
-                        output_file.write(chunk)
+            download_url_in_parallel(cloud_credential.signed_uri, local_file_path)
         except Exception as err:
             raise MlflowException(err)
 
@@ -314,4 +308,9 @@ class DatabricksArtifactRepository(ArtifactRepository):
         self._download_from_cloud(read_credentials.credentials, local_path)
 
     def delete_artifacts(self, artifact_path=None):
-        raise MlflowException("Not implemented yet")
+        # The Databricks artifacts service only issues read and write credentials
+        raise MlflowException(
+            "Deleting artifacts is not supported for access-controlled Databricks artifact "
+            "locations ({uri}).".format(uri=self.artifact_uri),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
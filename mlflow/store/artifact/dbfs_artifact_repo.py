@@ -12,7 +12,13 @@ from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
 from mlflow.tracking._tracking_service import utils
 from mlflow.utils.databricks_utils import get_databricks_host_creds
 from mlflow.utils.file_utils import relative_path_to_artifact_path
-from mlflow.utils.rest_utils import http_request, http_request_safe, RESOURCE_DOES_NOT_EXIST
+from mlflow.utils.rest_utils import (
+    get_error_code,
+    http_request,
+    http_request_safe,
+    verify_rest_response,
+    RESOURCE_DOES_NOT_EXIST,
+)
 from mlflow.utils.string_utils import strip_prefix
 from mlflow.utils.uri import (
     get_databricks_profile_uri_from_artifact_uri,
@@ -25,6 +31,8 @@ import mlflow.utils.databricks_utils
 
 LIST_API_ENDPOINT = "/api/2.0/dbfs/list"
 GET_STATUS_ENDPOINT = "/api/2.0/dbfs/get-status"
+DELETE_API_ENDPOINT = "/api/2.0/dbfs/delete"
+PARTIAL_DELETE = "PARTIAL_DELETE"
 DOWNLOAD_CHUNK_SIZE = 1024
 USE_FUSE_ENV_VAR = "MLFLOW_ENABLE_DBFS_FUSE_ARTIFACT_REPO"
 
@@ -170,7 +178,25 @@ class DbfsRestArtifactRepository(ArtifactRepository):
         )
 
     def delete_artifacts(self, artifact_path=None):
-        raise MlflowException("Not implemented yet")
+        dbfs_path = self._get_dbfs_path(artifact_path) if artifact_path else self._get_dbfs_path("")
+        host_creds = self.get_host_creds()
+        while True:
+            # The DBFS delete API removes a bounded number of files per request and reports
+            # PARTIAL_DELETE with a 503 status when more remain, in which case the request must be
+            # repeated.
+            response = http_request(
+                host_creds=host_creds,
+                endpoint=DELETE_API_ENDPOINT,
+                method="POST",
+                json={"path": dbfs_path, "recursive": True},
+                return_error_codes=[PARTIAL_DELETE],
+            )
+            error_code = get_error_code(response) if response.status_code != 200 else None
+            if error_code != PARTIAL_DELETE:
+                break
+        # Artifacts that do not exist, e.g. of runs that never logged any, are already deleted
+        if error_code != RESOURCE_DOES_NOT_EXIST:
+            verify_rest_response(response, DELETE_API_ENDPOINT)
 
 
 def _get_host_creds_from_default_store():
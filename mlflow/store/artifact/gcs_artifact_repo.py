@@ -5,8 +5,11 @@ import urllib.parse
 
 from mlflow.entities import FileInfo
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.utils import _chunk_list
 from mlflow.utils.file_utils import relative_path_to_artifact_path
-from mlflow.exceptions import MlflowException
+
+# Maximum number of calls accepted by a single GCS batch request
+_MAX_BLOBS_PER_DELETE_BATCH = 100
 
 
 class GCSArtifactRepository(ArtifactRepository):
@@ -110,4 +113,17 @@ class GCSArtifactRepository(ArtifactRepository):
         gcs_bucket.blob(remote_full_path).download_to_filename(local_path)
 
     def delete_artifacts(self, artifact_path=None):
-        raise MlflowException("Not implemented yet")
+        (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
+        if artifact_path:
+            dest_path = posixpath.join(dest_path, artifact_path)
+        prefix = dest_path + "/" if dest_path else ""
+        gcs_bucket = self._get_bucket(bucket)
+        blobs = [
+            blob
+            for blob in gcs_bucket.list_blobs(prefix=dest_path)
+            if blob.name == dest_path or blob.name.startswith(prefix)
+        ]
+        for batch in _chunk_list(blobs, _MAX_BLOBS_PER_DELETE_BATCH):
+            with gcs_bucket.client.batch():
+                for blob in batch:
+                    blob.delete()
@@ -1,3 +1,4 @@
+import logging
 import os
 from mimetypes import guess_type
 
@@ -8,8 +9,19 @@ from mlflow import data
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
+from mlflow.utils import _chunk_list
+from mlflow.utils.download_utils import (
+    PARALLEL_DOWNLOAD_CHUNK_SIZE_ENV_VAR,
+    PARALLEL_DOWNLOAD_MAX_WORKERS_ENV_VAR,
+    get_parallel_download_chunk_size,
+    get_parallel_download_max_workers,
+)
 from mlflow.utils.file_utils import relative_path_to_artifact_path
 
+_logger = logging.getLogger(__name__)
+# Maximum number of keys accepted by a single DeleteObjects request
+_MAX_KEYS_PER_DELETE_REQUEST = 1000
+
 
 class S3ArtifactRepository(ArtifactRepository):
     """Stores artifacts on Amazon S3."""
@@ -56,6 +68,24 @@ class S3ArtifactRepository(ArtifactRepository):
             verify=verify,
         )
 
+    @staticmethod
+    def _get_s3_download_config():
+        """
+        ``download_file`` already splits large objects into byte ranges that are fetched
+        concurrently and written at their offsets. Apply the MLflow parallel download settings to
+        it when they are configured, and keep boto3's defaults otherwise.
+        """
+        from boto3.s3.transfer import TransferConfig
+
+        config_kwargs = {}
+        if PARALLEL_DOWNLOAD_CHUNK_SIZE_ENV_VAR in os.environ:
+            chunk_size = get_parallel_download_chunk_size()
+            config_kwargs["multipart_threshold"] = chunk_size
+            config_kwargs["multipart_chunksize"] = chunk_size
+        if PARALLEL_DOWNLOAD_MAX_WORKERS_ENV_VAR in os.environ:
+            config_kwargs["max_concurrency"] = get_parallel_download_max_workers()
+        return TransferConfig(**config_kwargs)
+
     def _upload_file(self, s3_client, local_file, bucket, key):
         extra_args = dict()
         guessed_type, guessed_encoding = guess_type(local_file)
@@ -144,7 +174,34 @@ class S3ArtifactRepository(ArtifactRepository):
         (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
         s3_full_path = posixpath.join(s3_root_path, remote_file_path)
         s3_client = self._get_s3_client()
-        s3_client.download_file(bucket, s3_full_path, local_path)
+        s3_client.download_file(
+            bucket, s3_full_path, local_path, Config=self._get_s3_download_config()
+        )
 
     def delete_artifacts(self, artifact_path=None):
-        raise MlflowException("Not implemented yet")
+        (bucket, dest_path) = data.parse_s3_uri(self.artifact_uri)
+        if artifact_path:
+            dest_path = posixpath.join(dest_path, artifact_path)
+        s3_client = self._get_s3_client()
+        # ``artifact_path`` may refer to a single object; deleting a missing key is a no-op
+        keys = [dest_path] if artifact_path else []
+        prefix = dest_path + "/" if dest_path else ""
+        paginator = s3_client.get_paginator("list_objects_v2")
+        for result in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            keys.extend(obj["Key"] for obj in result.get("Contents", []))
+
+        num_deleted = 0
+        for batch in _chunk_list(keys, _MAX_KEYS_PER_DELETE_REQUEST):
+            response = s3_client.delete_objects(
+                Bucket=bucket, Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            errors = response.get("Errors", [])
+            if errors:
+                raise MlflowException(
+                    "Failed to delete {num_errors} S3 objects under '{uri}'. First error: "
+                    "{error}".format(num_errors=len(errors), uri=self.artifact_uri, error=errors[0])
+                )
+            num_deleted += len(batch)
+            _logger.debug(
+                "Deleted %d/%d objects from s3://%s/%s", num_deleted, len(keys), bucket, prefix
+            )
@@ -0,0 +1,31 @@
+"""add registry changes table
+
+Revision ID: 2b42c614cb6d
+Revises: 3033144eca28
+Create Date: 2020-08-24 15:12:48.836420
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from mlflow.store.model_registry.dbmodels.models import SqlRegistryChange
+
+# revision identifiers, used by Alembic.
+revision = "2b42c614cb6d"
+down_revision = "3033144eca28"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        SqlRegistryChange.__tablename__,
+        sa.Column("revision", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=256), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=True),
+        sa.Column("timestamp", sa.BigInteger()),
+        sa.PrimaryKeyConstraint("revision", name="registry_change_pk"),
+    )
+
+
+def downgrade():
+    pass
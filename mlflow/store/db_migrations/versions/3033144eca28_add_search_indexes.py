@@ -0,0 +1,38 @@
+"""add search indexes
+
+Revision ID: 3033144eca28
+Revises: a8c4a736bde6
+Create Date: 2020-08-17 09:41:12.204581
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "3033144eca28"
+down_revision = "a8c4a736bde6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The same indexes are created on every database, so that the migrated schema matches the
+    # schema declared by the ORM models. Tag keys and values are at most 250 characters long, so
+    # the tags (key, value) index does not exceed the maximum size of an index entry
+    op.create_index(
+        "index_runs_experiment_id_lifecycle_stage_start_time",
+        "runs",
+        ["experiment_id", "lifecycle_stage", "start_time"],
+    )
+    op.create_index("index_latest_metrics_key_value", "latest_metrics", ["key", "value"])
+    op.create_index("index_params_key_value", "params", ["key", "value"])
+    op.create_index("index_tags_key_value", "tags", ["key", "value"])
+    # Runs are loaded together with their tags, params and latest metrics, which are looked up by
+    # run UUID. The primary keys of these tables start with the key column and cannot serve these
+    # lookups
+    for table in ["tags", "params", "latest_metrics"]:
+        op.create_index("index_{}_run_uuid".format(table), table, ["run_uuid"])
+
+
+def downgrade():
+    pass
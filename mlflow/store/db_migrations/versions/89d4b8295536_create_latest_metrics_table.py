@@ -124,7 +124,7 @@ def upgrade():
     _describe_migration_if_necessary(session)
     all_latest_metrics = _get_latest_metrics_for_runs(session=session)
 
-    op.create_table(
+    latest_metrics_table = op.create_table(
         SqlLatestMetric.__tablename__,
         Column("key", String(length=250)),
         Column("value", Float(precision=53), nullable=False),
@@ -135,18 +135,21 @@ def upgrade():
         PrimaryKeyConstraint("key", "run_uuid", name="latest_metric_pk"),
     )
 
-    session.add_all(
+    # Insert through the table created above rather than the ``SqlLatestMetric`` model, which
+    # may declare columns added by later migrations
+    op.bulk_insert(
+        latest_metrics_table,
         [
-            SqlLatestMetric(
-                run_uuid=run_uuid,
-                key=key,
-                step=step,
-                timestamp=timestamp,
-                value=value,
-                is_nan=is_nan,
-            )
+            {
+                "run_uuid": run_uuid,
+                "key": key,
+                "step": step,
+                "timestamp": timestamp,
+                "value": value,
+                "is_nan": is_nan,
+            }
             for run_uuid, key, step, timestamp, value, is_nan in all_latest_metrics
-        ]
+        ],
     )
     session.commit()
 
@@ -0,0 +1,64 @@
+"""add run columns to latest_metrics
+
+Revision ID: a8c4a736bde6
+Revises: 84291f40a231
+Create Date: 2020-08-10 11:02:37.413571
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a8c4a736bde6"
+down_revision = "84291f40a231"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("latest_metrics") as batch_op:
+        batch_op.add_column(sa.Column("experiment_id", sa.Integer, nullable=True))
+        batch_op.add_column(sa.Column("lifecycle_stage", sa.String(20), nullable=True))
+        batch_op.add_column(sa.Column("start_time", sa.BigInteger, nullable=True))
+
+    # Copy the run columns into existing latest metric entries
+    runs = sa.table(
+        "runs",
+        sa.column("run_uuid"),
+        sa.column("experiment_id"),
+        sa.column("lifecycle_stage"),
+        sa.column("start_time"),
+    )
+    latest_metrics = sa.table(
+        "latest_metrics",
+        sa.column("run_uuid"),
+        sa.column("experiment_id"),
+        sa.column("lifecycle_stage"),
+        sa.column("start_time"),
+    )
+
+    def _run_column(name):
+        return (
+            sa.select([runs.c[name]])
+            .where(runs.c.run_uuid == latest_metrics.c.run_uuid)
+            .as_scalar()
+        )
+
+    op.execute(
+        latest_metrics.update().values(
+            experiment_id=_run_column("experiment_id"),
+            lifecycle_stage=_run_column("lifecycle_stage"),
+            start_time=_run_column("start_time"),
+        )
+    )
+
+    op.create_index(
+        "index_latest_metrics_experiment_id_key_lifecycle_stage_value",
+        "latest_metrics",
+        ["experiment_id", "key", "lifecycle_stage", "value"],
+    )
+
+
+def downgrade():
+    pass
@@ -0,0 +1,343 @@
+"""
+Columnar container for the runs of a search result.
+"""
+from bisect import bisect_left
+
+from mlflow.entities import Metric, Param, Run, RunData, RunInfo, RunStatus, RunTag
+from mlflow.protos.service_pb2 import Run as ProtoRun
+
+_INFO_COLUMNS = (
+    "run_id",
+    "experiment_id",
+    "user_id",
+    "status",
+    "start_time",
+    "end_time",
+    "lifecycle_stage",
+    "artifact_uri",
+)
+
+
+class _KeyColumn(object):
+    """
+    Values of a single metric, param or tag key, stored in long form: one entry per value, in
+    increasing order of the index of the run the value belongs to.
+    """
+
+    __slots__ = ("run_indices", "values", "timestamps", "steps")
+
+    def __init__(self, has_history=False):
+        self.run_indices = []
+        self.values = []
+        self.timestamps = [] if has_history else None
+        self.steps = [] if has_history else None
+
+    def get_range(self, run_index):
+        start = bisect_left(self.run_indices, run_index)
+        end = start
+        while end < len(self.run_indices) and self.run_indices[end] == run_index:
+            end += 1
+        return start, end
+
+    def latest_values(self, num_runs, fill_value):
+        """
+        :return: List with the value of every run, ``fill_value`` for the runs without a value.
+                 If a run has several values, the last one is returned, as with
+                 :py:attr:`mlflow.entities.RunData.metrics`.
+        """
+        column = [fill_value] * num_runs
+        for run_index, value in zip(self.run_indices, self.values):
+            column[run_index] = value
+        return column
+
+
+class RunBatch(object):
+    """
+    Columnar collection of runs, e.g. a page of search results. Run attributes are stored as
+    one list per attribute, and metrics, params and tags as one :py:class:`_KeyColumn` per key,
+    so that a batch of runs can be converted to protobuf messages or to a pandas DataFrame
+    without creating a :py:class:`mlflow.entities.Run` object per run. Indexing or iterating
+    over the batch returns :py:class:`mlflow.entities.Run` objects, created on demand.
+
+    :param runs: Optional iterable of :py:class:`mlflow.entities.Run` to add to the batch.
+    :param token: Optional pagination token for the next batch, as in
+                  :py:class:`mlflow.store.entities.PagedList`.
+    """
+
+    def __init__(self, runs=None, token=None):
+        self.token = token
+        self._num_runs = 0
+        self._info = {name: [] for name in _INFO_COLUMNS}
+        self._metrics = {}
+        self._params = {}
+        self._tags = {}
+        if runs is not None:
+            self.extend(runs)
+
+    def __len__(self):
+        return self._num_runs
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._num_runs))]
+        if index < 0:
+            index += self._num_runs
+        if not 0 <= index < self._num_runs:
+            raise IndexError("RunBatch index out of range")
+        return self._get_run(index)
+
+    def __iter__(self):
+        for index in range(self._num_runs):
+            yield self._get_run(index)
+
+    @property
+    def run_ids(self):
+        """List of the IDs of the runs in the batch."""
+        return list(self._info["run_id"])
+
+    def _add_info(
+        self,
+        run_id,
+        experiment_id,
+        user_id,
+        status,
+        start_time,
+        end_time,
+        lifecycle_stage,
+        artifact_uri,
+    ):
+        info = self._info
+        info["run_id"].append(run_id)
+        info["experiment_id"].append(experiment_id)
+        info["user_id"].append(user_id)
+        info["status"].append(status)
+        info["start_time"].append(start_time)
+        info["end_time"].append(end_time)
+        info["lifecycle_stage"].append(lifecycle_stage)
+        info["artifact_uri"].append(artifact_uri)
+
+    def _add_metric(self, run_index, key, value, timestamp, step):
+        column = self._metrics.get(key)
+        if column is None:
+            column = self._metrics[key] = _KeyColumn(has_history=True)
+        column.run_indices.append(run_index)
+        column.values.append(value)
+        column.timestamps.append(timestamp)
+        column.steps.append(step)
+
+    @staticmethod
+    def _add_value(columns, run_index, key, value):
+        column = columns.get(key)
+        if column is None:
+            column = columns[key] = _KeyColumn()
+        column.run_indices.append(run_index)
+        column.values.append(value)
+
+    def append(self, run):
+        """
+        Add a :py:class:`mlflow.entities.Run` to the batch.
+        """
+        run_index = self._num_runs
+        info = run.info
+        self._add_info(
+            info.run_id,
+            info.experiment_id,
+            info.user_id,
+            info.status,
+            info.start_time,
+            info.end_time,
+            info.lifecycle_stage,
+            info.artifact_uri,
+        )
+        data = run.data
+        if data is not None and data._proto is not None:
+            # Do not expand run data that was converted from protobuf
+            self._add_proto_data(run_index, data._proto)
+        elif data is not None:
+            for metric in data._metric_list:
+                self._add_metric(run_index, metric.key, metric.value, metric.timestamp, metric.step)
+            for key, value in data.params.items():
+                self._add_value(self._params, run_index, key, value)
+            for key, value in data.tags.items():
+                self._add_value(self._tags, run_index, key, value)
+        self._num_runs += 1
+
+    def extend(self, runs):
+        """
+        Add an iterable of :py:class:`mlflow.entities.Run`, or the runs of another
+        :py:class:`RunBatch`, to the batch.
+        """
+        if isinstance(runs, RunBatch):
+            self._extend_batch(runs)
+            return
+        for run in runs:
+            self.append(run)
+
+    def _extend_batch(self, other):
+        offset = self._num_runs
+        for name, column in other._info.items():
+            self._info[name].extend(column)
+        for columns, other_columns in [
+            (self._metrics, other._metrics),
+            (self._params, other._params),
+            (self._tags, other._tags),
+        ]:
+            for key, other_column in other_columns.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = _KeyColumn(has_history=other_column.steps is not None)
+                column.run_indices.extend(index + offset for index in other_column.run_indices)
+                column.values.extend(other_column.values)
+                if other_column.steps is not None:
+                    column.timestamps.extend(other_column.timestamps)
+                    column.steps.extend(other_column.steps)
+        self._num_runs += other._num_runs
+
+    def _add_proto_data(self, run_index, proto_data):
+        for metric in proto_data.metrics:
+            self._add_metric(run_index, metric.key, metric.value, metric.timestamp, metric.step)
+        for param in proto_data.params:
+            self._add_value(self._params, run_index, param.key, param.value)
+        for tag in proto_data.tags:
+            self._add_value(self._tags, run_index, tag.key, tag.value)
+
+    def append_proto(self, proto):
+        """
+        Add a run given as a ``mlflow.protos.service_pb2.Run`` protobuf message to the batch.
+        """
+        run_index = self._num_runs
+        info = proto.info
+        self._add_info(
+            info.run_id,
+            info.experiment_id,
+            info.user_id,
+            RunStatus.to_string(info.status),
+            info.start_time,
+            # The proto2 default scalar value of zero indicates that the run's end time is absent
+            info.end_time or None,
+            info.lifecycle_stage,
+            info.artifact_uri,
+        )
+        self._add_proto_data(run_index, proto.data)
+        self._num_runs += 1
+
+    def extend_protos(self, protos):
+        """
+        Add an iterable of ``mlflow.protos.service_pb2.Run`` protobuf messages to the batch.
+        """
+        for proto in protos:
+            self.append_proto(proto)
+
+    def _get_run(self, run_index):
+        info = {name: column[run_index] for name, column in self._info.items()}
+        run_info = RunInfo(run_uuid=info["run_id"], **info)
+        metrics = []
+        for key, column in self._metrics.items():
+            start, end = column.get_range(run_index)
+            metrics.extend(
+                Metric(key, column.values[i], column.timestamps[i], column.steps[i])
+                for i in range(start, end)
+            )
+        params = []
+        for key, column in self._params.items():
+            start, end = column.get_range(run_index)
+            params.extend(Param(key, column.values[i]) for i in range(start, end))
+        tags = []
+        for key, column in self._tags.items():
+            start, end = column.get_range(run_index)
+            tags.extend(RunTag(key, column.values[i]) for i in range(start, end))
+        return Run(run_info, RunData(metrics=metrics, params=params, tags=tags))
+
+    def to_proto(self):
+        """
+        :return: List of ``mlflow.protos.service_pb2.Run`` protobuf messages, one per run.
+        """
+        protos = []
+        info = self._info
+        for run_index in range(self._num_runs):
+            proto = ProtoRun()
+            proto_info = proto.info
+            proto_info.run_uuid = info["run_id"][run_index]
+            proto_info.run_id = info["run_id"][run_index]
+            proto_info.experiment_id = info["experiment_id"][run_index]
+            proto_info.user_id = info["user_id"][run_index]
+            proto_info.status = RunStatus.from_string(info["status"][run_index])
+            proto_info.start_time = info["start_time"][run_index]
+            if info["end_time"][run_index]:
+                proto_info.end_time = info["end_time"][run_index]
+            if info["artifact_uri"][run_index]:
+                proto_info.artifact_uri = info["artifact_uri"][run_index]
+            proto_info.lifecycle_stage = info["lifecycle_stage"][run_index]
+            proto.data.SetInParent()
+            protos.append(proto)
+        for key, column in self._metrics.items():
+            for run_index, value, timestamp, step in zip(
+                column.run_indices, column.values, column.timestamps, column.steps
+            ):
+                protos[run_index].data.metrics.add(
+                    key=key, value=value, timestamp=timestamp, step=step
+                )
+        for key, column in self._params.items():
+            for run_index, value in zip(column.run_indices, column.values):
+                protos[run_index].data.params.add(key=key, value=value)
+        for key, column in self._tags.items():
+            for run_index, value in zip(column.run_indices, column.values):
+                protos[run_index].data.tags.add(key=key, value=value)
+        return protos
+
+    def to_pandas(self):
+        """
+        :return: A pandas DataFrame with one row per run, in the format returned by
+                 :py:func:`mlflow.search_runs`: the ``run_id``, ``experiment_id``, ``status``,
+                 ``artifact_uri``, ``start_time`` and ``end_time`` columns, followed by one
+                 ``metrics.<key>``, ``params.<key>`` and ``tags.<key>`` column per key. Missing
+                 metrics are ``NaN`` and missing params and tags are ``None``.
+        """
+        import numpy as np
+        import pandas as pd
+
+        info = self._info
+        data = {
+            "run_id": info["run_id"],
+            "experiment_id": info["experiment_id"],
+            "status": info["status"],
+            "artifact_uri": info["artifact_uri"],
+            "start_time": pd.to_datetime(info["start_time"], unit="ms", utc=True),
+            "end_time": pd.to_datetime(info["end_time"], unit="ms", utc=True),
+        }
+        for prefix, columns, fill_value in [
+            ("metrics", self._metrics, np.nan),
+            ("params", self._params, None),
+            ("tags", self._tags, None),
+        ]:
+            for key, column in columns.items():
+                data[prefix + "." + key] = column.latest_values(self._num_runs, fill_value)
+        return pd.DataFrame(data)
+
+    def to_arrow(self):
+        """
+        :return: A ``pyarrow.Table`` with the columns of :py:meth:`to_pandas`, built directly from
+                 the columns of the batch. Requires the ``pyarrow`` package.
+        """
+        import pyarrow as pa
+
+        info = self._info
+        timestamp_type = pa.timestamp("ms", tz="UTC")
+        data = {
+            "run_id": pa.array(info["run_id"], type=pa.string()),
+            "experiment_id": pa.array(info["experiment_id"], type=pa.string()),
+            "status": pa.array(info["status"], type=pa.string()),
+            "artifact_uri": pa.array(info["artifact_uri"], type=pa.string()),
+            "start_time": pa.array(info["start_time"], type=timestamp_type),
+            "end_time": pa.array(info["end_time"], type=timestamp_type),
+        }
+        for prefix, columns, value_type in [
+            ("metrics", self._metrics, pa.float64()),
+            ("params", self._params, pa.string()),
+            ("tags", self._tags, pa.string()),
+        ]:
+            for key, column in columns.items():
+                data[prefix + "." + key] = pa.array(
+                    column.latest_values(self._num_runs, None), type=value_type
+                )
+        return pa.table(data)
@@ -1,2 +1,8 @@
 SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT = 100
 SEARCH_REGISTERED_MODEL_MAX_RESULTS_THRESHOLD = 1000
+SEARCH_MODEL_VERSION_MAX_RESULTS_DEFAULT = 200000
+SEARCH_MODEL_VERSION_MAX_RESULTS_THRESHOLD = 200000
+# Maximum number of seconds a registry change feed request may wait for changes
+REGISTRY_CHANGES_MAX_TIMEOUT = 30
+# Path of the REST endpoint of the registry change feed, which is not part of the protobuf API
+REGISTRY_CHANGES_PATH = "/preview/mlflow/registry/changes"
@@ -228,15 +228,25 @@ class AbstractStore:
         pass
 
     @abstractmethod
-    def search_model_versions(self, filter_string):
+    def search_model_versions(
+        self, filter_string, max_results=None, order_by=None, page_token=None
+    ):
         """
         Search for model versions in backend that satisfy the filter criteria.
 
-        :param filter_string: A filter string expression. Currently supports a single filter
-                              condition either name of model like ``name = 'model_name'`` or
-                              ``run_id = '...'``.
+        :param filter_string: A filter string expression: one or more comparisons joined by
+                              ``AND``, on ``name``, ``run_id``, ``source_path``,
+                              ``current_stage``, ``version_number``, ``creation_timestamp``,
+                              ``last_updated_timestamp`` or tags (``tags.<key>``), e.g.
+                              ``name = 'model_name' AND current_stage = 'Production'``.
+        :param max_results: Maximum number of model versions desired.
+        :param order_by: List of column names with ASC|DESC annotation, to be used for ordering
+                         matching search results.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                            a ``search_model_versions`` call.
         :return: PagedList of :py:class:`mlflow.entities.model_registry.ModelVersion`
-                 objects.
+                 objects. The pagination token for the next page can be obtained via the
+                 ``token`` attribute of the object.
         """
         pass
 
@@ -263,3 +273,23 @@ class AbstractStore:
         :return: None
         """
         pass
+
+    # Registry change feed
+
+    def get_registry_changes(self, since_revision, timeout=0):
+        """
+        Get the registered models that changed after a given registry revision, optionally
+        waiting for changes. Stores that do not implement a change feed raise
+        ``NotImplementedError``.
+
+        :param since_revision: Registry revision, e.g. returned by a previous call. If ``None``,
+                               only the current revision is returned.
+        :param timeout: Maximum number of seconds to wait for a change after ``since_revision``
+                        if there is none yet.
+        :return: Tuple ``(revision, names)`` of the current registry revision and of the sorted
+                 names of the registered models that changed (or were created, renamed or
+                 deleted) after ``since_revision``.
+        """
+        raise NotImplementedError(
+            "{} does not support the registry change feed".format(type(self).__name__)
+        )
@@ -40,21 +40,29 @@ class SqlRegisteredModel(Base):
             self.name, self.description, self.creation_time, self.last_updated_time
         )
 
-    def to_mlflow_entity(self):
-        # SqlRegisteredModel has backref to all "model_versions". Filter latest for each stage.
-        latest_versions = {}
-        for mv in self.model_versions:
-            stage = mv.current_stage
-            if stage != STAGE_DELETED_INTERNAL and (
-                stage not in latest_versions or latest_versions[stage].version < mv.version
-            ):
-                latest_versions[stage] = mv
+    def to_mlflow_entity(self, latest_versions=None):
+        """
+        :param latest_versions: List of the latest ``SqlModelVersion`` of each stage, e.g. fetched
+                                for many registered models at once. If ``None``, they are
+                                computed from all the versions of this registered model.
+        """
+        if latest_versions is None:
+            # SqlRegisteredModel has backref to all "model_versions". Filter latest for each stage.
+            latest_versions_by_stage = {}
+            for mv in self.model_versions:
+                stage = mv.current_stage
+                if stage != STAGE_DELETED_INTERNAL and (
+                    stage not in latest_versions_by_stage
+                    or latest_versions_by_stage[stage].version < mv.version
+                ):
+                    latest_versions_by_stage[stage] = mv
+            latest_versions = latest_versions_by_stage.values()
         return RegisteredModel(
             self.name,
             self.creation_time,
             self.last_updated_time,
             self.description,
-            [mvd.to_mlflow_entity() for mvd in latest_versions.values()],
+            [mvd.to_mlflow_entity() for mvd in latest_versions],
             [tag.to_mlflow_entity() for tag in self.registered_model_tags],
         )
 
@@ -171,3 +179,25 @@ class SqlModelVersionTag(Base):
     # entity mappers
     def to_mlflow_entity(self):
         return ModelVersionTag(self.key, self.value)
+
+
+class SqlRegistryChange(Base):
+    """
+    Entry of the registry change feed, recorded by every call that modifies a registered model or
+    one of its versions. Revisions are assigned in increasing order.
+    """
+
+    __tablename__ = "registry_changes"
+
+    revision = Column(Integer, autoincrement=True)
+
+    name = Column(String(256), nullable=False)
+
+    version = Column(Integer, nullable=True)
+
+    timestamp = Column(BigInteger, default=lambda: int(time.time() * 1000))
+
+    __table_args__ = (PrimaryKeyConstraint("revision", name="registry_change_pk"),)
+
+    def __repr__(self):
+        return "<SqlRegistryChange ({}, {}, {})>".format(self.revision, self.name, self.version)
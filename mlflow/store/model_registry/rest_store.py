@@ -1,3 +1,4 @@
+import json
 import logging
 
 from mlflow.entities.model_registry import RegisteredModel, ModelVersion
@@ -24,11 +25,13 @@ from mlflow.protos.model_registry_pb2 import (
     DeleteModelVersionTag,
 )
 from mlflow.store.entities.paged_list import PagedList
+from mlflow.store.model_registry import REGISTRY_CHANGES_MAX_TIMEOUT, REGISTRY_CHANGES_PATH
 from mlflow.store.model_registry.abstract_store import AbstractStore
-from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.rest_utils import (
     call_endpoint,
     extract_api_info_for_service,
+    http_request,
+    verify_rest_response,
     _REST_API_PATH_PREFIX,
 )
 
@@ -71,9 +74,7 @@ class RestStore(AbstractStore):
                  created in the backend.
         """
         proto_tags = [tag.to_proto() for tag in tags or []]
-        req_body = message_to_json(
-            CreateRegisteredModel(name=name, tags=proto_tags, description=description)
-        )
+        req_body = CreateRegisteredModel(name=name, tags=proto_tags, description=description)
         response_proto = self._call_endpoint(CreateRegisteredModel, req_body)
         return RegisteredModel.from_proto(response_proto.registered_model)
 
@@ -85,7 +86,7 @@ class RestStore(AbstractStore):
         :param description: New description.
         :return: A single updated :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
         """
-        req_body = message_to_json(UpdateRegisteredModel(name=name, description=description))
+        req_body = UpdateRegisteredModel(name=name, description=description)
         response_proto = self._call_endpoint(UpdateRegisteredModel, req_body)
         return RegisteredModel.from_proto(response_proto.registered_model)
 
@@ -97,7 +98,7 @@ class RestStore(AbstractStore):
         :param new_name: New proposed name.
         :return: A single updated :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
         """
-        req_body = message_to_json(RenameRegisteredModel(name=name, new_name=new_name))
+        req_body = RenameRegisteredModel(name=name, new_name=new_name)
         response_proto = self._call_endpoint(RenameRegisteredModel, req_body)
         return RegisteredModel.from_proto(response_proto.registered_model)
 
@@ -109,7 +110,7 @@ class RestStore(AbstractStore):
         :param name: Registered model name.
         :return: None
         """
-        req_body = message_to_json(DeleteRegisteredModel(name=name))
+        req_body = DeleteRegisteredModel(name=name)
         self._call_endpoint(DeleteRegisteredModel, req_body)
 
     def list_registered_models(self, max_results, page_token):
@@ -123,9 +124,7 @@ class RestStore(AbstractStore):
                 that satisfy the search expressions. The pagination token for the next page can be
                 obtained via the ``token`` attribute of the object.
         """
-        req_body = message_to_json(
-            ListRegisteredModels(page_token=page_token, max_results=max_results)
-        )
+        req_body = ListRegisteredModels(page_token=page_token, max_results=max_results)
         response_proto = self._call_endpoint(ListRegisteredModels, req_body)
         return PagedList(
             [
@@ -151,13 +150,8 @@ class RestStore(AbstractStore):
                 that satisfy the search expressions. The pagination token for the next page can be
                 obtained via the ``token`` attribute of the object.
         """
-        req_body = message_to_json(
-            SearchRegisteredModels(
-                filter=filter_string,
-                max_results=max_results,
-                order_by=order_by,
-                page_token=page_token,
-            )
+        req_body = SearchRegisteredModels(
+            filter=filter_string, max_results=max_results, order_by=order_by, page_token=page_token,
         )
         response_proto = self._call_endpoint(SearchRegisteredModels, req_body)
         registered_models = [
@@ -173,7 +167,7 @@ class RestStore(AbstractStore):
         :param name: Registered model name.
         :return: A single :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
         """
-        req_body = message_to_json(GetRegisteredModel(name=name))
+        req_body = GetRegisteredModel(name=name)
         response_proto = self._call_endpoint(GetRegisteredModel, req_body)
         return RegisteredModel.from_proto(response_proto.registered_model)
 
@@ -187,7 +181,7 @@ class RestStore(AbstractStore):
                        for 'Staging' and 'Production' stages.
         :return: List of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
         """
-        req_body = message_to_json(GetLatestVersions(name=name, stages=stages))
+        req_body = GetLatestVersions(name=name, stages=stages)
         response_proto = self._call_endpoint(GetLatestVersions, req_body)
         return [
             ModelVersion.from_proto(model_version)
@@ -202,7 +196,7 @@ class RestStore(AbstractStore):
         :param tag: :py:class:`mlflow.entities.model_registry.RegisteredModelTag` instance to log.
         :return: None
         """
-        req_body = message_to_json(SetRegisteredModelTag(name=name, key=tag.key, value=tag.value))
+        req_body = SetRegisteredModelTag(name=name, key=tag.key, value=tag.value)
         self._call_endpoint(SetRegisteredModelTag, req_body)
 
     def delete_registered_model_tag(self, name, key):
@@ -213,7 +207,7 @@ class RestStore(AbstractStore):
         :param key: Registered model tag key.
         :return: None
         """
-        req_body = message_to_json(DeleteRegisteredModelTag(name=name, key=key))
+        req_body = DeleteRegisteredModelTag(name=name, key=key)
         self._call_endpoint(DeleteRegisteredModelTag, req_body)
 
     # CRUD API for ModelVersion objects
@@ -235,15 +229,13 @@ class RestStore(AbstractStore):
                  created in the backend.
         """
         proto_tags = [tag.to_proto() for tag in tags or []]
-        req_body = message_to_json(
-            CreateModelVersion(
-                name=name,
-                source=source,
-                run_id=run_id,
-                run_link=run_link,
-                tags=proto_tags,
-                description=description,
-            )
+        req_body = CreateModelVersion(
+            name=name,
+            source=source,
+            run_id=run_id,
+            run_link=run_link,
+            tags=proto_tags,
+            description=description,
         )
         response_proto = self._call_endpoint(CreateModelVersion, req_body)
         return ModelVersion.from_proto(response_proto.model_version)
@@ -261,13 +253,11 @@ class RestStore(AbstractStore):
 
         :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
         """
-        req_body = message_to_json(
-            TransitionModelVersionStage(
-                name=name,
-                version=str(version),
-                stage=stage,
-                archive_existing_versions=archive_existing_versions,
-            )
+        req_body = TransitionModelVersionStage(
+            name=name,
+            version=str(version),
+            stage=stage,
+            archive_existing_versions=archive_existing_versions,
         )
         response_proto = self._call_endpoint(TransitionModelVersionStage, req_body)
         return ModelVersion.from_proto(response_proto.model_version)
@@ -281,9 +271,7 @@ class RestStore(AbstractStore):
         :param description: New model description.
         :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
         """
-        req_body = message_to_json(
-            UpdateModelVersion(name=name, version=str(version), description=description)
-        )
+        req_body = UpdateModelVersion(name=name, version=str(version), description=description)
         response_proto = self._call_endpoint(UpdateModelVersion, req_body)
         return ModelVersion.from_proto(response_proto.model_version)
 
@@ -295,7 +283,7 @@ class RestStore(AbstractStore):
         :param version: Registered model version.
         :return: None
         """
-        req_body = message_to_json(DeleteModelVersion(name=name, version=str(version)))
+        req_body = DeleteModelVersion(name=name, version=str(version))
         self._call_endpoint(DeleteModelVersion, req_body)
 
     def get_model_version(self, name, version):
@@ -306,7 +294,7 @@ class RestStore(AbstractStore):
         :param version: Registered model version.
         :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
         """
-        req_body = message_to_json(GetModelVersion(name=name, version=str(version)))
+        req_body = GetModelVersion(name=name, version=str(version))
         response_proto = self._call_endpoint(GetModelVersion, req_body)
         return ModelVersion.from_proto(response_proto.model_version)
 
@@ -320,21 +308,33 @@ class RestStore(AbstractStore):
         :param version: Registered model version.
         :return: A single URI location that allows reads for downloading.
         """
-        req_body = message_to_json(GetModelVersionDownloadUri(name=name, version=str(version)))
+        req_body = GetModelVersionDownloadUri(name=name, version=str(version))
         response_proto = self._call_endpoint(GetModelVersionDownloadUri, req_body)
         return response_proto.artifact_uri
 
-    def search_model_versions(self, filter_string):
+    def search_model_versions(
+        self, filter_string, max_results=None, order_by=None, page_token=None
+    ):
         """
         Search for model versions in backend that satisfy the filter criteria.
 
-        :param filter_string: A filter string expression. Currently supports a single filter
-                              condition either name of model like ``name = 'model_name'`` or
-                              ``run_id = '...'``.
+        :param filter_string: A filter string expression: one or more comparisons joined by
+                              ``AND``, on ``name``, ``run_id``, ``source_path``,
+                              ``current_stage``, ``version_number``, ``creation_timestamp``,
+                              ``last_updated_timestamp`` or tags (``tags.<key>``), e.g.
+                              ``name = 'model_name' AND current_stage = 'Production'``.
+        :param max_results: Maximum number of model versions desired.
+        :param order_by: List of column names with ASC|DESC annotation, to be used for ordering
+                         matching search results.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                            a ``search_model_versions`` call.
         :return: PagedList of :py:class:`mlflow.entities.model_registry.ModelVersion`
-                 objects.
+                 objects. The pagination token for the next page can be obtained via the
+                 ``token`` attribute of the object.
         """
-        req_body = message_to_json(SearchModelVersions(filter=filter_string))
+        req_body = SearchModelVersions(
+            filter=filter_string, max_results=max_results, order_by=order_by, page_token=page_token,
+        )
         response_proto = self._call_endpoint(SearchModelVersions, req_body)
         model_versions = [ModelVersion.from_proto(mvd) for mvd in response_proto.model_versions]
         return PagedList(model_versions, response_proto.next_page_token)
@@ -348,9 +348,7 @@ class RestStore(AbstractStore):
         :param tag: :py:class:`mlflow.entities.model_registry.ModelVersionTag` instance to log.
         :return: None
         """
-        req_body = message_to_json(
-            SetModelVersionTag(name=name, version=version, key=tag.key, value=tag.value)
-        )
+        req_body = SetModelVersionTag(name=name, version=version, key=tag.key, value=tag.value)
         self._call_endpoint(SetModelVersionTag, req_body)
 
     def delete_model_version_tag(self, name, version, key):
@@ -362,5 +360,36 @@ class RestStore(AbstractStore):
         :param key: Tag key.
         :return: None
         """
-        req_body = message_to_json(DeleteModelVersionTag(name=name, version=version, key=key))
+        req_body = DeleteModelVersionTag(name=name, version=version, key=key)
         self._call_endpoint(DeleteModelVersionTag, req_body)
+
+    def get_registry_changes(self, since_revision, timeout=0):
+        """
+        Get the registered models that changed after a given registry revision, optionally
+        waiting for changes.
+
+        :param since_revision: Registry revision, e.g. returned by a previous call. If ``None``,
+                               only the current revision is returned.
+        :param timeout: Maximum number of seconds to wait for a change after ``since_revision``
+                        if there is none yet.
+        :return: Tuple ``(revision, names)`` of the current registry revision and of the sorted
+                 names of the registered models that changed (or were created, renamed or
+                 deleted) after ``since_revision``.
+        """
+        endpoint = _REST_API_PATH_PREFIX + REGISTRY_CHANGES_PATH
+        response = http_request(
+            host_creds=self.get_host_creds(),
+            endpoint=endpoint,
+            method="GET",
+            params={"since_revision": since_revision, "timeout": timeout},
+            # Leave time for the server to respond once the long-poll timeout has elapsed
+            timeout=min(timeout, REGISTRY_CHANGES_MAX_TIMEOUT) + 60,
+        )
+        if response.status_code == 404:
+            # The change feed is not available on servers of earlier versions
+            raise NotImplementedError(
+                "The model registry change feed is not supported by the server at '%s'"
+                % self.get_host_creds().host
+            )
+        response_json = json.loads(verify_rest_response(response, endpoint).text)
+        return response_json["revision"], response_json["registered_model_names"]
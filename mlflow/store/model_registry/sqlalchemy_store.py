@@ -18,6 +18,9 @@ from mlflow.protos.databricks_pb2 import (
 )
 import mlflow.store.db.utils
 from mlflow.store.model_registry import (
+    REGISTRY_CHANGES_MAX_TIMEOUT,
+    SEARCH_MODEL_VERSION_MAX_RESULTS_DEFAULT,
+    SEARCH_MODEL_VERSION_MAX_RESULTS_THRESHOLD,
     SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT,
     SEARCH_REGISTERED_MODEL_MAX_RESULTS_THRESHOLD,
 )
@@ -29,6 +32,7 @@ from mlflow.store.model_registry.dbmodels.models import (
     SqlModelVersion,
     SqlRegisteredModelTag,
     SqlModelVersionTag,
+    SqlRegistryChange,
 )
 from mlflow.utils.search_utils import SearchUtils
 from mlflow.utils.uri import extract_db_type_from_uri
@@ -51,6 +55,20 @@ _logger = logging.getLogger(__name__)
 sqlalchemy.orm.configure_mappers()
 
 
+# Maximum number of registered model names bound in a single query, which keeps queries below
+# the limit on the number of bound parameters of SQLite
+_MAX_NAMES_PER_QUERY = 500
+
+# Interval at which ``get_registry_changes`` polls the change feed while waiting for changes
+_REGISTRY_CHANGES_POLL_INTERVAL_SECONDS = 0.5
+
+# Entries of the change feed are deleted once they are older than the retention period, which is
+# much longer than the maximum age of the reads of the registry read cache. Old entries are
+# pruned at most once per interval by each store instance
+_REGISTRY_CHANGES_RETENTION_SECONDS = 24 * 60 * 60
+_REGISTRY_CHANGES_PRUNING_INTERVAL_SECONDS = 60 * 60
+
+
 def now():
     return int(time.time() * 1000)
 
@@ -100,6 +118,7 @@ class SqlAlchemyStore(AbstractStore):
         # TODO: verify schema here once we add logic to initialize the registry tables if they
         # don't exist (schema verification will fail in tests otherwise)
         # mlflow.store.db.utils._verify_schema(self.engine)
+        self._last_registry_changes_pruning_time = 0
 
     @staticmethod
     def _verify_registry_tables_exist(engine):
@@ -141,6 +160,65 @@ class SqlAlchemyStore(AbstractStore):
         # loading_relationships.html#relationship-loading-techniques
         return [sqlalchemy.orm.subqueryload(SqlModelVersion.model_version_tags)]
 
+    @classmethod
+    def _get_latest_model_versions(cls, session, names, stages=None):
+        """
+        Fetch the latest version of each stage of the given registered models, computed in SQL
+        with a single group-by query per batch of names rather than by loading every version.
+
+        :param names: Names of the registered models.
+        :param stages: Canonical names of the stages to fetch the latest versions of. If
+                       ``None``, the latest versions of all stages are fetched.
+        :return: Dictionary mapping each registered model name to the list of its latest
+                 ``SqlModelVersion`` objects, with eagerly loaded tags, ordered by version.
+        """
+        latest_versions = {name: [] for name in names}
+        names = list(latest_versions)
+        for start in range(0, len(names), _MAX_NAMES_PER_QUERY):
+            conditions = [
+                SqlModelVersion.name.in_(names[start : start + _MAX_NAMES_PER_QUERY]),
+                SqlModelVersion.current_stage != STAGE_DELETED_INTERNAL,
+            ]
+            if stages is not None:
+                conditions.append(SqlModelVersion.current_stage.in_(list(stages)))
+            latest_versions_query = (
+                session.query(
+                    SqlModelVersion.name,
+                    sqlalchemy.func.max(SqlModelVersion.version).label("version"),
+                )
+                .filter(*conditions)
+                .group_by(SqlModelVersion.name, SqlModelVersion.current_stage)
+                .subquery()
+            )
+            sql_model_versions = (
+                session.query(SqlModelVersion)
+                .options(*cls._get_eager_model_version_query_options())
+                .join(
+                    latest_versions_query,
+                    sqlalchemy.and_(
+                        SqlModelVersion.name == latest_versions_query.c.name,
+                        SqlModelVersion.version == latest_versions_query.c.version,
+                    ),
+                )
+                .order_by(SqlModelVersion.name, SqlModelVersion.version)
+                .all()
+            )
+            for sql_model_version in sql_model_versions:
+                latest_versions[sql_model_version.name].append(sql_model_version)
+        return latest_versions
+
+    @classmethod
+    def _to_registered_model_entities(cls, session, sql_registered_models):
+        """
+        Convert ``SqlRegisteredModel`` objects to
+        :py:class:`mlflow.entities.model_registry.RegisteredModel` entities, fetching the latest
+        versions of all of them with a constant number of queries.
+        """
+        latest_versions = cls._get_latest_model_versions(
+            session, [rm.name for rm in sql_registered_models]
+        )
+        return [rm.to_mlflow_entity(latest_versions[rm.name]) for rm in sql_registered_models]
+
     def _save_to_db(self, session, objs):
         """
         Store in db
@@ -151,6 +229,81 @@ class SqlAlchemyStore(AbstractStore):
             # single object
             session.add(objs)
 
+    def _record_change(self, session, name, version=None):
+        """
+        Append an entry to the registry change feed, as part of the transaction of ``session``,
+        and periodically delete the entries older than the retention period.
+        """
+        session.add(
+            SqlRegistryChange(
+                name=name, version=None if version is None else int(version), timestamp=now()
+            )
+        )
+        pruning_time = time.time()
+        if (
+            pruning_time - self._last_registry_changes_pruning_time
+            >= _REGISTRY_CHANGES_PRUNING_INTERVAL_SECONDS
+        ):
+            self._last_registry_changes_pruning_time = pruning_time
+            self._prune_registry_changes(session)
+
+    @staticmethod
+    def _prune_registry_changes(session):
+        # The latest entry is always kept, so that the registry revision never decreases
+        latest_revision = session.query(sqlalchemy.func.max(SqlRegistryChange.revision)).scalar()
+        if latest_revision is None:
+            return
+        session.query(SqlRegistryChange).filter(
+            SqlRegistryChange.timestamp < now() - _REGISTRY_CHANGES_RETENTION_SECONDS * 1000,
+            SqlRegistryChange.revision < latest_revision,
+        ).delete(synchronize_session=False)
+
+    def get_registry_revision(self):
+        """
+        :return: The current revision of the registry, which increases with every change to a
+                 registered model or model version. ``0`` if the registry was never modified.
+        """
+        with self.ManagedSessionMaker() as session:
+            return session.query(sqlalchemy.func.max(SqlRegistryChange.revision)).scalar() or 0
+
+    def get_registry_changes(self, since_revision, timeout=0):
+        """
+        Get the registered models that changed after a given registry revision, optionally
+        waiting for changes.
+
+        :param since_revision: Registry revision, e.g. returned by a previous call. If ``None``,
+                               only the current revision is returned.
+        :param timeout: Maximum number of seconds to wait for a change after ``since_revision``
+                        if there is none yet.
+        :return: Tuple ``(revision, names)`` of the current registry revision and of the sorted
+                 names of the registered models that changed (or were created, renamed or
+                 deleted) after ``since_revision``.
+        """
+        if since_revision is None:
+            return self.get_registry_revision(), []
+        deadline = time.time() + min(timeout, REGISTRY_CHANGES_MAX_TIMEOUT)
+        while True:
+            with self.ManagedSessionMaker() as session:
+                changes = (
+                    session.query(
+                        SqlRegistryChange.name,
+                        sqlalchemy.func.max(SqlRegistryChange.revision).label("revision"),
+                    )
+                    .filter(SqlRegistryChange.revision > since_revision)
+                    .group_by(SqlRegistryChange.name)
+                    .all()
+                )
+                if changes:
+                    revision = max(change.revision for change in changes)
+                    return revision, sorted(change.name for change in changes)
+                revision = (
+                    session.query(sqlalchemy.func.max(SqlRegistryChange.revision)).scalar() or 0
+                )
+            # Also return if the registry was reset to an earlier revision
+            if revision < since_revision or time.time() >= deadline:
+                return revision, []
+            time.sleep(_REGISTRY_CHANGES_POLL_INTERVAL_SECONDS)
+
     def create_registered_model(self, name, tags=None, description=None):
         """
         Create a new registered model in backend store.
@@ -181,6 +334,7 @@ class SqlAlchemyStore(AbstractStore):
                     SqlRegisteredModelTag(key=key, value=value) for key, value in tags_dict.items()
                 ]
                 self._save_to_db(session, registered_model)
+                self._record_change(session, name)
                 session.flush()
                 return registered_model.to_mlflow_entity()
             except sqlalchemy.exc.IntegrityError as e:
@@ -232,8 +386,9 @@ class SqlAlchemyStore(AbstractStore):
             sql_registered_model.description = description
             sql_registered_model.last_updated_time = updated_time
             self._save_to_db(session, [sql_registered_model])
+            self._record_change(session, name)
             session.flush()
-            return sql_registered_model.to_mlflow_entity()
+            return self._to_registered_model_entities(session, [sql_registered_model])[0]
 
     def rename_registered_model(self, name, new_name):
         """
@@ -256,6 +411,8 @@ class SqlAlchemyStore(AbstractStore):
                 self._save_to_db(
                     session, [sql_registered_model] + sql_registered_model.model_versions
                 )
+                self._record_change(session, name)
+                self._record_change(session, new_name)
                 session.flush()
                 return sql_registered_model.to_mlflow_entity()
             except sqlalchemy.exc.IntegrityError as e:
@@ -276,6 +433,7 @@ class SqlAlchemyStore(AbstractStore):
         with self.ManagedSessionMaker() as session:
             sql_registered_model = self._get_registered_model(session, name)
             session.delete(sql_registered_model)
+            self._record_change(session, name)
 
     def list_registered_models(self, max_results, page_token):
         """
@@ -366,6 +524,7 @@ class SqlAlchemyStore(AbstractStore):
         with self.ManagedSessionMaker() as session:
             query = (
                 session.query(SqlRegisteredModel)
+                .options(*self._get_eager_registered_model_query_options())
                 .filter(*conditions)
                 .order_by(*parsed_orderby)
                 .limit(max_results_for_query)
@@ -374,7 +533,9 @@ class SqlAlchemyStore(AbstractStore):
                 query = query.offset(offset)
             sql_registered_models = query.all()
             next_page_token = compute_next_token(len(sql_registered_models))
-            rm_entities = [rm.to_mlflow_entity() for rm in sql_registered_models][:max_results]
+            rm_entities = self._to_registered_model_entities(
+                session, sql_registered_models[:max_results]
+            )
             return PagedList(rm_entities, next_page_token)
 
     @classmethod
@@ -423,7 +584,8 @@ class SqlAlchemyStore(AbstractStore):
         :return: A single :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
         """
         with self.ManagedSessionMaker() as session:
-            return self._get_registered_model(session, name, eager=True).to_mlflow_entity()
+            sql_registered_model = self._get_registered_model(session, name, eager=True)
+            return self._to_registered_model_entities(session, [sql_registered_model])[0]
 
     def get_latest_versions(self, name, stages=None):
         """
@@ -435,17 +597,19 @@ class SqlAlchemyStore(AbstractStore):
                        for 'Staging' and 'Production' stages.
         :return: List of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
         """
+        if stages is None or len(stages) == 0:
+            expected_stages = set(
+                [get_canonical_stage(stage) for stage in DEFAULT_STAGES_FOR_GET_LATEST_VERSIONS]
+            )
+        else:
+            expected_stages = set([get_canonical_stage(stage) for stage in stages])
         with self.ManagedSessionMaker() as session:
-            sql_registered_model = self._get_registered_model(session, name)
-            # Convert to RegisteredModel entity first and then extract latest_versions
-            latest_versions = sql_registered_model.to_mlflow_entity().latest_versions
-            if stages is None or len(stages) == 0:
-                expected_stages = set(
-                    [get_canonical_stage(stage) for stage in DEFAULT_STAGES_FOR_GET_LATEST_VERSIONS]
-                )
-            else:
-                expected_stages = set([get_canonical_stage(stage) for stage in stages])
-            return [mv for mv in latest_versions if mv.current_stage in expected_stages]
+            # check if registered model exists
+            self._get_registered_model(session, name)
+            latest_versions = self._get_latest_model_versions(
+                session, [name], stages=expected_stages
+            )
+            return [mv.to_mlflow_entity() for mv in latest_versions[name]]
 
     @classmethod
     def _get_registered_model_tag(cls, session, name, key):
@@ -478,6 +642,7 @@ class SqlAlchemyStore(AbstractStore):
             # check if registered model exists
             self._get_registered_model(session, name)
             session.merge(SqlRegisteredModelTag(name=name, key=tag.key, value=tag.value))
+            self._record_change(session, name)
 
     def delete_registered_model_tag(self, name, key):
         """
@@ -495,6 +660,7 @@ class SqlAlchemyStore(AbstractStore):
             existing_tag = self._get_registered_model_tag(session, name, key)
             if existing_tag is not None:
                 session.delete(existing_tag)
+                self._record_change(session, name)
 
     # CRUD API for ModelVersion objects
 
@@ -548,6 +714,7 @@ class SqlAlchemyStore(AbstractStore):
                         SqlModelVersionTag(key=key, value=value) for key, value in tags_dict.items()
                     ]
                     self._save_to_db(session, [sql_registered_model, model_version])
+                    self._record_change(session, name, version)
                     session.flush()
                     return model_version.to_mlflow_entity()
                 except sqlalchemy.exc.IntegrityError:
@@ -631,6 +798,7 @@ class SqlAlchemyStore(AbstractStore):
             sql_model_version.description = description
             sql_model_version.last_updated_time = updated_time
             self._save_to_db(session, [sql_model_version])
+            self._record_change(session, name, version)
             return sql_model_version.to_mlflow_entity()
 
     def transition_model_version_stage(self, name, version, stage, archive_existing_versions):
@@ -677,6 +845,9 @@ class SqlAlchemyStore(AbstractStore):
             sql_registered_model = sql_model_version.registered_model
             sql_registered_model.last_updated_time = last_updated_time
             self._save_to_db(session, [*model_versions, sql_model_version, sql_registered_model])
+            for mv in model_versions:
+                self._record_change(session, name, mv.version)
+            self._record_change(session, name, version)
             return sql_model_version.to_mlflow_entity()
 
     def delete_model_version(self, name, version):
@@ -702,6 +873,7 @@ class SqlAlchemyStore(AbstractStore):
             sql_model_version.run_link = "REDACTED-RUN-LINK"
             sql_model_version.status_message = None
             self._save_to_db(session, [sql_registered_model, sql_model_version])
+            self._record_change(session, name, version)
 
     def get_model_version(self, name, version):
         """
@@ -729,56 +901,132 @@ class SqlAlchemyStore(AbstractStore):
             sql_model_version = self._get_sql_model_version(session, name, version)
             return sql_model_version.source
 
-    def search_model_versions(self, filter_string):
+    def search_model_versions(
+        self,
+        filter_string,
+        max_results=SEARCH_MODEL_VERSION_MAX_RESULTS_DEFAULT,
+        order_by=None,
+        page_token=None,
+    ):
         """
         Search for model versions in backend that satisfy the filter criteria.
 
-        :param filter_string: A filter string expression. Currently supports a single filter
-                              condition either name of model like ``name = 'model_name'`` or
-                              ``run_id = '...'``.
+        :param filter_string: A filter string expression: one or more comparisons joined by
+                              ``AND``, on ``name``, ``run_id``, ``source_path``,
+                              ``current_stage``, ``version_number``, ``creation_timestamp``,
+                              ``last_updated_timestamp`` or tags (``tags.<key>``), e.g.
+                              ``name = 'model_name' AND current_stage = 'Production'``.
+        :param max_results: Maximum number of model versions desired.
+        :param order_by: List of column names with ASC|DESC annotation, to be used for ordering
+                         matching search results.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                            a ``search_model_versions`` call.
         :return: PagedList of :py:class:`mlflow.entities.model_registry.ModelVersion`
-                 objects.
+                 objects. The pagination token for the next page can be obtained via the
+                 ``token`` attribute of the object.
         """
-        parsed_filter = SearchUtils.parse_filter_for_model_versions(filter_string)
-        if len(parsed_filter) == 0:
-            conditions = []
-        elif len(parsed_filter) == 1:
-            filter_dict = parsed_filter[0]
-            if filter_dict["comparator"] not in SearchUtils.VALID_MODEL_VERSIONS_SEARCH_COMPARATORS:
-                raise MlflowException(
-                    "Model Registry search filter only supports the equality(=) "
-                    "comparator and the IN operator "
-                    "for the run_id parameter. Input filter string: %s" % filter_string,
-                    error_code=INVALID_PARAMETER_VALUE,
-                )
-            if filter_dict["key"] == "name":
-                conditions = [SqlModelVersion.name == filter_dict["value"]]
-            elif filter_dict["key"] == "source_path":
-                conditions = [SqlModelVersion.source == filter_dict["value"]]
-            elif filter_dict["key"] == "run_id":
-                if filter_dict["comparator"] == "IN":
-                    conditions = [SqlModelVersion.run_id.in_(filter_dict["value"])]
-                else:
-                    conditions = [SqlModelVersion.run_id == filter_dict["value"]]
-            else:
-                raise MlflowException(
-                    "Invalid filter string: %s" % filter_string, error_code=INVALID_PARAMETER_VALUE
-                )
-        else:
+        if max_results < 1 or max_results > SEARCH_MODEL_VERSION_MAX_RESULTS_THRESHOLD:
             raise MlflowException(
-                "Model Registry expects filter to be one of "
-                "\"name = '<model_name>'\" or "
-                "\"source_path = '<source_path>'\" "
-                'or "run_id = \'<run_id>\' or "run_id IN (<run_ids>)".'
-                "Input filter string: %s. " % filter_string,
-                error_code=INVALID_PARAMETER_VALUE,
+                "Invalid value for request parameter max_results. "
+                "It must be between 1 and {}, but got value {}".format(
+                    SEARCH_MODEL_VERSION_MAX_RESULTS_THRESHOLD, max_results
+                ),
+                INVALID_PARAMETER_VALUE,
             )
+        conditions = [
+            self._get_model_version_search_condition(comparison)
+            for comparison in SearchUtils.parse_filter_for_model_versions(filter_string)
+        ]
+        conditions.append(SqlModelVersion.current_stage != STAGE_DELETED_INTERNAL)
+        parsed_orderby = self._parse_search_model_versions_order_by(order_by)
+        ordering = [
+            "{} {}".format(key, "ASC" if ascending else "DESC")
+            for key, _, ascending in parsed_orderby
+        ]
+        keyset = SearchUtils.parse_keyset_from_page_token(page_token, ordering)
+        if keyset is not None:
+            conditions.append(_get_keyset_condition(parsed_orderby, keyset))
 
         with self.ManagedSessionMaker() as session:
-            conditions.append(SqlModelVersion.current_stage != STAGE_DELETED_INTERNAL)
-            sql_model_version = session.query(SqlModelVersion).filter(*conditions).all()
-            model_versions = [mv.to_mlflow_entity() for mv in sql_model_version]
-            return PagedList(model_versions, None)
+            # Query for max_results + 1 model versions to check whether there is another page
+            sql_model_versions = (
+                session.query(SqlModelVersion)
+                .options(*self._get_eager_model_version_query_options())
+                .filter(*conditions)
+                .order_by(
+                    *[
+                        column.asc() if ascending else column.desc()
+                        for _, column, ascending in parsed_orderby
+                    ]
+                )
+                .limit(max_results + 1)
+                .all()
+            )
+            next_page_token = None
+            if len(sql_model_versions) > max_results:
+                sql_model_versions = sql_model_versions[:max_results]
+                last = sql_model_versions[-1]
+                next_page_token = SearchUtils.create_keyset_page_token(
+                    ordering, [getattr(last, column.key) for _, column, _ in parsed_orderby]
+                )
+            model_versions = [mv.to_mlflow_entity() for mv in sql_model_versions]
+            return PagedList(model_versions, next_page_token)
+
+    # Model version columns by search filter and order_by key
+    _MODEL_VERSION_SEARCH_COLUMNS = {
+        "name": SqlModelVersion.name,
+        "run_id": SqlModelVersion.run_id,
+        "source_path": SqlModelVersion.source,
+        "current_stage": SqlModelVersion.current_stage,
+        "version_number": SqlModelVersion.version,
+        "creation_timestamp": SqlModelVersion.creation_time,
+        "last_updated_timestamp": SqlModelVersion.last_updated_time,
+    }
+
+    @classmethod
+    def _get_model_version_search_condition(cls, comparison):
+        comparator = comparison["comparator"]
+        value = comparison["value"]
+        if comparison["type"] == SearchUtils._TAG_IDENTIFIER:
+            # Model versions match if they have a tag with the key whose value matches
+            return SqlModelVersion.model_version_tags.any(
+                sqlalchemy.and_(
+                    SqlModelVersionTag.key == comparison["key"],
+                    _get_comparison_clause(SqlModelVersionTag.value, comparator, value),
+                )
+            )
+        if comparison["key"] == "current_stage":
+            value = (
+                [get_canonical_stage(stage) for stage in value]
+                if comparator == SearchUtils.IN_OPERATOR
+                else get_canonical_stage(value)
+            )
+        return _get_comparison_clause(
+            cls._MODEL_VERSION_SEARCH_COLUMNS[comparison["key"]], comparator, value
+        )
+
+    @classmethod
+    def _parse_search_model_versions_order_by(cls, order_by_list):
+        """
+        Parse the ordering of a model version search. Model versions are naturally ordered by
+        name, then by version, i.e. in primary key order, which overriding orderings are
+        completed with so that the ordering is total, as required by keyset pagination.
+
+        :return: List of ``(key, column, ascending)`` tuples.
+        """
+        clauses = []
+        for order_by_clause in order_by_list or []:
+            key, ascending = SearchUtils.parse_order_by_for_search_model_versions(order_by_clause)
+            if key in [clause[0] for clause in clauses]:
+                raise MlflowException(
+                    "`order_by` contains duplicate fields: {}".format(order_by_list),
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            clauses.append((key, cls._MODEL_VERSION_SEARCH_COLUMNS[key], ascending))
+        for key in ["name", "version_number"]:
+            if key not in [clause[0] for clause in clauses]:
+                clauses.append((key, cls._MODEL_VERSION_SEARCH_COLUMNS[key], True))
+        return clauses
 
     @classmethod
     def _get_model_version_tag(cls, session, name, version, key):
@@ -819,6 +1067,7 @@ class SqlAlchemyStore(AbstractStore):
             session.merge(
                 SqlModelVersionTag(name=name, version=version, key=tag.key, value=tag.value)
             )
+            self._record_change(session, name, version)
 
     def delete_model_version_tag(self, name, version, key):
         """
@@ -838,3 +1087,28 @@ class SqlAlchemyStore(AbstractStore):
             existing_tag = self._get_model_version_tag(session, name, version, key)
             if existing_tag is not None:
                 session.delete(existing_tag)
+                self._record_change(session, name, version)
+
+
+def _get_comparison_clause(column, comparator, value):
+    if comparator == SearchUtils.IN_OPERATOR:
+        return column.in_(value)
+    elif comparator in SearchUtils.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
+        return SearchUtils.get_sql_filter_ops(column, comparator)(value)
+    return SearchUtils.filter_ops[comparator](column, value)
+
+
+def _get_keyset_condition(parsed_orderby, keyset):
+    """
+    :return: Condition selecting the rows that follow the row with sort key values ``keyset`` in
+             the ordering ``parsed_orderby``, a list of ``(key, column, ascending)`` tuples.
+    """
+    conditions = []
+    for i, (_, column, ascending) in enumerate(parsed_orderby):
+        previous_columns_equal = [
+            previous_column == previous_value
+            for (_, previous_column, _), previous_value in zip(parsed_orderby[:i], keyset[:i])
+        ]
+        column_after = column > keyset[i] if ascending else column < keyset[i]
+        conditions.append(sqlalchemy.and_(*(previous_columns_equal + [column_after])))
+    return sqlalchemy.or_(*conditions)
@@ -2,6 +2,7 @@ from abc import abstractmethod, ABCMeta
 
 from mlflow.entities import ViewType
 from mlflow.store.entities.paged_list import PagedList
+from mlflow.store.entities.run_batch import RunBatch
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.utils.annotations import experimental
 
@@ -236,6 +237,32 @@ class AbstractStore:
         )
         return PagedList(runs, token)
 
+    def search_runs_batch(
+        self,
+        experiment_ids,
+        filter_string,
+        run_view_type,
+        max_results=SEARCH_MAX_RESULTS_DEFAULT,
+        order_by=None,
+        page_token=None,
+    ):
+        """
+        Return runs that match the given list of search expressions within the experiments, in
+        columnar form. Stores that receive search results in bulk (e.g. as protobuf messages)
+        can override this method to fill the batch without creating a
+        :py:class:`mlflow.entities.Run` object per run.
+
+        See ``search_runs`` for parameter descriptions.
+
+        :return: A :py:class:`mlflow.store.entities.run_batch.RunBatch` of the runs that satisfy
+            the search expressions, with the pagination token for the next page in its ``token``
+            attribute.
+        """
+        runs = self.search_runs(
+            experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+        )
+        return RunBatch(runs, token=runs.token)
+
     @abstractmethod
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
@@ -0,0 +1,282 @@
+"""
+Export of experiments and runs of a tracking store to an archive, and their import into another
+tracking store, e.g. to migrate from a ``FileStore`` directory to a SQL database or to back up an
+experiment.
+
+An archive is a directory containing:
+
+- ``records.jsonl.gz``: a gzip-compressed file of JSON objects, one per line, each with a
+  ``type`` field. An archive starts with a ``header`` record, followed by the ``experiment``
+  record of each experiment, itself followed by the ``run`` record of each of its runs, with
+  their params and tags. The metric history of each run follows its ``run`` record, in
+  ``metrics`` records of at most ``MAX_METRICS_PER_BATCH`` metrics.
+- ``artifacts``: if artifacts are exported, a subdirectory per run ID with the artifacts of the
+  run.
+
+Records are written and read one at a time, so that exporting and importing use a bounded
+amount of memory whatever the number of runs.
+"""
+import gzip
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from mlflow.entities import (
+    ExperimentTag,
+    LifecycleStage,
+    Metric,
+    Param,
+    RunStatus,
+    RunTag,
+    ViewType,
+)
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, INVALID_STATE
+from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.utils.mlflow_tags import MLFLOW_PARENT_RUN_ID
+from mlflow.utils.validation import MAX_METRICS_PER_BATCH, MAX_PARAMS_TAGS_PER_BATCH
+from mlflow.version import VERSION
+
+RECORDS_FILE_NAME = "records.jsonl.gz"
+ARTIFACTS_DIR_NAME = "artifacts"
+FORMAT_VERSION = 1
+_DEFAULT_MAX_WORKERS = 8
+
+_logger = logging.getLogger(__name__)
+
+
+def export_experiments(store, path, experiment_ids=None, include_artifacts=False, max_workers=None):
+    """
+    Export experiments with all their runs to an archive.
+
+    :param store: Tracking store to export from.
+    :param path: Path of the archive directory, created if it does not exist. Existing archive
+                 files in it are overwritten.
+    :param experiment_ids: IDs of the experiments to export. All experiments, including deleted
+                           ones, are exported by default.
+    :param include_artifacts: Whether to download the artifacts of the runs into the archive.
+    :param max_workers: Number of threads fetching the metric histories and artifacts of runs
+                        concurrently. Defaults to 8.
+    """
+    if experiment_ids is None:
+        experiments = store.list_experiments(ViewType.ALL)
+    else:
+        experiments = [store.get_experiment(experiment_id) for experiment_id in experiment_ids]
+    os.makedirs(path, exist_ok=True)
+    with gzip.open(os.path.join(path, RECORDS_FILE_NAME), "wt", encoding="utf-8") as f:
+        _write_record(f, {"type": "header", "format_version": FORMAT_VERSION, "version": VERSION})
+        with ThreadPoolExecutor(max_workers=max_workers or _DEFAULT_MAX_WORKERS) as executor:
+            for experiment in experiments:
+                _write_record(f, _experiment_to_record(experiment))
+                num_runs = 0
+                for runs in _iter_run_pages(store, experiment.experiment_id):
+                    artifact_futures = []
+                    if include_artifacts:
+                        artifact_futures = [
+                            executor.submit(
+                                _download_run_artifacts,
+                                run.info.artifact_uri,
+                                os.path.join(path, ARTIFACTS_DIR_NAME, run.info.run_id),
+                            )
+                            for run in runs
+                        ]
+                    # Metric histories are fetched concurrently, and written in order of the runs
+                    histories = executor.map(lambda run: _get_metric_history(store, run), runs)
+                    for run, history in zip(runs, histories):
+                        _write_record(f, _run_to_record(run))
+                        for start in range(0, len(history), MAX_METRICS_PER_BATCH):
+                            _write_record(
+                                f,
+                                {
+                                    "type": "metrics",
+                                    "run_id": run.info.run_id,
+                                    "metrics": [
+                                        [m.key, m.value, m.timestamp, m.step]
+                                        for m in history[start : start + MAX_METRICS_PER_BATCH]
+                                    ],
+                                },
+                            )
+                    for future in artifact_futures:
+                        future.result()
+                    num_runs += len(runs)
+                _logger.info(
+                    "Exported experiment '%s' with %d runs", experiment.experiment_id, num_runs
+                )
+
+
+def import_experiments(store, path):
+    """
+    Import the experiments and runs of an archive created by :py:func:`export_experiments`.
+
+    Runs are created with new IDs, and the tags referencing the ID of the parent run of nested
+    runs are updated accordingly. Experiments are imported into the existing active experiment
+    with the same name if there is one, and are otherwise created with the default artifact
+    location of the store. Params, tags and metrics are written with ``log_batch``. Deleted
+    experiments of the archive are only deleted in the store if the import created them: the
+    imported runs of deleted experiments are deleted instead of existing active experiments.
+
+    :param store: Tracking store to import into.
+    :param path: Path of the archive directory.
+    :return: Dictionary mapping the IDs of the runs in the archive to the IDs of the imported runs.
+    """
+    experiment_ids = {}
+    run_ids = {}
+    # Runs and experiments are deleted once their content is imported
+    deleted_run_ids = []
+    deleted_experiment_ids = []
+    # Archive IDs of the deleted experiments imported into existing active experiments
+    reused_deleted_experiment_ids = set()
+    # Imported run ID -> archive ID of its parent run, for parents imported after their children
+    unresolved_parent_run_ids = {}
+    with gzip.open(os.path.join(path, RECORDS_FILE_NAME), "rt", encoding="utf-8") as f:
+        header = json.loads(next(f, "{}"))
+        if header.get("type") != "header" or header.get("format_version", 0) > FORMAT_VERSION:
+            raise MlflowException(
+                "'%s' is not an archive of experiments supported by this version of MLflow" % path,
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        for line in f:
+            record = json.loads(line)
+            if record["type"] == "experiment":
+                experiment_id, created = _import_experiment(store, record)
+                experiment_ids[record["experiment_id"]] = experiment_id
+                if record["lifecycle_stage"] == LifecycleStage.DELETED:
+                    if created:
+                        deleted_experiment_ids.append(experiment_id)
+                    else:
+                        reused_deleted_experiment_ids.add(record["experiment_id"])
+            elif record["type"] == "run":
+                run = _import_run(store, record, experiment_ids[record["experiment_id"]], run_ids)
+                run_ids[record["run_id"]] = run.info.run_id
+                parent_run_id = record["tags"].get(MLFLOW_PARENT_RUN_ID)
+                if parent_run_id is not None and parent_run_id not in run_ids:
+                    unresolved_parent_run_ids[run.info.run_id] = parent_run_id
+                if (
+                    record["lifecycle_stage"] == LifecycleStage.DELETED
+                    or record["experiment_id"] in reused_deleted_experiment_ids
+                ):
+                    deleted_run_ids.append(run.info.run_id)
+                artifacts_dir = os.path.join(path, ARTIFACTS_DIR_NAME, record["run_id"])
+                if os.path.isdir(artifacts_dir):
+                    get_artifact_repository(run.info.artifact_uri).log_artifacts(artifacts_dir)
+            elif record["type"] == "metrics":
+                metrics = [Metric(*metric) for metric in record["metrics"]]
+                store.log_batch(run_ids[record["run_id"]], metrics=metrics, params=[], tags=[])
+    for run_id, parent_run_id in unresolved_parent_run_ids.items():
+        if parent_run_id in run_ids:
+            store.set_tag(run_id, RunTag(MLFLOW_PARENT_RUN_ID, run_ids[parent_run_id]))
+    for run_id in deleted_run_ids:
+        store.delete_run(run_id)
+    for experiment_id in deleted_experiment_ids:
+        store.delete_experiment(experiment_id)
+    _logger.info("Imported %d experiments and %d runs", len(experiment_ids), len(run_ids))
+    return run_ids
+
+
+def _write_record(f, record):
+    f.write(json.dumps(record, separators=(",", ":")))
+    f.write("\n")
+
+
+def _experiment_to_record(experiment):
+    return {
+        "type": "experiment",
+        "experiment_id": experiment.experiment_id,
+        "name": experiment.name,
+        "artifact_location": experiment.artifact_location,
+        "lifecycle_stage": experiment.lifecycle_stage,
+        "tags": experiment.tags,
+    }
+
+
+def _run_to_record(run):
+    return {
+        "type": "run",
+        "run_id": run.info.run_id,
+        "experiment_id": run.info.experiment_id,
+        "user_id": run.info.user_id,
+        "status": run.info.status,
+        "start_time": run.info.start_time,
+        "end_time": run.info.end_time,
+        "lifecycle_stage": run.info.lifecycle_stage,
+        "params": run.data.params,
+        "tags": run.data.tags,
+    }
+
+
+def _iter_run_pages(store, experiment_id):
+    page_token = None
+    while True:
+        runs = store.search_runs(
+            [experiment_id],
+            None,
+            ViewType.ALL,
+            max_results=SEARCH_MAX_RESULTS_DEFAULT,
+            # Parent runs are usually exported before their children
+            order_by=["attribute.start_time ASC"],
+            page_token=page_token,
+        )
+        if runs:
+            yield list(runs)
+        page_token = runs.token
+        if not page_token:
+            return
+
+
+def _get_metric_history(store, run):
+    return [
+        metric
+        for key in run.data.metrics
+        for metric in store.get_metric_history(run.info.run_id, key)
+    ]
+
+
+def _download_run_artifacts(artifact_uri, dst_path):
+    artifact_repo = get_artifact_repository(artifact_uri)
+    file_infos = artifact_repo.list_artifacts()
+    if file_infos:
+        os.makedirs(dst_path, exist_ok=True)
+    for file_info in file_infos:
+        artifact_repo.download_artifacts(file_info.path, dst_path)
+
+
+def _import_experiment(store, record):
+    """
+    :return: Tuple ``(experiment_id, created)`` of the ID of the experiment the runs of the
+             archived experiment are imported into, and of whether it was created by the import.
+    """
+    experiment = store.get_experiment_by_name(record["name"])
+    if experiment is not None:
+        if experiment.lifecycle_stage != LifecycleStage.ACTIVE:
+            raise MlflowException(
+                "Cannot import experiment '%s' into the deleted experiment with the same name. "
+                "Restore or permanently delete it first." % record["name"],
+                error_code=INVALID_STATE,
+            )
+        experiment_id = experiment.experiment_id
+        created = False
+    else:
+        experiment_id = store.create_experiment(record["name"])
+        created = True
+    for key, value in record["tags"].items():
+        store.set_experiment_tag(experiment_id, ExperimentTag(key, value))
+    return experiment_id, created
+
+
+def _import_run(store, record, experiment_id, run_ids):
+    run = store.create_run(experiment_id, record["user_id"], record["start_time"], tags=[])
+    params = [Param(key, value) for key, value in record["params"].items()]
+    tags = [
+        RunTag(key, run_ids.get(value, value) if key == MLFLOW_PARENT_RUN_ID else value)
+        for key, value in record["tags"].items()
+    ]
+    for start in range(0, max(len(params), len(tags)), MAX_PARAMS_TAGS_PER_BATCH):
+        end = start + MAX_PARAMS_TAGS_PER_BATCH
+        store.log_batch(run.info.run_id, metrics=[], params=params[start:end], tags=tags[start:end])
+    if record["status"] != RunStatus.to_string(RunStatus.RUNNING) or record["end_time"]:
+        store.update_run_info(
+            run.info.run_id, RunStatus.from_string(record["status"]), record["end_time"]
+        )
+    return run
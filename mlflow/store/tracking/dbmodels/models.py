@@ -10,6 +10,7 @@ from sqlalchemy import (
     BigInteger,
     PrimaryKeyConstraint,
     Boolean,
+    Index,
 )
 from mlflow.entities import (
     Experiment,
@@ -172,6 +173,12 @@ class SqlRun(Base):
             name="runs_lifecycle_stage",
         ),
         PrimaryKeyConstraint("run_uuid", name="run_pk"),
+        Index(
+            "index_runs_experiment_id_lifecycle_stage_start_time",
+            "experiment_id",
+            "lifecycle_stage",
+            "start_time",
+        ),
     )
 
     @staticmethod
@@ -274,7 +281,11 @@ class SqlTag(Base):
     SQLAlchemy relationship (many:one) with :py:class:`mlflow.store.dbmodels.models.SqlRun`.
     """
 
-    __table_args__ = (PrimaryKeyConstraint("key", "run_uuid", name="tag_pk"),)
+    __table_args__ = (
+        PrimaryKeyConstraint("key", "run_uuid", name="tag_pk"),
+        Index("index_tags_key_value", "key", "value"),
+        Index("index_tags_run_uuid", "run_uuid"),
+    )
 
     def __repr__(self):
         return "<SqlRunTag({}, {})>".format(self.key, self.value)
@@ -374,12 +385,37 @@ class SqlLatestMetric(Base):
     Run UUID to which this metric belongs to: Part of *Primary Key* for ``latest_metrics`` table.
                                               *Foreign Key* into ``runs`` table.
     """
+    experiment_id = Column(Integer, nullable=True)
+    """
+    Experiment ID of the run: `Integer`. Copied from the ``runs`` table so that runs can be
+    searched and sorted by metric value without joining the ``runs`` table.
+    """
+    lifecycle_stage = Column(String(20), nullable=True)
+    """
+    Lifecycle stage of the run: `String` (limit 20 characters). Copied from the ``runs`` table and
+    kept up to date when the run is deleted or restored.
+    """
+    start_time = Column(BigInteger, nullable=True)
+    """
+    Start time of the run: `BigInteger`. Copied from the ``runs`` table.
+    """
     run = relationship("SqlRun", backref=backref("latest_metrics", cascade="all"))
     """
     SQLAlchemy relationship (many:one) with :py:class:`mlflow.store.dbmodels.models.SqlRun`.
     """
 
-    __table_args__ = (PrimaryKeyConstraint("key", "run_uuid", name="latest_metric_pk"),)
+    __table_args__ = (
+        PrimaryKeyConstraint("key", "run_uuid", name="latest_metric_pk"),
+        Index(
+            "index_latest_metrics_experiment_id_key_lifecycle_stage_value",
+            "experiment_id",
+            "key",
+            "lifecycle_stage",
+            "value",
+        ),
+        Index("index_latest_metrics_key_value", "key", "value"),
+        Index("index_latest_metrics_run_uuid", "run_uuid"),
+    )
 
     def __repr__(self):
         return "<SqlLatestMetric({}, {}, {}, {})>".format(
@@ -421,7 +457,11 @@ class SqlParam(Base):
     SQLAlchemy relationship (many:one) with :py:class:`mlflow.store.dbmodels.models.SqlRun`.
     """
 
-    __table_args__ = (PrimaryKeyConstraint("key", "run_uuid", name="param_pk"),)
+    __table_args__ = (
+        PrimaryKeyConstraint("key", "run_uuid", name="param_pk"),
+        Index("index_params_key_value", "key", "value"),
+        Index("index_params_run_uuid", "run_uuid"),
+    )
 
     def __repr__(self):
         return "<SqlParam({}, {})>".format(self.key, self.value)
@@ -1,10 +1,13 @@
+import collections
 import json
 import logging
 import os
 import sys
 import shutil
+import threading
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 from mlflow.entities import (
     Experiment,
@@ -56,12 +59,21 @@ from mlflow.utils.file_utils import (
     local_file_uri_to_path,
     path_to_local_file_uri,
 )
+from mlflow.utils.run_table import RunTable
 from mlflow.utils.search_utils import SearchUtils
 from mlflow.utils.string_utils import is_string_type
 from mlflow.utils.uri import append_to_uri_path
 from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
 
 _TRACKING_DIR_ENV_VAR = "MLFLOW_TRACKING_DIR"
+# Number of threads reading the files of experiments and runs concurrently when searching runs and
+# listing experiments, which mostly helps with network file systems. 1 disables the thread pool
+_MAX_WORKERS_ENV_VAR = "MLFLOW_FILE_STORE_MAX_WORKERS"
+_DEFAULT_MAX_WORKERS = 8
+# Maximum number of parsed ``meta.yaml`` files of experiments and runs cached by each store. 0
+# disables the cache
+_METADATA_CACHE_SIZE_ENV_VAR = "MLFLOW_FILE_STORE_METADATA_CACHE_SIZE"
+_DEFAULT_METADATA_CACHE_SIZE = 10000
 
 
 def _default_root_dir():
@@ -113,6 +125,53 @@ def _read_persisted_run_info_dict(run_info_dict):
     return RunInfo.from_dictionary(dict_copy)
 
 
+class _MetadataCache(object):
+    """
+    Thread-safe LRU cache of parsed YAML files. An entry is only used while the modification time,
+    size and inode of its file are unchanged, so that writes made by other processes are seen,
+    and the store invalidates the entries of the files it writes.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        # Path -> (file version, parsed content)
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def read(self, root, file_name):
+        """
+        :return: A copy of the content of the YAML file ``file_name`` of directory ``root``.
+        """
+        path = os.path.join(root, file_name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # Raises the same exception as when the cache is disabled
+            return read_yaml(root, file_name)
+        version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(path)
+                return self._copy(entry[1])
+        data = read_yaml(root, file_name)
+        with self._lock:
+            self._entries[path] = (version, data)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return self._copy(data)
+
+    def invalidate(self, root, file_name):
+        with self._lock:
+            self._entries.pop(os.path.join(root, file_name), None)
+
+    @staticmethod
+    def _copy(data):
+        # Callers modify the top-level keys of metadata dictionaries
+        return dict(data) if isinstance(data, dict) else data
+
+
 class FileStore(AbstractStore):
     TRASH_FOLDER_NAME = ".trash"
     ARTIFACTS_FOLDER_NAME = "artifacts"
@@ -129,6 +188,16 @@ class FileStore(AbstractStore):
         Create a new FileStore with the given root directory and a given default artifact root URI.
         """
         super().__init__()
+        self.max_workers = int(get_env(_MAX_WORKERS_ENV_VAR) or _DEFAULT_MAX_WORKERS)
+        self._executor = None
+        self._executor_pid = None
+        self._executor_lock = threading.Lock()
+        metadata_cache_size = int(
+            get_env(_METADATA_CACHE_SIZE_ENV_VAR) or _DEFAULT_METADATA_CACHE_SIZE
+        )
+        self._metadata_cache = (
+            _MetadataCache(metadata_cache_size) if metadata_cache_size > 0 else None
+        )
         self.root_directory = local_file_uri_to_path(root_directory or _default_root_dir())
         self.artifact_root_uri = artifact_root_uri or path_to_local_file_uri(self.root_directory)
         self.trash_folder = os.path.join(self.root_directory, FileStore.TRASH_FOLDER_NAME)
@@ -144,6 +213,36 @@ class FileStore(AbstractStore):
         if not exists(self.trash_folder):
             mkdir(self.trash_folder)
 
+    def _read_metadata(self, meta_dir):
+        if self._metadata_cache is None:
+            return read_yaml(meta_dir, FileStore.META_DATA_FILE_NAME)
+        return self._metadata_cache.read(meta_dir, FileStore.META_DATA_FILE_NAME)
+
+    def _write_metadata(self, meta_dir, data, overwrite=False):
+        write_yaml(meta_dir, FileStore.META_DATA_FILE_NAME, data, overwrite=overwrite)
+        if self._metadata_cache is not None:
+            self._metadata_cache.invalidate(meta_dir, FileStore.META_DATA_FILE_NAME)
+
+    def _get_executor(self):
+        # Threads do not survive forks, e.g. of server worker processes, which need their own pool
+        pid = os.getpid()
+        with self._executor_lock:
+            if self._executor_pid != pid:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+                self._executor_pid = pid
+        return self._executor
+
+    def _map(self, func, items):
+        """
+        Apply ``func`` to each of ``items`` with the thread pool of the store.
+
+        :return: List of the results, in the order of ``items``.
+        """
+        items = list(items)
+        if self.max_workers <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        return list(self._get_executor().map(func, items))
+
     def _check_root_dir(self):
         """
         Run checks before running directory operations.
@@ -230,13 +329,11 @@ class FileStore(AbstractStore):
             rsl += self._get_active_experiments(full_path=False)
         if view_type == ViewType.DELETED_ONLY or view_type == ViewType.ALL:
             rsl += self._get_deleted_experiments(full_path=False)
-        experiments = []
-        for exp_id in rsl:
+
+        def get_experiment(exp_id):
             try:
                 # trap and warn known issues, will raise unexpected exceptions to caller
-                experiment = self._get_experiment(exp_id, view_type)
-                if experiment:
-                    experiments.append(experiment)
+                return self._get_experiment(exp_id, view_type)
             except MissingConfigException as rnfe:
                 # Trap malformed experiments and log warnings.
                 logging.warning(
@@ -245,7 +342,9 @@ class FileStore(AbstractStore):
                     str(rnfe),
                     exc_info=True,
                 )
-        return experiments
+                return None
+
+        return [experiment for experiment in self._map(get_experiment, rsl) if experiment]
 
     def _create_experiment_with_id(self, name, experiment_id, artifact_uri):
         artifact_uri = artifact_uri or append_to_uri_path(
@@ -258,7 +357,7 @@ class FileStore(AbstractStore):
         # tags are added to the file system and are not written to this dict on write
         # As such, we should not include them in the meta file.
         del experiment_dict["tags"]
-        write_yaml(meta_dir, FileStore.META_DATA_FILE_NAME, experiment_dict)
+        self._write_metadata(meta_dir, experiment_dict)
         return experiment_id
 
     def _validate_experiment_name(self, name):
@@ -308,7 +407,7 @@ class FileStore(AbstractStore):
                 "Could not find experiment with ID %s" % experiment_id,
                 databricks_pb2.RESOURCE_DOES_NOT_EXIST,
             )
-        meta = read_yaml(experiment_dir, FileStore.META_DATA_FILE_NAME)
+        meta = self._read_metadata(experiment_dir)
         if experiment_dir.startswith(self.trash_folder):
             meta["lifecycle_stage"] = LifecycleStage.DELETED
         else:
@@ -384,7 +483,7 @@ class FileStore(AbstractStore):
                 "Cannot rename experiment in non-active lifecycle stage."
                 " Current stage: %s" % experiment.lifecycle_stage
             )
-        write_yaml(meta_dir, FileStore.META_DATA_FILE_NAME, dict(experiment), overwrite=True)
+        self._write_metadata(meta_dir, dict(experiment), overwrite=True)
 
     def delete_run(self, run_id):
         run_info = self._get_run_info(run_id)
@@ -483,7 +582,7 @@ class FileStore(AbstractStore):
         run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_id)
         mkdir(run_dir)
         run_info_dict = _make_persisted_run_info_dict(run_info)
-        write_yaml(run_dir, FileStore.META_DATA_FILE_NAME, run_info_dict)
+        self._write_metadata(run_dir, run_info_dict)
         mkdir(run_dir, FileStore.METRICS_FOLDER_NAME)
         mkdir(run_dir, FileStore.PARAMS_FOLDER_NAME)
         mkdir(run_dir, FileStore.ARTIFACTS_FOLDER_NAME)
@@ -526,7 +625,7 @@ class FileStore(AbstractStore):
         return run_info
 
     def _get_run_info_from_dir(self, run_dir):
-        meta = read_yaml(run_dir, FileStore.META_DATA_FILE_NAME)
+        meta = self._read_metadata(run_dir)
         run_info = _read_persisted_run_info_dict(meta)
         return run_info
 
@@ -692,8 +791,8 @@ class FileStore(AbstractStore):
             and os.path.isdir(x),
             full_path=True,
         )
-        run_infos = []
-        for r_dir in run_dirs:
+
+        def get_run_info(r_dir):
             try:
                 # trap and warn known issues, will raise unexpected exceptions to caller
                 run_info = self._get_run_info_from_dir(r_dir)
@@ -706,16 +805,18 @@ class FileStore(AbstractStore):
                         str(experiment_id),
                         exc_info=True,
                     )
-                    continue
+                    return None
                 if LifecycleStage.matches_view_type(view_type, run_info.lifecycle_stage):
-                    run_infos.append(run_info)
+                    return run_info
             except MissingConfigException as rnfe:
                 # trap malformed run exception and log warning
                 r_id = os.path.basename(r_dir)
                 logging.warning(
                     "Malformed run '%s'. Detailed error %s", r_id, str(rnfe), exc_info=True
                 )
-        return run_infos
+            return None
+
+        return [run_info for run_info in self._map(get_run_info, run_dirs) if run_info]
 
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
@@ -729,9 +830,8 @@ class FileStore(AbstractStore):
         runs = []
         for experiment_id in experiment_ids:
             run_infos = self._list_run_infos(experiment_id, run_view_type)
-            runs.extend(self._get_run_from_info(r) for r in run_infos)
-        filtered = SearchUtils.filter(runs, filter_string)
-        sorted_runs = SearchUtils.sort(filtered, order_by)
+            runs.extend(self._map(self._get_run_from_info, run_infos))
+        sorted_runs = RunTable(runs).search(filter_string, order_by)
         runs, next_page_token = SearchUtils.paginate(sorted_runs, page_token, max_results)
         return runs, next_page_token
 
@@ -845,7 +945,7 @@ class FileStore(AbstractStore):
     def _overwrite_run_info(self, run_info):
         run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_id)
         run_info_dict = _make_persisted_run_info_dict(run_info)
-        write_yaml(run_dir, FileStore.META_DATA_FILE_NAME, run_info_dict, overwrite=True)
+        self._write_metadata(run_dir, run_info_dict, overwrite=True)
 
     def log_batch(self, run_id, metrics, params, tags):
         _validate_run_id(run_id)
@@ -874,7 +974,6 @@ class FileStore(AbstractStore):
         run_info = self._get_run_info(run_id)
         check_run_is_active(run_info)
         model_dict = mlflow_model.to_dict()
-        run_info = self._get_run_info(run_id)
         path = self._get_tag_path(run_info.experiment_id, run_info.run_id, MLFLOW_LOGGED_MODELS)
         if os.path.exists(path):
             with open(path, "r") as f:
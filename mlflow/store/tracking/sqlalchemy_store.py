@@ -1,3 +1,4 @@
+import collections
 import json
 import logging
 import uuid
@@ -479,6 +480,7 @@ class SqlAlchemyStore(AbstractStore):
             self._check_run_is_deleted(run)
             run.lifecycle_stage = LifecycleStage.ACTIVE
             self._save_to_db(objs=run, session=session)
+            self._update_latest_metrics_lifecycle_stage(run, session)
 
     def delete_run(self, run_id):
         with self.ManagedSessionMaker() as session:
@@ -486,6 +488,14 @@ class SqlAlchemyStore(AbstractStore):
             self._check_run_is_active(run)
             run.lifecycle_stage = LifecycleStage.DELETED
             self._save_to_db(objs=run, session=session)
+            self._update_latest_metrics_lifecycle_stage(run, session)
+
+    @staticmethod
+    def _update_latest_metrics_lifecycle_stage(run, session):
+        # Keep the copy of the run's lifecycle stage in ``latest_metrics`` up to date
+        session.query(SqlLatestMetric).filter(SqlLatestMetric.run_uuid == run.run_uuid).update(
+            {SqlLatestMetric.lifecycle_stage: run.lifecycle_stage}, synchronize_session=False
+        )
 
     def _hard_delete_run(self, run_id):
         """
@@ -507,14 +517,7 @@ class SqlAlchemyStore(AbstractStore):
 
     def log_metric(self, run_id, metric):
         _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
-        is_nan = math.isnan(metric.value)
-        if is_nan:
-            value = 0
-        elif math.isinf(metric.value):
-            #  NB: Sql can not represent Infs = > We replace +/- Inf with max/min 64b float value
-            value = 1.7976931348623157e308 if metric.value > 0 else -1.7976931348623157e308
-        else:
-            value = metric.value
+        value, is_nan = _get_metric_value_details(metric.value)
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
             self._check_run_is_active(run)
@@ -533,10 +536,68 @@ class SqlAlchemyStore(AbstractStore):
             # already present in the ``metrics`` table. If the logged metric was already present,
             # we assume that the ``latest_metrics`` table already accounts for its presence
             if just_created:
-                self._update_latest_metric_if_necessary(logged_metric, session)
+                self._update_latest_metric_if_necessary(logged_metric, session, run)
+
+    def _log_metrics(self, run_id, metrics):
+        """
+        Log the metrics of a run in a single transaction, which updates the ``latest_metrics``
+        table once per metric key. As with ``log_metric``, metrics that were already logged are
+        skipped.
+        """
+        if not metrics:
+            return
+        metric_instances = collections.OrderedDict()
+        for metric in metrics:
+            _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
+            value, is_nan = _get_metric_value_details(metric.value)
+            primary_key = (metric.key, metric.timestamp, metric.step, value, is_nan)
+            if primary_key not in metric_instances:
+                metric_instances[primary_key] = SqlMetric(
+                    run_uuid=run_id,
+                    key=metric.key,
+                    value=value,
+                    timestamp=metric.timestamp,
+                    step=metric.step,
+                    is_nan=is_nan,
+                )
+        with self.ManagedSessionMaker() as session:
+            run = self._get_run(run_uuid=run_id, session=session)
+            self._check_run_is_active(run)
+            logged_metrics = (
+                session.query(SqlMetric)
+                .filter(
+                    SqlMetric.run_uuid == run_id,
+                    SqlMetric.key.in_(set(key[0] for key in metric_instances)),
+                    SqlMetric.timestamp.in_(set(key[1] for key in metric_instances)),
+                )
+                .all()
+            )
+            for logged_metric in logged_metrics:
+                metric_instances.pop(
+                    (
+                        logged_metric.key,
+                        logged_metric.timestamp,
+                        logged_metric.step,
+                        logged_metric.value,
+                        logged_metric.is_nan,
+                    ),
+                    None,
+                )
+            session.add_all(metric_instances.values())
+            latest_metrics = {}
+            for metric_instance in metric_instances.values():
+                latest_metric = latest_metrics.get(metric_instance.key)
+                if latest_metric is None or (
+                    metric_instance.step,
+                    metric_instance.timestamp,
+                    metric_instance.value,
+                ) > (latest_metric.step, latest_metric.timestamp, latest_metric.value):
+                    latest_metrics[metric_instance.key] = metric_instance
+            for latest_metric in latest_metrics.values():
+                self._update_latest_metric_if_necessary(latest_metric, session, run)
 
     @staticmethod
-    def _update_latest_metric_if_necessary(logged_metric, session):
+    def _update_latest_metric_if_necessary(logged_metric, session, run):
         def _compare_metrics(metric_a, metric_b):
             """
             :return: True if ``metric_a`` is strictly more recent than ``metric_b``, as determined
@@ -569,6 +630,9 @@ class SqlAlchemyStore(AbstractStore):
                     timestamp=logged_metric.timestamp,
                     step=logged_metric.step,
                     is_nan=logged_metric.is_nan,
+                    experiment_id=run.experiment_id,
+                    lifecycle_stage=run.lifecycle_stage,
+                    start_time=run.start_time,
                 )
             )
 
@@ -704,37 +768,102 @@ class SqlAlchemyStore(AbstractStore):
             # ``run.to_mlflow_entity()``, so eager loading helps avoid additional database queries
             # that are otherwise executed at attribute access time under a lazy loading model.
             parsed_filters = SearchUtils.parse_search_filter(filter_string)
-            parsed_orderby, sorting_joins = _get_orderby_clauses(order_by, session)
-
-            query = session.query(SqlRun)
-            for j in _get_sqlalchemy_filter_clauses(parsed_filters, session):
-                query = query.join(j)
-            # using an outer join is necessary here because we want to be able to sort
-            # on a column (tag, metric or param) without removing the lines that
-            # do not have a value for this column (which is what inner join would do)
-            for j in sorting_joins:
-                query = query.outerjoin(j)
-
             offset = SearchUtils.parse_start_offset_from_page_token(page_token)
-            queried_runs = (
-                query.distinct()
-                .options(*self._get_eager_run_query_options())
-                .filter(
-                    SqlRun.experiment_id.in_(experiment_ids),
-                    SqlRun.lifecycle_stage.in_(stages),
-                    *_get_attributes_filtering_clauses(parsed_filters)
+            if _get_single_metric_order_by(order_by) is not None:
+                queried_runs = self._search_runs_ordered_by_metric(
+                    session, experiment_ids, stages, parsed_filters, order_by, offset, max_results
+                )
+            else:
+                parsed_orderby, sorting_joins = _get_orderby_clauses(order_by, session)
+
+                query = session.query(SqlRun)
+                # using an outer join is necessary here because we want to be able to sort
+                # on a column (tag, metric or param) without removing the lines that
+                # do not have a value for this column (which is what inner join would do)
+                for j in sorting_joins:
+                    query = query.outerjoin(j)
+
+                queried_runs = (
+                    query.distinct()
+                    .options(*self._get_eager_run_query_options())
+                    .filter(
+                        SqlRun.experiment_id.in_(experiment_ids),
+                        SqlRun.lifecycle_stage.in_(stages),
+                        *_get_sqlalchemy_filter_clauses(parsed_filters)
+                    )
+                    .order_by(*parsed_orderby)
+                    .offset(offset)
+                    .limit(max_results)
+                    .all()
                 )
-                .order_by(*parsed_orderby)
-                .offset(offset)
-                .limit(max_results)
-                .all()
-            )
 
             runs = [run.to_mlflow_entity() for run in queried_runs]
             next_page_token = compute_next_token(len(runs))
 
         return runs, next_page_token
 
+    def _search_runs_ordered_by_metric(
+        self, session, experiment_ids, stages, parsed_filters, order_by, offset, max_results,
+    ):
+        """
+        Search runs ordered by the value of a single metric, using the run columns copied into the
+        ``latest_metrics`` table: runs that have a (non-NaN) value for the metric are read in
+        order from the ``latest_metrics`` index, followed by the runs that do not, which matches
+        the ordering produced by ``_get_orderby_clauses``.
+        """
+        metric_key, ascending = _get_single_metric_order_by(order_by)
+        filter_clauses = _get_sqlalchemy_filter_clauses(parsed_filters)
+        has_metric = sql.and_(
+            SqlLatestMetric.key == metric_key,
+            SqlLatestMetric.experiment_id.in_(experiment_ids),
+            SqlLatestMetric.lifecycle_stage.in_(stages),
+            SqlLatestMetric.is_nan == sql.false(),
+        )
+        runs_with_metric = (
+            session.query(SqlRun)
+            .join(SqlLatestMetric, SqlLatestMetric.run_uuid == SqlRun.run_uuid)
+            .filter(has_metric, *filter_clauses)
+        )
+        queried_runs = (
+            runs_with_metric.options(*self._get_eager_run_query_options())
+            .order_by(
+                SqlLatestMetric.value if ascending else SqlLatestMetric.value.desc(),
+                SqlLatestMetric.start_time.desc(),
+                SqlLatestMetric.run_uuid,
+            )
+            .offset(offset)
+            .limit(max_results)
+            .all()
+        )
+        if len(queried_runs) == max_results:
+            return queried_runs
+
+        # The page extends past the runs that have the metric: fill it with the remaining runs,
+        # ordered exactly as by the generic search query
+        if len(queried_runs) > 0 or offset == 0:
+            num_runs_with_metric = offset + len(queried_runs)
+        else:
+            num_runs_with_metric = runs_with_metric.count()
+        parsed_orderby, (metric_subquery,) = _get_orderby_clauses(order_by, session)
+        runs_without_metric = (
+            session.query(SqlRun)
+            .outerjoin(metric_subquery)
+            .options(*self._get_eager_run_query_options())
+            .filter(
+                SqlRun.experiment_id.in_(experiment_ids),
+                SqlRun.lifecycle_stage.in_(stages),
+                sql.or_(
+                    metric_subquery.c.run_uuid.is_(None), metric_subquery.c.is_nan == sql.true()
+                ),
+                *filter_clauses
+            )
+            .order_by(*parsed_orderby)
+            .offset(max(0, offset - num_runs_with_metric))
+            .limit(max_results - len(queried_runs))
+            .all()
+        )
+        return queried_runs + runs_without_metric
+
     def log_batch(self, run_id, metrics, params, tags):
         _validate_run_id(run_id)
         _validate_batch_log_data(metrics, params, tags)
@@ -745,8 +874,7 @@ class SqlAlchemyStore(AbstractStore):
         try:
             for param in params:
                 self.log_param(run_id, param)
-            for metric in metrics:
-                self.log_metric(run_id, metric)
+            self._log_metrics(run_id, metrics)
             for tag in tags:
                 self.set_tag(run_id, tag)
         except MlflowException as e:
@@ -774,27 +902,42 @@ class SqlAlchemyStore(AbstractStore):
             session.merge(SqlTag(key=MLFLOW_LOGGED_MODELS, value=value, run_uuid=run_id))
 
 
-def _get_attributes_filtering_clauses(parsed):
-    clauses = []
-    for sql_statement in parsed:
-        key_type = sql_statement.get("type")
-        key_name = sql_statement.get("key")
-        value = sql_statement.get("value")
-        comparator = sql_statement.get("comparator").upper()
-        if SearchUtils.is_attribute(key_type, comparator):
-            # key_name is guaranteed to be a valid searchable attribute of entities.RunInfo
-            # by the call to parse_search_filter
-            attribute = getattr(SqlRun, SqlRun.get_attribute_name(key_name))
-            if comparator in SearchUtils.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
-                op = SearchUtils.get_sql_filter_ops(attribute, comparator)
-                clauses.append(op(value))
-            elif comparator in SearchUtils.filter_ops:
-                op = SearchUtils.filter_ops.get(comparator)
-                clauses.append(op(attribute, value))
-    return clauses
-
-
-def _to_sqlalchemy_filtering_statement(sql_statement, session):
+def _get_metric_value_details(value):
+    """
+    :return: Tuple of the value of a metric as stored in the ``metrics`` table, and whether it is
+             NaN.
+    """
+    if math.isnan(value):
+        return 0, True
+    if math.isinf(value):
+        #  NB: Sql can not represent Infs = > We replace +/- Inf with max/min 64b float value
+        return (1.7976931348623157e308 if value > 0 else -1.7976931348623157e308), False
+    return value, False
+
+
+def _get_comparison_clause(column, comparator, value):
+    if comparator == SearchUtils.IS_NULL_OPERATOR:
+        return column.is_(None)
+    elif comparator == SearchUtils.IS_NOT_NULL_OPERATOR:
+        return column.isnot(None)
+    elif comparator == SearchUtils.IN_OPERATOR:
+        return column.in_(value)
+    elif comparator == SearchUtils.NOT_IN_OPERATOR:
+        return column.notin_(value)
+    elif comparator in SearchUtils.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
+        return SearchUtils.get_sql_filter_ops(column, comparator)(value)
+    elif comparator in SearchUtils.filter_ops:
+        return SearchUtils.filter_ops.get(comparator)(column, value)
+    return sql.false()
+
+
+def _to_sqlalchemy_filtering_statement(sql_statement):
+    if "operator" in sql_statement:
+        clauses = [_to_sqlalchemy_filtering_statement(c) for c in sql_statement["clauses"]]
+        if sql_statement["operator"] == SearchUtils.OR_OPERATOR:
+            return sql.or_(*clauses)
+        return sql.and_(*clauses)
+
     key_type = sql_statement.get("type")
     key_name = sql_statement.get("key")
     value = sql_statement.get("value")
@@ -802,39 +945,53 @@ def _to_sqlalchemy_filtering_statement(sql_statement, session):
 
     if SearchUtils.is_metric(key_type, comparator):
         entity = SqlLatestMetric
-        value = float(value)
+        if comparator in SearchUtils.LIST_COMPARISON_OPERATORS:
+            value = [float(v) for v in value]
+        elif comparator not in SearchUtils.NULL_COMPARISON_OPERATORS:
+            value = float(value)
     elif SearchUtils.is_param(key_type, comparator):
         entity = SqlParam
     elif SearchUtils.is_tag(key_type, comparator):
         entity = SqlTag
     elif SearchUtils.is_attribute(key_type, comparator):
-        return None
+        # key_name is guaranteed to be a valid searchable attribute of entities.RunInfo
+        # by the call to parse_search_filter
+        attribute = getattr(SqlRun, SqlRun.get_attribute_name(key_name))
+        return _get_comparison_clause(attribute, comparator, value)
     else:
         raise MlflowException(
             "Invalid search expression type '%s'" % key_type, error_code=INVALID_PARAMETER_VALUE
         )
 
-    if comparator in SearchUtils.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
-        op = SearchUtils.get_sql_filter_ops(entity.value, comparator)
-        return session.query(entity).filter(entity.key == key_name, op(value)).subquery()
-    elif comparator in SearchUtils.filter_ops:
-        op = SearchUtils.filter_ops.get(comparator)
-        return (
-            session.query(entity).filter(entity.key == key_name, op(entity.value, value)).subquery()
-        )
-    else:
-        return None
+    run_has_key = sql.and_(entity.run_uuid == SqlRun.run_uuid, entity.key == key_name)
+    if comparator == SearchUtils.IS_NULL_OPERATOR:
+        return ~sql.exists().where(run_has_key)
+    elif comparator == SearchUtils.IS_NOT_NULL_OPERATOR:
+        return sql.exists().where(run_has_key)
+    return sql.exists().where(
+        sql.and_(run_has_key, _get_comparison_clause(entity.value, comparator, value))
+    )
+
 
+def _get_sqlalchemy_filter_clauses(parsed):
+    """Creates SqlAlchemy clauses implementing a parsed search filter, to be AND-ed in the WHERE
+    clause of a query on SqlRun. Conditions on metrics, params and tags are expressed as
+    EXISTS subqueries correlated with the run, so that the whole filter, including OR-ed
+    conditions, is evaluated by a single query."""
+    return [_to_sqlalchemy_filtering_statement(sql_statement) for sql_statement in parsed]
 
-def _get_sqlalchemy_filter_clauses(parsed, session):
-    """creates SqlAlchemy subqueries
-    that will be inner-joined to SQLRun to act as multi-clause filters."""
-    filters = []
-    for sql_statement in parsed:
-        filter_query = _to_sqlalchemy_filtering_statement(sql_statement, session)
-        if filter_query is not None:
-            filters.append(filter_query)
-    return filters
+
+def _get_single_metric_order_by(order_by_list):
+    """
+    :return: Pair ``(metric_key, ascending)`` if ``order_by_list`` orders runs by a single metric,
+             ``None`` otherwise.
+    """
+    if not order_by_list or len(order_by_list) != 1:
+        return None
+    key_type, key, ascending = SearchUtils.parse_order_by_for_search_runs(order_by_list[0])
+    if not SearchUtils.is_metric(key_type, "="):
+        return None
+    return key, ascending
 
 
 def _get_orderby_clauses(order_by_list, session):
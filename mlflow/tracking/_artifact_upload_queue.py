@@ -0,0 +1,193 @@
+"""
+Background upload of artifacts logged through the fluent ``mlflow.log_artifact`` and
+``mlflow.log_artifacts`` APIs.
+
+Asynchronous uploads are disabled by default and are enabled by setting the
+``MLFLOW_ASYNC_ARTIFACT_UPLOAD`` environment variable to ``true``. Each logged file or directory
+is first snapshotted into a private staging directory, so the caller may modify or delete it as
+soon as the logging call returns, and is then uploaded by a pool of worker threads. Pending
+uploads are flushed when the active run ends, including by the ``end_run`` call made when the
+process exits, which marks the run as ``FAILED`` if some of its uploads failed.
+"""
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from mlflow.exceptions import MlflowException
+
+ASYNC_ARTIFACT_UPLOAD_ENV_VAR = "MLFLOW_ASYNC_ARTIFACT_UPLOAD"
+ASYNC_ARTIFACT_UPLOAD_MAX_WORKERS_ENV_VAR = "MLFLOW_ASYNC_ARTIFACT_UPLOAD_MAX_WORKERS"
+ASYNC_ARTIFACT_UPLOAD_QUEUE_SIZE_ENV_VAR = "MLFLOW_ASYNC_ARTIFACT_UPLOAD_QUEUE_SIZE"
+# Either "copy" (the default) or "hardlink". Hard links avoid copying large files but only
+# protect the snapshot against files that are replaced, not against files rewritten in place.
+ASYNC_ARTIFACT_UPLOAD_SNAPSHOT_ENV_VAR = "MLFLOW_ASYNC_ARTIFACT_UPLOAD_SNAPSHOT"
+
+_DEFAULT_MAX_WORKERS = 4
+_DEFAULT_QUEUE_SIZE = 64
+
+_logger = logging.getLogger(__name__)
+
+_artifact_upload_queue = None
+_artifact_upload_queue_lock = threading.Lock()
+
+
+def _is_async_artifact_upload_enabled():
+    return os.environ.get(ASYNC_ARTIFACT_UPLOAD_ENV_VAR, "false").lower() in ["true", "1"]
+
+
+def get_artifact_upload_queue():
+    """
+    :return: The process-wide :py:class:`ArtifactUploadQueue`, or ``None`` if asynchronous
+             artifact uploads are disabled.
+    """
+    global _artifact_upload_queue
+    if not _is_async_artifact_upload_enabled():
+        return None
+    with _artifact_upload_queue_lock:
+        if _artifact_upload_queue is None:
+            _artifact_upload_queue = ArtifactUploadQueue(
+                max_workers=int(
+                    os.environ.get(ASYNC_ARTIFACT_UPLOAD_MAX_WORKERS_ENV_VAR, _DEFAULT_MAX_WORKERS)
+                ),
+                max_queue_size=int(
+                    os.environ.get(ASYNC_ARTIFACT_UPLOAD_QUEUE_SIZE_ENV_VAR, _DEFAULT_QUEUE_SIZE)
+                ),
+                use_hardlinks=os.environ.get(ASYNC_ARTIFACT_UPLOAD_SNAPSHOT_ENV_VAR, "copy").lower()
+                == "hardlink",
+            )
+        return _artifact_upload_queue
+
+
+def flush_artifact_uploads():
+    """
+    Block until all pending asynchronous artifact uploads have completed. No-op if asynchronous
+    uploads were never used.
+
+    :raises MlflowException: If any pending upload failed.
+    """
+    if _artifact_upload_queue is not None:
+        _artifact_upload_queue.flush()
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Hard links are not supported across file systems or on some platforms
+        shutil.copy2(src, dst)
+
+
+class ArtifactUploadQueue(object):
+    """
+    Bounded queue of artifact uploads executed by a pool of worker threads.
+    """
+
+    def __init__(self, max_workers, max_queue_size, use_hardlinks=False):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Bounds the number of snapshots waiting to be uploaded, and hence the disk space they use
+        self._slots = threading.BoundedSemaphore(max_queue_size)
+        self._copy_function = _link_or_copy if use_hardlinks else shutil.copy2
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._errors = []
+        self._num_submitted = 0
+        self._num_completed = 0
+
+    def _snapshot(self, local_path):
+        staging_dir = tempfile.mkdtemp(prefix="mlflow-artifact-upload-")
+        # Preserve the base name, which determines the name of the logged artifact
+        snapshot_path = os.path.join(staging_dir, os.path.basename(os.path.normpath(local_path)))
+        try:
+            if os.path.isdir(local_path):
+                shutil.copytree(local_path, snapshot_path, copy_function=self._copy_function)
+            else:
+                self._copy_function(local_path, snapshot_path)
+        except Exception:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+        return staging_dir, snapshot_path
+
+    def submit(self, local_path, upload_fn):
+        """
+        Snapshot ``local_path`` and schedule ``upload_fn(snapshot_path)`` on a worker thread.
+        Blocks while the queue is full.
+
+        :param local_path: Local file or directory to upload.
+        :param upload_fn: Function that uploads the file or directory at the path it is given.
+                          The snapshot has the same base name as ``local_path``.
+        """
+        self._slots.acquire()
+        try:
+            staging_dir, snapshot_path = self._snapshot(local_path)
+        except Exception:
+            self._slots.release()
+            raise
+
+        def _upload():
+            try:
+                upload_fn(snapshot_path)
+            finally:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+
+        with self._lock:
+            self._num_submitted += 1
+            future = self._executor.submit(_upload)
+            self._pending.add(future)
+        future.add_done_callback(lambda f: self._on_upload_done(f, local_path))
+        return future
+
+    def _on_upload_done(self, future, local_path):
+        self._slots.release()
+        error = future.exception()
+        with self._lock:
+            if error is not None:
+                self._errors.append((local_path, error))
+            # Only mark the upload as completed once its error is recorded, so that ``flush``
+            # cannot miss it
+            self._pending.discard(future)
+            self._num_completed += 1
+            num_completed, num_submitted = self._num_completed, self._num_submitted
+        if error is not None:
+            _logger.error("Failed to upload artifact '%s': %s", local_path, error)
+        else:
+            _logger.debug(
+                "Uploaded artifact '%s' (%d/%d uploads completed)",
+                local_path,
+                num_completed,
+                num_submitted,
+            )
+
+    @property
+    def num_pending(self):
+        """The number of uploads that have been submitted but have not completed yet."""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self):
+        """
+        Block until all submitted uploads have completed.
+
+        :raises MlflowException: If any upload failed since the last flush.
+        """
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                break
+            # Exceptions are collected by ``_on_upload_done``, which may run shortly after the
+            # futures complete
+            wait(pending)
+            time.sleep(0.01)
+        with self._lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise MlflowException(
+                "Failed to upload {num} artifact(s): {details}".format(
+                    num=len(errors),
+                    details="; ".join("'{}': {}".format(path, e) for path, e in errors),
+                )
+            )
@@ -0,0 +1,158 @@
+"""
+Process-wide cache of model registry reads, kept up to date with the registry change feed.
+
+Caching is disabled by default and is enabled by setting the ``MLFLOW_REGISTRY_CACHE``
+environment variable to ``true``. Reads of a registered model (its latest versions, model
+versions and download URIs) are then served from memory. At most every
+``MLFLOW_REGISTRY_CACHE_SYNC_INTERVAL`` seconds (default 5), the next read asks the registry
+which models changed since the last known registry revision, and only the cached reads of those
+models are discarded. Cached reads are additionally never older than
+``MLFLOW_REGISTRY_CACHE_MAX_AGE`` seconds (default 300), which bounds their staleness should a
+change ever be missed, e.g. when concurrent transactions commit out of revision order.
+
+If the registry has no change feed, e.g. for servers of earlier versions, reads are not cached.
+If a change feed request fails, reads are not cached either until the next successful request.
+"""
+import copy
+import logging
+import os
+import threading
+import time
+
+REGISTRY_CACHE_ENV_VAR = "MLFLOW_REGISTRY_CACHE"
+REGISTRY_CACHE_SYNC_INTERVAL_ENV_VAR = "MLFLOW_REGISTRY_CACHE_SYNC_INTERVAL"
+REGISTRY_CACHE_MAX_AGE_ENV_VAR = "MLFLOW_REGISTRY_CACHE_MAX_AGE"
+
+_DEFAULT_SYNC_INTERVAL_SECONDS = 5
+_DEFAULT_MAX_AGE_SECONDS = 300
+
+_logger = logging.getLogger(__name__)
+
+_registry_read_caches = {}
+_registry_read_caches_lock = threading.Lock()
+
+
+def _is_registry_cache_enabled():
+    return os.environ.get(REGISTRY_CACHE_ENV_VAR, "false").lower() in ["true", "1"]
+
+
+def get_registry_read_cache(registry_uri, store):
+    """
+    :return: The :py:class:`RegistryReadCache` shared by all clients of ``registry_uri``, or
+             ``None`` if registry caching is disabled.
+    """
+    if not _is_registry_cache_enabled():
+        return None
+    with _registry_read_caches_lock:
+        if registry_uri not in _registry_read_caches:
+            _registry_read_caches[registry_uri] = RegistryReadCache(
+                store,
+                sync_interval=float(
+                    os.environ.get(
+                        REGISTRY_CACHE_SYNC_INTERVAL_ENV_VAR, _DEFAULT_SYNC_INTERVAL_SECONDS
+                    )
+                ),
+                max_age=float(
+                    os.environ.get(REGISTRY_CACHE_MAX_AGE_ENV_VAR, _DEFAULT_MAX_AGE_SECONDS)
+                ),
+            )
+        return _registry_read_caches[registry_uri]
+
+
+class RegistryReadCache(object):
+    """
+    Cache of the results of registry reads, grouped by registered model name and invalidated
+    with the change feed of ``store`` (see
+    :py:meth:`mlflow.store.model_registry.abstract_store.AbstractStore.get_registry_changes`).
+    If the store has no change feed, reads are never cached, and they are not cached while the
+    change feed cannot be read.
+
+    :param store: Model registry store.
+    :param sync_interval: Minimum number of seconds between two change feed requests.
+    :param max_age: Maximum number of seconds a read is cached for.
+    """
+
+    def __init__(self, store, sync_interval, max_age):
+        self._store = store
+        self._sync_interval = sync_interval
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        # Registered model name -> {read key: (cache time, result)}
+        self._entries = {}
+        self._revision = None
+        self._last_sync_time = None
+        # Whether the last change feed request succeeded
+        self._synced = False
+        self._enabled = True
+
+    @property
+    def revision(self):
+        """The registry revision the cached reads are known to be up to date with."""
+        return self._revision
+
+    def _sync(self):
+        """
+        :return: Whether the cached reads are up to date with the change feed.
+        """
+        now = time.time()
+        if self._last_sync_time is not None and now - self._last_sync_time < self._sync_interval:
+            return self._synced
+        try:
+            revision, names = self._store.get_registry_changes(since_revision=self._revision)
+        except NotImplementedError as e:
+            _logger.debug("Disabling the model registry read cache: %s", e)
+            self._enabled = False
+            return False
+        except Exception as e:  # pylint: disable=broad-except
+            # Cached reads are kept, and the changes since the last known revision discard them
+            # once the change feed can be read again
+            _logger.warning(
+                "Failed to get the changes of the model registry, reads are not cached until the "
+                "next attempt in %s seconds: %s",
+                self._sync_interval,
+                e,
+            )
+            self._synced = False
+            self._last_sync_time = now
+            return False
+        with self._lock:
+            if self._revision is not None and revision < self._revision:
+                # The registry was reset to an earlier state
+                self._entries.clear()
+            for name in names:
+                self._entries.pop(name, None)
+            self._revision = revision
+            self._last_sync_time = now
+            self._synced = True
+        return True
+
+    def invalidate(self, *names):
+        """
+        Discard the cached reads of the registered models ``names``, e.g. after modifying them.
+        """
+        with self._lock:
+            for name in names:
+                self._entries.pop(name, None)
+
+    def get(self, name, key, read_fn):
+        """
+        Return the cached result of a read of the registered model ``name``, or perform and cache
+        the read if necessary. Failed reads are not cached.
+
+        :param name: Name of the registered model the read depends on.
+        :param key: Hashable key identifying the read among the reads of ``name``.
+        :param read_fn: Function that performs the read.
+        :return: A copy of the result of ``read_fn``.
+        """
+        if not self._enabled or not self._sync():
+            return read_fn()
+        with self._lock:
+            cache_time, result = self._entries.get(name, {}).get(key, (None, None))
+        if cache_time is None or time.time() - cache_time >= self._max_age:
+            # Changes that happen during the read have a later revision than the current one and
+            # invalidate the result at the next sync
+            cache_time = time.time()
+            result = read_fn()
+            with self._lock:
+                self._entries.setdefault(name, {})[key] = (cache_time, result)
+        return copy.deepcopy(result)
@@ -3,16 +3,21 @@ Internal package providing a Python CRUD interface to MLflow models and versions
 This is a lower level API than the :py:mod:`mlflow.tracking.fluent` module, and is
 exposed in the :py:mod:`mlflow.tracking` module.
 """
+from contextlib import contextmanager
 from datetime import timedelta, datetime
 from time import sleep
 
 import logging
 
 from mlflow.exceptions import MlflowException
-from mlflow.store.model_registry import SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT
+from mlflow.store.model_registry import (
+    SEARCH_MODEL_VERSION_MAX_RESULTS_DEFAULT,
+    SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT,
+)
 from mlflow.entities.model_registry import RegisteredModelTag, ModelVersionTag
 from mlflow.entities.model_registry.model_version_status import ModelVersionStatus
 from mlflow.tracking._model_registry import utils, DEFAULT_AWAIT_MAX_SLEEP_SECONDS
+from mlflow.tracking._model_registry.cache import get_registry_read_cache
 
 _logger = logging.getLogger(__name__)
 
@@ -31,6 +36,22 @@ class ModelRegistryClient(object):
         """
         self.registry_uri = registry_uri
         self.store = utils._get_store(self.registry_uri)
+        self._cache = get_registry_read_cache(self.registry_uri, self.store)
+
+    def _cached_read(self, name, key, read_fn):
+        if self._cache is None:
+            return read_fn()
+        return self._cache.get(name, key, read_fn)
+
+    @contextmanager
+    def _invalidating(self, *names):
+        # Invalidate cached reads once the write is done, so that reads concurrent with the write
+        # do not cache the previous state
+        try:
+            yield
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(*names)
 
     # Registered Model Methods
 
@@ -49,7 +70,8 @@ class ModelRegistryClient(object):
         #       Those are constraints applicable to any backend, given the model URI format.
         tags = tags if tags else {}
         tags = [RegisteredModelTag(key, str(value)) for key, value in tags.items()]
-        return self.store.create_registered_model(name, tags, description)
+        with self._invalidating(name):
+            return self.store.create_registered_model(name, tags, description)
 
     def update_registered_model(self, name, description):
         """
@@ -61,7 +83,8 @@ class ModelRegistryClient(object):
         :param description: New description.
         :return: A single updated :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
         """
-        return self.store.update_registered_model(name=name, description=description)
+        with self._invalidating(name):
+            return self.store.update_registered_model(name=name, description=description)
 
     def rename_registered_model(self, name, new_name):
         """
@@ -74,7 +97,8 @@ class ModelRegistryClient(object):
         """
         if new_name.strip() == "":
             raise MlflowException("The name must not be an empty string.")
-        return self.store.rename_registered_model(name=name, new_name=new_name)
+        with self._invalidating(name, new_name):
+            return self.store.rename_registered_model(name=name, new_name=new_name)
 
     def delete_registered_model(self, name):
         """
@@ -83,7 +107,8 @@ class ModelRegistryClient(object):
 
         :param name: Name of the registered model to update.
         """
-        self.store.delete_registered_model(name)
+        with self._invalidating(name):
+            self.store.delete_registered_model(name)
 
     def list_registered_models(
         self, max_results=SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT, page_token=None
@@ -127,7 +152,9 @@ class ModelRegistryClient(object):
         :param name: Name of the registered model to update.
         :return: A single :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
         """
-        return self.store.get_registered_model(name)
+        return self._cached_read(
+            name, "registered_model", lambda: self.store.get_registered_model(name)
+        )
 
     def get_latest_versions(self, name, stages=None):
         """
@@ -139,7 +166,11 @@ class ModelRegistryClient(object):
                        for 'Staging' and 'Production' stages.
         :return: List of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
         """
-        return self.store.get_latest_versions(name, stages)
+        return self._cached_read(
+            name,
+            ("latest_versions", tuple(stages) if stages is not None else None),
+            lambda: self.store.get_latest_versions(name, stages),
+        )
 
     def set_registered_model_tag(self, name, key, value):
         """
@@ -150,7 +181,8 @@ class ModelRegistryClient(object):
         :param value: Tag value log.
         :return: None
         """
-        self.store.set_registered_model_tag(name, RegisteredModelTag(key, str(value)))
+        with self._invalidating(name):
+            self.store.set_registered_model_tag(name, RegisteredModelTag(key, str(value)))
 
     def delete_registered_model_tag(self, name, key):
         """
@@ -160,7 +192,8 @@ class ModelRegistryClient(object):
         :param key: Registered model tag key.
         :return: None
         """
-        self.store.delete_registered_model_tag(name, key)
+        with self._invalidating(name):
+            self.store.delete_registered_model_tag(name, key)
 
     # Model Version Methods
 
@@ -193,7 +226,8 @@ class ModelRegistryClient(object):
         """
         tags = tags if tags else {}
         tags = [ModelVersionTag(key, str(value)) for key, value in tags.items()]
-        mv = self.store.create_model_version(name, source, run_id, tags, run_link, description)
+        with self._invalidating(name):
+            mv = self.store.create_model_version(name, source, run_id, tags, run_link, description)
         if await_creation_for and await_creation_for > 0:
             _logger.info(
                 "Waiting up to %d seconds for model version to finish creation. \
@@ -212,7 +246,7 @@ class ModelRegistryClient(object):
                             mv.name, mv.version, mv.status, await_creation_for
                         )
                     )
-                mv = self.get_model_version(mv.name, mv.version)
+                mv = self.store.get_model_version(mv.name, mv.version)
                 sleep(AWAIT_MODEL_VERSION_CREATE_SLEEP_DURATION_SECONDS)
         return mv
 
@@ -224,7 +258,10 @@ class ModelRegistryClient(object):
         :param version: Version number of the model version.
         :param description: New description.
         """
-        return self.store.update_model_version(name=name, version=version, description=description)
+        with self._invalidating(name):
+            return self.store.update_model_version(
+                name=name, version=version, description=description
+            )
 
     def transition_model_version_stage(self, name, version, stage, archive_existing_versions=False):
         """
@@ -241,12 +278,13 @@ class ModelRegistryClient(object):
         """
         if stage.strip() == "":
             raise MlflowException("The stage must not be an empty string.")
-        return self.store.transition_model_version_stage(
-            name=name,
-            version=version,
-            stage=stage,
-            archive_existing_versions=archive_existing_versions,
-        )
+        with self._invalidating(name):
+            return self.store.transition_model_version_stage(
+                name=name,
+                version=version,
+                stage=stage,
+                archive_existing_versions=archive_existing_versions,
+            )
 
     def get_model_version(self, name, version):
         """
@@ -254,7 +292,11 @@ class ModelRegistryClient(object):
         :param version: Version number of the model version.
         :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
         """
-        return self.store.get_model_version(name, version)
+        return self._cached_read(
+            name,
+            ("model_version", str(version)),
+            lambda: self.store.get_model_version(name, version),
+        )
 
     def delete_model_version(self, name, version):
         """
@@ -263,7 +305,8 @@ class ModelRegistryClient(object):
         :param name: Name of the containing registered model.
         :param version: Version number of the model version.
         """
-        self.store.delete_model_version(name, version)
+        with self._invalidating(name):
+            self.store.delete_model_version(name, version)
 
     def get_model_version_download_uri(self, name, version):
         """
@@ -273,18 +316,36 @@ class ModelRegistryClient(object):
         :param version: Version number of the model version.
         :return: A single URI location that allows reads for downloading.
         """
-        return self.store.get_model_version_download_uri(name, version)
+        return self._cached_read(
+            name,
+            ("model_version_download_uri", str(version)),
+            lambda: self.store.get_model_version_download_uri(name, version),
+        )
 
-    def search_model_versions(self, filter_string):
+    def search_model_versions(
+        self,
+        filter_string,
+        max_results=SEARCH_MODEL_VERSION_MAX_RESULTS_DEFAULT,
+        order_by=None,
+        page_token=None,
+    ):
         """
         Search for model versions in backend that satisfy the filter criteria.
 
-        :param filter_string: A filter string expression. Currently supports a single filter
-                              condition either name of model like ``name = 'model_name'`` or
-                              ``run_id = '...'``.
+        :param filter_string: A filter string expression: one or more comparisons joined by
+                              ``AND``, on ``name``, ``run_id``, ``source_path``,
+                              ``current_stage``, ``version_number``, ``creation_timestamp``,
+                              ``last_updated_timestamp`` or tags (``tags.<key>``).
+        :param max_results: Maximum number of model versions desired.
+        :param order_by: List of column names with ASC|DESC annotation, to be used for ordering
+                         matching search results.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                            a ``search_model_versions`` call.
         :return: PagedList of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
+                 The pagination token for the next page can be obtained via the ``token``
+                 attribute of the object.
         """
-        return self.store.search_model_versions(filter_string)
+        return self.store.search_model_versions(filter_string, max_results, order_by, page_token)
 
     def get_model_version_stages(self, name, version):
         """
@@ -302,7 +363,8 @@ class ModelRegistryClient(object):
         :param value: Tag value to log.
         :return: None
         """
-        self.store.set_model_version_tag(name, version, ModelVersionTag(key, str(value)))
+        with self._invalidating(name):
+            self.store.set_model_version_tag(name, version, ModelVersionTag(key, str(value)))
 
     def delete_model_version_tag(self, name, version, key):
         """
@@ -313,4 +375,17 @@ class ModelRegistryClient(object):
         :param key: Tag key.
         :return: None
         """
-        self.store.delete_model_version_tag(name, version, key)
+        with self._invalidating(name):
+            self.store.delete_model_version_tag(name, version, key)
+
+    def get_registry_changes(self, since_revision=None, timeout=0):
+        """
+        Get the names of the registered models that changed since a registry revision.
+
+        :param since_revision: Registry revision returned by a previous call, or ``None`` to only
+                               get the current registry revision.
+        :param timeout: Number of seconds to wait for changes if there are none yet.
+        :return: Pair of the current registry revision and the list of names of the registered
+                 models that changed since ``since_revision``.
+        """
+        return self.store.get_registry_changes(since_revision=since_revision, timeout=timeout)
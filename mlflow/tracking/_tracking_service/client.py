@@ -20,6 +20,7 @@ from mlflow.utils.validation import (
 )
 from mlflow.entities import Param, Metric, RunStatus, RunTag, ViewType, ExperimentTag
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.tracking import archive
 from mlflow.utils.mlflow_tags import MLFLOW_USER
 from mlflow.utils.string_utils import is_string_type
 from mlflow.utils.uri import add_databricks_profile_info_to_artifact_uri
@@ -277,14 +278,20 @@ class TrackingServiceClient(object):
         else:
             artifact_repo.log_artifact(local_path, artifact_path)
 
-    def log_artifacts(self, run_id, local_dir, artifact_path=None):
+    def log_artifacts(self, run_id, local_dir, artifact_path=None, sync=False):
         """
         Write a directory of files to the remote ``artifact_uri``.
 
         :param local_dir: Path to the directory of files to write.
         :param artifact_path: If provided, the directory in ``artifact_uri`` to write to.
+        :param sync: If True, only upload files that differ from the ones previously synced to
+                     ``artifact_path``.
         """
-        self._get_artifact_repo(run_id).log_artifacts(local_dir, artifact_path)
+        artifact_repo = self._get_artifact_repo(run_id)
+        if sync:
+            artifact_repo.sync_upload_artifacts(local_dir, artifact_path)
+        else:
+            artifact_repo.log_artifacts(local_dir, artifact_path)
 
     def list_artifacts(self, run_id, path=None):
         """
@@ -297,7 +304,7 @@ class TrackingServiceClient(object):
         """
         return self._get_artifact_repo(run_id).list_artifacts(path)
 
-    def download_artifacts(self, run_id, path, dst_path=None):
+    def download_artifacts(self, run_id, path, dst_path=None, sync=False):
         """
         Download an artifact file or directory from a run to a local directory if applicable,
         and return a local path for it.
@@ -309,9 +316,14 @@ class TrackingServiceClient(object):
                          If unspecified, the artifacts will either be downloaded to a new
                          uniquely-named directory on the local filesystem or will be returned
                          directly in the case of the LocalArtifactRepository.
+        :param sync: If True and ``dst_path`` is specified, only download files that differ from
+                     the ones already present under ``dst_path``.
         :return: Local path of desired artifact.
         """
-        return self._get_artifact_repo(run_id).download_artifacts(path, dst_path)
+        artifact_repo = self._get_artifact_repo(run_id)
+        if sync and dst_path is not None:
+            return artifact_repo.sync_download_artifacts(path, dst_path)
+        return artifact_repo.download_artifacts(path, dst_path)
 
     def set_terminated(self, run_id, status=None, end_time=None):
         """Set a run's status to terminated.
@@ -374,3 +386,46 @@ class TrackingServiceClient(object):
             order_by=order_by,
             page_token=page_token,
         )
+
+    def search_runs_batch(
+        self,
+        experiment_ids,
+        filter_string="",
+        run_view_type=ViewType.ACTIVE_ONLY,
+        max_results=SEARCH_MAX_RESULTS_DEFAULT,
+        order_by=None,
+        page_token=None,
+    ):
+        """
+        Search runs like :py:meth:`search_runs`, returning them in columnar form.
+
+        :return: A :py:class:`mlflow.store.entities.run_batch.RunBatch` of the runs that satisfy
+            the search expressions, with the token for the next page in its ``token`` attribute.
+        """
+        if isinstance(experiment_ids, int) or is_string_type(experiment_ids):
+            experiment_ids = [experiment_ids]
+        return self.store.search_runs_batch(
+            experiment_ids=experiment_ids,
+            filter_string=filter_string,
+            run_view_type=run_view_type,
+            max_results=max_results,
+            order_by=order_by,
+            page_token=page_token,
+        )
+
+    def export_experiments(self, path, experiment_ids=None, include_artifacts=False):
+        """
+        Export experiments with all their runs to an archive directory. See
+        :py:func:`mlflow.store.tracking.archive.export_experiments`.
+        """
+        archive.export_experiments(self.store, path, experiment_ids, include_artifacts)
+
+    def import_experiments(self, path):
+        """
+        Import the experiments and runs of an archive directory. See
+        :py:func:`mlflow.store.tracking.archive.import_experiments`.
+
+        :return: Dictionary mapping the IDs of the runs in the archive to the IDs of the imported
+                 runs.
+        """
+        return archive.import_experiments(self.store, path)
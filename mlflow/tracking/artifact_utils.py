@@ -1,19 +1,28 @@
 """
 Utilities for dealing with artifacts in the context of a Run.
 """
+import os
 import pathlib
 import posixpath
 import shutil
 import tempfile
 import urllib.parse
 
+from mlflow.entities import RunStatus
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.artifact.artifact_cache import get_artifact_cache
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.dbfs_artifact_repo import DbfsRestArtifactRepository
 from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
+from mlflow.store.artifact.runs_artifact_repo import RunsArtifactRepository
 from mlflow.tracking._tracking_service.utils import _get_store
-from mlflow.utils.uri import add_databricks_profile_info_to_artifact_uri, append_to_uri_path
+from mlflow.utils.file_utils import _copy_tree
+from mlflow.utils.uri import (
+    add_databricks_profile_info_to_artifact_uri,
+    append_to_uri_path,
+    get_databricks_profile_uri_from_artifact_uri,
+)
 
 
 def get_artifact_uri(run_id, artifact_path=None, tracking_uri=None):
@@ -51,6 +60,29 @@ def get_artifact_uri(run_id, artifact_path=None, tracking_uri=None):
         return append_to_uri_path(run.info.artifact_uri, artifact_path)
 
 
+def _get_immutable_artifact_uri(artifact_uri):
+    """
+    Resolve a ``runs:/`` or ``models:/`` URI to the underlying location of its artifacts if the
+    artifacts at that location can no longer change, i.e. if the URI refers to a terminated run
+    or to a model version (a model stage is resolved to its current version first).
+
+    :return: The resolved artifact URI, or ``None`` if the artifacts may still change.
+    """
+    if RunsArtifactRepository.is_runs_uri(artifact_uri):
+        run_id, artifact_path = RunsArtifactRepository.parse_runs_uri(artifact_uri)
+        tracking_uri = get_databricks_profile_uri_from_artifact_uri(artifact_uri)
+        run = _get_store(tracking_uri).get_run(run_id)
+        if not RunStatus.is_terminated(RunStatus.from_string(run.info.status)):
+            return None
+        uri = run.info.artifact_uri
+        if artifact_path is not None:
+            uri = append_to_uri_path(uri, artifact_path)
+        return add_databricks_profile_info_to_artifact_uri(uri, tracking_uri)
+    elif ModelsArtifactRepository.is_models_uri(artifact_uri):
+        return ModelsArtifactRepository.get_underlying_uri(artifact_uri)
+    return None
+
+
 # TODO: This would be much simpler if artifact_repo.download_artifacts could take the absolute path
 # or no path.
 def _download_artifact_from_uri(artifact_uri, output_path=None):
@@ -58,7 +90,33 @@ def _download_artifact_from_uri(artifact_uri, output_path=None):
     :param artifact_uri: The *absolute* URI of the artifact to download.
     :param output_path: The local filesystem path to which to download the artifact. If unspecified,
                         a local output path will be created.
+
+    If the ``MLFLOW_ARTIFACT_CACHE_DIR`` environment variable is set, the artifacts of terminated
+    runs (``runs:/`` URIs) and of model versions (``models:/`` URIs) are downloaded once into a
+    shared on-disk cache. If ``output_path`` is unspecified, the read-only cached path is
+    returned directly, and may be evicted once the cache is full; otherwise the cached artifacts
+    are copied to ``output_path``.
     """
+    artifact_cache = get_artifact_cache()
+    if artifact_cache is not None:
+        resolved_uri = _get_immutable_artifact_uri(str(artifact_uri))
+        if resolved_uri is not None:
+
+            def download_fn(dst_path):
+                return _download_artifact_from_uri(resolved_uri, dst_path)
+
+            if output_path is None:
+                return artifact_cache.get_or_download(resolved_uri, download_fn)
+            # The cached artifacts cannot be evicted while they are copied
+            with artifact_cache.lease(resolved_uri, download_fn) as cached_path:
+                local_path = os.path.join(output_path, os.path.basename(cached_path))
+                if os.path.isdir(cached_path):
+                    # Copy without preserving the read-only mode of the cached files
+                    _copy_tree(cached_path, local_path)
+                else:
+                    shutil.copyfile(cached_path, local_path)
+            return local_path
+
     parsed_uri = urllib.parse.urlparse(str(artifact_uri))
     prefix = ""
     if parsed_uri.scheme and not parsed_uri.path.startswith("/"):
@@ -9,7 +9,10 @@ from mlflow.entities import ViewType
 from mlflow.entities.model_registry.model_version_stages import ALL_STAGES
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import FEATURE_DISABLED
-from mlflow.store.model_registry import SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT
+from mlflow.store.model_registry import (
+    SEARCH_MODEL_VERSION_MAX_RESULTS_DEFAULT,
+    SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT,
+)
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.tracking._model_registry.client import ModelRegistryClient
 from mlflow.tracking._model_registry import utils as registry_utils
@@ -766,12 +769,15 @@ class MlflowClient(object):
         """
         self._tracking_client.log_artifact(run_id, local_path, artifact_path)
 
-    def log_artifacts(self, run_id, local_dir, artifact_path=None):
+    def log_artifacts(self, run_id, local_dir, artifact_path=None, sync=False):
         """
         Write a directory of files to the remote ``artifact_uri``.
 
         :param local_dir: Path to the directory of files to write.
         :param artifact_path: If provided, the directory in ``artifact_uri`` to write to.
+        :param sync: If True, only upload files whose size or MD5 digest differ from the ones
+                     previously synced to ``artifact_path``. A manifest describing the synced
+                     files is stored next to the artifacts.
 
         .. code-block:: python
             :caption: Example
@@ -808,7 +814,7 @@ class MlflowClient(object):
             artifact: states
             is_dir: True
         """
-        self._tracking_client.log_artifacts(run_id, local_dir, artifact_path)
+        self._tracking_client.log_artifacts(run_id, local_dir, artifact_path, sync)
 
     def _record_logged_model(self, run_id, mlflow_model):
         """
@@ -870,7 +876,7 @@ class MlflowClient(object):
         """
         return self._tracking_client.list_artifacts(run_id, path)
 
-    def download_artifacts(self, run_id, path, dst_path=None):
+    def download_artifacts(self, run_id, path, dst_path=None, sync=False):
         """
         Download an artifact file or directory from a run to a local directory if applicable,
         and return a local path for it.
@@ -882,9 +888,11 @@ class MlflowClient(object):
                          If unspecified, the artifacts will either be downloaded to a new
                          uniquely-named directory on the local filesystem or will be returned
                          directly in the case of the LocalArtifactRepository.
+        :param sync: If True and ``dst_path`` is specified, only download files that are missing
+                     from ``dst_path`` or differ from the artifacts logged with ``sync=True``.
         :return: Local path of desired artifact.
         """
-        return self._tracking_client.download_artifacts(run_id, path, dst_path)
+        return self._tracking_client.download_artifacts(run_id, path, dst_path, sync)
 
     def set_terminated(self, run_id, status=None, end_time=None):
         """Set a run's status to terminated.
@@ -1022,6 +1030,74 @@ class MlflowClient(object):
             experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
         )
 
+    @experimental
+    def search_runs_batch(
+        self,
+        experiment_ids,
+        filter_string="",
+        run_view_type=ViewType.ACTIVE_ONLY,
+        max_results=SEARCH_MAX_RESULTS_DEFAULT,
+        order_by=None,
+        page_token=None,
+    ):
+        """
+        Search runs like :py:meth:`search_runs`, returning them in columnar form, which avoids
+        creating a :py:class:`mlflow.entities.Run` object per run when converting them to a
+        pandas DataFrame or an Arrow table.
+
+        :param experiment_ids: List of experiment IDs, or a single int or string id.
+        :param filter_string: Filter query string, defaults to searching all runs.
+        :param run_view_type: one of enum values ACTIVE_ONLY, DELETED_ONLY, or ALL runs
+                              defined in :py:class:`mlflow.entities.ViewType`.
+        :param max_results: Maximum number of runs desired.
+        :param order_by: List of columns to order by, as in :py:meth:`search_runs`.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+            a ``search_runs_batch`` call.
+
+        :return: A :py:class:`mlflow.store.entities.run_batch.RunBatch` of the runs that satisfy
+            the search expressions, with the token for the next page in its ``token`` attribute.
+        """
+        return self._tracking_client.search_runs_batch(
+            experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+        )
+
+    @experimental
+    def export_experiments(self, path, experiment_ids=None, include_artifacts=False):
+        """
+        Export experiments with all their runs, params, tags and metric histories to an archive
+        directory, which :py:meth:`import_experiments` can import into another tracking server or
+        backend store.
+
+        :param path: Path of the archive directory, created if it does not exist.
+        :param experiment_ids: List of IDs of the experiments to export. All experiments,
+                               including deleted ones, are exported by default.
+        :param include_artifacts: Whether to also export the artifacts of the runs.
+
+        .. code-block:: python
+            :caption: Example
+
+            from mlflow.tracking import MlflowClient
+
+            # Copy the default experiment from a local directory to a SQLite database
+            MlflowClient("file:./mlruns").export_experiments("/tmp/backup", experiment_ids=["0"])
+            run_ids = MlflowClient("sqlite:///mlflow.db").import_experiments("/tmp/backup")
+            print("Imported {} runs".format(len(run_ids)))
+        """
+        self._tracking_client.export_experiments(path, experiment_ids, include_artifacts)
+
+    @experimental
+    def import_experiments(self, path):
+        """
+        Import the experiments and runs of an archive directory created by
+        :py:meth:`export_experiments`. Runs are imported with new IDs into the existing active
+        experiment with the same name if there is one, and into a new experiment otherwise.
+
+        :param path: Path of the archive directory.
+        :return: Dictionary mapping the IDs of the runs in the archive to the IDs of the imported
+                 runs.
+        """
+        return self._tracking_client.import_experiments(path)
+
     # Registry API
 
     # Registered Model Methods
@@ -1373,14 +1449,30 @@ class MlflowClient(object):
         return self._get_registry_client().get_model_version_download_uri(name, version)
 
     @experimental
-    def search_model_versions(self, filter_string):
+    def search_model_versions(
+        self,
+        filter_string,
+        max_results=SEARCH_MODEL_VERSION_MAX_RESULTS_DEFAULT,
+        order_by=None,
+        page_token=None,
+    ):
         """
         Search for model versions in backend that satisfy the filter criteria.
 
-        :param filter_string: A filter string expression. Currently, it supports a single filter
-                              condition either a name of model like ``name = 'model_name'`` or
-                              ``run_id = '...'``.
+        :param filter_string: A filter string expression: one or more comparisons joined by
+                              ``AND``, on ``name``, ``run_id``, ``source_path``,
+                              ``current_stage``, ``version_number``, ``creation_timestamp``,
+                              ``last_updated_timestamp`` or tags (``tags.<key>``), e.g.
+                              ``name = 'model_name' AND current_stage = 'Production'``.
+        :param max_results: Maximum number of model versions desired.
+        :param order_by: List of column names with ASC|DESC annotation, to be used for ordering
+                         matching search results. Model versions are ordered by name, then by
+                         version by default.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+                            a ``search_model_versions`` call.
         :return: PagedList of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
+                 The pagination token for the next page can be obtained via the ``token``
+                 attribute of the object.
 
         .. code-block:: python
             :caption: Example
@@ -1415,7 +1507,9 @@ class MlflowClient(object):
             ------------------------------------------------------------------------------------
             name=CordobaWeatherForecastModel; run_id=e14afa2f47a040728060c1699968fd43; version=2
         """
-        return self._get_registry_client().search_model_versions(filter_string)
+        return self._get_registry_client().search_model_versions(
+            filter_string, max_results, order_by, page_token
+        )
 
     @experimental
     def get_model_version_stages(self, name, version):  # pylint: disable=unused-argument
@@ -7,15 +7,19 @@ import os
 import atexit
 import time
 import logging
-import numpy as np
-import pandas as pd
 
 from mlflow.entities import Run, RunStatus, Param, RunTag, Metric, ViewType
 from mlflow.entities.lifecycle_stage import LifecycleStage
 from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 from mlflow.tracking.client import MlflowClient
+from mlflow.tracking._artifact_upload_queue import (
+    flush_artifact_uploads,
+    get_artifact_upload_queue,
+)
 from mlflow.tracking import artifact_utils, _get_store
 from mlflow.tracking.context import registry as context_registry
+from mlflow.store.entities.run_batch import RunBatch
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.utils import env
 from mlflow.utils.databricks_utils import is_in_databricks_notebook, get_notebook_id
@@ -225,6 +229,10 @@ def start_run(run_id=None, experiment_id=None, run_name=None, nested=False):
 def end_run(status=RunStatus.to_string(RunStatus.FINISHED)):
     """End an active MLflow run (if there is one).
 
+    Any artifacts still being uploaded in the background (see :py:func:`mlflow.log_artifact`) are
+    uploaded first. If some of them fail to upload, the run is marked as ``FAILED`` and an
+    :py:class:`mlflow.exceptions.MlflowException` is raised.
+
     .. code-block:: python
         :caption: Example
 
@@ -257,6 +265,12 @@ def end_run(status=RunStatus.to_string(RunStatus.FINISHED)):
         # Clear out the global existing run environment variable as well.
         env.unset_variable(_RUN_ID_ENV_VAR)
         run = _active_run_stack.pop()
+        try:
+            flush_artifact_uploads()
+        except Exception:
+            # Don't leave the run in the RUNNING state if some of its artifacts failed to upload
+            MlflowClient().set_terminated(run.info.run_id, RunStatus.to_string(RunStatus.FAILED))
+            raise
         MlflowClient().set_terminated(run.info.run_id, status)
 
 
@@ -501,6 +515,10 @@ def log_artifact(local_path, artifact_path=None):
     :param local_path: Path to the file to write.
     :param artifact_path: If provided, the directory in ``artifact_uri`` to write to.
 
+    If the ``MLFLOW_ASYNC_ARTIFACT_UPLOAD`` environment variable is set to ``true``, a snapshot
+    of ``local_path`` is uploaded in the background and this method returns immediately. Pending
+    uploads complete before the run ends; see :py:func:`mlflow.end_run`.
+
     .. code-block:: python
         :caption: Example
 
@@ -517,16 +535,29 @@ def log_artifact(local_path, artifact_path=None):
             mlflow.log_artifact("features.txt")
     """
     run_id = _get_or_start_run().info.run_id
-    MlflowClient().log_artifact(run_id, local_path, artifact_path)
+    upload_queue = get_artifact_upload_queue()
+    if upload_queue is not None:
+        upload_queue.submit(
+            local_path,
+            lambda snapshot_path: MlflowClient().log_artifact(run_id, snapshot_path, artifact_path),
+        )
+    else:
+        MlflowClient().log_artifact(run_id, local_path, artifact_path)
 
 
-def log_artifacts(local_dir, artifact_path=None):
+def log_artifacts(local_dir, artifact_path=None, sync=False):
     """
     Log all the contents of a local directory as artifacts of the run. If no run is active,
     this method will create a new active run.
 
     :param local_dir: Path to the directory of files to write.
     :param artifact_path: If provided, the directory in ``artifact_uri`` to write to.
+    :param sync: If True, only upload files that changed since the directory was last logged
+                 with ``sync=True``, e.g. when repeatedly logging a checkpoint directory.
+
+    If the ``MLFLOW_ASYNC_ARTIFACT_UPLOAD`` environment variable is set to ``true``, a snapshot
+    of ``local_dir`` is uploaded in the background and this method returns immediately. Pending
+    uploads complete before the run ends; see :py:func:`mlflow.end_run`.
 
     .. code-block:: python
         :caption: Example
@@ -550,7 +581,16 @@ def log_artifacts(local_dir, artifact_path=None):
             mlflow.log_artifacts("data", artifact_path="states")
     """
     run_id = _get_or_start_run().info.run_id
-    MlflowClient().log_artifacts(run_id, local_dir, artifact_path)
+    upload_queue = get_artifact_upload_queue()
+    if upload_queue is not None:
+        upload_queue.submit(
+            local_dir,
+            lambda snapshot_dir: MlflowClient().log_artifacts(
+                run_id, snapshot_dir, artifact_path, sync
+            ),
+        )
+    else:
+        MlflowClient().log_artifacts(run_id, local_dir, artifact_path, sync)
 
 
 def _record_logged_model(mlflow_model):
@@ -767,6 +807,7 @@ def search_runs(
     run_view_type=ViewType.ACTIVE_ONLY,
     max_results=SEARCH_MAX_RESULTS_PANDAS,
     order_by=None,
+    output_format="pandas",
 ):
     """
     Get a pandas DataFrame of runs that fit the search criteria.
@@ -780,6 +821,9 @@ def search_runs(
     :param order_by: List of columns to order by (e.g., "metrics.rmse"). The ``order_by`` column
                      can contain an optional ``DESC`` or ``ASC`` value. The default is ``ASC``.
                      The default ordering is to sort by ``start_time DESC``, then ``run_id``.
+    :param output_format: ``"pandas"`` to return a pandas DataFrame, or ``"arrow"`` to return a
+                          ``pyarrow.Table`` with the same columns, which requires the ``pyarrow``
+                          package.
 
     :return: A pandas.DataFrame of runs, where each metric, parameter, and tag
         are expanded into their own columns named metrics.*, params.*, and tags.*
@@ -821,81 +865,27 @@ def search_runs(
            metrics.m tags.s.release                            run_id
         0       1.55       1.1.0-RC  5cc7feaf532f496f885ad7750809c4d4
     """
+    if output_format not in ("pandas", "arrow"):
+        raise MlflowException(
+            "Invalid output format '%s'. Supported formats: 'pandas', 'arrow'" % output_format,
+            error_code=INVALID_PARAMETER_VALUE,
+        )
     if not experiment_ids:
         experiment_ids = _get_experiment_id()
 
     # Using an internal function as the linter doesn't like assigning a lambda, and inlining the
     # full thing is a mess
     def pagination_wrapper_func(number_to_get, next_page_token):
-        return MlflowClient().search_runs(
+        return MlflowClient().search_runs_batch(
             experiment_ids, filter_string, run_view_type, number_to_get, order_by, next_page_token
         )
 
-    runs = _paginate(pagination_wrapper_func, NUM_RUNS_PER_PAGE_PANDAS, max_results)
-
-    info = {
-        "run_id": [],
-        "experiment_id": [],
-        "status": [],
-        "artifact_uri": [],
-        "start_time": [],
-        "end_time": [],
-    }
-    params, metrics, tags = ({}, {}, {})
-    PARAM_NULL, METRIC_NULL, TAG_NULL = (None, np.nan, None)
-    for i, run in enumerate(runs):
-        info["run_id"].append(run.info.run_id)
-        info["experiment_id"].append(run.info.experiment_id)
-        info["status"].append(run.info.status)
-        info["artifact_uri"].append(run.info.artifact_uri)
-        info["start_time"].append(pd.to_datetime(run.info.start_time, unit="ms", utc=True))
-        info["end_time"].append(pd.to_datetime(run.info.end_time, unit="ms", utc=True))
-
-        # Params
-        param_keys = set(params.keys())
-        for key in param_keys:
-            if key in run.data.params:
-                params[key].append(run.data.params[key])
-            else:
-                params[key].append(PARAM_NULL)
-        new_params = set(run.data.params.keys()) - param_keys
-        for p in new_params:
-            params[p] = [PARAM_NULL] * i  # Fill in null values for all previous runs
-            params[p].append(run.data.params[p])
-
-        # Metrics
-        metric_keys = set(metrics.keys())
-        for key in metric_keys:
-            if key in run.data.metrics:
-                metrics[key].append(run.data.metrics[key])
-            else:
-                metrics[key].append(METRIC_NULL)
-        new_metrics = set(run.data.metrics.keys()) - metric_keys
-        for m in new_metrics:
-            metrics[m] = [METRIC_NULL] * i
-            metrics[m].append(run.data.metrics[m])
-
-        # Tags
-        tag_keys = set(tags.keys())
-        for key in tag_keys:
-            if key in run.data.tags:
-                tags[key].append(run.data.tags[key])
-            else:
-                tags[key].append(TAG_NULL)
-        new_tags = set(run.data.tags.keys()) - tag_keys
-        for t in new_tags:
-            tags[t] = [TAG_NULL] * i
-            tags[t].append(run.data.tags[t])
-
-    data = {}
-    data.update(info)
-    for key in metrics:
-        data["metrics." + key] = metrics[key]
-    for key in params:
-        data["params." + key] = params[key]
-    for key in tags:
-        data["tags." + key] = tags[key]
-    return pd.DataFrame(data)
+    # Pages are appended column by column to a single batch of runs, without creating a Run
+    # object per run
+    runs = _paginate(
+        pagination_wrapper_func, NUM_RUNS_PER_PAGE_PANDAS, max_results, all_results=RunBatch()
+    )
+    return runs.to_arrow() if output_format == "arrow" else runs.to_pandas()
 
 
 def list_run_infos(
@@ -967,7 +957,7 @@ def list_run_infos(
     return _paginate(pagination_wrapper_func, SEARCH_MAX_RESULTS_DEFAULT, max_results)
 
 
-def _paginate(paginated_fn, max_results_per_page, max_results):
+def _paginate(paginated_fn, max_results_per_page, max_results, all_results=None):
     """
     Intended to be a general use pagination utility.
 
@@ -978,11 +968,16 @@ def _paginate(paginated_fn, max_results_per_page, max_results):
     :type max_results_per_page: The maximum number of results to retrieve per page
     :param max_results:
     :type max_results: The maximum number of results to retrieve overall
+    :param all_results:
+    :type all_results: Optional container to add the pages of results to, with ``extend`` and
+        ``__len__`` methods, e.g. a :py:class:`mlflow.store.entities.run_batch.RunBatch`.
+        Defaults to an empty list
     :return: Returns a list of entities, as determined by the paginated_fn parameter, with no more
         entities than specified by max_results
     :rtype: list[object]
     """
-    all_results = []
+    if all_results is None:
+        all_results = []
     next_page_token = None
     while len(all_results) < max_results:
         num_to_get = max_results - len(all_results)
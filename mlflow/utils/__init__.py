@@ -40,3 +40,11 @@ def get_unique_resource_id(max_length=None):
     if max_length is not None:
         unique_id = unique_id[: int(max_length)]
     return unique_id
+
+
+def _chunk_list(lst, chunk_size):
+    """
+    Yield successive ``chunk_size``-sized slices of ``lst``.
+    """
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i : i + chunk_size]
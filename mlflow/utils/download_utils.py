@@ -0,0 +1,235 @@
+"""
+Utilities for downloading large files over several concurrent byte-range requests.
+"""
+import base64
+import binascii
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from mlflow.exceptions import MlflowException
+from mlflow.utils.file_utils import compute_file_md5
+from mlflow.utils.rest_utils import get_request_session
+
+PARALLEL_DOWNLOAD_CHUNK_SIZE_ENV_VAR = "MLFLOW_PARALLEL_DOWNLOAD_CHUNK_SIZE"
+PARALLEL_DOWNLOAD_MAX_WORKERS_ENV_VAR = "MLFLOW_PARALLEL_DOWNLOAD_MAX_WORKERS"
+_DEFAULT_PARALLEL_DOWNLOAD_CHUNK_SIZE = 100 * 1024 * 1024
+_DEFAULT_PARALLEL_DOWNLOAD_MAX_WORKERS = 8
+_STREAM_CHUNK_SIZE = 1024 * 1024
+_CONTENT_RANGE_REGEX = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+# ETags of single-part uploads to S3 (and of many other object stores) are the MD5 of the object,
+# whereas ETags of multipart uploads end with "-<number of parts>"
+_MD5_ETAG_REGEX = re.compile(r'^"?([0-9a-fA-F]{32})"?$')
+# With these server-side encryption modes, the ETag of an S3 object is not its MD5
+_S3_ENCRYPTION_HEADERS = {
+    "x-amz-server-side-encryption": ["aws:kms"],
+    "x-amz-server-side-encryption-customer-algorithm": None,
+}
+
+
+def get_parallel_download_chunk_size():
+    """
+    :return: The size in bytes of each range requested by parallel downloads, read from the
+             ``MLFLOW_PARALLEL_DOWNLOAD_CHUNK_SIZE`` environment variable (default 100 MB).
+    """
+    return int(
+        os.environ.get(PARALLEL_DOWNLOAD_CHUNK_SIZE_ENV_VAR, _DEFAULT_PARALLEL_DOWNLOAD_CHUNK_SIZE)
+    )
+
+
+def get_parallel_download_max_workers():
+    """
+    :return: The maximum number of concurrent range requests issued by parallel downloads, read
+             from the ``MLFLOW_PARALLEL_DOWNLOAD_MAX_WORKERS`` environment variable (default 8).
+    """
+    return int(
+        os.environ.get(
+            PARALLEL_DOWNLOAD_MAX_WORKERS_ENV_VAR, _DEFAULT_PARALLEL_DOWNLOAD_MAX_WORKERS
+        )
+    )
+
+
+def _get_ranges(start, file_size, chunk_size):
+    """
+    :return: List of inclusive ``(first_byte, last_byte)`` tuples covering
+             ``[start, file_size)`` in chunks of at most ``chunk_size`` bytes.
+    """
+    return [
+        (offset, min(offset + chunk_size, file_size) - 1)
+        for offset in range(start, file_size, chunk_size)
+    ]
+
+
+def download_ranges_in_parallel(
+    fetch_range, local_path, file_size, chunk_size, max_workers, start=0
+):
+    """
+    Download the bytes ``[start, file_size)`` of a remote file into ``local_path`` by issuing
+    concurrent range requests. ``local_path`` must already exist; it is grown to ``file_size``
+    bytes up front and every range is written at its own offset, so ranges may complete in any
+    order. The length of every fetched range and the size of the final file are verified.
+
+    :param fetch_range: Function accepting inclusive ``(first_byte, last_byte)`` offsets and
+                        returning the corresponding bytes of the remote file.
+    :param local_path: Path of the local file to write into.
+    :param file_size: Total size of the remote file in bytes.
+    :param chunk_size: Maximum number of bytes requested by a single range request.
+    :param max_workers: Maximum number of concurrent range requests.
+    :param start: Offset of the first byte to download. Bytes before it are assumed to already
+                  have been written to ``local_path``.
+    """
+    with open(local_path, "r+b") as f:
+        f.truncate(file_size)
+
+    def _download_range(byte_range):
+        first_byte, last_byte = byte_range
+        data = fetch_range(first_byte, last_byte)
+        expected_length = last_byte - first_byte + 1
+        if len(data) != expected_length:
+            raise MlflowException(
+                "Failed to download bytes {first}-{last} of '{path}': expected {expected} bytes,"
+                " received {received}.".format(
+                    first=first_byte,
+                    last=last_byte,
+                    path=local_path,
+                    expected=expected_length,
+                    received=len(data),
+                )
+            )
+        with open(local_path, "r+b") as f:
+            f.seek(first_byte)
+            f.write(data)
+
+    ranges = _get_ranges(start, file_size, chunk_size)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ranges) or 1))) as executor:
+        # Consume the results so that the first failure is raised to the caller
+        list(executor.map(_download_range, ranges))
+
+    actual_size = os.path.getsize(local_path)
+    if actual_size != file_size:
+        raise MlflowException(
+            "Downloaded file '{path}' has size {actual}, expected {expected}.".format(
+                path=local_path, actual=actual_size, expected=file_size
+            )
+        )
+
+
+def _base64_md5_to_hex(value):
+    try:
+        return binascii.hexlify(base64.b64decode(value.strip())).decode("ascii")
+    except (binascii.Error, ValueError):
+        return None
+
+
+def _get_expected_md5(response):
+    """
+    :return: The hexadecimal MD5 digest of the whole remote file advertised by the headers of
+             ``response``, or ``None`` if the server did not advertise one.
+    """
+    headers = response.headers
+    # Google Cloud Storage and Azure Blob Storage advertise the MD5 of the whole object, also in
+    # partial responses
+    for value in headers.get("x-goog-hash", "").split(","):
+        name, _, digest = value.strip().partition("=")
+        if name == "md5":
+            return _base64_md5_to_hex(digest)
+    if "x-ms-blob-content-md5" in headers:
+        return _base64_md5_to_hex(headers["x-ms-blob-content-md5"])
+    # The Content-MD5 header of a partial response is the MD5 of the range only
+    if response.status_code == 200 and "Content-MD5" in headers:
+        return _base64_md5_to_hex(headers["Content-MD5"])
+    for name, values in _S3_ENCRYPTION_HEADERS.items():
+        if name in headers and (values is None or headers[name] in values):
+            return None
+    match = _MD5_ETAG_REGEX.match(headers.get("ETag", ""))
+    return match.group(1).lower() if match else None
+
+
+def _verify_md5(local_path, expected_md5):
+    actual_md5 = compute_file_md5(local_path, chunk_size=_STREAM_CHUNK_SIZE)
+    if actual_md5 != expected_md5:
+        raise MlflowException(
+            "Downloaded file '{path}' has MD5 digest {actual}, expected {expected}.".format(
+                path=local_path, actual=actual_md5, expected=expected_md5
+            )
+        )
+
+
+def download_url_in_parallel(url, local_path, chunk_size=None, max_workers=None):
+    """
+    Download the file at ``url`` (e.g. a presigned cloud storage URL) into ``local_path``. The
+    first ``chunk_size`` bytes are requested with a ``Range`` header; if the server honors it, the
+    total size is read from the ``Content-Range`` response header and the remaining ranges are
+    fetched concurrently with :py:func:`download_ranges_in_parallel`. Every range request carries
+    an ``If-Match`` header with the ETag of the first response, so a file that changes during the
+    download fails instead of being silently corrupted. Servers that do not support range
+    requests are handled by streaming the full response body over a single connection.
+
+    The length of every range and the size of the file are always verified. The MD5 digest of
+    the downloaded file is also verified if the server advertises the MD5 of the whole file, with
+    a ``Content-MD5`` header in a full response, an ``x-goog-hash`` or ``x-ms-blob-content-md5``
+    header, or an ETag that is an MD5 digest, like the ETags of objects uploaded to S3 in a single
+    part without KMS or customer-provided encryption keys.
+    """
+    chunk_size = chunk_size or get_parallel_download_chunk_size()
+    max_workers = max_workers or get_parallel_download_max_workers()
+    first_range = "bytes=0-{}".format(chunk_size - 1)
+    session = get_request_session(url)
+    with session.get(url, headers={"Range": first_range}, stream=True) as response:
+        if response.status_code == 416:
+            # Range not satisfiable: the remote file is empty
+            open(local_path, "wb").close()
+            return
+        response.raise_for_status()
+        with open(local_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                f.write(chunk)
+        content_range = response.headers.get("Content-Range")
+        etag = response.headers.get("ETag")
+        expected_md5 = _get_expected_md5(response)
+        if response.status_code != 206 or content_range is None:
+            # The server ignored the Range header and sent the whole file
+            if expected_md5 is not None:
+                _verify_md5(local_path, expected_md5)
+            return
+
+    match = _CONTENT_RANGE_REGEX.match(content_range)
+    if match is None:
+        raise MlflowException(
+            "Unexpected Content-Range header '{}' while downloading '{}'".format(
+                content_range, local_path
+            )
+        )
+    first_chunk_length = int(match.group(2)) + 1
+    file_size = int(match.group(3))
+    if os.path.getsize(local_path) != first_chunk_length:
+        raise MlflowException(
+            "Failed to download bytes 0-{last} of '{path}'".format(
+                last=first_chunk_length - 1, path=local_path
+            )
+        )
+
+    def fetch_range(first_byte, last_byte):
+        headers = {"Range": "bytes={}-{}".format(first_byte, last_byte)}
+        if etag is not None:
+            headers["If-Match"] = etag
+        range_response = session.get(url, headers=headers)
+        range_response.raise_for_status()
+        if range_response.status_code != 206:
+            raise MlflowException(
+                "Expected a partial response while downloading bytes {}-{} of '{}', got status"
+                " code {}".format(first_byte, last_byte, local_path, range_response.status_code)
+            )
+        return range_response.content
+
+    if first_chunk_length < file_size:
+        download_ranges_in_parallel(
+            fetch_range=fetch_range,
+            local_path=local_path,
+            file_size=file_size,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            start=first_chunk_length,
+        )
+    if expected_md5 is not None:
+        _verify_md5(local_path, expected_md5)
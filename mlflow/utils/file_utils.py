@@ -1,6 +1,7 @@
 import codecs
 import errno
 import gzip
+import hashlib
 import os
 import posixpath
 import shutil
@@ -91,8 +92,16 @@ def find(root, name, full_path=False):
 
     :return: list of matching files or directories
     """
+    if not is_directory(root):
+        raise Exception("Invalid parent directory '%s'" % root)
     path_name = os.path.join(root, name)
-    return list_all(root, lambda x: x == path_name, full_path)
+    # Look the name up instead of listing the root directory, which is slow for directories with
+    # many entries, such as experiments with many runs
+    if name in ("", os.curdir, os.pardir) or os.path.basename(path_name) != name:
+        return []
+    if not os.path.lexists(path_name):
+        return []
+    return [path_name] if full_path else [name]
 
 
 def mkdir(root, name=None):  # noqa
@@ -350,6 +359,21 @@ def _copy_file_or_tree(src, dst, dst_dir=None):
     return dst_subpath
 
 
+def _copy_tree(src, dst):
+    """
+    Copy the contents of the directory ``src`` into the directory ``dst``, which is created if it
+    does not exist, replacing existing files. Files are copied without their permission bits, so
+    that copies of read-only files are writable.
+    """
+    for root, dir_names, file_names in os.walk(src):
+        dst_root = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(dst_root, exist_ok=True)
+        for dir_name in dir_names:
+            os.makedirs(os.path.join(dst_root, dir_name), exist_ok=True)
+        for file_name in file_names:
+            shutil.copyfile(os.path.join(root, file_name), os.path.join(dst_root, file_name))
+
+
 def get_parent_dir(path):
     return os.path.abspath(os.path.join(path, os.pardir))
 
@@ -413,3 +437,15 @@ def yield_file_in_chunks(file, chunk_size=100000000):
                 yield chunk
             else:
                 break
+
+
+def compute_file_md5(path, chunk_size=1024 * 1024):
+    """
+    Compute the hex-encoded MD5 digest of a local file, reading it in chunks of ``chunk_size``
+    bytes so that large files are never held in memory.
+    """
+    md5 = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
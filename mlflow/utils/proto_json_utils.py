@@ -1,8 +1,9 @@
 import base64
+import json
 
 from json import JSONEncoder
 
-from google.protobuf.json_format import MessageToJson, ParseDict
+from google.protobuf.json_format import MessageToDict, MessageToJson, ParseDict
 import numpy as np
 import pandas as pd
 
@@ -15,6 +16,17 @@ def message_to_json(message):
     return MessageToJson(message, preserving_proto_field_name=True)
 
 
+def message_to_compact_json(message):
+    """
+    Converts a message to JSON without whitespace, using snake_case for field names. Unlike the
+    indented output of :py:func:`message_to_json`, this is serialized by the C JSON encoder, and
+    is used for the messages sent over the wire.
+    """
+    return json.dumps(
+        MessageToDict(message, preserving_proto_field_name=True), separators=(",", ":")
+    )
+
+
 def _stringify_all_experiment_ids(x):
     """Converts experiment_id fields which are defined as ints into strings in the given json.
     This is necessary for backwards- and forwards-compatibility with MLflow clients/servers
@@ -1,14 +1,21 @@
 import base64
+import gzip
+import os
+import random
+import threading
 import time
 import logging
 import json
+from urllib.parse import urlparse
 
 import requests
+from google.protobuf.message import DecodeError, Message
+from requests.adapters import HTTPAdapter
 
 from mlflow import __version__
 from mlflow.protos import databricks_pb2
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
-from mlflow.utils.proto_json_utils import parse_dict
+from mlflow.utils.proto_json_utils import message_to_compact_json, parse_dict
 from mlflow.utils.string_utils import strip_suffix
 from mlflow.exceptions import MlflowException, RestException
 
@@ -19,19 +26,106 @@ _logger = logging.getLogger(__name__)
 
 _DEFAULT_HEADERS = {"User-Agent": "mlflow-python-client/%s" % __version__}
 
+# Maximum number of connections kept alive per host, e.g. by concurrent artifact downloads
+HTTP_POOL_MAXSIZE_ENV_VAR = "MLFLOW_HTTP_POOL_MAXSIZE"
+_DEFAULT_HTTP_POOL_MAXSIZE = 10
+
+_request_sessions = {}
+_request_sessions_lock = threading.Lock()
+
+
+def _get_http_pool_maxsize():
+    return int(os.environ.get(HTTP_POOL_MAXSIZE_ENV_VAR, _DEFAULT_HTTP_POOL_MAXSIZE))
+
+
+def get_request_session(url):
+    """
+    Return the ``requests.Session`` shared by all requests of this process to the host of
+    ``url``. The session keeps up to ``MLFLOW_HTTP_POOL_MAXSIZE`` connections to the host alive
+    (10 by default), so that successive requests reuse a connection instead of paying for a new
+    TCP and TLS handshake each. The connection pool of a session is thread-safe. Sessions are
+    never shared with forked child processes, which create their own.
+
+    :param url: URL of a request, e.g. ``https://my-host/api/2.0/mlflow/runs/get``.
+    """
+    key = (os.getpid(),) + _get_host_key(url)
+    with _request_sessions_lock:
+        session = _request_sessions.get(key)
+        if session is None:
+            pool_maxsize = _get_http_pool_maxsize()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _request_sessions[key] = session
+        return session
+
+
+# Request bodies of at least this many bytes are gzip-compressed for hosts that accept it
+_GZIP_REQUEST_MIN_SIZE = 16 * 1024
+
+# (scheme, netloc) of the hosts that accept gzip-compressed request bodies, as advertised with an
+# ``Accept-Encoding`` response header (RFC 7694)
+_gzip_request_hosts = set()
+
+
+def _get_host_key(url):
+    parsed_url = urlparse(url)
+    return parsed_url.scheme, parsed_url.netloc
+
+
+def _record_accepted_encodings(url, response):
+    headers = getattr(response, "headers", None)
+    accept_encoding = headers.get("Accept-Encoding") if headers is not None else None
+    if isinstance(accept_encoding, str) and "gzip" in accept_encoding.lower():
+        _gzip_request_hosts.add(_get_host_key(url))
+
+
+JSON_CONTENT_TYPE = "application/json"
+PROTOBUF_CONTENT_TYPE = "application/x-protobuf"
+_ACCEPT_PROTOBUF = "%s, %s;q=0.9" % (PROTOBUF_CONTENT_TYPE, JSON_CONTENT_TYPE)
+
+# Set to ``false`` to send and request only JSON in REST API calls
+PROTOBUF_ENABLED_ENV_VAR = "MLFLOW_ENABLE_PROTOBUF_WIRE_FORMAT"
+
+# (scheme, netloc) of the hosts that have returned a binary protobuf response, and so accept
+# binary protobuf requests
+_protobuf_hosts = set()
+
+
+def _jitter(seconds):
+    """
+    :return: ``seconds`` scaled by a random factor between 0.5 and 1, so that clients whose
+             requests failed at the same time do not all retry at the same time.
+    """
+    return seconds * random.uniform(0.5, 1)
+
 
 def http_request(
-    host_creds, endpoint, retries=3, retry_interval=3, max_rate_limit_interval=60, **kwargs
+    host_creds,
+    endpoint,
+    retries=3,
+    retry_interval=3,
+    max_rate_limit_interval=60,
+    extra_headers=None,
+    return_error_codes=None,
+    **kwargs
 ):
     """
-    Makes an HTTP request with the specified method to the specified hostname/endpoint. Ratelimit
-    error code (429) will be retried with an exponential back off (1, 2, 4, ... seconds) for at most
+    Makes an HTTP request with the specified method to the specified hostname/endpoint, over the
+    pooled connections of :py:func:`get_request_session`. Ratelimit error code (429) will be
+    retried with a jittered exponential back off (up to 1, 2, 4, ... seconds) for at most
     `max_rate_limit_interval` seconds.  Internal errors (500s) will be retried up to `retries` times
-    , waiting `retry_interval` seconds between successive retries. Parses the API response
-    (assumed to be JSON) into a Python object and returns it.
+    , waiting up to `retry_interval`, 2 * `retry_interval`, 4 * `retry_interval`, ... seconds
+    between successive retries. Parses the API response (assumed to be JSON) into a Python object
+    and returns it. Request bodies given as ``data`` bytes are gzip-compressed if they are large
+    and the host has advertised that it accepts gzip-compressed requests.
 
     :param host_creds: A :py:class:`mlflow.rest_utils.MlflowHostCreds` object containing
         hostname and optional authentication.
+    :param extra_headers: Optional dictionary of headers to send in addition to the default ones.
+    :param return_error_codes: Optional collection of the error codes (e.g. ``PARTIAL_DELETE``)
+                               of 5xx responses that are returned instead of being retried.
     :return: Parsed API response
     """
     hostname = host_creds.host
@@ -43,6 +137,8 @@ def http_request(
         auth_str = "Bearer %s" % host_creds.token
 
     headers = dict(_DEFAULT_HEADERS)
+    if extra_headers:
+        headers.update(extra_headers)
     if auth_str:
         headers["Authorization"] = auth_str
 
@@ -54,32 +150,47 @@ def http_request(
     if host_creds.client_cert_path is not None:
         kwargs["cert"] = host_creds.client_cert_path
 
+    cleaned_hostname = strip_suffix(hostname, "/")
+    url = "%s%s" % (cleaned_hostname, endpoint)
+    session = get_request_session(url)
+
+    data = kwargs.get("data")
+    if (
+        isinstance(data, bytes)
+        and len(data) >= _GZIP_REQUEST_MIN_SIZE
+        and _get_host_key(url) in _gzip_request_hosts
+    ):
+        kwargs["data"] = gzip.compress(data, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+
     def request_with_ratelimit_retries(max_rate_limit_interval, **kwargs):
-        response = requests.request(**kwargs)
+        response = session.request(**kwargs)
         time_left = max_rate_limit_interval
         sleep = 1
         while response.status_code == 429 and time_left > 0:
             _logger.warning(
-                "API request to {path} returned status code 429 (Rate limit exceeded). "
-                "Retrying in %d seconds. "
+                "API request to %s returned status code 429 (Rate limit exceeded). "
+                "Retrying in up to %d seconds. "
                 "Will continue to retry 429s for up to %d seconds.",
+                url,
                 sleep,
                 time_left,
             )
-            time.sleep(sleep)
+            time.sleep(_jitter(sleep))
             time_left -= sleep
-            response = requests.request(**kwargs)
-            sleep = min(time_left, sleep * 2)  # sleep for 1, 2, 4, ... seconds;
+            response = session.request(**kwargs)
+            sleep = min(time_left, sleep * 2)  # sleep for up to 1, 2, 4, ... seconds;
+        _record_accepted_encodings(url, response)
         return response
 
-    cleaned_hostname = strip_suffix(hostname, "/")
-    url = "%s%s" % (cleaned_hostname, endpoint)
     for i in range(retries):
         response = request_with_ratelimit_retries(
             max_rate_limit_interval, url=url, headers=headers, verify=verify, **kwargs
         )
         if response.status_code >= 200 and response.status_code < 500:
             return response
+        elif return_error_codes and get_error_code(response) in return_error_codes:
+            return response
         else:
             _logger.error(
                 "API request to %s failed with code %s != 200, retrying up to %s more times. "
@@ -89,12 +200,24 @@ def http_request(
                 retries - i - 1,
                 response.text,
             )
-            time.sleep(retry_interval)
+            if i < retries - 1:
+                time.sleep(_jitter(retry_interval * 2 ** i))
     raise MlflowException(
         "API request to %s failed to return code 200 after %s tries" % (url, retries)
     )
 
 
+def get_error_code(response):
+    """
+    :return: The ``error_code`` field of the JSON body of an error response, or None.
+    """
+    try:
+        body = json.loads(response.text)
+    except ValueError:
+        return None
+    return body.get("error_code") if isinstance(body, dict) else None
+
+
 def _can_parse_as_json(string):
     try:
         json.loads(string)
@@ -151,20 +274,85 @@ def extract_api_info_for_service(service, path_prefix):
     return res
 
 
+def _is_protobuf_enabled():
+    return os.environ.get(PROTOBUF_ENABLED_ENV_VAR, "true").lower() != "false"
+
+
+def _record_response_content_type(url, response):
+    headers = getattr(response, "headers", None)
+    content_type = headers.get("Content-Type") if headers is not None else None
+    if isinstance(content_type, str) and content_type.startswith(PROTOBUF_CONTENT_TYPE):
+        _protobuf_hosts.add(_get_host_key(url))
+        return PROTOBUF_CONTENT_TYPE
+    return JSON_CONTENT_TYPE
+
+
 def call_endpoint(host_creds, endpoint, method, json_body, response_proto):
-    # Convert json string to json dictionary, to pass to requests
-    if json_body:
-        json_body = json.loads(json_body)
+    """
+    Call a REST API endpoint and parse its response into ``response_proto``.
+
+    Responses are requested in the binary protobuf format with an ``Accept`` header, and parsed
+    according to their ``Content-Type``, so that servers which only support JSON keep working.
+    Request messages are sent in the binary protobuf format to hosts that have returned a
+    protobuf response before, and as compact JSON otherwise. Set the
+    ``MLFLOW_ENABLE_PROTOBUF_WIRE_FORMAT`` environment variable to ``false`` to only use JSON.
+
+    :param json_body: Request protobuf message, or request serialized as a JSON string, which is
+                      sent as is, without being parsed and serialized again.
+    """
+    protobuf_enabled = _is_protobuf_enabled()
+    extra_headers = {"Accept": _ACCEPT_PROTOBUF} if protobuf_enabled else {}
+    url = "%s%s" % (strip_suffix(host_creds.host, "/"), endpoint)
+    send_protobuf = (
+        isinstance(json_body, Message)
+        and protobuf_enabled
+        and method != "GET"
+        and _get_host_key(url) in _protobuf_hosts
+    )
+    if isinstance(json_body, Message) and not send_protobuf:
+        json_body = message_to_compact_json(json_body)
     if method == "GET":
+        # Convert json string to json dictionary, to pass to requests as query parameters
+        params = json.loads(json_body) if json_body else None
         response = http_request(
-            host_creds=host_creds, endpoint=endpoint, method=method, params=json_body
+            host_creds=host_creds,
+            endpoint=endpoint,
+            method=method,
+            params=params,
+            extra_headers=extra_headers,
         )
     else:
+        if send_protobuf:
+            data = json_body.SerializeToString()
+            extra_headers["Content-Type"] = PROTOBUF_CONTENT_TYPE
+        else:
+            data = json_body.encode("utf-8") if json_body else None
+            extra_headers["Content-Type"] = JSON_CONTENT_TYPE
         response = http_request(
-            host_creds=host_creds, endpoint=endpoint, method=method, json=json_body
+            host_creds=host_creds,
+            endpoint=endpoint,
+            method=method,
+            data=data,
+            extra_headers=extra_headers,
+        )
+    if response.status_code != 200:
+        verify_rest_response(response, endpoint)
+    if _record_response_content_type(url, response) == PROTOBUF_CONTENT_TYPE:
+        try:
+            response_proto.ParseFromString(response.content)
+        except DecodeError:
+            raise MlflowException(
+                "API request to endpoint was successful but the response body was not "
+                "a valid %s message" % response_proto.DESCRIPTOR.full_name
+            )
+        return response_proto
+    try:
+        js_dict = json.loads(response.text)
+    except ValueError:
+        raise MlflowException(
+            "API request to endpoint was successful but the response body was not "
+            "in a valid JSON format. Response body: '%s'" % response.text
         )
-    response = verify_rest_response(response, endpoint)
-    js_dict = json.loads(response.text)
     parse_dict(js_dict=js_dict, message=response_proto)
     return response_proto
 
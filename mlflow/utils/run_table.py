@@ -0,0 +1,189 @@
+"""
+Columnar representation of a collection of runs, used to filter and sort large numbers of runs
+in memory (e.g. by the FileStore) with vectorized NumPy operations instead of per-run Python
+code.
+"""
+import operator
+
+import numpy as np
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.utils.search_utils import SearchUtils
+
+_COMPARISON_OPS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<=": operator.le,
+    "<": operator.lt,
+}
+
+
+class _Column(object):
+    """
+    Values of a single run attribute, metric, param or tag for every run of a :py:class:`RunTable`.
+
+    :param values: NumPy array of values: ``float64`` for metrics, ``object`` otherwise. Missing
+                   values are ``NaN`` or ``None`` respectively.
+    :param present: Boolean NumPy array, ``True`` for the runs that have a value.
+    """
+
+    def __init__(self, values, present):
+        self.values = values
+        self.present = present
+
+    def sort_keys(self, ascending):
+        """
+        :return: Pair of integer arrays ``(is_null, rank)`` that order the column values as
+                 :py:meth:`mlflow.utils.search_utils.SearchUtils.sort` does: by value in the
+                 requested direction, with missing and ``NaN`` values last.
+        """
+        if self.values.dtype == np.float64:
+            is_null = ~self.present | np.isnan(self.values)
+        else:
+            is_null = ~self.present
+        rank = np.zeros(len(self.values), dtype=np.int64)
+        if not is_null.all():
+            _, rank[~is_null] = np.unique(self.values[~is_null], return_inverse=True)
+        return is_null.astype(np.int64), rank if ascending else -rank
+
+
+class RunTable(object):
+    """
+    Columnar view over a list of :py:class:`mlflow.entities.Run` objects. Columns are extracted
+    lazily, once per referenced attribute, metric, param or tag, and filters and sorts are
+    evaluated on whole columns at once.
+    """
+
+    def __init__(self, runs):
+        self.runs = list(runs)
+        self._columns = {}
+
+    def __len__(self):
+        return len(self.runs)
+
+    def _get_column(self, key_type, key):
+        column = self._columns.get((key_type, key))
+        if column is not None:
+            return column
+        if key_type == SearchUtils._METRIC_IDENTIFIER:
+            raw = [run.data.metrics.get(key) for run in self.runs]
+            present = np.array([value is not None for value in raw], dtype=bool)
+            values = np.array(
+                [np.nan if value is None else value for value in raw], dtype=np.float64
+            )
+        else:
+            if key_type == SearchUtils._PARAM_IDENTIFIER:
+                raw = [run.data.params.get(key) for run in self.runs]
+            elif key_type == SearchUtils._TAG_IDENTIFIER:
+                raw = [run.data.tags.get(key) for run in self.runs]
+            elif key_type == SearchUtils._ATTRIBUTE_IDENTIFIER:
+                raw = [getattr(run.info, key) for run in self.runs]
+            else:
+                raise MlflowException(
+                    "Invalid search expression type '%s'" % key_type,
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            present = np.array([value is not None for value in raw], dtype=bool)
+            values = np.empty(len(raw), dtype=object)
+            values[:] = raw
+        column = _Column(values, present)
+        self._columns[(key_type, key)] = column
+        return column
+
+    def _match_distinct_values(self, column, match):
+        # Evaluate ``match`` only once per distinct value of the column
+        mask = np.zeros(len(self.runs), dtype=bool)
+        distinct, inverse = np.unique(column.values[column.present], return_inverse=True)
+        mask[column.present] = np.array([match(v) for v in distinct], dtype=bool)[inverse]
+        return mask
+
+    def _evaluate_clause(self, sed):
+        if "operator" in sed:
+            masks = [self._evaluate_clause(clause) for clause in sed["clauses"]]
+            if sed["operator"] == SearchUtils.OR_OPERATOR:
+                return np.logical_or.reduce(masks)
+            return np.logical_and.reduce(masks)
+
+        key_type = sed.get("type")
+        value = sed.get("value")
+        comparator = sed.get("comparator").upper()
+        if SearchUtils.is_metric(key_type, comparator):
+            if comparator in SearchUtils.LIST_COMPARISON_OPERATORS:
+                value = [float(v) for v in value]
+            elif comparator not in SearchUtils.NULL_COMPARISON_OPERATORS:
+                value = float(value)
+        elif not (
+            SearchUtils.is_param(key_type, comparator)
+            or SearchUtils.is_tag(key_type, comparator)
+            or SearchUtils.is_attribute(key_type, comparator)
+        ):
+            raise MlflowException(
+                "Invalid search expression type '%s'" % key_type, error_code=INVALID_PARAMETER_VALUE
+            )
+        column = self._get_column(key_type, sed.get("key"))
+        if comparator == SearchUtils.IS_NULL_OPERATOR:
+            return ~column.present
+        elif comparator == SearchUtils.IS_NOT_NULL_OPERATOR or not column.present.any():
+            return column.present.copy()
+
+        if comparator in SearchUtils.LIST_COMPARISON_OPERATORS:
+            values = frozenset(value)
+            expected = comparator == SearchUtils.IN_OPERATOR
+            return self._match_distinct_values(column, lambda v: (v in values) == expected)
+        elif comparator in SearchUtils.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
+            match = SearchUtils._like_to_regex(value, comparator).match
+            return self._match_distinct_values(column, lambda v: match(v) is not None)
+        elif comparator in _COMPARISON_OPS:
+            with np.errstate(invalid="ignore"):
+                result = _COMPARISON_OPS[comparator](column.values, value)
+            return column.present & np.asarray(result, dtype=bool)
+        return np.zeros(len(self.runs), dtype=bool)
+
+    def filter_mask(self, filter_string):
+        """
+        :return: Boolean NumPy array, ``True`` for the runs that match ``filter_string``.
+        """
+        mask = np.ones(len(self.runs), dtype=bool)
+        for sed in SearchUtils.parse_search_filter(filter_string):
+            if not mask.any():
+                break
+            mask &= self._evaluate_clause(sed)
+        return mask
+
+    def sort_indices(self, order_by_list, mask=None):
+        """
+        :return: Integer NumPy array of the indices of the runs selected by ``mask`` (all runs
+                 by default), in the order defined by ``order_by_list``. Runs are naturally
+                 ordered by start time descending, then by run ID, as in
+                 :py:meth:`mlflow.utils.search_utils.SearchUtils.sort`.
+        """
+        indices = np.arange(len(self.runs)) if mask is None else np.flatnonzero(mask)
+        if len(indices) == 0:
+            return indices
+        run_ids = np.array([self.runs[i].info.run_uuid for i in indices], dtype=object)
+        start_times = np.array([self.runs[i].info.start_time for i in indices], dtype=np.int64)
+        # np.lexsort sorts by the last key first
+        keys = [np.unique(run_ids, return_inverse=True)[1], -start_times]
+        for order_by_clause in reversed(order_by_list or []):
+            key_type, key, ascending = SearchUtils.parse_order_by_for_search_runs(order_by_clause)
+            if key_type not in SearchUtils._IDENTIFIERS:
+                raise MlflowException(
+                    "Invalid order_by entity type '%s'" % key_type,
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            column = self._get_column(key_type, key)
+            is_null, rank = _Column(column.values[indices], column.present[indices]).sort_keys(
+                ascending
+            )
+            keys.extend([rank, is_null])
+        return indices[np.lexsort(keys)]
+
+    def search(self, filter_string, order_by_list):
+        """
+        :return: List of the runs matching ``filter_string``, sorted by ``order_by_list``.
+        """
+        mask = self.filter_mask(filter_string) if filter_string else None
+        return [self.runs[i] for i in self.sort_indices(order_by_list, mask)]
@@ -1,4 +1,6 @@
 import base64
+import copy
+import functools
 import json
 import operator
 import re
@@ -23,6 +25,8 @@ from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 
 import math
 
+_SEARCH_FILTER_CACHE_SIZE = 256
+
 
 class SearchUtils(object):
     LIKE_OPERATOR = "LIKE"
@@ -30,10 +34,26 @@ class SearchUtils(object):
     ASC_OPERATOR = "asc"
     DESC_OPERATOR = "desc"
     VALID_ORDER_BY_TAGS = [ASC_OPERATOR, DESC_OPERATOR]
-    VALID_METRIC_COMPARATORS = set([">", ">=", "!=", "=", "<", "<="])
-    VALID_PARAM_COMPARATORS = set(["!=", "=", LIKE_OPERATOR, ILIKE_OPERATOR])
-    VALID_TAG_COMPARATORS = set(["!=", "=", LIKE_OPERATOR, ILIKE_OPERATOR])
-    VALID_STRING_ATTRIBUTE_COMPARATORS = set(["!=", "=", LIKE_OPERATOR, ILIKE_OPERATOR])
+    AND_OPERATOR = "AND"
+    OR_OPERATOR = "OR"
+    IN_OPERATOR = "IN"
+    NOT_IN_OPERATOR = "NOT IN"
+    IS_NULL_OPERATOR = "IS NULL"
+    IS_NOT_NULL_OPERATOR = "IS NOT NULL"
+    LIST_COMPARISON_OPERATORS = set([IN_OPERATOR, NOT_IN_OPERATOR])
+    NULL_COMPARISON_OPERATORS = set([IS_NULL_OPERATOR, IS_NOT_NULL_OPERATOR])
+    VALID_METRIC_COMPARATORS = set([">", ">=", "!=", "=", "<", "<="]).union(
+        LIST_COMPARISON_OPERATORS, NULL_COMPARISON_OPERATORS
+    )
+    VALID_PARAM_COMPARATORS = set(["!=", "=", LIKE_OPERATOR, ILIKE_OPERATOR]).union(
+        LIST_COMPARISON_OPERATORS, NULL_COMPARISON_OPERATORS
+    )
+    VALID_TAG_COMPARATORS = set(["!=", "=", LIKE_OPERATOR, ILIKE_OPERATOR]).union(
+        LIST_COMPARISON_OPERATORS, NULL_COMPARISON_OPERATORS
+    )
+    VALID_STRING_ATTRIBUTE_COMPARATORS = set(["!=", "=", LIKE_OPERATOR, ILIKE_OPERATOR]).union(
+        LIST_COMPARISON_OPERATORS, NULL_COMPARISON_OPERATORS
+    )
     CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS = set([LIKE_OPERATOR, ILIKE_OPERATOR])
     VALID_REGISTERED_MODEL_SEARCH_COMPARATORS = CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS.union(
         {"="}
@@ -234,19 +254,137 @@ class SearchUtils(object):
         cls._validate_comparison(stripped_comparison)
         comp = cls._get_identifier(stripped_comparison[0].value, cls.VALID_SEARCH_ATTRIBUTE_KEYS)
         comp["comparator"] = stripped_comparison[1].value
-        comp["value"] = cls._get_value(comp.get("type"), stripped_comparison[2])
+        if isinstance(stripped_comparison[2], Parenthesis):
+            # Some versions of sqlparse group "<identifier> IN (<values>)" as a comparison
+            comp["value"] = cls._get_list_value(comp.get("type"), stripped_comparison[2])
+        else:
+            comp["value"] = cls._get_value(comp.get("type"), stripped_comparison[2])
         return comp
 
     @classmethod
-    def _invalid_statement_token_search_runs(cls, token):
-        if isinstance(token, Comparison):
-            return False
-        elif token.is_whitespace:
-            return False
-        elif token.match(ttype=TokenType.Keyword, values=["AND"]):
-            return False
-        else:
-            return True
+    def _get_list_value(cls, identifier_type, parenthesis):
+        value_tokens = []
+        for token in parenthesis.tokens[1:-1]:
+            if isinstance(token, IdentifierList):
+                value_tokens.extend(
+                    t
+                    for t in token.tokens
+                    if not t.is_whitespace and t.ttype not in cls.DELIMITER_VALUE_TYPES
+                )
+            elif not token.is_whitespace:
+                value_tokens.append(token)
+        if len(value_tokens) == 0:
+            raise MlflowException(
+                "While parsing a list in the query,"
+                " expected a non-empty list of values, but got empty list",
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return [cls._get_value(identifier_type, token) for token in value_tokens]
+
+    @classmethod
+    def _invalid_clauses_exception(cls, tokens):
+        invalid_clauses = ", ".join("'%s'" % token for token in tokens)
+        return MlflowException(
+            "Invalid clause(s) in filter string: %s" % invalid_clauses,
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+    @classmethod
+    def _get_list_or_null_comparison(cls, tokens, index):
+        """
+        Parse a ``<identifier> [NOT] IN (<values>)`` or ``<identifier> IS [NOT] NULL`` clause
+        starting with the identifier at ``tokens[index]``.
+
+        :return: Pair of the comparison and the index of the token following the clause.
+        """
+        identifier = tokens[index]
+        keywords = []
+        end = index + 1
+        while (
+            end < len(tokens)
+            and tokens[end].ttype in TokenType.Keyword
+            and not tokens[end].match(
+                ttype=TokenType.Keyword, values=[cls.AND_OPERATOR, cls.OR_OPERATOR]
+            )
+        ):
+            keywords.append(tokens[end].normalized.upper())
+            end += 1
+        keywords = " ".join(keywords)
+        is_list = keywords in cls.LIST_COMPARISON_OPERATORS
+        if is_list and end < len(tokens) and isinstance(tokens[end], Parenthesis):
+            value_token = tokens[end]
+            end += 1
+        elif keywords not in cls.NULL_COMPARISON_OPERATORS or "." not in identifier.value:
+            raise cls._invalid_clauses_exception(tokens[index : max(end, index + 1)])
+        comp = cls._get_identifier(identifier.value, cls.VALID_SEARCH_ATTRIBUTE_KEYS)
+        comp["comparator"] = keywords
+        comp["value"] = cls._get_list_value(comp.get("type"), value_token) if is_list else None
+        return comp, end
+
+    @classmethod
+    def _process_tokens(cls, tokens):
+        """
+        Parse the tokens of a filter expression into a list of AND-ed clauses. AND takes
+        precedence over OR, and parentheses may be used for grouping. Each clause is either a
+        comparison dictionary with ``type``, ``key``, ``comparator`` and ``value`` keys, or a
+        dictionary with an ``operator`` key (``AND`` or ``OR``) and a ``clauses`` key holding the
+        list of combined clauses.
+        """
+        tokens = [token for token in tokens if not token.is_whitespace]
+        invalids = [
+            token
+            for token in tokens
+            if not isinstance(token, (Comparison, Parenthesis, Identifier))
+            and token.ttype not in TokenType.Keyword
+        ]
+        if len(invalids) > 0:
+            raise cls._invalid_clauses_exception(invalids)
+        or_groups = [[]]
+        expect_clause = True
+        index = 0
+        while index < len(tokens):
+            token = tokens[index]
+            if not expect_clause:
+                if token.match(ttype=TokenType.Keyword, values=[cls.AND_OPERATOR]):
+                    pass
+                elif token.match(ttype=TokenType.Keyword, values=[cls.OR_OPERATOR]):
+                    or_groups.append([])
+                else:
+                    raise cls._invalid_clauses_exception(tokens[index:])
+                expect_clause = True
+                index += 1
+                continue
+            if isinstance(token, Comparison):
+                or_groups[-1].append(cls._get_comparison(token))
+                index += 1
+            elif isinstance(token, Parenthesis):
+                inner_tokens = [t for t in token.tokens[1:-1] if not t.is_whitespace]
+                if len(inner_tokens) == 0:
+                    raise cls._invalid_clauses_exception([token])
+                or_groups[-1].extend(cls._process_tokens(inner_tokens))
+                index += 1
+            elif isinstance(token, Identifier):
+                comparison, index = cls._get_list_or_null_comparison(tokens, index)
+                or_groups[-1].append(comparison)
+            else:
+                raise cls._invalid_clauses_exception(tokens[index:])
+            expect_clause = False
+        if expect_clause and len(tokens) > 0:
+            # The expression ends with AND or OR
+            raise cls._invalid_clauses_exception(tokens[-1:])
+        if len(or_groups) == 1:
+            return or_groups[0]
+        return [
+            {
+                "operator": cls.OR_OPERATOR,
+                "clauses": [
+                    group[0]
+                    if len(group) == 1
+                    else {"operator": cls.AND_OPERATOR, "clauses": group}
+                    for group in or_groups
+                ],
+            }
+        ]
 
     @classmethod
     def _invalid_statement_token_search_model_registry(cls, token):
@@ -269,18 +407,10 @@ class SearchUtils(object):
 
     @classmethod
     def _process_statement(cls, statement):
-        # check validity
-        invalids = list(filter(cls._invalid_statement_token_search_runs, statement.tokens))
-        if len(invalids) > 0:
-            invalid_clauses = ", ".join("'%s'" % token for token in invalids)
-            raise MlflowException(
-                "Invalid clause(s) in filter string: %s" % invalid_clauses,
-                error_code=INVALID_PARAMETER_VALUE,
-            )
-        return [cls._get_comparison(si) for si in statement.tokens if isinstance(si, Comparison)]
+        return cls._process_tokens(statement.tokens)
 
     @classmethod
-    def parse_search_filter(cls, filter_string):
+    def _parse_search_filter(cls, filter_string):
         if not filter_string:
             return []
         try:
@@ -302,6 +432,15 @@ class SearchUtils(object):
             )
         return SearchUtils._process_statement(parsed[0])
 
+    @classmethod
+    def parse_search_filter(cls, filter_string):
+        """
+        Parse a search filter string into a list of AND-ed clauses, as described in
+        :py:meth:`_process_tokens`. Parsed filters are cached by filter string.
+        """
+        # Copy the cached clauses so that callers cannot modify them
+        return copy.deepcopy(_compile_search_filter(filter_string).parsed)
+
     @classmethod
     def is_metric(cls, key_type, comparator):
         if key_type == cls._METRIC_IDENTIFIER:
@@ -349,56 +488,100 @@ class SearchUtils(object):
         return False
 
     @classmethod
-    def _does_run_match_clause(cls, run, sed):
+    def _like_to_regex(cls, pattern, comparator):
+        # Change value from sql syntax to regex syntax
+        if not pattern.startswith("%"):
+            pattern = "^" + pattern
+        if not pattern.endswith("%"):
+            pattern = pattern + "$"
+        pattern = pattern.replace("_", ".").replace("%", ".*")
+        return re.compile(pattern, re.IGNORECASE if comparator == cls.ILIKE_OPERATOR else 0)
+
+    @classmethod
+    def _compile_clause(cls, sed):
+        """
+        Compile a parsed clause into a predicate accepting a :py:class:`mlflow.entities.Run`.
+        Comparators are validated and values converted once, so that the predicate can be applied
+        to many runs cheaply.
+        """
+        if "operator" in sed:
+            predicates = [cls._compile_clause(clause) for clause in sed["clauses"]]
+            combine = any if sed["operator"] == cls.OR_OPERATOR else all
+            return lambda run: combine(predicate(run) for predicate in predicates)
+
         key_type = sed.get("type")
         key = sed.get("key")
         value = sed.get("value")
         comparator = sed.get("comparator").upper()
 
         if cls.is_metric(key_type, comparator):
-            lhs = run.data.metrics.get(key, None)
-            value = float(value)
+            if comparator in cls.LIST_COMPARISON_OPERATORS:
+                value = [float(v) for v in value]
+            elif comparator not in cls.NULL_COMPARISON_OPERATORS:
+                value = float(value)
+
+            def get_lhs(run):
+                return run.data.metrics.get(key)
+
         elif cls.is_param(key_type, comparator):
-            lhs = run.data.params.get(key, None)
+
+            def get_lhs(run):
+                return run.data.params.get(key)
+
         elif cls.is_tag(key_type, comparator):
-            lhs = run.data.tags.get(key, None)
+
+            def get_lhs(run):
+                return run.data.tags.get(key)
+
         elif cls.is_attribute(key_type, comparator):
-            lhs = getattr(run.info, key)
+
+            def get_lhs(run):
+                return getattr(run.info, key)
+
         else:
             raise MlflowException(
                 "Invalid search expression type '%s'" % key_type, error_code=INVALID_PARAMETER_VALUE
             )
-        if lhs is None:
-            return False
 
-        if comparator in cls.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
-            # Change value from sql syntax to regex syntax
-            if comparator == "ILIKE":
-                value = value.lower()
-                lhs = lhs.lower()
-            if not value.startswith("%"):
-                value = "^" + value
-            if not value.endswith("%"):
-                value = value + "$"
-            value = value.replace("_", ".").replace("%", ".*")
-            return cls.filter_ops.get(comparator)(value, lhs)
-
-        elif comparator in cls.filter_ops.keys():
-            return cls.filter_ops.get(comparator)(lhs, value)
+        if comparator == cls.IS_NULL_OPERATOR:
+            return lambda run: get_lhs(run) is None
+        elif comparator == cls.IS_NOT_NULL_OPERATOR:
+            return lambda run: get_lhs(run) is not None
+        elif comparator in cls.LIST_COMPARISON_OPERATORS:
+            values = frozenset(value)
+            expected = comparator == cls.IN_OPERATOR
+
+            def compare(lhs):
+                return (lhs in values) == expected
+
+        elif comparator in cls.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
+            match = cls._like_to_regex(value, comparator).match
+
+            def compare(lhs):
+                return match(lhs) is not None
+
+        elif comparator in cls.filter_ops:
+            op = cls.filter_ops[comparator]
+
+            def compare(lhs):
+                return op(lhs, value)
+
         else:
-            return False
+            return lambda run: False
+
+        def predicate(run):
+            lhs = get_lhs(run)
+            return lhs is not None and compare(lhs)
+
+        return predicate
 
     @classmethod
     def filter(cls, runs, filter_string):
         """Filters a set of runs based on a search filter string."""
         if not filter_string:
             return runs
-        parsed = cls.parse_search_filter(filter_string)
-
-        def run_matches(run):
-            return all([cls._does_run_match_clause(run, s) for s in parsed])
-
-        return [run for run in runs if run_matches(run)]
+        compiled_filter = _compile_search_filter(filter_string)
+        return [run for run in runs if compiled_filter.matches(run)]
 
     @classmethod
     def _validate_order_by_and_generate_token(cls, order_by):
@@ -473,6 +656,18 @@ class SearchUtils(object):
             )
         return token_value, is_ascending
 
+    @classmethod
+    def parse_order_by_for_search_model_versions(cls, order_by):
+        token_value, is_ascending = cls._parse_order_by_string(order_by)
+        token_value = token_value.strip()
+        if token_value not in cls.VALID_ORDER_BY_KEYS_MODEL_VERSIONS:
+            raise MlflowException(
+                "Invalid order by key '{}' specified. Valid keys ".format(token_value)
+                + "are '{}'".format(sorted(cls.VALID_ORDER_BY_KEYS_MODEL_VERSIONS)),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return token_value, is_ascending
+
     @classmethod
     def _get_value_for_sort(cls, run, key_type, key, ascending):
         """Returns a tuple suitable to be used as a sort key for runs."""
@@ -519,13 +714,7 @@ class SearchUtils(object):
         return runs
 
     @classmethod
-    def parse_start_offset_from_page_token(cls, page_token):
-        # Note: the page_token is expected to be a base64-encoded JSON that looks like
-        # { "offset": xxx }. However, this format is not stable, so it should not be
-        # relied upon outside of this method.
-        if not page_token:
-            return 0
-
+    def _decode_page_token(cls, page_token):
         try:
             decoded_token = base64.b64decode(page_token)
         except TypeError:
@@ -544,7 +733,22 @@ class SearchUtils(object):
                 "Invalid page token, decoded value=%s" % decoded_token,
                 error_code=INVALID_PARAMETER_VALUE,
             )
+        if not isinstance(parsed_token, dict):
+            raise MlflowException(
+                "Invalid page token, parsed value=%s" % parsed_token,
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return parsed_token
+
+    @classmethod
+    def parse_start_offset_from_page_token(cls, page_token):
+        # Note: the page_token is expected to be a base64-encoded JSON that looks like
+        # { "offset": xxx }. However, this format is not stable, so it should not be
+        # relied upon outside of this method.
+        if not page_token:
+            return 0
 
+        parsed_token = cls._decode_page_token(page_token)
         offset_str = parsed_token.get("offset")
         if not offset_str:
             raise MlflowException(
@@ -562,6 +766,51 @@ class SearchUtils(object):
 
         return offset
 
+    @classmethod
+    def parse_keyset_from_page_token(cls, page_token, order_by):
+        """
+        :param page_token: Token created by :py:meth:`create_keyset_page_token`.
+        :param order_by: Ordering of the search the token is used for, which must be the ordering
+                         of the search that created the token.
+        :return: The sort key values of the last result of the previous page, or ``None`` if
+                 ``page_token`` is empty.
+        """
+        # Note: the page_token is expected to be a base64-encoded JSON that looks like
+        # { "order_by": [...], "keyset": [...] }. However, this format is not stable, so it should
+        # not be relied upon outside of this method.
+        if not page_token:
+            return None
+
+        parsed_token = cls._decode_page_token(page_token)
+        keyset = parsed_token.get("keyset")
+        if not isinstance(keyset, list) or len(keyset) != len(order_by):
+            raise MlflowException(
+                "Invalid page token, parsed value=%s" % parsed_token,
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        if parsed_token.get("order_by") != list(order_by):
+            raise MlflowException(
+                "Invalid page token, it was created by a search with a different ordering: "
+                "{}".format(parsed_token.get("order_by")),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return keyset
+
+    @classmethod
+    def create_keyset_page_token(cls, order_by, keyset):
+        """
+        Create a page token that resumes a search after the result whose sort key values are
+        ``keyset``, rather than after a number of results. Unlike offset tokens, such tokens
+        do not require the skipped results to be read again, and stay valid if results of
+        previous pages are removed.
+
+        :param order_by: Ordering of the search, as a list of strings.
+        :param keyset: Sort key values of the last result of the page, in ``order_by`` order.
+        """
+        return base64.b64encode(
+            json.dumps({"order_by": list(order_by), "keyset": list(keyset)}).encode("utf-8")
+        )
+
     @classmethod
     def create_page_token(cls, offset):
         return base64.b64encode(json.dumps({"offset": offset}).encode("utf-8"))
@@ -585,8 +834,37 @@ class SearchUtils(object):
     # TODO: Tech debt. Refactor search code into common utils, tracking server, and model
     #       registry specific code.
 
-    VALID_SEARCH_KEYS_FOR_MODEL_VERSIONS = set(["name", "run_id", "source_path"])
+    VALID_SEARCH_KEYS_FOR_MODEL_VERSIONS = set(
+        [
+            "name",
+            "run_id",
+            "source_path",
+            "current_stage",
+            "version_number",
+            "creation_timestamp",
+            "last_updated_timestamp",
+        ]
+    )
+    NUMERIC_SEARCH_KEYS_FOR_MODEL_VERSIONS = set(
+        ["version_number", "creation_timestamp", "last_updated_timestamp"]
+    )
     VALID_SEARCH_KEYS_FOR_REGISTERED_MODELS = set(["name"])
+    _NUMERIC_COMPARATORS = set([">", ">=", "!=", "=", "<", "<="])
+    # Comparators supported by model version filters, by attribute key. Tags support the
+    # comparators of the "tag" key.
+    VALID_MODEL_VERSION_SEARCH_COMPARATORS_BY_KEY = {
+        "name": set(["=", "!=", LIKE_OPERATOR, ILIKE_OPERATOR, IN_OPERATOR]),
+        "run_id": set(["=", "!=", IN_OPERATOR]),
+        "source_path": set(["=", "!=", LIKE_OPERATOR, ILIKE_OPERATOR]),
+        "current_stage": set(["=", "!=", IN_OPERATOR]),
+        "version_number": _NUMERIC_COMPARATORS,
+        "creation_timestamp": _NUMERIC_COMPARATORS,
+        "last_updated_timestamp": _NUMERIC_COMPARATORS,
+        _TAG_IDENTIFIER: set(["=", "!=", LIKE_OPERATOR, ILIKE_OPERATOR]),
+    }
+    VALID_ORDER_BY_KEYS_MODEL_VERSIONS = set(
+        ["name", "version_number", "current_stage", "creation_timestamp", "last_updated_timestamp"]
+    )
 
     @classmethod
     def _check_valid_identifier_list(cls, value_token):
@@ -604,8 +882,8 @@ class SearchUtils(object):
             )
         elif not all(
             map(
-                lambda token: token.ttype
-                in cls.STRING_VALUE_TYPES.union(cls.DELIMITER_VALUE_TYPES),
+                lambda token: token.is_whitespace
+                or token.ttype in cls.STRING_VALUE_TYPES.union(cls.DELIMITER_VALUE_TYPES),
                 value_token._groupable_tokens[0].tokens,
             )
         ):
@@ -629,18 +907,45 @@ class SearchUtils(object):
             )
 
     @classmethod
-    def _get_comparison_for_model_registry(cls, comparison, valid_search_keys):
+    def _get_comparison_for_model_registry(
+        cls, comparison, valid_search_keys, allow_tags=False, numeric_keys=()
+    ):
         stripped_comparison = [token for token in comparison.tokens if not token.is_whitespace]
         cls._validate_comparison(stripped_comparison)
         key = stripped_comparison[0].value
-        if key not in valid_search_keys:
+        key_type = cls._ATTRIBUTE_IDENTIFIER
+        if allow_tags and "." in key:
+            identifier = cls._get_identifier(key, valid_search_keys)
+            key_type, key = identifier["type"], identifier["key"]
+            if key_type not in [cls._TAG_IDENTIFIER, cls._ATTRIBUTE_IDENTIFIER]:
+                raise MlflowException(
+                    "Invalid entity type '{}'. Filters support attributes and tags, e.g. "
+                    "\"tags.<key> = '<value>'\"".format(key_type),
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+        if key_type == cls._ATTRIBUTE_IDENTIFIER and key not in valid_search_keys:
             raise MlflowException(
                 "Invalid attribute key '{}' specified. Valid keys "
                 " are '{}'".format(key, valid_search_keys),
                 error_code=INVALID_PARAMETER_VALUE,
             )
         value_token = stripped_comparison[2]
-        if (
+        if key_type == cls._ATTRIBUTE_IDENTIFIER and key in numeric_keys:
+            if value_token.ttype not in cls.NUMERIC_VALUE_TYPES:
+                raise MlflowException(
+                    "Expected an integer value for attribute '{key}'. "
+                    "Got value {value}".format(key=key, value=value_token.value),
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            try:
+                value = int(value_token.value)
+            except ValueError:
+                raise MlflowException(
+                    "Expected an integer value for attribute '{key}'. "
+                    "Got value {value}".format(key=key, value=value_token.value),
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+        elif (
             not isinstance(value_token, Parenthesis)
             and value_token.ttype not in cls.STRING_VALUE_TYPES
         ):
@@ -658,8 +963,9 @@ class SearchUtils(object):
             value = cls._strip_quotes(value_token.value, expect_quoted_value=True)
 
         comp = {
+            "type": key_type,
             "key": key,
-            "comparator": stripped_comparison[1].value,
+            "comparator": stripped_comparison[1].value.upper(),
             "value": value,
         }
         return comp
@@ -724,7 +1030,9 @@ class SearchUtils(object):
         return token_list
 
     @classmethod
-    def _parse_filter_for_model_registry(cls, filter_string, valid_search_keys):
+    def _parse_filter_for_model_registry(
+        cls, filter_string, valid_search_keys, allow_conjunctions=False, **comparison_kwargs
+    ):
         if not filter_string or filter_string == "":
             return []
         expected = "Expected search filter with single comparison operator. e.g. name='myModelName'"
@@ -756,21 +1064,89 @@ class SearchUtils(object):
                 "Invalid clause(s) in filter string: %s. " "%s" % (invalid_clauses, expected),
                 error_code=INVALID_PARAMETER_VALUE,
             )
-        token_list = cls._process_statement_tokens(statement.tokens, filter_string)
+        if allow_conjunctions:
+            # Each AND-ed expression must be a single comparison
+            expressions = [[]]
+            for token in statement.tokens:
+                if token.match(ttype=TokenType.Keyword, values=[cls.AND_OPERATOR]):
+                    expressions.append([])
+                elif not token.is_whitespace:
+                    expressions[-1].append(token)
+        else:
+            expressions = [statement.tokens]
+        token_list = []
+        for expression_tokens in expressions:
+            token_list.extend(cls._process_statement_tokens(expression_tokens, filter_string))
         return [
-            cls._get_comparison_for_model_registry(si, valid_search_keys)
+            cls._get_comparison_for_model_registry(si, valid_search_keys, **comparison_kwargs)
             for si in token_list
             if isinstance(si, Comparison)
         ]
 
     @classmethod
     def parse_filter_for_model_versions(cls, filter_string):
-        return cls._parse_filter_for_model_registry(
-            filter_string, cls.VALID_SEARCH_KEYS_FOR_MODEL_VERSIONS
+        """
+        Parse a model version filter string: one or more comparisons joined by ``AND``. Each
+        comparison applies to an attribute of ``VALID_SEARCH_KEYS_FOR_MODEL_VERSIONS`` or to a
+        tag (``tags.<key>``), with one of the comparators of
+        ``VALID_MODEL_VERSION_SEARCH_COMPARATORS_BY_KEY``.
+
+        :return: List of comparison dictionaries with ``type`` (``attribute`` or ``tag``),
+                 ``key``, ``comparator`` and ``value`` keys.
+        """
+        comparisons = cls._parse_filter_for_model_registry(
+            filter_string,
+            cls.VALID_SEARCH_KEYS_FOR_MODEL_VERSIONS,
+            allow_conjunctions=True,
+            allow_tags=True,
+            numeric_keys=cls.NUMERIC_SEARCH_KEYS_FOR_MODEL_VERSIONS,
         )
+        for comparison in comparisons:
+            key = (
+                comparison["key"]
+                if comparison["type"] == cls._ATTRIBUTE_IDENTIFIER
+                else comparison["type"]
+            )
+            valid_comparators = cls.VALID_MODEL_VERSION_SEARCH_COMPARATORS_BY_KEY[key]
+            if comparison["comparator"] not in valid_comparators:
+                raise MlflowException(
+                    "Invalid comparator '{}' for '{}' in filter string: {}. Valid comparators "
+                    "are {}".format(
+                        comparison["comparator"],
+                        comparison["key"],
+                        filter_string,
+                        sorted(valid_comparators),
+                    ),
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+        return comparisons
 
     @classmethod
     def parse_filter_for_registered_models(cls, filter_string):
         return cls._parse_filter_for_model_registry(
             filter_string, cls.VALID_SEARCH_KEYS_FOR_REGISTERED_MODELS
         )
+
+
+class _CompiledSearchFilter(object):
+    """
+    A search filter string parsed and compiled into predicates that can be applied to many runs.
+    """
+
+    def __init__(self, parsed):
+        self.parsed = parsed
+        self._predicates = None
+
+    def matches(self, run):
+        if self._predicates is None:
+            # Compiled lazily: filters that are only used to build SQL queries are validated by
+            # the SQL store instead
+            self._predicates = [SearchUtils._compile_clause(sed) for sed in self.parsed]
+        return all(predicate(run) for predicate in self._predicates)
+
+
+# Clients such as the tracking UI repeatedly send identical filter strings, so parsing and
+# compiling them once saves re-running the SQL parser on every search request
+@functools.lru_cache(maxsize=_SEARCH_FILTER_CACHE_SIZE)
+def _compile_search_filter(filter_string):
+    return _CompiledSearchFilter(SearchUtils._parse_search_filter(filter_string))
@@ -60,3 +60,36 @@ class TestRunData(unittest.TestCase):
         proto = rd1.to_proto()
         rd2 = RunData.from_proto(proto)
         self._check(rd2, metrics, params, tags)
+
+    def test_from_proto_is_lazy(self):
+        rd1, metrics, params, tags = TestRunData._create()
+        proto = rd1.to_proto()
+        rd2 = RunData.from_proto(proto)
+        self.assertIsNotNone(rd2._proto)
+        self.assertEqual(rd2.to_proto(), proto)
+        self.assertIsNotNone(rd2._proto)
+        self.assertEqual(rd2.params, {p.key: p.value for p in params})
+        self.assertIsNone(rd2._proto)
+        TestRunData._check(self, rd2, metrics, params, tags)
+
+    def test_add_after_from_proto(self):
+        rd1, metrics, params, tags = TestRunData._create()
+        rd2 = RunData.from_proto(rd1.to_proto())
+        new_metric = Metric("new_metric", 1.0, 123, 0)
+        rd2._add_metric(new_metric)
+        rd2._add_param(Param("new_param", "value"))
+        rd2._add_tag(RunTag("new_tag", "value"))
+        TestRunData._check(
+            self,
+            rd2,
+            metrics + [new_metric],
+            params + [Param("new_param", "value")],
+            tags + [RunTag("new_tag", "value")],
+        )
+        self.assertEqual(len(rd2.to_proto().metrics), len(metrics) + 1)
+
+    def test_entities_have_no_instance_dict(self):
+        rd, metrics, params, tags = TestRunData._create()
+        for entity in [rd, metrics[0], params[0], tags[0]]:
+            with self.assertRaises(AttributeError):
+                entity.__dict__
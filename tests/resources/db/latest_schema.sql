@@ -26,6 +26,15 @@ CREATE TABLE registered_models (
 )
 
 
+CREATE TABLE registry_changes (
+	revision INTEGER NOT NULL,
+	name VARCHAR(256) NOT NULL,
+	version INTEGER,
+	timestamp BIGINT,
+	CONSTRAINT registry_change_pk PRIMARY KEY (revision)
+)
+
+
 CREATE TABLE experiment_tags (
 	key VARCHAR(250) NOT NULL,
 	value VARCHAR(5000),
@@ -91,6 +100,9 @@ CREATE TABLE latest_metrics (
 	step BIGINT NOT NULL,
 	is_nan BOOLEAN NOT NULL,
 	run_uuid VARCHAR(32) NOT NULL,
+	experiment_id INTEGER,
+	lifecycle_stage VARCHAR(20),
+	start_time BIGINT,
 	CONSTRAINT latest_metric_pk PRIMARY KEY (key, run_uuid),
 	FOREIGN KEY(run_uuid) REFERENCES runs (run_uuid),
 	CHECK (is_nan IN (0, 1))
@@ -0,0 +1,65 @@
+import gzip
+import json
+
+import pytest
+from flask import Flask, Response, request
+
+from mlflow.server import compression
+from mlflow.server.compression import activate_compression
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+
+    @app.route("/echo", methods=["POST"])
+    def echo():
+        response = Response(mimetype="application/json")
+        response.set_data(json.dumps({"received": json.loads(request.get_data())}))
+        return response
+
+    @app.route("/text")
+    def text():
+        return "x" * 10000
+
+    activate_compression(app)
+    return app.test_client()
+
+
+def _post(client, body, headers):
+    return client.post("/echo", data=body, headers=headers)
+
+
+def test_large_json_responses_are_compressed_for_clients_that_accept_gzip(client):
+    body = json.dumps({"value": "x" * 10000})
+    response = _post(client, body, {"Accept-Encoding": "gzip, deflate"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Accept-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(response.get_data())) == {"received": {"value": "x" * 10000}}
+
+    response = _post(client, body, {})
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Accept-Encoding"] == "gzip"
+    assert json.loads(response.get_data()) == {"received": {"value": "x" * 10000}}
+
+
+def test_small_and_non_json_responses_are_not_compressed(client):
+    response = _post(client, json.dumps({"value": "x"}), {"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+    response = client.get("/text", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+    assert response.get_data() == b"x" * 10000
+
+
+def test_gzip_requests_are_decompressed(client):
+    body = gzip.compress(json.dumps({"value": "y" * 100}).encode("utf-8"))
+    response = _post(client, body, {"Content-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert json.loads(response.get_data()) == {"received": {"value": "y" * 100}}
+
+
+def test_invalid_and_oversized_gzip_requests_are_rejected(client, monkeypatch):
+    assert _post(client, b"not gzip", {"Content-Encoding": "gzip"}).status_code == 400
+    monkeypatch.setattr(compression, "MAX_DECOMPRESSED_REQUEST_SIZE", 10)
+    body = gzip.compress(json.dumps({"value": "y" * 100}).encode("utf-8"))
+    assert _post(client, body, {"Content-Encoding": "gzip"}).status_code == 413
@@ -44,7 +44,7 @@ from mlflow.server.handlers import (
 )
 from mlflow.server import BACKEND_STORE_URI_ENV_VAR, app
 from mlflow.store.entities.paged_list import PagedList
-from mlflow.protos.service_pb2 import CreateExperiment, SearchRuns
+from mlflow.protos.service_pb2 import CreateExperiment, LogBatch, Metric, RunTag, SearchRuns
 from mlflow.protos.model_registry_pb2 import (
     CreateRegisteredModel,
     UpdateRegisteredModel,
@@ -641,12 +641,37 @@ def test_search_model_versions(mock_get_request_message, mock_model_registry_sto
             status_message=None,
         ),
     ]
-    mock_model_registry_store.search_model_versions.return_value = mvds
+    mock_model_registry_store.search_model_versions.return_value = PagedList(mvds, None)
     resp = _search_model_versions()
-    args, _ = mock_model_registry_store.search_model_versions.call_args
-    assert args == ("source_path = 'A/B/CD'",)
+    _, args = mock_model_registry_store.search_model_versions.call_args
+    assert args == {
+        "filter_string": "source_path = 'A/B/CD'",
+        "max_results": 200000,
+        "order_by": [],
+        "page_token": "",
+    }
     assert json.loads(resp.get_data()) == {"model_versions": jsonify(mvds)}
 
+    mock_get_request_message.return_value = SearchModelVersions(
+        filter="current_stage = 'Production'",
+        max_results=2,
+        order_by=["version_number DESC"],
+        page_token="a token",
+    )
+    mock_model_registry_store.search_model_versions.return_value = PagedList(mvds[:2], "next token")
+    resp = _search_model_versions()
+    _, args = mock_model_registry_store.search_model_versions.call_args
+    assert args == {
+        "filter_string": "current_stage = 'Production'",
+        "max_results": 2,
+        "order_by": ["version_number DESC"],
+        "page_token": "a token",
+    }
+    assert json.loads(resp.get_data()) == {
+        "model_versions": jsonify(mvds[:2]),
+        "next_page_token": "next token",
+    }
+
 
 def test_set_model_version_tag(mock_get_request_message, mock_model_registry_store):
     name = "model1"
@@ -670,3 +695,235 @@ def test_delete_model_version_tag(mock_get_request_message, mock_model_registry_
     _delete_model_version_tag()
     _, args = mock_model_registry_store.delete_model_version_tag.call_args
     assert args == {"name": name, "version": version, "key": key}
+
+
+def test_get_registry_changes(mock_model_registry_store):
+    mock_model_registry_store.get_registry_changes.return_value = (12, ["model 1", "model 2"])
+    with app.test_client() as c:
+        response = c.get(
+            "/api/2.0/preview/mlflow/registry/changes", query_string={"since_revision": 7}
+        )
+    assert response.status_code == 200
+    assert json.loads(response.get_data()) == {
+        "revision": 12,
+        "registered_model_names": ["model 1", "model 2"],
+    }
+    mock_model_registry_store.get_registry_changes.assert_called_once_with(
+        since_revision=7, timeout=0
+    )
+
+    mock_model_registry_store.get_registry_changes.reset_mock()
+    with app.test_client() as c:
+        response = c.get("/ajax-api/2.0/preview/mlflow/registry/changes")
+    assert response.status_code == 200
+    mock_model_registry_store.get_registry_changes.assert_called_once_with(
+        since_revision=None, timeout=0
+    )
+
+    with app.test_client() as c:
+        response = c.get(
+            "/api/2.0/preview/mlflow/registry/changes", query_string={"timeout": "soon"}
+        )
+    assert response.status_code == 400
+    assert json.loads(response.get_data())["error_code"] == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+
+def test_can_parse_protobuf():
+    request = mock.MagicMock()
+    request.method = "POST"
+    request.mimetype = "application/x-protobuf"
+    request.get_data.return_value = CreateExperiment(name="hello").SerializeToString()
+    msg = _get_request_message(CreateExperiment(), flask_request=request)
+    assert msg.name == "hello"
+    request.get_json.assert_not_called()
+
+
+def test_responses_are_negotiated_with_accept_header(mock_tracking_store):
+    mock_tracking_store.create_experiment.return_value = "123"
+    body = CreateExperiment(name="hello")
+    with app.test_client() as c:
+        # Older clients and the UI send and accept JSON
+        response = c.post("/api/2.0/mlflow/experiments/create", data=message_to_json(body))
+        assert response.mimetype == "application/json"
+        assert json.loads(response.get_data()) == {"experiment_id": "123"}
+        assert "Accept" in response.headers["Vary"]
+        response = c.post(
+            "/api/2.0/mlflow/experiments/create",
+            data=message_to_json(body),
+            headers={"Accept": "*/*"},
+        )
+        assert response.mimetype == "application/json"
+
+        response = c.post(
+            "/api/2.0/mlflow/experiments/create",
+            data=body.SerializeToString(),
+            headers={
+                "Content-Type": "application/x-protobuf",
+                "Accept": "application/x-protobuf, application/json;q=0.9",
+            },
+        )
+        assert response.mimetype == "application/x-protobuf"
+        response_message = CreateExperiment.Response()
+        response_message.ParseFromString(response.get_data())
+        assert response_message.experiment_id == "123"
+    mock_tracking_store.create_experiment.assert_called_with("hello", "")
+
+
+def test_log_batch_accepts_protobuf(mock_tracking_store):
+    body = LogBatch(run_id="abc", metrics=[Metric(key="m", value=1.0, timestamp=1, step=2)])
+    with app.test_client() as c:
+        response = c.post(
+            "/api/2.0/mlflow/runs/log-batch",
+            data=body.SerializeToString(),
+            headers={"Content-Type": "application/x-protobuf"},
+        )
+    assert response.status_code == 200
+    _, kwargs = mock_tracking_store.log_batch.call_args
+    assert kwargs["run_id"] == "abc"
+    assert [(m.key, m.value, m.timestamp, m.step) for m in kwargs["metrics"]] == [("m", 1.0, 1, 2)]
+
+
+def test_log_batch_validates_protobuf_requests(mock_tracking_store):
+    metrics = [Metric(key="m", value=1.0, timestamp=1, step=i) for i in range(1001)]
+    with app.test_client() as c:
+        response = c.post(
+            "/api/2.0/mlflow/runs/log-batch",
+            data=LogBatch(run_id="abc", metrics=metrics).SerializeToString(),
+            headers={"Content-Type": "application/x-protobuf"},
+        )
+        assert response.status_code == 400
+        assert "A batch logging request can contain at most 1000 metrics" in response.get_data(
+            as_text=True
+        )
+        too_large = [RunTag(key="t%d" % i, value="v" * 10000) for i in range(100)]
+        response = c.post(
+            "/api/2.0/mlflow/runs/log-batch",
+            data=LogBatch(run_id="abc", tags=too_large).SerializeToString(),
+            headers={"Content-Type": "application/x-protobuf"},
+        )
+        assert response.status_code == 400
+        assert "Batched logging API requests must be at most" in response.get_data(as_text=True)
+    mock_tracking_store.log_batch.assert_not_called()
+
+
+@pytest.fixture()
+def response_cache():
+    with mock.patch.dict(os.environ, {"MLFLOW_SERVER_RESPONSE_CACHE_SIZE": "100"}):
+        with mock.patch("mlflow.server.handlers._response_cache", None):
+            yield
+
+
+def _create_run(run_id, status):
+    run_info = mlflow.entities.RunInfo(
+        run_uuid=run_id,
+        run_id=run_id,
+        experiment_id="0",
+        user_id="user",
+        status=status,
+        start_time=1,
+        end_time=None,
+        lifecycle_stage="active",
+        artifact_uri="uri",
+    )
+    return mlflow.entities.Run(run_info, mlflow.entities.RunData())
+
+
+def test_get_run_responses_are_cached_and_invalidated_by_writes(
+    response_cache, mock_tracking_store
+):
+    mock_tracking_store.get_run.return_value = _create_run("run1", "RUNNING")
+    with app.test_client() as c:
+        response = c.get("/api/2.0/mlflow/runs/get?run_id=run1")
+        assert response.status_code == 200
+        assert c.get("/api/2.0/mlflow/runs/get?run_id=run1").get_data() == response.get_data()
+        assert mock_tracking_store.get_run.call_count == 1
+        # Other runs are not cached yet
+        c.get("/api/2.0/mlflow/runs/get?run_id=run2")
+        assert mock_tracking_store.get_run.call_count == 2
+
+        c.post("/api/2.0/mlflow/runs/set-tag", json={"run_id": "run1", "key": "k", "value": "v"})
+        c.get("/api/2.0/mlflow/runs/get?run_id=run1")
+        c.get("/api/2.0/mlflow/runs/get?run_id=run2")
+        assert mock_tracking_store.get_run.call_count == 3
+
+
+def test_search_runs_responses_are_invalidated_by_run_writes(response_cache, mock_tracking_store):
+    mock_tracking_store.search_runs.return_value = PagedList([], None)
+    body = {"experiment_ids": ["0"]}
+    with app.test_client() as c:
+        c.post("/api/2.0/mlflow/runs/search", json=body)
+        c.post("/api/2.0/mlflow/runs/search", json=body)
+        assert mock_tracking_store.search_runs.call_count == 1
+        # Different requests are cached separately
+        c.post("/api/2.0/mlflow/runs/search", json={"experiment_ids": ["1"]})
+        assert mock_tracking_store.search_runs.call_count == 2
+
+        c.post("/api/2.0/mlflow/runs/log-metric", json={"run_id": "run", "key": "m", "value": 1})
+        c.post("/api/2.0/mlflow/runs/search", json=body)
+        assert mock_tracking_store.search_runs.call_count == 3
+
+
+def test_terminated_run_responses_expire_like_other_responses_by_default(
+    response_cache, mock_tracking_store
+):
+    mock_tracking_store.get_run.return_value = _create_run("run1", "FINISHED")
+    with app.test_client() as c:
+        with mock.patch("time.time", return_value=1000):
+            c.get("/api/2.0/mlflow/runs/get?run_id=run1")
+        with mock.patch("time.time", return_value=1100):
+            c.get("/api/2.0/mlflow/runs/get?run_id=run1")
+    assert mock_tracking_store.get_run.call_count == 2
+
+
+def test_terminated_run_responses_live_longer_if_enabled(
+    response_cache, mock_tracking_store, monkeypatch
+):
+    monkeypatch.setenv("MLFLOW_SERVER_TERMINATED_RUN_CACHE_TTL", "600")
+    with app.test_client() as c:
+        with mock.patch("time.time", return_value=1000):
+            mock_tracking_store.get_run.return_value = _create_run("run1", "FINISHED")
+            c.get("/api/2.0/mlflow/runs/get?run_id=run1")
+            mock_tracking_store.get_run.return_value = _create_run("run2", "RUNNING")
+            c.get("/api/2.0/mlflow/runs/get?run_id=run2")
+        with mock.patch("time.time", return_value=1100):
+            c.get("/api/2.0/mlflow/runs/get?run_id=run1")
+            c.get("/api/2.0/mlflow/runs/get?run_id=run2")
+    assert [args[0][0] for args in mock_tracking_store.get_run.call_args_list] == [
+        "run1",
+        "run2",
+        "run2",
+    ]
+
+
+def test_get_requests_are_conditional_on_etag(mock_tracking_store):
+    mock_tracking_store.list_experiments.return_value = []
+    with app.test_client() as c:
+        response = c.get("/api/2.0/mlflow/experiments/list")
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "no-cache"
+        etag = response.headers["ETag"]
+        assert etag.startswith('W/"')
+        response = c.get("/api/2.0/mlflow/experiments/list", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.get_data() == b""
+        response = c.get("/api/2.0/mlflow/experiments/list", headers={"If-None-Match": 'W/"x"'})
+        assert response.status_code == 200
+
+
+def test_log_metric_is_buffered_when_enabled(mock_tracking_store):
+    env = {"MLFLOW_SERVER_METRIC_BUFFER": "flush", "MLFLOW_SERVER_METRIC_FLUSH_INTERVAL_MS": "10"}
+    with mock.patch.dict(os.environ, env), mock.patch(
+        "mlflow.server.handlers._metric_write_buffer", None
+    ):
+        with app.test_client() as c:
+            response = c.post(
+                "/api/2.0/mlflow/runs/log-metric",
+                json={"run_id": "run", "key": "m", "value": 1, "timestamp": 2, "step": 3},
+            )
+        assert response.status_code == 200
+        mock_tracking_store.log_metric.assert_not_called()
+        mock_tracking_store.log_batch.assert_called_once()
+        _, kwargs = mock_tracking_store.log_batch.call_args
+        assert [(m.key, m.value, m.timestamp, m.step) for m in kwargs["metrics"]] == [
+            ("m", 1, 2, 3)
+        ]
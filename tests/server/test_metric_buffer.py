@@ -0,0 +1,189 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from mlflow.entities import Metric
+from mlflow.exceptions import MlflowException
+from mlflow.server import metric_buffer
+from mlflow.server.metric_buffer import (
+    ACKNOWLEDGE_AFTER_ENQUEUE,
+    ACKNOWLEDGE_AFTER_FLUSH,
+    MetricWriteBuffer,
+)
+from mlflow.utils.validation import MAX_METRICS_PER_BATCH
+
+
+def _metric(step):
+    return Metric("m", step, 1, step)
+
+
+def _logged_metrics(store):
+    return [
+        (args[0], [metric.step for metric in kwargs["metrics"]])
+        for args, kwargs in store.log_batch.call_args_list
+    ]
+
+
+def test_invalid_acknowledgement_mode_is_rejected():
+    with pytest.raises(MlflowException, match="Invalid metric buffer acknowledgement mode"):
+        MetricWriteBuffer(mock.Mock, acknowledge="never")
+
+
+def test_metrics_are_flushed_in_batches_per_run():
+    store = mock.Mock()
+    buffer = MetricWriteBuffer(lambda: store, acknowledge=ACKNOWLEDGE_AFTER_ENQUEUE)
+    # The flusher thread is not started, so that the test controls the flushes
+    buffer._flusher = mock.Mock()
+    buffer.log_metric("run1", _metric(0))
+    buffer.log_metric("run2", _metric(1))
+    buffer.log_metric("run1", _metric(2))
+    assert len(buffer) == 3
+    store.log_batch.assert_not_called()
+
+    buffer.flush()
+    assert len(buffer) == 0
+    assert _logged_metrics(store) == [("run1", [0, 2]), ("run2", [1])]
+    buffer.flush()
+    assert store.log_batch.call_count == 2
+
+
+def test_batches_are_limited_in_size():
+    store = mock.Mock()
+    buffer = MetricWriteBuffer(lambda: store, acknowledge=ACKNOWLEDGE_AFTER_ENQUEUE)
+    buffer._flusher = mock.Mock()
+    for step in range(MAX_METRICS_PER_BATCH + 1):
+        buffer.log_metric("run", _metric(step))
+    buffer.flush()
+    assert [len(steps) for _, steps in _logged_metrics(store)] == [MAX_METRICS_PER_BATCH, 1]
+
+
+def test_flush_calls_on_flush_with_flushed_runs():
+    on_flush = mock.Mock()
+    buffer = MetricWriteBuffer(mock.Mock, acknowledge=ACKNOWLEDGE_AFTER_ENQUEUE, on_flush=on_flush)
+    buffer._flusher = mock.Mock()
+    buffer.log_metric("run1", _metric(0))
+    buffer.log_metric("run2", _metric(0))
+    buffer.flush()
+    assert on_flush.call_args_list == [mock.call("run1"), mock.call("run2")]
+
+
+def test_invalid_metrics_are_rejected_before_being_buffered():
+    buffer = MetricWriteBuffer(mock.Mock, acknowledge=ACKNOWLEDGE_AFTER_ENQUEUE)
+    buffer._flusher = mock.Mock()
+    with pytest.raises(MlflowException):
+        buffer.log_metric("run", Metric("m", "not a number", 1, 0))
+    assert len(buffer) == 0
+
+
+def test_acknowledgement_after_flush_waits_for_the_write():
+    store = mock.Mock()
+    buffer = MetricWriteBuffer(lambda: store, flush_interval=0.01)
+    buffer.log_metric("run", _metric(0))
+    assert _logged_metrics(store) == [("run", [0])]
+
+
+def test_acknowledgement_after_flush_raises_write_errors():
+    store = mock.Mock()
+    store.log_batch.side_effect = MlflowException("batch failed")
+
+    def log_metric(run_id, metric):
+        if run_id == "missing":
+            raise MlflowException("Run 'missing' not found")
+
+    store.log_metric.side_effect = log_metric
+    buffer = MetricWriteBuffer(lambda: store)
+    buffer._flusher = mock.Mock()
+    errors = {}
+
+    def log(run_id):
+        try:
+            buffer.log_metric(run_id, _metric(0))
+        except MlflowException as e:
+            errors[run_id] = e
+
+    threads = [threading.Thread(target=log, args=(run_id,)) for run_id in ["run", "missing"]]
+    for thread in threads:
+        thread.start()
+    while len(buffer) < 2:
+        pass
+    buffer.flush()
+    for thread in threads:
+        thread.join()
+    assert list(errors) == ["missing"]
+    assert "not found" in str(errors["missing"])
+    assert store.log_metric.call_count == 2
+
+
+def test_acknowledgement_after_enqueue_logs_write_errors():
+    store = mock.Mock()
+    store.log_batch.side_effect = MlflowException("batch failed")
+    store.log_metric.side_effect = MlflowException("Run 'missing' not found")
+    buffer = MetricWriteBuffer(lambda: store, acknowledge=ACKNOWLEDGE_AFTER_ENQUEUE)
+    buffer._flusher = mock.Mock()
+    buffer.log_metric("missing", _metric(0))
+    with mock.patch.object(metric_buffer._logger, "error") as log_error:
+        buffer.flush()
+    log_error.assert_called_once()
+    assert "missing" in log_error.call_args[0]
+
+
+def test_full_buffer_blocks_until_flushed():
+    store = mock.Mock()
+    buffer = MetricWriteBuffer(
+        lambda: store, acknowledge=ACKNOWLEDGE_AFTER_ENQUEUE, flush_interval=60, max_size=2
+    )
+    for step in range(5):
+        buffer.log_metric("run", _metric(step))
+    # The flusher does not wait for the flush interval when the buffer is full
+    assert len(buffer) <= 2
+    buffer.flush()
+    assert sorted(step for _, steps in _logged_metrics(store) for step in steps) == list(range(5))
+
+
+def test_queue_depth_and_flush_duration_are_measured():
+    buffer = MetricWriteBuffer(mock.Mock, acknowledge=ACKNOWLEDGE_AFTER_ENQUEUE)
+    buffer._flusher = mock.Mock()
+    with mock.patch.object(metric_buffer, "QUEUE_DEPTH") as queue_depth, mock.patch.object(
+        metric_buffer, "FLUSH_DURATION"
+    ) as flush_duration:
+        buffer.log_metric("run", _metric(0))
+        buffer.log_metric("run", _metric(1))
+        buffer.flush()
+    assert queue_depth.inc.call_count == 2
+    queue_depth.dec.assert_called_once_with(2)
+    flush_duration.observe.assert_called_once()
+
+
+def test_pending_writes_fail_when_the_store_is_unavailable():
+    def get_store():
+        raise MlflowException("store unavailable")
+
+    buffer = MetricWriteBuffer(get_store)
+    buffer._flusher = mock.Mock()
+    errors = []
+
+    def log():
+        try:
+            buffer.log_metric("run", _metric(0))
+        except MlflowException as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=log)
+    thread.start()
+    while len(buffer) < 1:
+        pass
+    with pytest.raises(MlflowException, match="store unavailable"):
+        buffer.flush()
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert [str(e) for e in errors] == ["store unavailable"]
+
+
+def test_acknowledgement_after_flush_times_out():
+    buffer = MetricWriteBuffer(mock.Mock, write_timeout=0.01)
+    # Nothing flushes the buffer
+    buffer._flusher = mock.Mock()
+    with pytest.raises(MlflowException, match="not written to the tracking store within") as e:
+        buffer.log_metric("run", _metric(0))
+    assert e.value.error_code == "TEMPORARILY_UNAVAILABLE"
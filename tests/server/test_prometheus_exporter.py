@@ -0,0 +1,130 @@
+import os
+from unittest import mock
+
+import pytest
+import sqlalchemy
+from flask import Flask
+
+from mlflow.server import handlers
+from mlflow.server import prometheus_exporter
+from mlflow.server.prometheus_exporter import activate_prometheus_exporter
+from mlflow.store.entities.paged_list import PagedList
+from mlflow.store.tracking.dbmodels.models import Base, SqlExperiment
+
+
+def _get_sample_value(metric, sample_name, **labels):
+    for sample in metric.collect()[0].samples:
+        if sample.name == sample_name and all(
+            sample.labels.get(key) == value for key, value in labels.items()
+        ):
+            return sample.value
+    return 0
+
+
+@pytest.fixture(scope="module")
+def app(tmpdir_factory):
+    app = Flask(__name__)
+    for http_path, handler, methods in handlers.get_endpoints():
+        app.add_url_rule(http_path, handler.__name__, handler, methods=methods)
+    app.add_url_rule("/get-artifact", "serve_artifacts", lambda: "artifact content")
+    multiproc_dir = str(tmpdir_factory.mktemp("prometheus"))
+    with mock.patch.dict(os.environ, {"prometheus_multiproc_dir": multiproc_dir}):
+        activate_prometheus_exporter(app)
+    return app
+
+
+def test_all_handlers_and_artifact_views_are_instrumented(app):
+    for handler in handlers.HANDLERS.values():
+        assert app.view_functions[handler.__name__] is not handler
+    assert app.view_functions["_get_registry_changes"] is not handlers._get_registry_changes
+    assert app.view_functions["serve_artifacts"].__wrapped__
+
+
+def test_payload_sizes_are_observed(app):
+    path = "runs_search"
+    requests_before = _get_sample_value(
+        prometheus_exporter.REQUEST_SIZE, "mlflow_request_size_bytes_count", path=path
+    )
+    with mock.patch("mlflow.server.handlers._get_tracking_store") as get_tracking_store:
+        get_tracking_store.return_value.search_runs.return_value = PagedList([], None)
+        with app.test_client() as c:
+            response = c.post("/api/2.0/mlflow/runs/search", data='{"experiment_ids":["0"]}')
+            assert response.status_code == 200
+            c.get("/get-artifact")
+    assert (
+        _get_sample_value(
+            prometheus_exporter.REQUEST_SIZE, "mlflow_request_size_bytes_count", path=path
+        )
+        == requests_before + 1
+    )
+    assert _get_sample_value(
+        prometheus_exporter.RESPONSE_SIZE,
+        "mlflow_response_size_bytes_sum",
+        path="_get-artifact",
+        status="200",
+    ) >= len("artifact content")
+
+
+def test_sqlalchemy_queries_sessions_and_rows_are_observed(app):
+    engine = sqlalchemy.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    queries_before = _get_sample_value(
+        prometheus_exporter.SQL_QUERY_DURATION,
+        "mlflow_sqlalchemy_query_duration_seconds_count",
+        statement="SELECT",
+    )
+    sessions_before = _get_sample_value(
+        prometheus_exporter.SQL_SESSIONS, "mlflow_sqlalchemy_sessions_total"
+    )
+    rows_before = _get_sample_value(
+        prometheus_exporter.SQL_ROWS_LOADED,
+        "mlflow_sqlalchemy_rows_loaded_total",
+        table="experiments",
+    )
+
+    session = sqlalchemy.orm.sessionmaker(bind=engine)()
+    session.add_all(
+        [
+            SqlExperiment(name="a", lifecycle_stage="active"),
+            SqlExperiment(name="b", lifecycle_stage="active"),
+        ]
+    )
+    session.commit()
+    session.close()
+    session = sqlalchemy.orm.sessionmaker(bind=engine)()
+    assert len(session.query(SqlExperiment).all()) == 2
+    session.close()
+
+    assert (
+        _get_sample_value(
+            prometheus_exporter.SQL_QUERY_DURATION,
+            "mlflow_sqlalchemy_query_duration_seconds_count",
+            statement="SELECT",
+        )
+        >= queries_before + 1
+    )
+    assert (
+        _get_sample_value(prometheus_exporter.SQL_SESSIONS, "mlflow_sqlalchemy_sessions_total")
+        == sessions_before + 2
+    )
+    assert (
+        _get_sample_value(
+            prometheus_exporter.SQL_ROWS_LOADED,
+            "mlflow_sqlalchemy_rows_loaded_total",
+            table="experiments",
+        )
+        == rows_before + 2
+    )
+
+
+@pytest.mark.parametrize(
+    "statement, statement_type",
+    [
+        ("SELECT * FROM runs", "SELECT"),
+        ("\n  insert into runs VALUES (?)", "INSERT"),
+        ("PRAGMA foreign_keys = ON;", "OTHER"),
+        ("", "OTHER"),
+    ],
+)
+def test_get_statement_type(statement, statement_type):
+    assert prometheus_exporter._get_statement_type(statement) == statement_type
@@ -0,0 +1,65 @@
+from unittest import mock
+
+from mlflow.server.response_cache import SEARCH_SCOPE, ResponseCache, compute_etag
+
+
+def _put(cache, key, scope, data=b"data", ttl=None):
+    return cache.put(key, scope, cache.generation(), data, "application/json", ttl)
+
+
+def test_response_cache_get_and_put():
+    cache = ResponseCache(max_entries=10, ttl=10)
+    assert cache.get("key") is None
+    entry = _put(cache, "key", "run1")
+    assert entry.etag == compute_etag(b"data")
+    assert cache.get("key") == entry
+    assert cache.get("key").data == b"data"
+    assert cache.get("key").mimetype == "application/json"
+
+
+def test_response_cache_evicts_least_recently_used_entries():
+    cache = ResponseCache(max_entries=2, ttl=10)
+    _put(cache, "key1", "run1")
+    _put(cache, "key2", "run2")
+    cache.get("key1")
+    _put(cache, "key3", "run3")
+    assert len(cache) == 2
+    assert cache.get("key1") is not None
+    assert cache.get("key2") is None
+    assert cache.get("key3") is not None
+
+
+def test_response_cache_entries_expire():
+    cache = ResponseCache(max_entries=10, ttl=10)
+    with mock.patch("time.time", return_value=1000):
+        _put(cache, "key1", "run1")
+        _put(cache, "key2", "run1", ttl=100)
+    with mock.patch("time.time", return_value=1050):
+        assert cache.get("key1") is None
+        assert cache.get("key2") is not None
+    assert len(cache) == 1
+
+
+def test_response_cache_invalidation():
+    cache = ResponseCache(max_entries=10, ttl=10)
+    _put(cache, "run1-key", "run1")
+    _put(cache, "run2-key", "run2")
+    _put(cache, "search-key", SEARCH_SCOPE)
+    _put(cache, "experiments-key", "experiments")
+    cache.invalidate("run1")
+    # Search results may contain the data of any run
+    assert cache.get("run1-key") is None
+    assert cache.get("search-key") is None
+    assert cache.get("run2-key") is not None
+    assert cache.get("experiments-key") is not None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_response_cache_does_not_cache_responses_computed_during_writes():
+    cache = ResponseCache(max_entries=10, ttl=10)
+    generation = cache.generation()
+    cache.invalidate("run1")
+    entry = cache.put("key", "run1", generation, b"stale", "application/json")
+    assert entry.data == b"stale"
+    assert cache.get("key") is None
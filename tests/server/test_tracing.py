@@ -0,0 +1,185 @@
+import json
+import sys
+import time
+from unittest import mock
+
+import pytest
+from flask import Flask
+
+from mlflow.exceptions import MlflowException
+from mlflow.server import handlers
+from mlflow.server.tracing import (
+    LogSpanExporter,
+    SlowRequestProfiler,
+    Tracer,
+    activate_tracing,
+    _collapse_stack,
+)
+from mlflow.store.entities.paged_list import PagedList
+
+
+class RecordingExporter(object):
+    def __init__(self):
+        self.traces = []
+
+    def export(self, spans):
+        self.traces.append(spans)
+
+
+@pytest.fixture()
+def restore_handlers():
+    names = [
+        "_get_request_message",
+        "_wrap_response",
+        "_get_tracking_store",
+        "_get_model_registry_store",
+    ]
+    original = {name: getattr(handlers, name) for name in names}
+    yield
+    for name, func in original.items():
+        setattr(handlers, name, func)
+
+
+def _create_app():
+    app = Flask(__name__)
+    for http_path, handler, methods in handlers.get_endpoints():
+        app.add_url_rule(http_path, handler.__name__, handler, methods=methods)
+    return app
+
+
+def test_tracer_records_nested_spans():
+    exporter = RecordingExporter()
+    tracer = Tracer(exporter)
+    inner = tracer.wrap("inner", lambda x: x + 1)
+    outer = tracer.wrap("outer", lambda: inner(1) + inner(2))
+    assert outer() == 5
+    outer()
+    assert len(exporter.traces) == 2
+    spans = exporter.traces[0]
+    assert [span.name for span in spans] == ["outer", "inner", "inner"]
+    assert spans[1].parent_span_id == spans[0].span_id
+    assert spans[2].parent_span_id == spans[0].span_id
+    assert len(set(span.trace_id for span in spans)) == 1
+    assert exporter.traces[1][0].trace_id != spans[0].trace_id
+    assert all(span.start_time <= span.end_time for span in spans)
+
+
+def test_tracer_records_errors():
+    exporter = RecordingExporter()
+    tracer = Tracer(exporter)
+
+    def fail():
+        raise ValueError("error")
+
+    with pytest.raises(ValueError):
+        tracer.wrap("fail", fail)()
+    assert exporter.traces[0][0].attributes == {"error": "ValueError"}
+
+
+def test_log_span_exporter_logs_otlp_json():
+    tracer = Tracer(LogSpanExporter())
+    with mock.patch("mlflow.server.tracing._logger.info") as info_mock:
+        tracer.wrap("span", lambda: None, get_attributes=lambda: {"key": "value"})()
+    span = json.loads(info_mock.call_args[0][0])
+    assert span["name"] == "span"
+    assert len(span["traceId"]) == 32
+    assert len(span["spanId"]) == 16
+    assert span["parentSpanId"] == ""
+    assert int(span["endTimeUnixNano"]) >= int(span["startTimeUnixNano"])
+    assert span["attributes"] == [{"key": "key", "value": {"stringValue": "value"}}]
+
+
+def test_activate_tracing_traces_handler_phases(restore_handlers):
+    exporter = RecordingExporter()
+    app = _create_app()
+    with mock.patch("mlflow.server.handlers._get_tracking_store") as get_tracking_store:
+        get_tracking_store.return_value.search_runs.return_value = PagedList([], None)
+        activate_tracing(app, exporter=exporter)
+        with app.test_client() as c:
+            response = c.post("/api/2.0/mlflow/runs/search", json={"experiment_ids": ["0"]})
+    assert response.status_code == 200
+    spans = exporter.traces[0]
+    assert [span.name for span in spans] == [
+        "_search_runs",
+        "parse_request",
+        "store.search_runs",
+        "encode_response",
+    ]
+    assert spans[0].attributes == {
+        "http.method": "POST",
+        "http.target": "/api/2.0/mlflow/runs/search",
+    }
+    assert all(span.parent_span_id == spans[0].span_id for span in spans[1:])
+
+
+def test_tracing_is_disabled_by_default(restore_handlers):
+    app = _create_app()
+    view_functions = dict(app.view_functions)
+    get_request_message = handlers._get_request_message
+    assert activate_tracing(app) is None
+    assert app.view_functions == view_functions
+    assert handlers._get_request_message is get_request_message
+
+
+def test_slow_request_profiler_logs_stack_samples():
+    profiler = SlowRequestProfiler(threshold=0, interval=60)
+    try:
+        profiler.start_request()
+        for _ in range(2):
+            profiler.sample()
+        with mock.patch("mlflow.server.tracing._logger.warning") as warning_mock:
+            profiler.end_request("POST /path")
+    finally:
+        profiler.stop()
+    message = warning_mock.call_args[0][0] % warning_mock.call_args[0][1:]
+    assert message.startswith("Slow request POST /path took")
+    assert "test_slow_request_profiler_logs_stack_samples (test_tracing.py:" in message
+    assert message.splitlines()[-1].endswith(" 2")
+
+    # Fast requests are not logged
+    profiler = SlowRequestProfiler(threshold=60, interval=60)
+    try:
+        profiler.start_request()
+        profiler.sample()
+        with mock.patch("mlflow.server.tracing._logger.warning") as warning_mock:
+            profiler.end_request("POST /path")
+    finally:
+        profiler.stop()
+    warning_mock.assert_not_called()
+
+
+@pytest.fixture
+def background_profiler():
+    profiler = SlowRequestProfiler(threshold=0, interval=0.001)
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+    assert not profiler._sampler.is_alive()
+
+
+def test_slow_request_profiler_samples_in_background(background_profiler):
+    with mock.patch("mlflow.server.tracing._logger.warning") as warning_mock:
+        background_profiler.start_request()
+        time.sleep(0.1)
+        background_profiler.end_request("GET /path")
+    assert warning_mock.call_args[0][1] == "GET /path"
+    assert background_profiler._sampler.is_alive()
+
+
+def test_slow_request_profiler_samples_only_during_requests(background_profiler):
+    with mock.patch.object(background_profiler, "sample") as sample_mock:
+        background_profiler.start_request()
+        time.sleep(0.05)
+        background_profiler.end_request("GET /path")
+        # Lets a sample in progress finish
+        time.sleep(0.01)
+        num_samples = sample_mock.call_count
+        assert num_samples > 0
+        time.sleep(0.05)
+        assert sample_mock.call_count == num_samples
+
+
+def test_collapse_stack():
+    stack = _collapse_stack(sys._getframe())
+    assert stack.split(";")[-1].startswith("test_collapse_stack (test_tracing.py:")
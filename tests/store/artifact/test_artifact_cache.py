@@ -0,0 +1,102 @@
+import os
+import threading
+
+import pytest
+
+from mlflow.store.artifact.artifact_cache import ArtifactCache, get_artifact_cache
+
+
+def _write_file(dst_dir, name, size):
+    path = os.path.join(dst_dir, name)
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+    return path
+
+
+def test_get_artifact_cache_is_configured_from_environment(tmpdir, monkeypatch):
+    monkeypatch.delenv("MLFLOW_ARTIFACT_CACHE_DIR", raising=False)
+    assert get_artifact_cache() is None
+    monkeypatch.setenv("MLFLOW_ARTIFACT_CACHE_DIR", tmpdir.strpath)
+    monkeypatch.setenv("MLFLOW_ARTIFACT_CACHE_MAX_SIZE", "1024")
+    cache = get_artifact_cache()
+    assert cache.root_dir == tmpdir.strpath
+    assert cache.max_size == 1024
+
+
+def test_get_or_download_downloads_once_and_returns_read_only_files(tmpdir):
+    cache = ArtifactCache(tmpdir.strpath, max_size=1024)
+    calls = []
+
+    def download(dst_dir):
+        calls.append(dst_dir)
+        return _write_file(dst_dir, "model.bin", 10)
+
+    assert cache.get("s3://bucket/model") is None
+    path = cache.get_or_download("s3://bucket/model", download)
+    assert cache.get_or_download("s3://bucket/model", download) == path
+    assert cache.get("s3://bucket/model") == path
+    assert len(calls) == 1
+    assert os.path.basename(path) == "model.bin"
+    assert not os.stat(path).st_mode & 0o222
+
+
+def test_get_or_download_does_not_cache_failed_downloads(tmpdir):
+    cache = ArtifactCache(tmpdir.strpath, max_size=1024)
+
+    def failing_download(dst_dir):
+        _write_file(dst_dir, "partial", 10)
+        raise Exception("download failed")
+
+    with pytest.raises(Exception, match="download failed"):
+        cache.get_or_download("s3://bucket/model", failing_download)
+    assert cache.get("s3://bucket/model") is None
+    assert os.listdir(os.path.join(tmpdir.strpath, "tmp")) == []
+
+
+def test_concurrent_downloads_of_same_location_are_serialized(tmpdir):
+    cache = ArtifactCache(tmpdir.strpath, max_size=1024)
+    calls = []
+
+    def download(dst_dir):
+        calls.append(dst_dir)
+        return _write_file(dst_dir, "model.bin", 10)
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(cache.get_or_download("s3://bucket/model", download))
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert len(set(results)) == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmpdir):
+    cache = ArtifactCache(tmpdir.strpath, max_size=25)
+    path_a = cache.get_or_download("loc-a", lambda dst: _write_file(dst, "a", 10))
+    path_b = cache.get_or_download("loc-b", lambda dst: _write_file(dst, "b", 10))
+    # Make "loc-a" the most recently used entry
+    entry_dir_b = os.path.dirname(os.path.dirname(path_b))
+    os.utime(entry_dir_b, (0, 0))
+    assert cache.get("loc-a") == path_a
+
+    cache.get_or_download("loc-c", lambda dst: _write_file(dst, "c", 10))
+    assert cache.get("loc-a") == path_a
+    assert cache.get("loc-b") is None
+    assert cache.get("loc-c") is not None
+
+
+def test_leased_entries_are_not_evicted(tmpdir):
+    cache = ArtifactCache(tmpdir.strpath, max_size=15)
+    with cache.lease("loc-a", lambda dst: _write_file(dst, "a", 10)) as path_a:
+        cache.get_or_download("loc-b", lambda dst: _write_file(dst, "b", 10))
+        assert os.path.exists(path_a)
+        assert cache.get("loc-a") == path_a
+    # Once the lease is released, the entry can be evicted
+    cache.get_or_download("loc-c", lambda dst: _write_file(dst, "c", 10))
+    assert cache.get("loc-a") is None
@@ -321,3 +321,20 @@ def test_download_artifact_throws_value_error_when_listed_blobs_do_not_contain_a
         repo.download_artifacts("")
 
     assert "Azure blob does not begin with the specified artifact path" in str(exc)
+
+
+def test_delete_artifacts(mock_client):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    blob_names = ["some/path/model/%d" % i for i in range(300)] + ["some/path/model2/a.txt"]
+    mock_client.get_container_client().list_blobs.return_value = [
+        BlobProperties(name=name) for name in blob_names
+    ]
+
+    repo.delete_artifacts("model")
+
+    mock_client.get_container_client().list_blobs.assert_called_with(
+        name_starts_with="some/path/model"
+    )
+    delete_calls = mock_client.get_container_client().delete_blobs.call_args_list
+    assert [len(args) for args, _ in delete_calls] == [256, 44]
+    assert set(sum([list(args) for args, _ in delete_calls], [])) == set(blob_names[:300])
@@ -294,7 +294,7 @@ class TestDatabricksArtifactRepository(object):
         mock_response.status_code = 200
         with mock.patch(
             DATABRICKS_ARTIFACT_REPOSITORY + "._get_write_credentials"
-        ) as write_credentials_mock, mock.patch("requests.put") as request_mock:
+        ) as write_credentials_mock, mock.patch("requests.Session.put") as request_mock:
             mock_credentials = ArtifactCredentialInfo(
                 signed_uri=MOCK_AWS_SIGNED_URI,
                 type=ArtifactCredentialType.AWS_PRESIGNED_URL,
@@ -312,7 +312,7 @@ class TestDatabricksArtifactRepository(object):
     def test_log_artifact_aws_presigned_url_error(self, databricks_artifact_repo, test_file):
         with mock.patch(
             DATABRICKS_ARTIFACT_REPOSITORY + "._get_write_credentials"
-        ) as write_credentials_mock, mock.patch("requests.put") as request_mock:
+        ) as write_credentials_mock, mock.patch("requests.Session.put") as request_mock:
             mock_credentials = ArtifactCredentialInfo(
                 signed_uri=MOCK_AWS_SIGNED_URI, type=ArtifactCredentialType.AWS_PRESIGNED_URL
             )
@@ -566,7 +566,7 @@ class TestDatabricksArtifactRepository(object):
         ) as read_credentials_mock, mock.patch(
             DATABRICKS_ARTIFACT_REPOSITORY + ".list_artifacts"
         ) as get_list_mock, mock.patch(
-            "requests.get"
+            "requests.Session.get"
         ) as request_mock:
             mock_credentials = ArtifactCredentialInfo(
                 signed_uri=MOCK_AZURE_SIGNED_URI, type=ArtifactCredentialType.AZURE_SAS_URI
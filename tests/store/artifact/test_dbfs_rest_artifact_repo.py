@@ -258,6 +258,46 @@ class TestDbfsArtifactRepository(object):
             _, kwargs_call = chronological_download_calls[0]
             assert kwargs_call["endpoint"] == "/dbfs/test/a.txt"
 
+    @pytest.mark.parametrize(
+        "artifact_path, expected_path", [(None, "/test/"), ("dir", "/test/dir")]
+    )
+    def test_delete_artifacts(self, dbfs_artifact_repo, artifact_path, expected_path):
+        # The HTTP session is mocked so that responses go through the retries of http_request
+        with mock.patch("requests.Session.request") as request_mock:
+            request_mock.side_effect = [
+                Mock(status_code=503, text=json.dumps({"error_code": "PARTIAL_DELETE"})),
+                Mock(status_code=503, text=json.dumps({"error_code": "PARTIAL_DELETE"})),
+                Mock(status_code=200, text="{}"),
+            ]
+            dbfs_artifact_repo.delete_artifacts(artifact_path)
+            assert request_mock.call_count == 3
+            for _, kwargs in request_mock.call_args_list:
+                assert kwargs["url"] == "http://host/api/2.0/dbfs/delete"
+                assert kwargs["json"] == {"path": expected_path, "recursive": True}
+
+    def test_delete_artifacts_that_do_not_exist(self, dbfs_artifact_repo):
+        with mock.patch("requests.Session.request") as request_mock:
+            request_mock.return_value = Mock(
+                status_code=404, text=json.dumps({"error_code": "RESOURCE_DOES_NOT_EXIST"})
+            )
+            dbfs_artifact_repo.delete_artifacts()
+            assert request_mock.call_count == 1
+
+    def test_delete_artifacts_error(self, dbfs_artifact_repo):
+        with mock.patch("requests.Session.request") as request_mock:
+            request_mock.return_value = Mock(status_code=403, text="Forbidden")
+            with pytest.raises(MlflowException):
+                dbfs_artifact_repo.delete_artifacts()
+
+    def test_delete_artifacts_retries_internal_errors(self, dbfs_artifact_repo):
+        with mock.patch("requests.Session.request") as request_mock, mock.patch("time.sleep"):
+            request_mock.return_value = Mock(
+                status_code=500, text=json.dumps({"error_code": "INTERNAL_ERROR"})
+            )
+            with pytest.raises(MlflowException, match="failed to return code 200 after 3 tries"):
+                dbfs_artifact_repo.delete_artifacts()
+            assert request_mock.call_count == 3
+
 
 def test_get_host_creds_from_default_store_file_store():
     with mock.patch("mlflow.tracking._tracking_service.utils._get_store") as get_store_mock:
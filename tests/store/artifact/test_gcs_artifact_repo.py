@@ -242,3 +242,22 @@ def test_download_artifacts_downloads_expected_content(gcs_mock, tmpdir):
     dir_contents = os.listdir(tmpdir.strpath)
     assert file_path_1 in dir_contents
     assert file_path_2 in dir_contents
+
+
+def test_delete_artifacts(gcs_mock):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    bucket_mock = gcs_mock.Client.return_value.bucket.return_value
+    blobs = []
+    for name in ["some/path/model/%d" % i for i in range(150)] + ["some/path/model2/a.txt"]:
+        blob = mock.MagicMock()
+        blob.name = name
+        blobs.append(blob)
+    bucket_mock.list_blobs.return_value = blobs
+
+    repo.delete_artifacts("model")
+
+    bucket_mock.list_blobs.assert_called_with(prefix="some/path/model")
+    assert bucket_mock.client.batch.call_count == 2
+    for blob in blobs[:150]:
+        blob.delete.assert_called_once_with()
+    blobs[150].delete.assert_not_called()
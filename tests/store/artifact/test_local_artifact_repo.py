@@ -1,6 +1,7 @@
 import os
 import pytest
 import posixpath
+from unittest import mock
 
 from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
@@ -187,3 +188,74 @@ def test_delete_artifacts(local_artifact_repo):
         assert os.path.exists(os.path.join(local_artifact_repo._artifact_dir, "b.txt"))
         local_artifact_repo.delete_artifacts()
         assert not os.path.exists(os.path.join(local_artifact_repo._artifact_dir))
+
+
+def test_sync_upload_artifacts_only_uploads_changed_files(local_artifact_repo, tmpdir_factory):
+    local_dir = tmpdir_factory.mktemp("checkpoint")
+    local_dir.join("weights.bin").write("weights-v1")
+    local_dir.mkdir("nested").join("config.json").write("{}")
+
+    uploaded = local_artifact_repo.sync_upload_artifacts(str(local_dir), "ckpt")
+    assert uploaded == ["nested/config.json", "weights.bin"]
+
+    with mock.patch.object(
+        local_artifact_repo, "log_artifact", wraps=local_artifact_repo.log_artifact
+    ) as log_artifact_mock:
+        assert local_artifact_repo.sync_upload_artifacts(str(local_dir), "ckpt") == []
+        log_artifact_mock.assert_not_called()
+
+    local_dir.join("weights.bin").write("weights-v2")
+    assert local_artifact_repo.sync_upload_artifacts(str(local_dir), "ckpt") == ["weights.bin"]
+    assert open(local_artifact_repo.download_artifacts("ckpt/weights.bin")).read() == "weights-v2"
+
+
+def test_sync_upload_artifacts_reuploads_files_modified_remotely(
+    local_artifact_repo, tmpdir_factory
+):
+    local_dir = tmpdir_factory.mktemp("checkpoint")
+    local_dir.join("a.txt").write("A")
+    local_artifact_repo.sync_upload_artifacts(str(local_dir))
+
+    with open(os.path.join(local_artifact_repo.artifact_dir, "a.txt"), "w") as f:
+        f.write("modified")
+    assert local_artifact_repo.sync_upload_artifacts(str(local_dir)) == ["a.txt"]
+    assert open(local_artifact_repo.download_artifacts("a.txt")).read() == "A"
+
+
+def test_sync_download_artifacts_only_downloads_changed_files(local_artifact_repo, tmpdir_factory):
+    local_dir = tmpdir_factory.mktemp("model")
+    local_dir.join("a.txt").write("A")
+    local_dir.mkdir("nested").join("b.txt").write("B")
+    local_artifact_repo.sync_upload_artifacts(str(local_dir), "model")
+
+    dst_dir = tmpdir_factory.mktemp("dst")
+    with mock.patch.object(
+        local_artifact_repo, "_download_file", wraps=local_artifact_repo._download_file
+    ) as download_file_mock:
+        dst_path = local_artifact_repo.sync_download_artifacts("model", str(dst_dir))
+        assert dst_path == os.path.join(str(dst_dir), "model")
+        assert open(os.path.join(dst_path, "a.txt")).read() == "A"
+        assert open(os.path.join(dst_path, "nested", "b.txt")).read() == "B"
+        downloaded = {c[1]["remote_file_path"] for c in download_file_mock.call_args_list}
+        assert downloaded == {"model/.mlflow-manifest.json", "model/a.txt", "model/nested/b.txt"}
+
+        download_file_mock.reset_mock()
+        local_dir.join("a.txt").write("A2")
+        local_artifact_repo.sync_upload_artifacts(str(local_dir), "model")
+        local_artifact_repo.sync_download_artifacts("model", str(dst_dir))
+        downloaded = {c[1]["remote_file_path"] for c in download_file_mock.call_args_list}
+        assert downloaded == {"model/.mlflow-manifest.json", "model/a.txt"}
+        assert open(os.path.join(dst_path, "a.txt")).read() == "A2"
+
+
+def test_sync_download_artifacts_without_manifest_downloads_everything(
+    local_artifact_repo, tmpdir_factory
+):
+    local_dir = tmpdir_factory.mktemp("model")
+    local_dir.join("a.txt").write("A")
+    local_artifact_repo.log_artifacts(str(local_dir), "model")
+
+    dst_dir = tmpdir_factory.mktemp("dst")
+    dst_dir.mkdir("model").join("a.txt").write("stale")
+    dst_path = local_artifact_repo.sync_download_artifacts("model", str(dst_dir))
+    assert open(os.path.join(dst_path, "a.txt")).read() == "A"
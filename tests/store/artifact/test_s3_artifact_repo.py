@@ -1,6 +1,7 @@
 import os
 import posixpath
 import tarfile
+from unittest import mock
 
 import pytest
 
@@ -194,6 +195,57 @@ def test_download_file_artifact_succeeds_when_artifact_root_is_s3_bucket_root(
         assert f.read() == file_a_text
 
 
+def test_large_file_artifact_is_downloaded_in_ranges(s3_artifact_root, tmpdir, monkeypatch):
+    monkeypatch.setenv("MLFLOW_PARALLEL_DOWNLOAD_CHUNK_SIZE", str(5 * 1024 * 1024))
+    monkeypatch.setenv("MLFLOW_PARALLEL_DOWNLOAD_MAX_WORKERS", "4")
+    config = S3ArtifactRepository._get_s3_download_config()
+    assert config.multipart_chunksize == 5 * 1024 * 1024
+    assert config.max_concurrency == 4
+
+    content = os.urandom(12 * 1024 * 1024)
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    bucket, _ = repo.parse_s3_uri(s3_artifact_root)
+    repo._get_s3_client().put_object(Bucket=bucket, Key="some/path/weights.bin", Body=content)
+    with open(repo.download_artifacts("weights.bin", dst_path=str(tmpdir)), "rb") as f:
+        assert f.read() == content
+
+
+def test_delete_artifacts(s3_artifact_root, tmpdir):
+    subdir = tmpdir.mkdir("subdir")
+    subdir.join("a.txt").write("A")
+    subdir.mkdir("nested").join("b.txt").write("B")
+    tmpdir.join("c.txt").write("C")
+
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    repo.log_artifacts(subdir.strpath, "subdir")
+    repo.log_artifacts(subdir.strpath, "subdir2")
+    repo.log_artifact(tmpdir.join("c.txt").strpath)
+
+    repo.delete_artifacts("subdir")
+    assert [f.path for f in repo.list_artifacts()] == ["c.txt", "subdir2"]
+    repo.delete_artifacts("c.txt")
+    assert [f.path for f in repo.list_artifacts()] == ["subdir2"]
+    repo.delete_artifacts()
+    assert repo.list_artifacts() == []
+
+
+def test_delete_artifacts_uses_batch_requests(s3_artifact_root, tmpdir):
+    for i in range(1005):
+        tmpdir.join("%d.txt" % i).write("x")
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    repo.log_artifacts(tmpdir.strpath)
+
+    s3_client = repo._get_s3_client()
+    with mock.patch.object(repo, "_get_s3_client", return_value=s3_client), mock.patch.object(
+        s3_client, "delete_objects", wraps=s3_client.delete_objects
+    ) as delete_objects_mock:
+        repo.delete_artifacts()
+    assert [
+        len(kwargs["Delete"]["Objects"]) for _, kwargs in delete_objects_mock.call_args_list
+    ] == [1000, 5]
+    assert repo.list_artifacts() == []
+
+
 def test_get_s3_file_upload_extra_args():
     os.environ.setdefault(
         "MLFLOW_S3_UPLOAD_EXTRA_ARGS",
@@ -0,0 +1,128 @@
+import math
+
+import pandas as pd
+import pytest
+
+from mlflow.entities import Metric, Param, Run, RunData, RunInfo, RunTag
+from mlflow.store.entities.run_batch import RunBatch
+
+
+def _create_run(index, metrics=(), params=(), tags=()):
+    run_info = RunInfo(
+        run_uuid="run%d" % index,
+        run_id="run%d" % index,
+        experiment_id="0",
+        user_id="user",
+        status="FINISHED",
+        start_time=1000 * index,
+        end_time=None if index % 2 else 1000 * index + 500,
+        lifecycle_stage="active",
+        artifact_uri="artifacts/%d" % index,
+    )
+    run_data = RunData(
+        metrics=[Metric(key, value, 10 * index, step) for key, value, step in metrics],
+        params=[Param(key, value) for key, value in params],
+        tags=[RunTag(key, value) for key, value in tags],
+    )
+    return Run(run_info, run_data)
+
+
+@pytest.fixture
+def runs():
+    return [
+        _create_run(0, metrics=[("m1", 1.0, 0), ("m1", 2.0, 1)], params=[("p", "a")]),
+        _create_run(1, metrics=[("m2", 3.0, 0)], tags=[("t", "x")]),
+        _create_run(2),
+        _create_run(3, metrics=[("m1", 4.0, 0)], params=[("p", "b")], tags=[("t", "y")]),
+    ]
+
+
+def _assert_runs_equal(run1, run2):
+    assert run1.info == run2.info
+    assert run1.data.metrics == run2.data.metrics
+    assert run1.data.params == run2.data.params
+    assert run1.data.tags == run2.data.tags
+    assert sorted((m.key, m.value, m.timestamp, m.step) for m in run1.data._metric_objs) == sorted(
+        (m.key, m.value, m.timestamp, m.step) for m in run2.data._metric_objs
+    )
+
+
+def test_run_batch_materializes_runs(runs):
+    batch = RunBatch(runs, token="token")
+    assert len(batch) == 4
+    assert batch.token == "token"
+    assert batch.run_ids == ["run0", "run1", "run2", "run3"]
+    for run, batch_run in zip(runs, batch):
+        _assert_runs_equal(run, batch_run)
+    _assert_runs_equal(batch[-1], runs[3])
+    assert [run.info.run_id for run in batch[1:3]] == ["run1", "run2"]
+    with pytest.raises(IndexError):
+        batch[4]
+
+
+def test_run_batch_to_proto_matches_entities(runs):
+    batch = RunBatch(runs)
+    for run, proto in zip(runs, batch.to_proto()):
+        _assert_runs_equal(run, Run.from_proto(proto))
+        assert proto.info == run.info.to_proto()
+
+
+def test_run_batch_from_protos(runs):
+    protos = [run.to_proto() for run in runs]
+    batch = RunBatch()
+    batch.extend_protos(protos)
+    assert batch.to_proto() == RunBatch(runs).to_proto()
+    for run, batch_run in zip(runs, batch):
+        _assert_runs_equal(run, batch_run)
+
+    # Runs with unexpanded protobuf run data are added without expanding it
+    proto_runs = [Run.from_proto(proto) for proto in protos]
+    batch = RunBatch(proto_runs)
+    assert all(run.data._proto is not None for run in proto_runs)
+    assert batch.to_proto() == protos
+
+
+def test_run_batch_to_pandas(runs):
+    df = RunBatch(runs).to_pandas()
+    assert list(df.columns) == [
+        "run_id",
+        "experiment_id",
+        "status",
+        "artifact_uri",
+        "start_time",
+        "end_time",
+        "metrics.m1",
+        "metrics.m2",
+        "params.p",
+        "tags.t",
+    ]
+    assert list(df["run_id"]) == ["run0", "run1", "run2", "run3"]
+    assert df["start_time"][1] == pd.to_datetime(1000, unit="ms", utc=True)
+    assert pd.isnull(df["end_time"][1])
+    assert df["end_time"][2] == pd.to_datetime(2500, unit="ms", utc=True)
+    assert list(df["metrics.m1"])[0] == 2.0
+    assert math.isnan(list(df["metrics.m1"])[1])
+    assert list(df["metrics.m1"])[3] == 4.0
+    assert list(df["params.p"]) == ["a", None, None, "b"]
+    assert list(df["tags.t"]) == [None, "x", None, "y"]
+
+
+def test_run_batch_extend_with_batch(runs):
+    batch = RunBatch(runs[:1])
+    batch.extend(RunBatch(runs[1:]))
+    assert batch.to_proto() == RunBatch(runs).to_proto()
+    pd.testing.assert_frame_equal(batch.to_pandas(), RunBatch(runs).to_pandas())
+
+
+def test_run_batch_to_arrow(runs):
+    pytest.importorskip("pyarrow")
+    batch = RunBatch(runs)
+    pd.testing.assert_frame_equal(batch.to_arrow().to_pandas(), batch.to_pandas())
+
+
+def test_empty_run_batch():
+    batch = RunBatch()
+    assert len(batch) == 0
+    assert list(batch) == []
+    assert batch.to_proto() == []
+    assert len(batch.to_pandas()) == 0
@@ -35,7 +35,7 @@ from mlflow.utils.rest_utils import MlflowHostCreds
 
 @pytest.fixture(scope="class")
 def request_fixture():
-    with mock.patch("requests.request") as request_mock:
+    with mock.patch("requests.Session.request") as request_mock:
         response = mock.MagicMock
         response.status_code = 200
         response.text = "{}"
@@ -57,11 +57,13 @@ class TestRestStore(unittest.TestCase):
             "host_creds": host_creds,
             "endpoint": "/api/2.0/preview/mlflow/%s" % endpoint,
             "method": method,
+            "extra_headers": {"Accept": "application/x-protobuf, application/json;q=0.9"},
         }
         if method == "GET":
             res["params"] = json.loads(json_body)
         else:
-            res["json"] = json.loads(json_body)
+            res["data"] = json.dumps(json.loads(json_body), separators=(",", ":")).encode("utf-8")
+            res["extra_headers"]["Content-Type"] = "application/json"
         return res
 
     def _verify_requests(self, http_request, endpoint, method, proto_message):
@@ -304,6 +306,22 @@ class TestRestStore(unittest.TestCase):
             mock_http, "model-versions/search", "GET", SearchModelVersions(filter="name='model_12'")
         )
 
+        params = {
+            "filter": "tags.key = 'value' AND current_stage = 'Staging'",
+            "max_results": 10,
+            "order_by": ["creation_timestamp DESC"],
+            "page_token": "12345abcde",
+        }
+        self.store.search_model_versions(
+            filter_string=params["filter"],
+            max_results=params["max_results"],
+            order_by=params["order_by"],
+            page_token=params["page_token"],
+        )
+        self._verify_requests(
+            mock_http, "model-versions/search", "GET", SearchModelVersions(**params)
+        )
+
     @mock.patch("mlflow.utils.rest_utils.http_request")
     def test_set_model_version_tag(self, mock_http):
         name = "model_1"
@@ -326,3 +344,28 @@ class TestRestStore(unittest.TestCase):
             "DELETE",
             DeleteModelVersionTag(name=name, version="1", key="key"),
         )
+
+    @mock.patch("mlflow.store.model_registry.rest_store.http_request")
+    def test_get_registry_changes(self, mock_http):
+        mock_http.return_value.status_code = 200
+        mock_http.return_value.text = json.dumps(
+            {"revision": 12, "registered_model_names": ["model_1", "model_2"]}
+        )
+        assert self.store.get_registry_changes(since_revision=7, timeout=10) == (
+            12,
+            ["model_1", "model_2"],
+        )
+        mock_http.assert_called_once_with(
+            host_creds=self.creds,
+            endpoint="/api/2.0/preview/mlflow/registry/changes",
+            method="GET",
+            params={"since_revision": 7, "timeout": 10},
+            timeout=70,
+        )
+
+    @mock.patch("mlflow.store.model_registry.rest_store.http_request")
+    def test_get_registry_changes_is_not_implemented_by_earlier_servers(self, mock_http):
+        mock_http.return_value.status_code = 404
+        mock_http.return_value.text = "<html>Not Found</html>"
+        with self.assertRaisesRegex(NotImplementedError, "change feed is not supported"):
+            self.store.get_registry_changes(since_revision=7)
@@ -3,8 +3,11 @@ import unittest
 
 import tempfile
 from unittest import mock
+import time
 import uuid
 
+import sqlalchemy
+
 import mlflow
 import mlflow.db
 import mlflow.store.db.base_sql_model
@@ -342,6 +345,72 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase):
             {"None": 1, "Production": 2, "Staging": 4},
         )
 
+    def test_get_latest_versions_for_stages(self):
+        name = "test_for_latest_versions_for_stages"
+        self._rm_maker(name)
+        for stage in ["Production", "Staging", "Production", "None", "Archived"]:
+            mv = self._mv_maker(name, tags=[ModelVersionTag("stage", stage)])
+            self.store.transition_model_version_stage(
+                name=mv.name, version=mv.version, stage=stage, archive_existing_versions=False
+            )
+        self.store.delete_model_version(name=name, version=3)
+
+        latest_versions = self.store.get_latest_versions(name)
+        self.assertEqual(
+            self._extract_latest_by_stage(latest_versions), {"Production": 1, "Staging": 2}
+        )
+        self.assertEqual(latest_versions[0].tags, {"stage": "Production"})
+        self.assertEqual(
+            self._extract_latest_by_stage(self.store.get_latest_versions(name, ["archived"])),
+            {"Archived": 5},
+        )
+
+    def _count_queries(self, fn):
+        statements = []
+
+        def before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):  # pylint: disable=unused-argument
+            statements.append(statement)
+
+        sqlalchemy.event.listen(self.store.engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            fn()
+        finally:
+            sqlalchemy.event.remove(
+                self.store.engine, "before_cursor_execute", before_cursor_execute
+            )
+        return len(statements)
+
+    def test_search_registered_models_uses_constant_number_of_queries(self):
+        def create_models(prefix, num_models, num_versions):
+            for i in range(num_models):
+                name = "{}-{}".format(prefix, i)
+                self._rm_maker(name, tags=[RegisteredModelTag("key", "value")])
+                for _ in range(num_versions):
+                    mv = self._mv_maker(name, tags=[ModelVersionTag("key", "value")])
+                self.store.transition_model_version_stage(
+                    name=name, version=mv.version, stage="Staging", archive_existing_versions=False
+                )
+
+        create_models("small", 1, 1)
+        num_queries = self._count_queries(
+            lambda: self.store.search_registered_models("name LIKE 'small%'")
+        )
+        create_models("large", 10, 5)
+
+        def search_large_models():
+            rms = self.store.search_registered_models("name LIKE 'large%'")
+            self.assertEqual(len(rms), 10)
+            for rm in rms:
+                self.assertEqual(rm.tags, {"key": "value"})
+                self.assertEqual(
+                    self._extract_latest_by_stage(rm.latest_versions), {"None": 4, "Staging": 5}
+                )
+                self.assertEqual([mv.tags for mv in rm.latest_versions], [{"key": "value"}] * 2)
+
+        self.assertEqual(self._count_queries(search_large_models), num_queries)
+
     def test_set_registered_model_tag(self):
         name1 = "SetRegisteredModelTag_TestMod"
         name2 = "SetRegisteredModelTag_TestMod 2"
@@ -764,15 +833,23 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase):
         assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
         assert "ill-formed list" in exception_context.exception.message
 
-        # search using the IN operator is not allowed with other additional filters
-        with self.assertRaises(MlflowException) as exception_context:
+        # search using the IN operator can be combined with other filters
+        self.assertEqual(
             search_versions(
                 "name='{name}]' AND run_id IN ('{run_id_1}','{run_id_2}')".format(
                     name=name, run_id_1=run_id_1, run_id_2=run_id_2
                 )
-            )
-        assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
-        assert "contains multiple expressions" in exception_context.exception.message
+            ),
+            [],
+        )
+        self.assertEqual(
+            search_versions(
+                "name='{name}' AND run_id IN ('{run_id_1}', '{run_id_2}')".format(
+                    name=name, run_id_1=run_id_1, run_id_2=run_id_2
+                )
+            ),
+            [1, 2, 3],
+        )
 
         # search using source_path "A/D" should return version 3 and 4
         self.assertEqual(set(search_versions("source_path = 'A/D'")), set([3, 4]))
@@ -808,6 +885,163 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase):
         assert mvds[0].source == "A/B"
         assert mvds[0].description == "Online prediction model!"
 
+    def test_search_model_versions_filters(self):
+        run_id_1 = uuid.uuid4().hex
+        run_id_2 = uuid.uuid4().hex
+        for name in ["model_a", "model_b"]:
+            self._rm_maker(name)
+            self._mv_maker(name, "A/B", run_id_1, [ModelVersionTag("team", "x")])
+            self._mv_maker(name, "A/C", run_id_2, [ModelVersionTag("team", "y")])
+            self._mv_maker(name, "B/C", run_id_2)
+        self.store.transition_model_version_stage("model_a", 2, "Production", False)
+        self.store.transition_model_version_stage("model_b", 3, "Staging", False)
+        self.store.delete_model_version("model_b", 1)
+
+        def search_versions(filter_string):
+            return [(mv.name, mv.version) for mv in self.store.search_model_versions(filter_string)]
+
+        assert search_versions("current_stage = 'production'") == [("model_a", 2)]
+        assert search_versions("current_stage != 'None'") == [("model_a", 2), ("model_b", 3)]
+        assert search_versions("current_stage IN ('Staging', 'Production')") == [
+            ("model_a", 2),
+            ("model_b", 3),
+        ]
+        assert search_versions("tags.team = 'x'") == [("model_a", 1)]
+        assert search_versions("tags.team != 'x'") == [("model_a", 2), ("model_b", 2)]
+        assert search_versions("tags.`team` LIKE '%'") == [
+            ("model_a", 1),
+            ("model_a", 2),
+            ("model_b", 2),
+        ]
+        assert search_versions("name = 'model_b' AND tags.team = 'y'") == [("model_b", 2)]
+        assert search_versions("name LIKE '%_b' AND version_number > 1") == [
+            ("model_b", 2),
+            ("model_b", 3),
+        ]
+        assert search_versions("name != 'model_a' AND source_path ILIKE 'a/%'") == [("model_b", 2)]
+        assert search_versions("run_id != '{}' AND version_number <= 2".format(run_id_1)) == [
+            ("model_a", 2),
+            ("model_b", 2),
+        ]
+
+        mv = self.store.get_model_version("model_a", 2)
+        assert search_versions("creation_timestamp < 0") == []
+        for filter_string, matches in [
+            (
+                "creation_timestamp >= {}".format(mv.creation_timestamp),
+                lambda other: other.creation_timestamp >= mv.creation_timestamp,
+            ),
+            (
+                "last_updated_timestamp < {}".format(mv.last_updated_timestamp),
+                lambda other: other.last_updated_timestamp < mv.last_updated_timestamp,
+            ),
+        ]:
+            expected = [
+                (other.name, other.version)
+                for other in self.store.search_model_versions(None)
+                if matches(other)
+            ]
+            assert search_versions(filter_string) == expected
+        assert ("model_a", 2) in search_versions(
+            "creation_timestamp = {}".format(mv.creation_timestamp)
+        )
+
+        for filter_string, message in [
+            ("tags.team > 'x'", "Invalid comparator '>'"),
+            ("current_stage LIKE 'Prod%'", "Invalid comparator 'LIKE'"),
+            ("version_number = '1'", "Expected an integer value"),
+            ("params.team = 'x'", "Invalid entity type"),
+            ("status = 'READY'", "Invalid attribute key"),
+            ("current_stage = 'Deployed'", "Invalid Model Version stage"),
+            ("name = 'model_a' OR name = 'model_b'", "Invalid clause"),
+            ("name = 'model_a' AND", "Invalid filter"),
+        ]:
+            with self.assertRaises(MlflowException) as exception_context:
+                search_versions(filter_string)
+            assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+            assert message in exception_context.exception.message
+
+    def test_search_model_versions_order_by_and_pagination(self):
+        for name in ["model_b", "model_a", "model_c"]:
+            self._rm_maker(name)
+            for _ in range(4):
+                self._mv_maker(name)
+        self.store.delete_model_version("model_c", 2)
+
+        def search_all_pages(max_results, order_by=None):
+            versions = []
+            page_token = None
+            while True:
+                result = self.store.search_model_versions(
+                    None, max_results=max_results, order_by=order_by, page_token=page_token
+                )
+                assert len(result) <= max_results
+                versions.extend((mv.name, mv.version) for mv in result)
+                page_token = result.token
+                if not page_token:
+                    return versions
+
+        # Model versions are ordered by name, then by version by default
+        expected = [
+            (name, version)
+            for name in ["model_a", "model_b", "model_c"]
+            for version in range(1, 5)
+            if (name, version) != ("model_c", 2)
+        ]
+        for max_results in [1, 2, 5, 11, 100]:
+            assert search_all_pages(max_results) == expected
+        assert search_all_pages(3, ["version_number DESC"]) == sorted(
+            expected, key=lambda mv: (-mv[1], mv[0])
+        )
+        assert search_all_pages(4, ["name DESC", "version_number DESC"]) == expected[::-1]
+        assert search_all_pages(5, ["creation_timestamp ASC"]) == [
+            mv
+            for mv in sorted(
+                self.store.search_model_versions(None),
+                key=lambda mv: (mv.creation_timestamp, mv.name, mv.version),
+            )
+            for mv in [(mv.name, mv.version)]
+        ]
+
+        # Pages stay consistent when model versions of previous pages are deleted
+        first_page = self.store.search_model_versions(None, max_results=2)
+        self.store.delete_model_version("model_a", 1)
+        second_page = self.store.search_model_versions(
+            None, max_results=2, page_token=first_page.token
+        )
+        assert [(mv.name, mv.version) for mv in second_page] == [("model_a", 3), ("model_a", 4)]
+
+        # Page tokens can only be used with the ordering of the search that created them
+        with self.assertRaises(MlflowException) as exception_context:
+            self.store.search_model_versions(
+                None, max_results=2, order_by=["name DESC"], page_token=first_page.token
+            )
+        assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+        with self.assertRaises(MlflowException) as exception_context:
+            self.store.search_model_versions(None, page_token="not a token")
+        assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+        for order_by in [["status ASC"], ["name ASC", "name DESC"]]:
+            with self.assertRaises(MlflowException) as exception_context:
+                self.store.search_model_versions(None, order_by=order_by)
+            assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+        for max_results in [0, 200001]:
+            with self.assertRaises(MlflowException) as exception_context:
+                self.store.search_model_versions(None, max_results=max_results)
+            assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+    def test_search_model_versions_uses_constant_number_of_queries(self):
+        for name in ["model_1", "model_2"]:
+            self._rm_maker(name)
+            self._mv_maker(name, tags=[ModelVersionTag("key", "value")])
+
+        num_queries = self._count_queries(lambda: self.store.search_model_versions(None))
+        for name in ["model_3", "model_4", "model_5"]:
+            self._rm_maker(name)
+            for _ in range(3):
+                self._mv_maker(name, tags=[ModelVersionTag("key", "value")])
+        assert self._count_queries(lambda: self.store.search_model_versions(None)) == num_queries
+
     def _search_registered_models(
         self, filter_string, max_results=10, order_by=None, page_token=None
     ):
@@ -1258,3 +1492,78 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase):
         with self.assertRaises(MlflowException) as exception_context:
             self.store.delete_model_version_tag(name1, "I am not a version", "key")
         assert exception_context.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+    def test_get_registry_changes(self):
+        revision, names = self.store.get_registry_changes(since_revision=None)
+        assert revision == 0
+        assert names == []
+
+        self._rm_maker("model 1")
+        self._rm_maker("model 2")
+        self._mv_maker("model 1")
+        revision_1, names = self.store.get_registry_changes(since_revision=revision)
+        assert revision_1 > revision
+        assert names == ["model 1", "model 2"]
+        assert self.store.get_registry_revision() == revision_1
+
+        # No changes since the latest revision
+        assert self.store.get_registry_changes(since_revision=revision_1) == (revision_1, [])
+        assert self.store.get_registry_changes(since_revision=None) == (revision_1, [])
+
+        self.store.transition_model_version_stage("model 1", 1, "Production", False)
+        self.store.set_registered_model_tag("model 2", RegisteredModelTag("key", "value"))
+        revision_2, names = self.store.get_registry_changes(since_revision=revision_1)
+        assert revision_2 > revision_1
+        assert names == ["model 1", "model 2"]
+
+        # Renames report both the old and the new name
+        self.store.rename_registered_model("model 2", "model 3")
+        revision_3, names = self.store.get_registry_changes(since_revision=revision_2)
+        assert names == ["model 2", "model 3"]
+
+        self.store.delete_model_version("model 1", 1)
+        self.store.delete_registered_model("model 3")
+        revision_4, names = self.store.get_registry_changes(since_revision=revision_3)
+        assert revision_4 > revision_3
+        assert names == ["model 1", "model 3"]
+
+        # Failed mutations are not recorded
+        with self.assertRaises(MlflowException):
+            self.store.update_registered_model("model 3", "description")
+        assert self.store.get_registry_revision() == revision_4
+
+    def test_get_registry_changes_waits_for_changes(self):
+        self._rm_maker("model")
+        revision = self.store.get_registry_revision()
+        with mock.patch(
+            "mlflow.store.model_registry.sqlalchemy_store._REGISTRY_CHANGES_POLL_INTERVAL_SECONDS",
+            0.01,
+        ), mock.patch("time.sleep") as sleep_mock:
+            sleep_mock.side_effect = lambda _: self.store.update_registered_model(
+                "model", "description"
+            )
+            new_revision, names = self.store.get_registry_changes(revision, timeout=5)
+        sleep_mock.assert_called_once_with(0.01)
+        assert new_revision > revision
+        assert names == ["model"]
+
+        start = time.time()
+        assert self.store.get_registry_changes(new_revision, timeout=0.1) == (new_revision, [])
+        assert time.time() - start >= 0.1
+
+    def test_old_registry_changes_are_pruned(self):
+        self._rm_maker("model 1")
+        self._rm_maker("model 2")
+        revision = self.store.get_registry_revision()
+        # Changes are pruned at most once per interval
+        self.store._last_registry_changes_pruning_time = 0
+        two_days_later = int(time.time() * 1000) + 2 * 24 * 60 * 60 * 1000
+        with mock.patch(
+            "mlflow.store.model_registry.sqlalchemy_store.now", return_value=two_days_later
+        ):
+            self._rm_maker("model 3")
+            self._rm_maker("model 4")
+        new_revision, names = self.store.get_registry_changes(since_revision=0)
+        assert new_revision > revision
+        assert names == ["model 3", "model 4"]
+        assert self.store.get_registry_revision() == new_revision
@@ -1,9 +1,10 @@
 from unittest import mock
 
 from mlflow.store.entities.paged_list import PagedList
+from mlflow.store.entities.run_batch import RunBatch
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.store.tracking.abstract_store import AbstractStore
-from mlflow.entities import ViewType
+from mlflow.entities import Run, RunInfo, ViewType
 
 
 class AbstractStoreTestImpl(AbstractStore):
@@ -152,3 +153,23 @@ def test_search_runs():
         store._search_runs.assert_called_once_with(
             [experiment_id], None, view_type, SEARCH_MAX_RESULTS_DEFAULT, None, None
         )
+
+
+def test_search_runs_batch():
+    runs = [
+        Run(RunInfo("run%d" % i, "run%d" % i, "0", "user", "FINISHED", i, None, "active"), None)
+        for i in range(2)
+    ]
+    token = "adfoiweroh12334kj129318934u"
+
+    with mock.patch.object(
+        AbstractStoreTestImpl, "search_runs", return_value=PagedList(runs, token)
+    ):
+        store = AbstractStoreTestImpl()
+        result = store.search_runs_batch(["0"], None, ViewType.ACTIVE_ONLY)
+        assert isinstance(result, RunBatch)
+        assert result.run_ids == ["run0", "run1"]
+        assert result.token == token
+        store.search_runs.assert_called_once_with(
+            ["0"], None, ViewType.ACTIVE_ONLY, SEARCH_MAX_RESULTS_DEFAULT, None, None
+        )
@@ -0,0 +1,197 @@
+import gzip
+import json
+import os
+
+import pytest
+
+from mlflow.entities import (
+    ExperimentTag,
+    LifecycleStage,
+    Metric,
+    Param,
+    RunStatus,
+    RunTag,
+    ViewType,
+)
+from mlflow.exceptions import MlflowException
+from mlflow.store.tracking import archive
+from mlflow.store.tracking.archive import export_experiments, import_experiments
+from mlflow.store.tracking.file_store import FileStore
+from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
+from mlflow.utils.mlflow_tags import MLFLOW_PARENT_RUN_ID
+from mlflow.utils.validation import MAX_METRICS_PER_BATCH
+
+
+@pytest.fixture
+def file_store(tmpdir):
+    return FileStore(str(tmpdir.join("mlruns")), str(tmpdir.join("artifacts")))
+
+
+@pytest.fixture
+def sqlite_store(tmpdir):
+    return SqlAlchemyStore(
+        "sqlite:///%s" % tmpdir.join("mlflow.db"), str(tmpdir.join("sql_artifacts"))
+    )
+
+
+def _get_runs(store, experiment_id):
+    runs = store.search_runs([experiment_id], None, ViewType.ALL)
+    return sorted(runs, key=lambda run: run.info.start_time)
+
+
+def _metric_history(store, run):
+    return sorted(
+        (m.key, m.value, m.timestamp, m.step)
+        for key in run.data.metrics
+        for m in store.get_metric_history(run.info.run_id, key)
+    )
+
+
+def _read_records(path):
+    with gzip.open(os.path.join(path, archive.RECORDS_FILE_NAME), "rt") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_export_import_round_trip(file_store, sqlite_store, tmpdir):
+    experiment_id = file_store.create_experiment("exp")
+    file_store.set_experiment_tag(experiment_id, ExperimentTag("team", "a"))
+    parent = file_store.create_run(experiment_id, "user", 1, [])
+    file_store.log_batch(
+        parent.info.run_id,
+        metrics=[Metric("loss", float(i), i, i) for i in range(MAX_METRICS_PER_BATCH)],
+        params=[],
+        tags=[],
+    )
+    file_store.log_batch(
+        parent.info.run_id,
+        metrics=[],
+        params=[Param("p%d" % i, str(i)) for i in range(100)],
+        tags=[RunTag("t", "v")],
+    )
+    # Metrics and params are exported and imported in several batches
+    file_store.log_batch(
+        parent.info.run_id,
+        metrics=[Metric("loss", float(i), i, i) for i in range(MAX_METRICS_PER_BATCH, 1005)],
+        params=[Param("p%d" % i, str(i)) for i in range(100, 150)],
+        tags=[],
+    )
+    file_store.update_run_info(parent.info.run_id, RunStatus.FINISHED, 10)
+    child = file_store.create_run(experiment_id, "user2", 2, [])
+    file_store.log_batch(
+        child.info.run_id,
+        metrics=[Metric("acc", 0.5, 3, 0), Metric("acc", float("nan"), 4, 1)],
+        params=[],
+        tags=[RunTag(MLFLOW_PARENT_RUN_ID, parent.info.run_id)],
+    )
+    path = str(tmpdir.join("archive"))
+    export_experiments(file_store, path, experiment_ids=[experiment_id])
+    records = _read_records(path)
+    assert [record["type"] for record in records] == [
+        "header",
+        "experiment",
+        "run",
+        "metrics",
+        "metrics",
+        "run",
+        "metrics",
+    ]
+
+    run_ids = import_experiments(sqlite_store, path)
+    assert set(run_ids) == {parent.info.run_id, child.info.run_id}
+    experiment = sqlite_store.get_experiment_by_name("exp")
+    assert experiment.tags == {"team": "a"}
+    imported_parent, imported_child = _get_runs(sqlite_store, experiment.experiment_id)
+    assert imported_parent.info.run_id == run_ids[parent.info.run_id]
+    assert imported_parent.info.user_id == "user"
+    assert imported_parent.info.status == "FINISHED"
+    assert imported_parent.info.end_time == 10
+    assert imported_parent.data.params == file_store.get_run(parent.info.run_id).data.params
+    assert imported_parent.data.tags["t"] == "v"
+    assert _metric_history(sqlite_store, imported_parent) == _metric_history(
+        file_store, file_store.get_run(parent.info.run_id)
+    )
+    assert imported_child.info.status == "RUNNING"
+    assert imported_child.data.tags[MLFLOW_PARENT_RUN_ID] == imported_parent.info.run_id
+    assert len(sqlite_store.get_metric_history(imported_child.info.run_id, "acc")) == 2
+
+
+def test_import_resolves_parents_imported_after_their_children(file_store, sqlite_store, tmpdir):
+    child = file_store.create_run("0", "user", 1, [])
+    parent = file_store.create_run("0", "user", 2, [])
+    file_store.set_tag(child.info.run_id, RunTag(MLFLOW_PARENT_RUN_ID, parent.info.run_id))
+    path = str(tmpdir.join("archive"))
+    export_experiments(file_store, path, experiment_ids=["0"])
+    run_ids = import_experiments(sqlite_store, path)
+    imported_child = sqlite_store.get_run(run_ids[child.info.run_id])
+    assert imported_child.data.tags[MLFLOW_PARENT_RUN_ID] == run_ids[parent.info.run_id]
+
+
+def test_import_preserves_deleted_runs_and_experiments(file_store, sqlite_store, tmpdir):
+    experiment_id = file_store.create_experiment("deleted")
+    run = file_store.create_run(experiment_id, "user", 1, [])
+    file_store.log_batch(run.info.run_id, metrics=[Metric("m", 1, 1, 0)], params=[], tags=[])
+    file_store.delete_run(run.info.run_id)
+    file_store.delete_experiment(experiment_id)
+    path = str(tmpdir.join("archive"))
+    export_experiments(file_store, path)
+    run_ids = import_experiments(sqlite_store, path)
+    imported_run = sqlite_store.get_run(run_ids[run.info.run_id])
+    assert imported_run.info.lifecycle_stage == LifecycleStage.DELETED
+    assert imported_run.data.metrics == {"m": 1}
+    experiment = sqlite_store.get_experiment_by_name("deleted")
+    assert experiment.lifecycle_stage == LifecycleStage.DELETED
+
+
+def test_import_of_deleted_experiment_keeps_active_experiment_with_same_name(
+    file_store, sqlite_store, tmpdir
+):
+    experiment_id = file_store.create_experiment("exp")
+    run = file_store.create_run(experiment_id, "user", 1, [])
+    file_store.delete_experiment(experiment_id)
+    target_experiment_id = sqlite_store.create_experiment("exp")
+    existing_run = sqlite_store.create_run(target_experiment_id, "user", 1, [])
+    path = str(tmpdir.join("archive"))
+    export_experiments(file_store, path, experiment_ids=[experiment_id])
+    run_ids = import_experiments(sqlite_store, path)
+    experiment = sqlite_store.get_experiment(target_experiment_id)
+    assert experiment.lifecycle_stage == LifecycleStage.ACTIVE
+    imported_run = sqlite_store.get_run(run_ids[run.info.run_id])
+    assert imported_run.info.experiment_id == target_experiment_id
+    assert imported_run.info.lifecycle_stage == LifecycleStage.DELETED
+    existing_run = sqlite_store.get_run(existing_run.info.run_id)
+    assert existing_run.info.lifecycle_stage == LifecycleStage.ACTIVE
+
+
+def test_import_into_deleted_experiment_with_same_name_fails(file_store, sqlite_store, tmpdir):
+    file_store.create_experiment("exp")
+    sqlite_store.delete_experiment(sqlite_store.create_experiment("exp"))
+    path = str(tmpdir.join("archive"))
+    export_experiments(file_store, path)
+    with pytest.raises(MlflowException, match="deleted experiment"):
+        import_experiments(sqlite_store, path)
+
+
+def test_export_import_artifacts(file_store, tmpdir):
+    run = file_store.create_run("0", "user", 1, [])
+    tmpdir.join("src", "model", "weights.txt").write("42", ensure=True)
+    tmpdir.join("src", "notes.txt").write("notes", ensure=True)
+    from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+
+    get_artifact_repository(run.info.artifact_uri).log_artifacts(str(tmpdir.join("src")))
+    path = str(tmpdir.join("archive"))
+    export_experiments(file_store, path, include_artifacts=True)
+    destination = FileStore(str(tmpdir.join("dest")), str(tmpdir.join("dest_artifacts")))
+    run_ids = import_experiments(destination, path)
+    imported_run = destination.get_run(run_ids[run.info.run_id])
+    artifact_repo = get_artifact_repository(imported_run.info.artifact_uri)
+    assert sorted(f.path for f in artifact_repo.list_artifacts()) == ["model", "notes.txt"]
+    with open(artifact_repo.download_artifacts("model/weights.txt")) as f:
+        assert f.read() == "42"
+
+
+def test_import_rejects_unsupported_archives(sqlite_store, tmpdir):
+    path = tmpdir.join("archive").mkdir()
+    with gzip.open(str(path.join(archive.RECORDS_FILE_NAME)), "wt") as f:
+        f.write(json.dumps({"type": "header", "format_version": archive.FORMAT_VERSION + 1}))
+    with pytest.raises(MlflowException, match="not an archive"):
+        import_experiments(sqlite_store, str(path))
@@ -625,6 +625,28 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
             [r2], self._search(fs, experiment_id, filter_str="tags.generic_2 ILIKE '%OTHER%'")
         )
 
+    def test_search_with_or_in_and_null_comparisons(self):
+        fs = FileStore(self.test_root)
+        experiment_id = fs.create_experiment("search_or_in_null")
+        r1 = fs.create_run(experiment_id, "user", 0, []).info.run_id
+        r2 = fs.create_run(experiment_id, "user", 0, []).info.run_id
+        r3 = fs.create_run(experiment_id, "user", 0, []).info.run_id
+        fs.log_batch(r1, [Metric("m", 1, 0, 0)], [Param("p", "a")], [RunTag("t", "x")])
+        fs.log_batch(r2, [Metric("m", 2, 0, 0)], [Param("p", "b")], [])
+        fs.log_batch(r3, [Metric("m", 3, 0, 0)], [], [RunTag("t", "y")])
+        for filter_string, expected in [
+            ("metrics.m > 2 OR params.p = 'a'", [r1, r3]),
+            ("(metrics.m > 2 OR params.p = 'a') AND tags.t = 'x'", [r1]),
+            ("metrics.m > 2 OR params.p = 'a' AND tags.t = 'y'", [r3]),
+            ("params.p IN ('a', 'b')", [r1, r2]),
+            ("params.p NOT IN ('a')", [r2]),
+            ("metrics.m IN (1, 3)", [r1, r3]),
+            ("tags.t IS NULL", [r2]),
+            ("tags.t IS NOT NULL AND params.p IS NULL", [r3]),
+            ("params.p = 'b' OR (metrics.m < 2 AND tags.t LIKE 'x%')", [r1, r2]),
+        ]:
+            self.assertCountEqual(expected, self._search(fs, experiment_id, filter_string))
+
     def test_search_with_max_results(self):
         fs = FileStore(self.test_root)
         exp = fs.create_experiment("search_with_max_results")
@@ -891,6 +913,71 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
             if rid != bad_run_id:
                 fs.get_run(rid)
 
+    def test_scans_read_files_with_thread_pool(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        with mock.patch.dict(os.environ, {"MLFLOW_FILE_STORE_MAX_WORKERS": "1"}):
+            sequential_fs = FileStore(self.test_root)
+        assert fs.max_workers == 8
+        assert sequential_fs.max_workers == 1
+        expected_runs = self._search(sequential_fs, exp_id)
+        expected_experiments = sequential_fs.list_experiments(ViewType.ALL)
+
+        with mock.patch.object(fs, "_get_executor", wraps=fs._get_executor) as get_executor:
+            assert self._search(fs, exp_id) == expected_runs
+            experiments = fs.list_experiments(ViewType.ALL)
+            assert [e.experiment_id for e in experiments] == [
+                e.experiment_id for e in expected_experiments
+            ]
+            # Run infos, run data and experiments are each read by the pool
+            assert get_executor.call_count == 3
+
+    def test_map_preserves_order_and_propagates_errors(self):
+        fs = FileStore(self.test_root)
+        items = list(range(50))
+
+        def slow_identity(item):
+            time.sleep(random.random() / 1000)
+            return item
+
+        assert fs._map(slow_identity, items) == items
+
+        def fail(item):
+            raise MlflowException("failed on %d" % item)
+
+        with pytest.raises(MlflowException, match="failed on 0"):
+            fs._map(fail, items)
+
+    def test_metadata_is_cached_until_its_file_changes(self):
+        run_id = self._create_run(FileStore(self.test_root)).info.run_id
+        fs = FileStore(self.test_root)
+        with mock.patch(FILESTORE_PACKAGE + ".read_yaml", wraps=read_yaml) as read_yaml_mock:
+            fs.get_run(run_id)
+            fs.get_run(run_id)
+            assert read_yaml_mock.call_count == 1
+            # Writes of the store invalidate the cache
+            fs.update_run_info(run_id, RunStatus.FINISHED, 1)
+            assert fs.get_run(run_id).info.status == "FINISHED"
+            assert read_yaml_mock.call_count == 2
+            # Writes of other processes are detected from the file modification time and size
+            run_dir = fs._find_run_root(run_id)[1]
+            with safe_edit_yaml(run_dir, "meta.yaml", lambda meta: dict(meta, end_time=12345)):
+                assert fs.get_run(run_id).info.end_time == 12345
+            assert read_yaml_mock.call_count == 3
+        # Cached metadata cannot be modified through returned dictionaries
+        meta = fs._read_metadata(run_dir)
+        meta["status"] = None
+        assert fs._read_metadata(run_dir)["status"] == RunStatus.FINISHED
+
+    def test_metadata_cache_can_be_disabled(self):
+        with mock.patch.dict(os.environ, {"MLFLOW_FILE_STORE_METADATA_CACHE_SIZE": "0"}):
+            fs = FileStore(self.test_root)
+        run_id = self._create_run(fs).info.run_id
+        with mock.patch(FILESTORE_PACKAGE + ".read_yaml", wraps=read_yaml) as read_yaml_mock:
+            fs.get_run(run_id)
+            fs.get_run(run_id)
+            assert read_yaml_mock.call_count == 2
+
     def test_mismatching_experiment_id(self):
         fs = FileStore(self.test_root)
         exp_0 = fs.get_experiment(FileStore.DEFAULT_EXPERIMENT_ID)
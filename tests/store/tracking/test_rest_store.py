@@ -18,6 +18,7 @@ from mlflow.entities import (
 from mlflow.exceptions import MlflowException
 from mlflow.models import Model
 from mlflow.protos.service_pb2 import (
+    Run as ProtoRun,
     CreateRun,
     DeleteExperiment,
     DeleteRun,
@@ -57,7 +58,7 @@ class CustomErrorHandlingRestStore(RestStore):
 
 
 class TestRestStore(object):
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_successful_http_request(self, request):
         def mock_request(**kwargs):
             # Filter out None arguments
@@ -66,7 +67,9 @@ class TestRestStore(object):
                 "method": "GET",
                 "params": {"view_type": "ACTIVE_ONLY"},
                 "url": "https://hello/api/2.0/mlflow/experiments/list",
-                "headers": _DEFAULT_HEADERS,
+                "headers": dict(
+                    _DEFAULT_HEADERS, Accept="application/x-protobuf, application/json;q=0.9"
+                ),
                 "verify": True,
             }
             response = mock.MagicMock
@@ -80,7 +83,7 @@ class TestRestStore(object):
         experiments = store.list_experiments()
         assert experiments[0].name == "Exp!"
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_failed_http_request(self, request):
         response = mock.MagicMock
         response.status_code = 404
@@ -92,7 +95,7 @@ class TestRestStore(object):
             store.list_experiments()
         assert "RESOURCE_DOES_NOT_EXIST: No experiment" in str(cm.value)
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_failed_http_request_custom_handler(self, request):
         response = mock.MagicMock
         response.status_code = 404
@@ -103,7 +106,7 @@ class TestRestStore(object):
         with pytest.raises(MyCoolException):
             store.list_experiments()
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_response_with_unknown_fields(self, request):
         experiment_json = {
             "experiment_id": "1",
@@ -129,17 +132,19 @@ class TestRestStore(object):
             "host_creds": host_creds,
             "endpoint": "/api/2.0/mlflow/%s" % endpoint,
             "method": method,
+            "extra_headers": {"Accept": "application/x-protobuf, application/json;q=0.9"},
         }
         if method == "GET":
             res["params"] = json.loads(json_body)
         else:
-            res["json"] = json.loads(json_body)
+            res["data"] = json.dumps(json.loads(json_body), separators=(",", ":")).encode("utf-8")
+            res["extra_headers"]["Content-Type"] = "application/json"
         return res
 
     def _verify_requests(self, http_request, host_creds, endpoint, method, json_body):
         http_request.assert_any_call(**(self._args(host_creds, endpoint, method, json_body)))
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_requestor(self, request):
         response = mock.MagicMock
         response.status_code = 200
@@ -186,11 +191,14 @@ class TestRestStore(object):
 
                 # Test the passed tag values separately from the rest of the request
                 # Tag order is inconsistent on Python 2 and 3, but the order does not matter
-                expected_tags = expected_kwargs["json"].pop("tags")
-                actual_tags = actual_kwargs["json"].pop("tags")
+                expected_body = json.loads(expected_kwargs.pop("data"))
+                actual_body = json.loads(actual_kwargs.pop("data"))
+                expected_tags = expected_body.pop("tags")
+                actual_tags = actual_body.pop("tags")
                 assert sorted(expected_tags, key=lambda t: t["key"]) == sorted(
                     actual_tags, key=lambda t: t["key"]
                 )
+                assert expected_body == actual_body
                 assert expected_kwargs == actual_kwargs
 
         with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
@@ -411,6 +419,39 @@ class TestRestStore(object):
             assert exc_info.value.error_code == ErrorCode.Name(REQUEST_LIMIT_EXCEEDED)
             assert mock_http.call_count == 1
 
+    def test_search_runs_batch(self):
+        creds = MlflowHostCreds("https://hello")
+        store = RestStore(lambda: creds)
+        run_proto = ProtoRun()
+        run_proto.info.run_id = "run_id"
+        run_proto.info.experiment_id = "0"
+        run_proto.info.start_time = 1
+        run_proto.data.metrics.add(key="m", value=1.0, timestamp=2, step=3)
+        run_proto.data.params.add(key="p", value="a")
+        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+            response = mock.MagicMock
+            response.status_code = 200
+            response.text = json.dumps(
+                {"runs": [json.loads(message_to_json(run_proto))], "next_page_token": "token"}
+            )
+            mock_http.return_value = response
+            with mock.patch("mlflow.entities.Run.from_proto") as run_from_proto:
+                batch = store.search_runs_batch(["0"], "", ViewType.ACTIVE_ONLY, max_results=10)
+            run_from_proto.assert_not_called()
+            expected_message = SearchRuns(
+                experiment_ids=["0"],
+                filter="",
+                run_view_type=ViewType.to_proto(ViewType.ACTIVE_ONLY),
+                max_results=10,
+            )
+            self._verify_requests(
+                mock_http, creds, "runs/search", "POST", message_to_json(expected_message)
+            )
+            assert batch.token == "token"
+            assert batch.run_ids == ["run_id"]
+            assert batch[0].data.metrics == {"m": 1.0}
+            assert batch[0].data.params == {"p": "a"}
+
     def test_databricks_rest_store_get_experiment_by_name(self):
         creds = MlflowHostCreds("https://hello")
         store = DatabricksRestStore(lambda: creds)
@@ -1026,6 +1026,78 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             self.get_ordered_runs(["metrics.x desc", "param.metric desc"], experiment_id),
         )
 
+    def test_order_by_single_metric_matches_generic_ordering_across_pages(self):
+        experiment_id = self.store.create_experiment("order_by_single_metric")
+        values = ["nan", None, "inf", "-inf", "-1000", "0", "0", "1000", None, "nan", "3"]
+        for i, value in enumerate(values):
+            run_id = self.store.create_run(
+                experiment_id, user_id="MrDuck", start_time=i % 3, tags=[]
+            ).info.run_id
+            if value is not None:
+                self.store.log_metric(run_id, entities.Metric("x", float(value), 1, 0))
+            self.store.log_metric(run_id, entities.Metric("y", 1.0, 1, 0))
+
+        for direction in ["ASC", "DESC"]:
+            # An additional (redundant) start time clause forces the generic search query
+            expected = [
+                r.info.run_id
+                for r in self.store.search_runs(
+                    [experiment_id],
+                    None,
+                    ViewType.ALL,
+                    order_by=["metrics.x " + direction, "attributes.start_time DESC"],
+                )
+            ]
+            for max_results in [1, 2, 4, 100]:
+                run_ids = []
+                page_token = None
+                while True:
+                    runs = self.store.search_runs(
+                        [experiment_id],
+                        None,
+                        ViewType.ALL,
+                        max_results=max_results,
+                        order_by=["metrics.x " + direction],
+                        page_token=page_token,
+                    )
+                    run_ids.extend(r.info.run_id for r in runs)
+                    page_token = runs.token
+                    if not page_token:
+                        break
+                assert run_ids == expected
+
+    def test_order_by_single_metric_follows_run_lifecycle_stage(self):
+        experiment_id = self.store.create_experiment("order_by_single_metric_lifecycle")
+        run_ids = []
+        for value in [1.0, 2.0]:
+            run_id = self.store.create_run(
+                experiment_id, user_id="MrDuck", start_time=0, tags=[]
+            ).info.run_id
+            self.store.log_metric(run_id, entities.Metric("x", value, 1, 0))
+            run_ids.append(run_id)
+
+        def search(run_view_type):
+            return [
+                r.info.run_id
+                for r in self.store.search_runs(
+                    [experiment_id], None, run_view_type, order_by=["metrics.x DESC"]
+                )
+            ]
+
+        self.store.delete_run(run_ids[1])
+        with self.store.ManagedSessionMaker() as session:
+            latest_metric = (
+                session.query(models.SqlLatestMetric).filter_by(run_uuid=run_ids[1]).one()
+            )
+            assert latest_metric.experiment_id == int(experiment_id)
+            assert latest_metric.lifecycle_stage == entities.LifecycleStage.DELETED
+            assert latest_metric.start_time == 0
+        assert search(ViewType.ACTIVE_ONLY) == [run_ids[0]]
+        assert search(ViewType.DELETED_ONLY) == [run_ids[1]]
+
+        self.store.restore_run(run_ids[1])
+        assert search(ViewType.ACTIVE_ONLY) == [run_ids[1], run_ids[0]]
+
     def test_order_by_attributes(self):
         experiment_id = self.store.create_experiment("order_by_attributes")
 
@@ -1428,6 +1500,32 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
         )
         self.assertCountEqual([], self._search(experiment_id, filter_string))
 
+    def test_search_with_or_in_and_null_comparisons(self):
+        experiment_id = self._experiment_factory("search_or_in_null")
+        r1 = self._run_factory(self._get_run_configs(experiment_id)).info.run_id
+        r2 = self._run_factory(self._get_run_configs(experiment_id)).info.run_id
+        r3 = self._run_factory(self._get_run_configs(experiment_id)).info.run_id
+        self.store.log_batch(
+            r1,
+            [entities.Metric("m", 1, 0, 0)],
+            [entities.Param("p", "a")],
+            [entities.RunTag("t", "x")],
+        )
+        self.store.log_batch(r2, [entities.Metric("m", 2, 0, 0)], [entities.Param("p", "b")], [])
+        self.store.log_batch(r3, [entities.Metric("m", 3, 0, 0)], [], [entities.RunTag("t", "y")])
+        for filter_string, expected in [
+            ("metrics.m > 2 OR params.p = 'a'", [r1, r3]),
+            ("(metrics.m > 2 OR params.p = 'a') AND tags.t = 'x'", [r1]),
+            ("metrics.m > 2 OR params.p = 'a' AND tags.t = 'y'", [r3]),
+            ("params.p IN ('a', 'b')", [r1, r2]),
+            ("params.p NOT IN ('a')", [r2]),
+            ("metrics.m IN (1, 3)", [r1, r3]),
+            ("tags.t IS NULL", [r2]),
+            ("tags.t IS NOT NULL AND params.p IS NULL", [r3]),
+            ("params.p = 'b' OR (metrics.m < 2 AND tags.t LIKE 'x%')", [r1, r2]),
+        ]:
+            self.assertCountEqual(expected, self._search(experiment_id, filter_string))
+
     def test_search_with_max_results(self):
         exp = self._experiment_factory("search_with_max_results")
         runs = [
@@ -1563,7 +1661,7 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             raise Exception("Some internal error")
 
         package = "mlflow.store.tracking.sqlalchemy_store.SqlAlchemyStore"
-        with mock.patch(package + ".log_metric") as metric_mock, mock.patch(
+        with mock.patch(package + "._log_metrics") as metric_mock, mock.patch(
             package + ".log_param"
         ) as param_mock, mock.patch(package + ".set_tag") as tags_mock:
             metric_mock.side_effect = _raise_exception_fn
@@ -1631,6 +1729,39 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             self.store, run.info.run_id, params=[], metrics=[metric0, metric1], tags=[]
         )
 
+    def test_log_batch_metrics_in_single_transaction(self):
+        run = self._run_factory()
+        metrics = [Metric("m", float(step), 100 + step, step) for step in range(50)]
+        special_metrics = [Metric("nan", float("nan"), 1, 0), Metric("inf", float("inf"), 1, 0)]
+        with mock.patch.object(
+            self.store, "ManagedSessionMaker", wraps=self.store.ManagedSessionMaker
+        ) as session_maker_mock:
+            self.store.log_batch(
+                run.info.run_id, metrics=metrics + special_metrics, params=[], tags=[]
+            )
+        # One session to check that the run is active, and one to log the metrics
+        assert session_maker_mock.call_count == 2
+
+        def get_metric_history():
+            history = self.store.get_metric_history(run.info.run_id, "m")
+            return sorted((m.key, m.value, m.timestamp, m.step) for m in history)
+
+        assert get_metric_history() == [(m.key, m.value, m.timestamp, m.step) for m in metrics]
+        run_data = self.store.get_run(run.info.run_id).data
+        assert run_data.metrics["m"] == 49.0
+        assert math.isnan(run_data.metrics["nan"])
+        assert run_data.metrics["inf"] == 1.7976931348623157e308
+
+        # Metrics that were already logged are skipped
+        older_metric = Metric("m", -1.0, 0, 0)
+        self.store.log_batch(
+            run.info.run_id, metrics=metrics[:10] + [older_metric], params=[], tags=[]
+        )
+        assert get_metric_history() == sorted(
+            (m.key, m.value, m.timestamp, m.step) for m in metrics + [older_metric]
+        )
+        assert self.store.get_run(run.info.run_id).data.metrics["m"] == 49.0
+
     def test_log_batch_same_metric_repeated_multiple_reqs(self):
         run = self._run_factory()
         metric0 = Metric(key="metric-key", value=1, timestamp=2, step=0)
@@ -19,7 +19,7 @@ from mlflow import experiments
 from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
 from mlflow.store.tracking.file_store import FileStore
 from mlflow.exceptions import MlflowException
-from mlflow.entities import ViewType
+from mlflow.entities import Param, ViewType
 
 
 def test_server_static_prefix_validation():
@@ -215,6 +215,21 @@ def test_mlflow_gc_file_store_passing_explicit_run_ids(file_store):
         store.get_run(run.info.run_uuid)
 
 
+def test_mlflow_gc_file_store_deletes_many_runs_concurrently(file_store):
+    store = file_store[0]
+    runs = [_create_run_in_store(store) for _ in range(10)]
+    for run in runs:
+        store.delete_run(run.info.run_uuid)
+    subprocess.check_output(
+        ["mlflow", "gc", "--backend-store-uri", file_store[1], "--max-workers", "4"]
+    )
+    assert (
+        store.search_runs(experiment_ids=["0"], filter_string="", run_view_type=ViewType.ALL) == []
+    )
+    for run in runs:
+        assert not os.path.exists(url2pathname(unquote(urlparse(run.info.artifact_uri).path)))
+
+
 def test_mlflow_gc_not_deleted_run(file_store):
     store = file_store[0]
     run = _create_run_in_store(store)
@@ -224,3 +239,20 @@ def test_mlflow_gc_not_deleted_run(file_store):
         )
     runs = store.search_runs(experiment_ids=["0"], filter_string="", run_view_type=ViewType.ALL)
     assert len(runs) == 1
+
+
+def test_mlflow_experiments_export_import(file_store, sqlite_store, tmpdir):
+    run = _create_run_in_store(file_store[0])
+    file_store[0].log_param(run.info.run_id, Param("p", "v"))
+    path = str(tmpdir.join("archive"))
+    with mock.patch("mlflow.experiments._get_store", return_value=file_store[0]):
+        result = CliRunner().invoke(
+            experiments.export_experiments, ["--path", path, "--experiment-id", "0"]
+        )
+    assert result.exit_code == 0, result.output
+    with mock.patch("mlflow.experiments._get_store", return_value=sqlite_store[0]):
+        result = CliRunner().invoke(experiments.import_experiments, ["--path", path])
+    assert result.exit_code == 0, result.output
+    assert "Imported 1 runs" in result.output
+    runs = sqlite_store[0].search_runs(["0"], "", ViewType.ALL)
+    assert [r.data.params for r in runs] == [{"p": "v"}]
@@ -0,0 +1,171 @@
+import os
+from unittest import mock
+
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.store.model_registry.sqlalchemy_store import SqlAlchemyStore
+from mlflow.tracking._model_registry import cache
+from mlflow.tracking._model_registry.cache import RegistryReadCache, get_registry_read_cache
+from mlflow.tracking._model_registry.client import ModelRegistryClient
+
+
+@pytest.fixture
+def registry_uri(tmpdir):
+    return "sqlite:///" + os.path.join(tmpdir.strpath, "registry.db")
+
+
+@pytest.fixture
+def enable_cache():
+    env = {cache.REGISTRY_CACHE_ENV_VAR: "true", cache.REGISTRY_CACHE_SYNC_INTERVAL_ENV_VAR: "0"}
+    with mock.patch.dict(os.environ, env), mock.patch.object(cache, "_registry_read_caches", {}):
+        yield
+
+
+def test_get_registry_read_cache_is_disabled_by_default():
+    with mock.patch.dict(os.environ, {}):
+        os.environ.pop(cache.REGISTRY_CACHE_ENV_VAR, None)
+        assert get_registry_read_cache("uri:/fake", mock.Mock()) is None
+
+
+def test_get_registry_read_cache_is_shared_per_registry_uri(enable_cache):
+    store = mock.Mock()
+    read_cache = get_registry_read_cache("uri:/fake", store)
+    assert isinstance(read_cache, RegistryReadCache)
+    assert get_registry_read_cache("uri:/fake", store) is read_cache
+    assert get_registry_read_cache("uri:/other", store) is not read_cache
+
+
+def test_cache_invalidates_changed_models():
+    store = mock.Mock()
+    store.get_registry_changes.return_value = (1, [])
+    read_cache = RegistryReadCache(store, sync_interval=0, max_age=300)
+    read_fn = mock.Mock(return_value={"version": 1})
+
+    assert read_cache.get("model", "key", read_fn) == {"version": 1}
+    assert read_cache.get("model", "key", read_fn) == {"version": 1}
+    assert read_cache.get("other model", "key", read_fn) == {"version": 1}
+    assert read_fn.call_count == 2
+    store.get_registry_changes.assert_called_with(since_revision=1)
+
+    store.get_registry_changes.return_value = (2, ["model"])
+    read_fn.return_value = {"version": 2}
+    assert read_cache.get("model", "key", read_fn) == {"version": 2}
+    assert read_cache.get("other model", "key", read_fn) == {"version": 1}
+    assert read_fn.call_count == 3
+    assert read_cache.revision == 2
+
+    # A registry reset to an earlier revision invalidates all models
+    store.get_registry_changes.return_value = (1, [])
+    read_fn.return_value = {"version": 3}
+    assert read_cache.get("other model", "key", read_fn) == {"version": 3}
+    assert read_cache.revision == 1
+
+
+def test_cache_returns_copies():
+    store = mock.Mock()
+    store.get_registry_changes.return_value = (1, [])
+    read_cache = RegistryReadCache(store, sync_interval=0, max_age=300)
+    read_cache.get("model", "key", lambda: {"version": 1})["version"] = 2
+    assert read_cache.get("model", "key", lambda: None) == {"version": 1}
+
+
+def test_cache_syncs_at_most_once_per_interval():
+    store = mock.Mock()
+    store.get_registry_changes.return_value = (1, [])
+    read_cache = RegistryReadCache(store, sync_interval=60, max_age=300)
+    for _ in range(3):
+        read_cache.get("model", "key", lambda: 1)
+    store.get_registry_changes.assert_called_once_with(since_revision=None)
+
+
+def test_cache_expires_reads_after_max_age():
+    store = mock.Mock()
+    store.get_registry_changes.return_value = (1, [])
+    read_cache = RegistryReadCache(store, sync_interval=0, max_age=0)
+    read_fn = mock.Mock(return_value=1)
+    read_cache.get("model", "key", read_fn)
+    read_cache.get("model", "key", read_fn)
+    assert read_fn.call_count == 2
+
+
+def test_cache_does_not_cache_failed_reads():
+    store = mock.Mock()
+    store.get_registry_changes.return_value = (1, [])
+    read_cache = RegistryReadCache(store, sync_interval=0, max_age=300)
+    with pytest.raises(ValueError):
+        read_cache.get("model", "key", mock.Mock(side_effect=ValueError))
+    assert read_cache.get("model", "key", lambda: 1) == 1
+
+
+def test_cache_is_disabled_for_stores_without_change_feed():
+    store = mock.Mock()
+    store.get_registry_changes.side_effect = NotImplementedError
+    read_cache = RegistryReadCache(store, sync_interval=0, max_age=300)
+    read_fn = mock.Mock(return_value=1)
+    read_cache.get("model", "key", read_fn)
+    read_cache.get("model", "key", read_fn)
+    assert read_fn.call_count == 2
+    store.get_registry_changes.assert_called_once()
+
+
+def test_cache_reads_through_while_change_feed_fails():
+    store = mock.Mock()
+    store.get_registry_changes.return_value = (1, [])
+    read_cache = RegistryReadCache(store, sync_interval=0, max_age=300)
+    read_cache.get("model", "key", lambda: 1)
+
+    store.get_registry_changes.side_effect = MlflowException("API request failed")
+    read_fn = mock.Mock(return_value=2)
+    with mock.patch.object(cache._logger, "warning") as warning_mock:
+        assert read_cache.get("model", "key", read_fn) == 2
+        assert read_cache.get("model", "key", read_fn) == 2
+    assert read_fn.call_count == 2
+    assert "Failed to get the changes of the model registry" in warning_mock.call_args[0][0]
+
+    # Changes made while the change feed failed are picked up once it can be read again
+    store.get_registry_changes.side_effect = [(2, ["model"]), (2, [])]
+    assert read_cache.get("model", "key", read_fn) == 2
+    assert read_cache.get("model", "key", read_fn) == 2
+    assert read_fn.call_count == 3
+
+
+def test_cache_waits_for_sync_interval_after_change_feed_failure():
+    store = mock.Mock()
+    store.get_registry_changes.side_effect = MlflowException("API request failed")
+    read_cache = RegistryReadCache(store, sync_interval=60, max_age=300)
+    read_fn = mock.Mock(return_value=1)
+    with mock.patch.object(cache._logger, "warning"):
+        read_cache.get("model", "key", read_fn)
+        read_cache.get("model", "key", read_fn)
+    assert read_fn.call_count == 2
+    store.get_registry_changes.assert_called_once()
+
+
+def test_client_reads_are_cached_and_invalidated(enable_cache, registry_uri):
+    client = ModelRegistryClient(registry_uri)
+    client.create_registered_model("model")
+    client.create_model_version("model", "path/to/source", "run_id", await_creation_for=None)
+
+    with mock.patch.object(
+        SqlAlchemyStore, "get_model_version", wraps=client.store.get_model_version
+    ) as get_model_version:
+        assert client.get_model_version("model", 1).current_stage == "None"
+        assert client.get_model_version("model", "1").current_stage == "None"
+        get_model_version.assert_called_once()
+
+        # Writes through the client invalidate the cached reads of the model
+        client.transition_model_version_stage("model", 1, "Production")
+        assert client.get_model_version("model", 1).current_stage == "Production"
+        assert get_model_version.call_count == 2
+
+        # Writes through other clients are picked up from the registry change feed
+        other_store = SqlAlchemyStore(registry_uri)
+        other_store.transition_model_version_stage("model", 1, "Staging", False)
+        assert client.get_model_version("model", 1).current_stage == "Staging"
+        assert get_model_version.call_count == 3
+
+    assert [mv.version for mv in client.get_latest_versions("model", ["Staging"])] == [1]
+    client.rename_registered_model("model", "new model")
+    assert client.get_registered_model("new model").name == "new model"
+    assert client.get_registry_changes(since_revision=None)[0] > 0
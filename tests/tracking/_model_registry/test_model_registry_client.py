@@ -323,7 +323,7 @@ def test_search_model_versions(mock_store):
         ModelVersion(name="Model 1", version="2", creation_timestamp=124),
     ]
     result = newModelRegistryClient().search_model_versions("name=Model 1")
-    mock_store.search_model_versions.assert_called_once_with("name=Model 1")
+    mock_store.search_model_versions.assert_called_once_with("name=Model 1", 200000, None, None)
     assert len(result) == 2
 
 
@@ -0,0 +1,133 @@
+import os
+import threading
+from unittest import mock
+
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.tracking import _artifact_upload_queue
+from mlflow.tracking._artifact_upload_queue import ArtifactUploadQueue, get_artifact_upload_queue
+
+
+@pytest.fixture(autouse=True)
+def reset_artifact_upload_queue():
+    yield
+    _artifact_upload_queue._artifact_upload_queue = None
+
+
+def test_upload_queue_uploads_snapshot_of_file(tmpdir):
+    local_path = tmpdir.join("model.txt")
+    local_path.write("v1")
+    uploaded = {}
+    release_upload = threading.Event()
+
+    def upload(snapshot_path):
+        release_upload.wait()
+        with open(snapshot_path) as f:
+            uploaded[os.path.basename(snapshot_path)] = f.read()
+
+    queue = ArtifactUploadQueue(max_workers=2, max_queue_size=4)
+    queue.submit(str(local_path), upload)
+    # Modifying or deleting the logged file must not affect the pending upload
+    local_path.write("v2")
+    local_path.remove()
+    release_upload.set()
+    queue.flush()
+    assert uploaded == {"model.txt": "v1"}
+    assert queue.num_pending == 0
+
+
+@pytest.mark.parametrize("use_hardlinks", [False, True])
+def test_upload_queue_uploads_snapshot_of_directory(tmpdir, use_hardlinks):
+    local_dir = tmpdir.mkdir("checkpoint")
+    local_dir.join("a.txt").write("a")
+    local_dir.mkdir("sub").join("b.txt").write("b")
+    uploaded = []
+
+    def upload(snapshot_dir):
+        assert os.path.basename(snapshot_dir) == "checkpoint"
+        for root, _, names in os.walk(snapshot_dir):
+            uploaded.extend(os.path.relpath(os.path.join(root, n), snapshot_dir) for n in names)
+
+    queue = ArtifactUploadQueue(max_workers=1, max_queue_size=1, use_hardlinks=use_hardlinks)
+    queue.submit(str(local_dir), upload)
+    queue.flush()
+    assert sorted(uploaded) == ["a.txt", os.path.join("sub", "b.txt")]
+
+
+def test_upload_queue_removes_snapshots_after_upload(tmpdir):
+    local_path = tmpdir.join("file.txt")
+    local_path.write("content")
+    snapshot_paths = []
+    queue = ArtifactUploadQueue(max_workers=1, max_queue_size=1)
+    queue.submit(str(local_path), snapshot_paths.append)
+    queue.flush()
+    assert len(snapshot_paths) == 1
+    assert not os.path.exists(os.path.dirname(snapshot_paths[0]))
+
+
+def test_upload_queue_blocks_when_full(tmpdir):
+    local_path = tmpdir.join("file.txt")
+    local_path.write("content")
+    release_upload = threading.Event()
+    queue = ArtifactUploadQueue(max_workers=1, max_queue_size=1)
+    queue.submit(str(local_path), lambda _: release_upload.wait())
+
+    second_submitted = threading.Event()
+
+    def submit_second():
+        queue.submit(str(local_path), lambda _: None)
+        second_submitted.set()
+
+    thread = threading.Thread(target=submit_second)
+    thread.start()
+    assert not second_submitted.wait(0.2)
+    release_upload.set()
+    assert second_submitted.wait(5)
+    thread.join()
+    queue.flush()
+
+
+def test_upload_queue_flush_raises_upload_errors(tmpdir):
+    local_path = tmpdir.join("file.txt")
+    local_path.write("content")
+
+    def upload(_):
+        raise Exception("upload failed")
+
+    queue = ArtifactUploadQueue(max_workers=2, max_queue_size=4)
+    queue.submit(str(local_path), upload)
+    queue.submit(str(local_path), lambda _: None)
+    with pytest.raises(MlflowException, match="Failed to upload 1 artifact.*upload failed"):
+        queue.flush()
+    # Errors are only reported once
+    queue.flush()
+
+
+def test_upload_queue_submit_raises_for_missing_file(tmpdir):
+    queue = ArtifactUploadQueue(max_workers=1, max_queue_size=1)
+    with pytest.raises(OSError):
+        queue.submit(str(tmpdir.join("missing")), lambda _: None)
+    # The queue slot is released
+    local_path = tmpdir.join("file.txt")
+    local_path.write("content")
+    queue.submit(str(local_path), lambda _: None)
+    queue.flush()
+
+
+def test_get_artifact_upload_queue_is_opt_in(monkeypatch):
+    monkeypatch.delenv("MLFLOW_ASYNC_ARTIFACT_UPLOAD", raising=False)
+    assert get_artifact_upload_queue() is None
+    monkeypatch.setenv("MLFLOW_ASYNC_ARTIFACT_UPLOAD", "true")
+    queue = get_artifact_upload_queue()
+    assert isinstance(queue, ArtifactUploadQueue)
+    assert get_artifact_upload_queue() is queue
+
+
+def test_upload_errors_are_kept_for_the_run_ended_at_exit(monkeypatch):
+    # ``end_run``, registered by the fluent API, flushes and reports the errors at exit: a hook of
+    # the queue would run first and swallow them
+    monkeypatch.setenv("MLFLOW_ASYNC_ARTIFACT_UPLOAD", "true")
+    with mock.patch("atexit.register") as register_mock:
+        get_artifact_upload_queue()
+    register_mock.assert_not_called()
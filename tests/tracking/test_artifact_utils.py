@@ -94,3 +94,38 @@ def test_upload_artifacts_to_databricks_no_run_id():
             new_source == "dbfs:/databricks/mlflow/tmp-external-source/"
             "4f746cdcc0374da2808917e81bb53323/sourcedir"
         )
+
+
+def test_download_artifact_from_runs_uri_uses_shared_cache(tmpdir, monkeypatch):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_CACHE_DIR", tmpdir.join("cache").strpath)
+    local_artifact_path = tmpdir.join("artifact.txt").strpath
+    with open(local_artifact_path, "w") as out:
+        out.write("Sample artifact text")
+
+    with mlflow.start_run() as run:
+        mlflow.log_artifact(local_path=local_artifact_path, artifact_path="model")
+        active_run_uri = "runs:/{}/model".format(run.info.run_id)
+        # Artifacts of active runs may still change and are never cached
+        assert not _download_artifact_from_uri(active_run_uri).startswith(
+            tmpdir.join("cache").strpath
+        )
+
+    runs_uri = "runs:/{}/model".format(run.info.run_id)
+    with mock.patch(
+        "mlflow.tracking.artifact_utils.get_artifact_repository",
+        wraps=mlflow.tracking.artifact_utils.get_artifact_repository,
+    ) as get_repo_mock:
+        first_path = _download_artifact_from_uri(runs_uri)
+        assert get_repo_mock.call_count == 1
+        second_path = _download_artifact_from_uri(runs_uri)
+        assert get_repo_mock.call_count == 1
+    assert first_path == second_path
+    assert first_path.startswith(tmpdir.join("cache").strpath)
+    with open(os.path.join(first_path, "artifact.txt"), "r") as f:
+        assert f.read() == "Sample artifact text"
+
+    output_path = tmpdir.mkdir("output").strpath
+    copied_path = _download_artifact_from_uri(runs_uri, output_path=output_path)
+    assert copied_path == os.path.join(output_path, "model")
+    with open(os.path.join(copied_path, "artifact.txt"), "a") as f:
+        f.write(" is writable")
@@ -152,6 +152,18 @@ def test_client_search_runs_string_experiment_id(mock_store):
     )
 
 
+def test_client_search_runs_batch(mock_store):
+    MlflowClient().search_runs_batch("abc", "my filter", max_results=10, page_token="token")
+    mock_store.search_runs_batch.assert_called_once_with(
+        experiment_ids=["abc"],
+        filter_string="my filter",
+        run_view_type=ViewType.ACTIVE_ONLY,
+        max_results=10,
+        order_by=None,
+        page_token="token",
+    )
+
+
 def test_client_search_runs_order_by(mock_store):
     MlflowClient().search_runs([5], order_by=["a", "b"])
     mock_store.search_runs.assert_called_once_with(
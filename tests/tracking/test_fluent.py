@@ -25,7 +25,9 @@ from mlflow.entities import (
 )
 from mlflow.exceptions import MlflowException
 from mlflow.store.entities.paged_list import PagedList
+from mlflow.store.entities.run_batch import RunBatch
 from mlflow.tracking.client import MlflowClient
+from mlflow.tracking._tracking_service.client import TrackingServiceClient
 from mlflow.tracking.fluent import (
     _EXPERIMENT_ID_ENV_VAR,
     _EXPERIMENT_NAME_ENV_VAR,
@@ -39,7 +41,7 @@ from mlflow.tracking.fluent import (
     get_run,
 )
 from mlflow.utils import mlflow_tags
-from mlflow.utils.file_utils import TempDir
+from mlflow.utils.file_utils import TempDir, local_file_uri_to_path
 
 # pylint: disable=unused-argument
 
@@ -471,7 +473,7 @@ def test_search_runs_attributes():
         create_run(status=RunStatus.FINISHED, a_uri="dbfs:/test", run_id="abc", exp_id="123"),
         create_run(status=RunStatus.SCHEDULED, a_uri="dbfs:/test2", run_id="def", exp_id="321"),
     ]
-    with mock.patch("mlflow.tracking.fluent._paginate", return_value=runs):
+    with mock.patch("mlflow.tracking.fluent._paginate", return_value=RunBatch(runs)):
         pdf = search_runs()
         data = {
             "status": [RunStatus.FINISHED, RunStatus.SCHEDULED],
@@ -502,7 +504,7 @@ def test_search_runs_data():
             end=1564783200000,
         ),
     ]
-    with mock.patch("mlflow.tracking.fluent._paginate", return_value=runs):
+    with mock.patch("mlflow.tracking.fluent._paginate", return_value=RunBatch(runs)):
         pdf = search_runs()
         data = {
             "status": [RunStatus.FINISHED] * 2,
@@ -529,6 +531,40 @@ def test_search_runs_data():
         pd.testing.assert_frame_equal(pdf, expected_df, check_like=True, check_frame_type=False)
 
 
+def test_search_runs_streams_pages_into_run_batch():
+    pages = [
+        RunBatch(
+            [create_run(run_id="a", metrics=[Metric("mse", 0.2, 0, 0)]), create_run(run_id="b")],
+            token="token",
+        ),
+        RunBatch([create_run(run_id="c", params=[Param("param", "value")])], token=None),
+    ]
+    with mock.patch.object(
+        TrackingServiceClient, "search_runs_batch", side_effect=pages
+    ) as search_runs_batch, mock.patch("mlflow.tracking.fluent.NUM_RUNS_PER_PAGE_PANDAS", 2):
+        pdf = search_runs(experiment_ids=["0"], max_results=10)
+    assert search_runs_batch.call_count == 2
+    assert search_runs_batch.call_args[0][3:] == (2, None, "token")
+    assert list(pdf["run_id"]) == ["a", "b", "c"]
+    assert list(pdf["metrics.mse"])[0] == 0.2
+    assert np.isnan(list(pdf["metrics.mse"])[2])
+    assert list(pdf["params.param"]) == [None, None, "value"]
+
+
+def test_search_runs_arrow_output():
+    pytest.importorskip("pyarrow")
+    runs = [create_run(run_id="a", metrics=[Metric("mse", 0.2, 0, 0)]), create_run(run_id="b")]
+    with mock.patch("mlflow.tracking.fluent._paginate", return_value=RunBatch(runs)):
+        table = search_runs(experiment_ids=["0"], output_format="arrow")
+        pd.testing.assert_frame_equal(table.to_pandas(), search_runs(experiment_ids=["0"]))
+
+
+def test_search_runs_rejects_invalid_output_format():
+    with pytest.raises(MlflowException, match="Invalid output format 'csv'") as e:
+        search_runs(experiment_ids=["0"], output_format="csv")
+    assert e.value.error_code == "INVALID_PARAMETER_VALUE"
+
+
 def test_search_runs_no_arguments():
     """
     When no experiment ID is specified, it should try to get the implicit one.
@@ -537,7 +573,9 @@ def test_search_runs_no_arguments():
     experiment_id_patch = mock.patch(
         "mlflow.tracking.fluent._get_experiment_id", return_value=mock_experiment_id
     )
-    get_paginated_runs_patch = mock.patch("mlflow.tracking.fluent._paginate", return_value=[])
+    get_paginated_runs_patch = mock.patch(
+        "mlflow.tracking.fluent._paginate", return_value=RunBatch()
+    )
     with experiment_id_patch, get_paginated_runs_patch:
         search_runs()
         mlflow.tracking.fluent._paginate.assert_called_once()
@@ -681,3 +719,38 @@ def test_delete_tag():
     with pytest.raises(MlflowException):
         mlflow.delete_tag("b")
     mlflow.end_run()
+
+
+@pytest.fixture
+def async_artifact_upload(monkeypatch):
+    monkeypatch.setenv("MLFLOW_ASYNC_ARTIFACT_UPLOAD", "true")
+    yield
+    mlflow.tracking._artifact_upload_queue._artifact_upload_queue = None
+
+
+def test_log_artifact_async_uploads_snapshot_before_run_ends(tmpdir, async_artifact_upload):
+    local_path = tmpdir.join("features.txt")
+    local_path.write("v1")
+    local_dir = tmpdir.mkdir("data")
+    local_dir.join("data.txt").write("data")
+    with start_run() as run:
+        run_artifact_dir = local_file_uri_to_path(mlflow.get_artifact_uri())
+        mlflow.log_artifact(str(local_path), "parent")
+        mlflow.log_artifacts(str(local_dir), "states")
+        local_path.write("v2")
+    assert MlflowClient().get_run(run.info.run_id).info.status == "FINISHED"
+    with open(os.path.join(run_artifact_dir, "parent", "features.txt")) as f:
+        assert f.read() == "v1"
+    assert os.listdir(os.path.join(run_artifact_dir, "states")) == ["data.txt"]
+
+
+def test_end_run_fails_run_if_async_artifact_upload_fails(tmpdir, async_artifact_upload):
+    local_path = tmpdir.join("features.txt")
+    local_path.write("content")
+    run = start_run()
+    with mock.patch.object(MlflowClient, "log_artifact", side_effect=Exception("upload failed")):
+        mlflow.log_artifact(str(local_path))
+        with pytest.raises(MlflowException, match="upload failed"):
+            mlflow.end_run()
+    assert mlflow.active_run() is None
+    assert MlflowClient().get_run(run.info.run_id).info.status == "FAILED"
@@ -0,0 +1,175 @@
+import base64
+import hashlib
+import os
+import re
+from unittest import mock
+
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.utils.download_utils import (
+    download_ranges_in_parallel,
+    download_url_in_parallel,
+    get_parallel_download_chunk_size,
+    get_parallel_download_max_workers,
+)
+
+
+class _FakeResponse(object):
+    def __init__(self, status_code, content, headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise Exception("HTTP error %s" % self.status_code)
+
+    def iter_content(self, chunk_size):
+        for offset in range(0, len(self.content), chunk_size):
+            yield self.content[offset : offset + chunk_size]
+
+
+def _fake_get(content, supports_ranges=True, etag='"abc"', response_headers=None):
+    def get(url, headers=None, stream=False):  # pylint: disable=unused-argument
+        range_header = (headers or {}).get("Range")
+        if not supports_ranges or range_header is None:
+            return _FakeResponse(200, content, dict(response_headers or {}))
+        if not content:
+            return _FakeResponse(416, b"")
+        if "If-Match" in headers and headers["If-Match"] != etag:
+            return _FakeResponse(412, b"")
+        first, last = map(int, re.match(r"bytes=(\d+)-(\d+)", range_header).groups())
+        last = min(last, len(content) - 1)
+        content_range = "bytes {}-{}/{}".format(first, last, len(content))
+        return _FakeResponse(
+            206,
+            content[first : last + 1],
+            dict(response_headers or {}, **{"Content-Range": content_range, "ETag": etag}),
+        )
+
+    return get
+
+
+@pytest.mark.parametrize("size", [0, 1, 99, 100, 101, 1000])
+def test_download_url_in_parallel_downloads_file_in_ranges(tmpdir, size):
+    content = os.urandom(size)
+    local_path = str(tmpdir.join("file"))
+    with mock.patch("requests.Session.get", side_effect=_fake_get(content)) as get_mock:
+        download_url_in_parallel("https://url", local_path, chunk_size=100, max_workers=4)
+    with open(local_path, "rb") as f:
+        assert f.read() == content
+    assert get_mock.call_count == max(1, -(-size // 100))
+
+
+def test_download_url_in_parallel_falls_back_to_single_stream(tmpdir):
+    content = os.urandom(1000)
+    local_path = str(tmpdir.join("file"))
+    with mock.patch(
+        "requests.Session.get", side_effect=_fake_get(content, supports_ranges=False)
+    ) as get_mock:
+        download_url_in_parallel("https://url", local_path, chunk_size=100, max_workers=4)
+    with open(local_path, "rb") as f:
+        assert f.read() == content
+    assert get_mock.call_count == 1
+
+
+def test_download_url_in_parallel_fails_if_file_changes(tmpdir):
+    content = os.urandom(1000)
+    fake_get = _fake_get(content)
+
+    def get(url, headers=None, stream=False):
+        if "If-Match" in headers:
+            return _fake_get(content, etag='"changed"')(url, headers, stream)
+        return fake_get(url, headers, stream)
+
+    with mock.patch("requests.Session.get", side_effect=get), pytest.raises(Exception):
+        download_url_in_parallel(
+            "https://url", str(tmpdir.join("file")), chunk_size=100, max_workers=4
+        )
+
+
+def _md5(content):
+    return hashlib.md5(content).hexdigest()
+
+
+def _base64_md5(content):
+    return base64.b64encode(hashlib.md5(content).digest()).decode("ascii")
+
+
+@pytest.mark.parametrize(
+    "supports_ranges, etag, response_headers",
+    [
+        (True, lambda content: '"%s"' % _md5(content), {}),
+        (
+            True,
+            lambda _: '"abc"',
+            {"x-goog-hash": lambda c: "crc32c=n03x6A==,md5=" + _base64_md5(c)},
+        ),
+        (True, lambda _: '"abc"', {"x-ms-blob-content-md5": _base64_md5}),
+        (False, lambda _: '"abc"', {"Content-MD5": _base64_md5}),
+    ],
+)
+def test_download_url_in_parallel_verifies_advertised_md5(
+    tmpdir, supports_ranges, etag, response_headers
+):
+    content = os.urandom(1000)
+    corrupted = content[:500] + b"x" + content[501:]
+    local_path = str(tmpdir.join("file"))
+    for served_content, expected_to_fail in [(content, False), (corrupted, True)]:
+        fake_get = _fake_get(
+            served_content,
+            supports_ranges=supports_ranges,
+            etag=etag(content),
+            response_headers={name: value(content) for name, value in response_headers.items()},
+        )
+        with mock.patch("requests.Session.get", side_effect=fake_get):
+            if expected_to_fail:
+                with pytest.raises(MlflowException, match="has MD5 digest"):
+                    download_url_in_parallel(
+                        "https://url", local_path, chunk_size=100, max_workers=4
+                    )
+            else:
+                download_url_in_parallel("https://url", local_path, chunk_size=100, max_workers=4)
+
+
+@pytest.mark.parametrize(
+    "etag, response_headers",
+    [
+        # ETag of a multipart upload
+        ('"%s-2"' % ("a" * 32), {}),
+        # ETags of objects encrypted with KMS or customer-provided keys are not their MD5
+        ('"%s"' % ("a" * 32), {"x-amz-server-side-encryption": "aws:kms"}),
+        ('"%s"' % ("a" * 32), {"x-amz-server-side-encryption-customer-algorithm": "AES256"}),
+    ],
+)
+def test_download_url_in_parallel_ignores_etags_that_are_not_md5(tmpdir, etag, response_headers):
+    content = os.urandom(1000)
+    local_path = str(tmpdir.join("file"))
+    fake_get = _fake_get(content, etag=etag, response_headers=response_headers)
+    with mock.patch("requests.Session.get", side_effect=fake_get):
+        download_url_in_parallel("https://url", local_path, chunk_size=100, max_workers=4)
+    with open(local_path, "rb") as f:
+        assert f.read() == content
+
+
+def test_download_ranges_in_parallel_verifies_range_lengths(tmpdir):
+    local_path = str(tmpdir.join("file"))
+    open(local_path, "wb").close()
+    with pytest.raises(MlflowException, match="expected 10 bytes, received 5"):
+        download_ranges_in_parallel(
+            lambda first, last: b"x" * 5, local_path, file_size=30, chunk_size=10, max_workers=2,
+        )
+
+
+def test_parallel_download_settings_are_read_from_environment(monkeypatch):
+    monkeypatch.setenv("MLFLOW_PARALLEL_DOWNLOAD_CHUNK_SIZE", "1024")
+    monkeypatch.setenv("MLFLOW_PARALLEL_DOWNLOAD_MAX_WORKERS", "3")
+    assert get_parallel_download_chunk_size() == 1024
+    assert get_parallel_download_max_workers() == 3
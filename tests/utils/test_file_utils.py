@@ -49,6 +49,21 @@ def test_yaml_read_and_write(tmpdir):
     assert "more_text" not in file_utils.read_yaml(temp_dir, yaml_file)
 
 
+def test_find(tmpdir):
+    tmpdir.join("run").mkdir()
+    tmpdir.join("file").write("")
+    root = str(tmpdir)
+    assert file_utils.find(root, "run") == ["run"]
+    assert file_utils.find(root, "run", full_path=True) == [os.path.join(root, "run")]
+    assert file_utils.find(root, "file") == ["file"]
+    assert file_utils.find(root, "missing") == []
+    # Only entries directly under the root directory match
+    for name in ["", ".", "..", os.path.join("run", "..", "file"), root]:
+        assert file_utils.find(root, name) == []
+    with pytest.raises(Exception, match="Invalid parent directory"):
+        file_utils.find(str(tmpdir.join("missing")), "run")
+
+
 def test_mkdir(tmpdir):
     temp_dir = str(tmpdir)
     new_dir_name = "mkdir_test_%d" % random_int()
@@ -137,3 +152,30 @@ def test_dir_copy():
             f.write("testing")
         _copy_file_or_tree(dir_path, copy_path, "")
         assert filecmp.dircmp(dir_path, copy_path)
+
+
+def test_compute_file_md5(tmpdir):
+    path = tmpdir.join("file.bin")
+    content = os.urandom(3 * 1024 + 7)
+    path.write_binary(content)
+    expected = hashlib.md5(content).hexdigest()
+    assert file_utils.compute_file_md5(str(path)) == expected
+    assert file_utils.compute_file_md5(str(path), chunk_size=1024) == expected
+
+
+def test_copy_tree_merges_into_existing_directory_without_permissions(tmpdir):
+    src = tmpdir.mkdir("src")
+    src.join("a.txt").write("a")
+    src.mkdir("empty")
+    src.mkdir("sub").join("b.txt").write("b")
+    os.chmod(src.join("a.txt").strpath, 0o444)
+    dst = tmpdir.mkdir("dst")
+    dst.join("a.txt").write("old")
+    dst.join("other.txt").write("other")
+
+    file_utils._copy_tree(src.strpath, dst.strpath)
+    assert dst.join("a.txt").read() == "a"
+    assert dst.join("sub", "b.txt").read() == "b"
+    assert dst.join("other.txt").read() == "other"
+    assert dst.join("empty").isdir()
+    assert os.stat(dst.join("a.txt").strpath).st_mode & 0o200
@@ -4,7 +4,12 @@ from mlflow.entities import Experiment, Metric
 from mlflow.protos.service_pb2 import Experiment as ProtoExperiment
 from mlflow.protos.service_pb2 import Metric as ProtoMetric
 
-from mlflow.utils.proto_json_utils import message_to_json, parse_dict, _stringify_all_experiment_ids
+from mlflow.utils.proto_json_utils import (
+    message_to_compact_json,
+    message_to_json,
+    parse_dict,
+    _stringify_all_experiment_ids,
+)
 
 
 def test_message_to_json():
@@ -17,6 +22,13 @@ def test_message_to_json():
     }
 
 
+def test_message_to_compact_json():
+    proto = Experiment("123", "name", "arty", "active").to_proto()
+    json_out = message_to_compact_json(proto)
+    assert json.loads(json_out) == json.loads(message_to_json(proto))
+    assert " " not in json_out and "\n" not in json_out
+
+
 def test_parse_dict():
     in_json = {"experiment_id": "123", "name": "name", "unknown": "field"}
     message = ProtoExperiment()
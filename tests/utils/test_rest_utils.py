@@ -1,10 +1,13 @@
 #!/usr/bin/env python
 
+import gzip
+import os
 from unittest import mock
 import numpy
 import pytest
 
 from mlflow.exceptions import MlflowException, RestException
+from mlflow.utils import rest_utils
 from mlflow.pyfunc.scoring_server import NumpyEncoder
 from mlflow.utils.rest_utils import (
     http_request,
@@ -12,13 +15,15 @@ from mlflow.utils.rest_utils import (
     MlflowHostCreds,
     _DEFAULT_HEADERS,
     call_endpoint,
+    get_error_code,
+    get_request_session,
 )
 from mlflow.protos.service_pb2 import GetRun
 from tests import helper_functions
 
 
 def test_well_formed_json_error_response():
-    with mock.patch("requests.request") as request_mock:
+    with mock.patch("requests.Session.request") as request_mock:
         host_only = MlflowHostCreds("http://my-host")
         response_mock = mock.MagicMock()
         response_mock.status_code = 400
@@ -31,7 +36,7 @@ def test_well_formed_json_error_response():
 
 
 def test_non_json_ok_response():
-    with mock.patch("requests.request") as request_mock:
+    with mock.patch("requests.Session.request") as request_mock:
         host_only = MlflowHostCreds("http://my-host")
         response_mock = mock.MagicMock()
         response_mock.status_code = 200
@@ -56,7 +61,7 @@ def test_non_json_ok_response():
     ],
 )
 def test_malformed_json_error_response(response_mock):
-    with mock.patch("requests.request") as request_mock:
+    with mock.patch("requests.Session.request") as request_mock:
         host_only = MlflowHostCreds("http://my-host")
         request_mock.return_value = response_mock
 
@@ -65,7 +70,7 @@ def test_malformed_json_error_response(response_mock):
             call_endpoint(host_only, "/my/endpoint", "GET", "", response_proto)
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_hostonly(request):
     host_only = MlflowHostCreds("http://my-host")
     response = mock.MagicMock()
@@ -77,7 +82,7 @@ def test_http_request_hostonly(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_cleans_hostname(request):
     # Add a trailing slash, should be removed.
     host_only = MlflowHostCreds("http://my-host/")
@@ -90,7 +95,7 @@ def test_http_request_cleans_hostname(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_with_basic_auth(request):
     host_only = MlflowHostCreds("http://my-host", username="user", password="pass")
     response = mock.MagicMock()
@@ -104,7 +109,7 @@ def test_http_request_with_basic_auth(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_with_token(request):
     host_only = MlflowHostCreds("http://my-host", token="my-token")
     response = mock.MagicMock()
@@ -118,7 +123,7 @@ def test_http_request_with_token(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_with_insecure(request):
     host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
     response = mock.MagicMock()
@@ -130,7 +135,7 @@ def test_http_request_with_insecure(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_client_cert_path(request):
     host_only = MlflowHostCreds("http://my-host", client_cert_path="/some/path")
     response = mock.MagicMock()
@@ -142,7 +147,7 @@ def test_http_request_client_cert_path(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_server_cert_path(request):
     host_only = MlflowHostCreds("http://my-host", server_cert_path="/some/path")
     response = mock.MagicMock()
@@ -161,7 +166,7 @@ def test_ignore_tls_verification_not_server_cert_path():
         )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_429_retries(request):
     host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
 
@@ -191,7 +196,7 @@ def test_429_retries(request):
     assert http_request(host_only, "/my/endpoint", retries=2).status_code == 200
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_wrapper(request):
     host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
     response = mock.MagicMock()
@@ -235,3 +240,142 @@ def test_numpy_encoder_fail():
     with pytest.raises(TypeError):
         ne = NumpyEncoder()
         ne.default(test_number)
+
+
+def test_get_request_session_is_shared_per_host():
+    session = get_request_session("https://my-host/api/2.0/mlflow/runs/get")
+    assert get_request_session("https://my-host/api/2.0/mlflow/runs/search") is session
+    assert get_request_session("https://other-host/api/2.0/mlflow/runs/get") is not session
+    assert get_request_session("http://my-host/api/2.0/mlflow/runs/get") is not session
+
+
+def test_get_request_session_pool_size(monkeypatch):
+    monkeypatch.setenv("MLFLOW_HTTP_POOL_MAXSIZE", "32")
+    with mock.patch.dict("mlflow.utils.rest_utils._request_sessions", clear=True):
+        session = get_request_session("https://my-host")
+        assert session.get_adapter("https://my-host")._pool_maxsize == 32
+
+
+@mock.patch("requests.Session.request")
+def test_http_request_reuses_session(request):
+    host_only = MlflowHostCreds("http://my-host")
+    request.return_value = mock.MagicMock(status_code=200)
+    with mock.patch.dict("mlflow.utils.rest_utils._request_sessions", clear=True):
+        http_request(host_only, "/my/endpoint")
+        http_request(host_only, "/my/other/endpoint")
+        assert len(rest_utils._request_sessions) == 1
+
+
+@mock.patch("requests.Session.request")
+def test_5xx_retries_back_off_exponentially_with_jitter(request):
+    host_only = MlflowHostCreds("http://my-host")
+    request.side_effect = [mock.MagicMock(status_code=x) for x in (503, 503, 503, 200)]
+    with mock.patch("time.sleep") as sleep_mock, mock.patch("random.uniform", return_value=0.5):
+        assert (
+            http_request(host_only, "/my/endpoint", retries=4, retry_interval=2).status_code == 200
+        )
+    assert [c[0][0] for c in sleep_mock.call_args_list] == [1, 2, 4]
+
+    request.side_effect = [mock.MagicMock(status_code=503) for _ in range(2)]
+    with mock.patch("time.sleep") as sleep_mock:
+        with pytest.raises(MlflowException, match="failed to return code 200"):
+            http_request(host_only, "/my/endpoint", retries=2, retry_interval=2)
+    # No wait after the last attempt
+    assert sleep_mock.call_count == 1
+    assert 1 <= sleep_mock.call_args[0][0] <= 2
+
+
+@mock.patch("requests.Session.request")
+def test_call_endpoint_sends_json_body_without_reserializing_it(request):
+    host_only = MlflowHostCreds("http://my-host")
+    request.return_value = mock.MagicMock(status_code=200, text='{"run": {}}')
+    json_body = '{"run_id":"abc"}'
+    call_endpoint(host_only, "/api/2.0/mlflow/runs/update", "POST", json_body, GetRun.Response())
+    assert request.call_args[1]["data"] == json_body.encode("utf-8")
+    assert request.call_args[1]["headers"]["Content-Type"] == "application/json"
+    assert "json" not in request.call_args[1]
+
+
+@mock.patch("requests.Session.request")
+def test_http_request_compresses_large_bodies_for_hosts_that_accept_gzip(request):
+    host_only = MlflowHostCreds("http://gzip-host")
+    body = b"x" * (rest_utils._GZIP_REQUEST_MIN_SIZE + 1)
+    with mock.patch.object(rest_utils, "_gzip_request_hosts", set()):
+        # The host has not advertised gzip support yet
+        request.return_value = mock.MagicMock(status_code=200, headers={"Accept-Encoding": "gzip"})
+        http_request(host_only, "/my/endpoint", method="POST", data=body)
+        assert request.call_args[1]["data"] == body
+        assert "Content-Encoding" not in request.call_args[1]["headers"]
+
+        http_request(host_only, "/my/endpoint", method="POST", data=body)
+        assert gzip.decompress(request.call_args[1]["data"]) == body
+        assert request.call_args[1]["headers"]["Content-Encoding"] == "gzip"
+
+        # Small bodies are never compressed
+        http_request(host_only, "/my/endpoint", method="POST", data=b"x")
+        assert request.call_args[1]["data"] == b"x"
+
+
+@mock.patch("requests.Session.request")
+def test_call_endpoint_negotiates_protobuf(request):
+    host_only = MlflowHostCreds("http://protobuf-host")
+    endpoint = "/api/2.0/mlflow/runs/get"
+    response_proto = GetRun.Response()
+    response_proto.run.info.run_id = "abc"
+    with mock.patch.object(rest_utils, "_protobuf_hosts", set()):
+        # Requests are sent as JSON until the host has returned a protobuf response
+        request.return_value = mock.MagicMock(
+            status_code=200,
+            headers={"Content-Type": "application/x-protobuf"},
+            content=response_proto.SerializeToString(),
+        )
+        result = call_endpoint(host_only, endpoint, "POST", GetRun(run_id="abc"), GetRun.Response())
+        assert result.run.info.run_id == "abc"
+        headers = request.call_args[1]["headers"]
+        assert headers["Accept"] == "application/x-protobuf, application/json;q=0.9"
+        assert headers["Content-Type"] == "application/json"
+        assert request.call_args[1]["data"] == b'{"run_id":"abc"}'
+
+        result = call_endpoint(host_only, endpoint, "POST", GetRun(run_id="abc"), GetRun.Response())
+        assert result.run.info.run_id == "abc"
+        assert request.call_args[1]["headers"]["Content-Type"] == "application/x-protobuf"
+        assert request.call_args[1]["data"] == GetRun(run_id="abc").SerializeToString()
+
+        # Query parameters of GET requests are always JSON
+        call_endpoint(host_only, endpoint, "GET", GetRun(run_id="abc"), GetRun.Response())
+        assert request.call_args[1]["params"] == {"run_id": "abc"}
+
+        # Servers that only support JSON ignore the Accept header
+        request.return_value = mock.MagicMock(
+            status_code=200, headers={"Content-Type": "application/json"}, text='{"run": {}}'
+        )
+        call_endpoint(
+            MlflowHostCreds("http://json-host"),
+            endpoint,
+            "POST",
+            GetRun(run_id="abc"),
+            GetRun.Response(),
+        )
+        assert request.call_args[1]["headers"]["Content-Type"] == "application/json"
+
+
+@mock.patch("requests.Session.request")
+def test_call_endpoint_protobuf_can_be_disabled(request):
+    host_only = MlflowHostCreds("http://protobuf-host")
+    request.return_value = mock.MagicMock(status_code=200, headers={}, text='{"run": {}}')
+    with mock.patch.dict(os.environ, {"MLFLOW_ENABLE_PROTOBUF_WIRE_FORMAT": "false"}):
+        with mock.patch.object(rest_utils, "_protobuf_hosts", {("http", "protobuf-host")}):
+            call_endpoint(host_only, "/my/endpoint", "POST", GetRun(run_id="a"), GetRun.Response())
+    headers = request.call_args[1]["headers"]
+    assert "Accept" not in headers
+    assert headers["Content-Type"] == "application/json"
+
+
+@mock.patch("requests.Session.request")
+def test_http_request_returns_responses_with_given_error_codes(request):
+    host_only = MlflowHostCreds("http://my-host")
+    request.return_value = mock.Mock(status_code=503, text='{"error_code": "PARTIAL_DELETE"}')
+    response = http_request(host_only, "/my/endpoint", return_error_codes=["PARTIAL_DELETE"])
+    assert response.status_code == 503
+    assert get_error_code(response) == "PARTIAL_DELETE"
+    assert request.call_count == 1
@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from mlflow.entities import Run, RunInfo, RunData, RunStatus, LifecycleStage, Metric, Param, RunTag
+from mlflow.exceptions import MlflowException
+from mlflow.utils.run_table import RunTable
+from mlflow.utils.search_utils import SearchUtils
+
+
+def _make_runs(num_runs, seed=0):
+    rng = random.Random(seed)
+    runs = []
+    for i in range(num_runs):
+        metrics = []
+        if rng.random() < 0.8:
+            metrics.append(Metric("acc", rng.choice([0.1, 0.5, 0.9, float("nan")]), 1, 0))
+        if rng.random() < 0.5:
+            metrics.append(Metric("loss", rng.random(), 1, 0))
+        params = [Param("model", rng.choice(["LR", "lr", "RF", "xgboost"]))]
+        tags = [RunTag("team", rng.choice(["a", "b"]))] if rng.random() < 0.5 else []
+        runs.append(
+            Run(
+                run_info=RunInfo(
+                    run_uuid="run%03d" % i,
+                    run_id="run%03d" % i,
+                    experiment_id=0,
+                    user_id="user-id",
+                    status=RunStatus.to_string(
+                        rng.choice([RunStatus.FINISHED, RunStatus.FAILED, RunStatus.RUNNING])
+                    ),
+                    start_time=rng.randint(0, 5),
+                    end_time=rng.choice([None, 1, 2]),
+                    lifecycle_stage=LifecycleStage.ACTIVE,
+                ),
+                run_data=RunData(metrics=metrics, params=params, tags=tags),
+            )
+        )
+    return runs
+
+
+def _run_ids(runs):
+    return [run.info.run_id for run in runs]
+
+
+@pytest.mark.parametrize(
+    "filter_string",
+    [
+        None,
+        "metrics.acc > 0.3",
+        "metrics.acc != 0.5",
+        "metrics.acc <= 0.5 AND metrics.loss >= 0.2",
+        "params.model = 'LR'",
+        "params.model != 'LR'",
+        "params.model LIKE 'L%'",
+        "params.model ILIKE 'l_'",
+        "params.model LIKE '%boo%'",
+        "tags.team = 'a'",
+        "tags.team != 'a'",
+        "attributes.status = 'FAILED'",
+        "attributes.status ILIKE 'fin%' AND params.model = 'RF'",
+        "metrics.missing > 0",
+        "metrics.acc > 0.3 OR params.model = 'RF'",
+        "(metrics.acc > 0.3 OR tags.team = 'a') AND params.model != 'LR'",
+        "metrics.loss < 0.5 OR tags.team = 'b' AND attributes.status = 'FAILED'",
+        "params.model IN ('LR', 'RF')",
+        "params.model NOT IN ('LR', 'RF')",
+        "metrics.acc IN (0.1, 0.9)",
+        "metrics.acc NOT IN (0.1)",
+        "tags.team IS NULL",
+        "tags.team IS NOT NULL AND metrics.loss IS NULL",
+    ],
+)
+def test_run_table_filter_matches_search_utils(filter_string):
+    runs = _make_runs(200)
+    expected = SearchUtils.filter(runs, filter_string)
+    assert _run_ids(RunTable(runs).search(filter_string, [])) == _run_ids(
+        SearchUtils.sort(expected, [])
+    )
+
+
+@pytest.mark.parametrize(
+    "order_by",
+    [
+        [],
+        ["metrics.acc"],
+        ["metrics.acc DESC"],
+        ["metrics.loss ASC", "params.model DESC"],
+        ["params.model", "tags.team DESC", "metrics.acc"],
+        ["tags.team"],
+        ["attributes.start_time"],
+        ["attributes.end_time DESC"],
+        ["attributes.status DESC", "metrics.loss"],
+    ],
+)
+def test_run_table_sort_matches_search_utils(order_by):
+    runs = _make_runs(200, seed=1)
+    # SearchUtils.sort cannot compare a missing metric to a NaN metric, so avoid mixing them
+    runs = [run for run in runs if "acc" in run.data.metrics]
+    random.Random(2).shuffle(runs)
+    assert _run_ids(RunTable(runs).search(None, order_by)) == _run_ids(
+        SearchUtils.sort(runs, order_by)
+    )
+
+
+def test_run_table_handles_empty_runs():
+    table = RunTable([])
+    assert table.search("metrics.acc > 0", ["metrics.acc DESC"]) == []
+    assert len(table.filter_mask("params.model = 'LR'")) == 0
+
+
+def test_run_table_rejects_invalid_comparators():
+    with pytest.raises(MlflowException, match="Invalid comparator"):
+        RunTable(_make_runs(1)).search("params.model > 'LR'", [])
@@ -1,6 +1,8 @@
 import base64
 import json
 import pytest
+import sqlparse
+from unittest import mock
 
 from mlflow.entities import RunInfo, RunData, Run, LifecycleStage, RunStatus, Metric, Param, RunTag
 from mlflow.exceptions import MlflowException
@@ -115,9 +117,16 @@ def test_correct_quote_trimming(filter_string, parsed_filter):
         ("attri.x != 1", "Invalid entity type"),
         ("a.x != 1", "Invalid entity type"),
         ("model >= 'LR'", "Invalid identifier"),
-        ("metrics.A > 0.1 OR params.B = 'LR'", "Invalid clause(s) in filter string"),
+        ("metrics.A > 0.1 OR", "Invalid clause(s) in filter string"),
+        ("metrics.A > 0.1 OR AND params.B = 'LR'", "Invalid clause(s) in filter string"),
         ("metrics.A > 0.1 NAND params.B = 'LR'", "Invalid clause(s) in filter string"),
-        ("metrics.A > 0.1 AND (params.B = 'LR')", "Invalid clause(s) in filter string"),
+        ("metrics.A > 0.1 AND ()", "Invalid clause(s) in filter string"),
+        ("metrics.A > 0.1 (params.B = 'LR')", "Invalid clause(s) in filter string"),
+        ("params.B IN 'LR'", "Invalid clause(s) in filter string"),
+        ("params.B IS NULL NULL", "Invalid clause(s) in filter string"),
+        ("params.B IN ()", "expected a non-empty list of values"),
+        ("params.B IN (1, 2)", "Expected a quoted string value for param"),
+        ("metrics.A NOT IN ('a')", "Expected numeric value type for metric"),
         ("`metrics.A > 0.1", "Invalid clause(s) in filter string"),
         ("param`.A > 0.1", "Invalid clause(s) in filter string"),
         ("`dummy.A > 0.1", "Invalid clause(s) in filter string"),
@@ -301,6 +310,125 @@ def test_correct_filtering(filter_string, matching_runs):
     assert set(filtered_runs) == set([runs[i] for i in matching_runs])
 
 
+@pytest.mark.parametrize(
+    "filter_string, parsed_filter",
+    [
+        (
+            "metrics.acc > 0.9 OR tags.team = 'x'",
+            [
+                {
+                    "operator": "OR",
+                    "clauses": [
+                        {"type": "metric", "key": "acc", "comparator": ">", "value": "0.9"},
+                        {"type": "tag", "key": "team", "comparator": "=", "value": "x"},
+                    ],
+                }
+            ],
+        ),
+        (
+            "metrics.acc > 0.9 or params.a = 'b' and params.c = 'd'",
+            [
+                {
+                    "operator": "OR",
+                    "clauses": [
+                        {"type": "metric", "key": "acc", "comparator": ">", "value": "0.9"},
+                        {
+                            "operator": "AND",
+                            "clauses": [
+                                {"type": "parameter", "key": "a", "comparator": "=", "value": "b"},
+                                {"type": "parameter", "key": "c", "comparator": "=", "value": "d"},
+                            ],
+                        },
+                    ],
+                }
+            ],
+        ),
+        (
+            "(metrics.acc > 0.9) AND (params.a = 'b')",
+            [
+                {"type": "metric", "key": "acc", "comparator": ">", "value": "0.9"},
+                {"type": "parameter", "key": "a", "comparator": "=", "value": "b"},
+            ],
+        ),
+        (
+            "params.model IN ('LR', \"RF\")",
+            [{"type": "parameter", "key": "model", "comparator": "IN", "value": ["LR", "RF"]}],
+        ),
+        (
+            "metrics.step not in (1, 2.5)",
+            [{"type": "metric", "key": "step", "comparator": "NOT IN", "value": ["1", "2.5"]}],
+        ),
+        (
+            "tags.`my tag` IS NULL AND attributes.status is not null",
+            [
+                {"type": "tag", "key": "my tag", "comparator": "IS NULL", "value": None},
+                {"type": "attribute", "key": "status", "comparator": "IS NOT NULL", "value": None},
+            ],
+        ),
+    ],
+)
+def test_parse_boolean_list_and_null_expressions(filter_string, parsed_filter):
+    assert SearchUtils.parse_search_filter(filter_string) == parsed_filter
+
+
+def test_parse_search_filter_is_cached():
+    filter_string = "metrics.acc > 0.9 AND params.model = 'cached'"
+    with mock.patch("sqlparse.parse", wraps=sqlparse.parse) as parse_mock:
+        parsed = SearchUtils.parse_search_filter(filter_string)
+        # Callers receive copies of the cached comparisons
+        parsed[0]["value"] = "modified"
+        assert SearchUtils.parse_search_filter(filter_string)[0]["value"] == "0.9"
+        SearchUtils.filter([], filter_string)
+    assert parse_mock.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "filter_string, matching_runs",
+    [
+        ("params.my_param LIKE 'a%'", []),
+        ("params.my_param ILIKE 'a%'", [0, 1]),
+        ("params.my_param LIKE '%bc'", [1]),
+        ("tags.tag1 ILIKE '_'", [0, 1]),
+        ("attributes.status LIKE 'FIN%'", [1]),
+    ],
+)
+def test_like_filtering(filter_string, matching_runs):
+    runs = [
+        Run(
+            run_info=RunInfo(
+                run_uuid="hi",
+                run_id="hi",
+                experiment_id=0,
+                user_id="user-id",
+                status=RunStatus.to_string(RunStatus.FAILED),
+                start_time=0,
+                end_time=1,
+                lifecycle_stage=LifecycleStage.ACTIVE,
+            ),
+            run_data=RunData(
+                metrics=[], params=[Param("my_param", "A")], tags=[RunTag("tag1", "c")]
+            ),
+        ),
+        Run(
+            run_info=RunInfo(
+                run_uuid="hi2",
+                run_id="hi2",
+                experiment_id=0,
+                user_id="user-id",
+                status=RunStatus.to_string(RunStatus.FINISHED),
+                start_time=0,
+                end_time=1,
+                lifecycle_stage=LifecycleStage.ACTIVE,
+            ),
+            run_data=RunData(
+                metrics=[], params=[Param("my_param", "Abc")], tags=[RunTag("tag1", "D")]
+            ),
+        ),
+    ]
+    filtered_runs = SearchUtils.filter(runs, filter_string)
+    assert set(filtered_runs) == set([runs[i] for i in matching_runs])
+
+
 @pytest.mark.parametrize(
     "order_bys, matching_runs",
     [
@@ -558,3 +686,72 @@ def test_invalid_page_tokens(page_token, error_message):
     with pytest.raises(MlflowException) as e:
         SearchUtils.paginate([], page_token, 1)
     assert error_message in e.value.message
+
+
+@pytest.mark.parametrize(
+    "filter_string, parsed_filter",
+    [
+        ("name = 'a'", [{"type": "attribute", "key": "name", "comparator": "=", "value": "a"}]),
+        (
+            "current_stage IN ('Staging', 'Production') and tags.`my tag` like 'x%'",
+            [
+                {
+                    "type": "attribute",
+                    "key": "current_stage",
+                    "comparator": "IN",
+                    "value": ("Staging", "Production"),
+                },
+                {"type": "tag", "key": "my tag", "comparator": "LIKE", "value": "x%"},
+            ],
+        ),
+        (
+            "version_number >= 3 AND creation_timestamp < 1600000000000",
+            [
+                {"type": "attribute", "key": "version_number", "comparator": ">=", "value": 3},
+                {
+                    "type": "attribute",
+                    "key": "creation_timestamp",
+                    "comparator": "<",
+                    "value": 1600000000000,
+                },
+            ],
+        ),
+    ],
+)
+def test_parse_filter_for_model_versions(filter_string, parsed_filter):
+    assert SearchUtils.parse_filter_for_model_versions(filter_string) == parsed_filter
+
+
+@pytest.mark.parametrize(
+    "filter_string, error_message",
+    [
+        ("tags.a > 'b'", "Invalid comparator"),
+        ("run_id LIKE 'a%'", "Invalid comparator"),
+        ("version_number = 'one'", "Expected an integer value"),
+        ("metrics.a = 1", "Invalid entity type"),
+        ("user_id = 'me'", "Invalid attribute key"),
+        ("name = 'a' OR name = 'b'", "Invalid clause"),
+        ("name = 'a' name = 'b'", "contains multiple expressions"),
+    ],
+)
+def test_invalid_filter_for_model_versions(filter_string, error_message):
+    with pytest.raises(MlflowException) as e:
+        SearchUtils.parse_filter_for_model_versions(filter_string)
+    assert error_message in e.value.message
+
+
+def test_keyset_page_tokens():
+    order_by = ["name ASC", "version_number DESC"]
+    page_token = SearchUtils.create_keyset_page_token(order_by, ["model", 3])
+    assert SearchUtils.parse_keyset_from_page_token(page_token, order_by) == ["model", 3]
+    assert SearchUtils.parse_keyset_from_page_token(None, order_by) is None
+
+    with pytest.raises(MlflowException, match="different ordering"):
+        SearchUtils.parse_keyset_from_page_token(page_token, ["name DESC", "version_number DESC"])
+    for invalid_token in [
+        SearchUtils.create_page_token(10),
+        base64.b64encode(json.dumps([1, 2]).encode("utf-8")),
+        "not base64",
+    ]:
+        with pytest.raises(MlflowException, match="Invalid page token"):
+            SearchUtils.parse_keyset_from_page_token(invalid_token, order_by)